@@ -181,10 +181,19 @@ async def handle_healthz(request: web.Request):
     }
     return web.Response(text=json.dumps(data, ensure_ascii=False), content_type="application/json")
 
+async def handle_yt_schedule(request: web.Request):
+    # debug view of the YouTube announcer poll queue
+    try:
+        from nixe.cogs.a21_youtube_wuwa_live_announce import schedule_snapshot
+        data = schedule_snapshot()
+    except Exception as e:
+        data = {"ok": False, "error": repr(e)}
+    return web.Response(text=json.dumps(data, ensure_ascii=False), content_type="application/json")
+
 async def start_web(port: int):
     app = web.Application()
     await _register_web_shutdown(app)
-    app.add_routes([web.get("/", handle_root), web.get("/healthz", handle_healthz)])
+    app.add_routes([web.get("/", handle_root), web.get("/healthz", handle_healthz), web.get("/yt/schedule", handle_yt_schedule)])
     runner = web.AppRunner(app, access_log=None)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+a00_guard_snapshot_overlay
+--------------------------
+Warm start for guard state (LPG cache, LPG denylist, pHash phishing sets).
+
+- On load (before the gateway connects): restore data/guard_state.snap so guards
+  have their state immediately instead of after the thread scans finish.
+- Periodically (NIXE_GUARD_SNAPSHOT_INTERVAL_SEC, default 600) and on cog unload:
+  write a fresh snapshot. a00_graceful_shutdown also writes one on SIGTERM.
+- Thread bootstraps still run afterwards and reconcile on top of the restored state.
+
+Env:
+  NIXE_GUARD_SNAPSHOT_ENABLE=1
+  NIXE_GUARD_SNAPSHOT_PATH=data/guard_state.snap
+  NIXE_GUARD_SNAPSHOT_INTERVAL_SEC=600
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+from discord.ext import commands, tasks
+
+from nixe.helpers import guard_snapshot
+
+log = logging.getLogger(__name__)
+
+
+def _interval_sec() -> float:
+    try:
+        return max(30.0, float(os.getenv("NIXE_GUARD_SNAPSHOT_INTERVAL_SEC", "600") or 600))
+    except Exception:
+        return 600.0
+
+
+class GuardSnapshot(commands.Cog):
+    """Restore guard state at boot and keep the local snapshot fresh."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        try:
+            self._periodic.change_interval(seconds=_interval_sec())
+        except Exception:
+            pass
+
+    async def cog_load(self) -> None:
+        if guard_snapshot.enabled() and not self._periodic.is_running():
+            self._periodic.start()
+
+    def cog_unload(self) -> None:
+        try:
+            self._periodic.cancel()
+        except Exception:
+            pass
+        guard_snapshot.save_now()
+
+    @tasks.loop(seconds=600.0)
+    async def _periodic(self):
+        n = await guard_snapshot.save_async()
+        if n:
+            log.debug("[guard-snap] periodic save bytes=%s", n)
+
+    @_periodic.before_loop
+    async def _before(self):
+        await self.bot.wait_until_ready()
+        # Skip the immediate first tick: state right after boot is the snapshot itself.
+        await asyncio.sleep(_interval_sec())
+
+
+async def setup(bot: commands.Bot):
+    # Restore synchronously: this runs during cog loading, before any on_ready bootstrap.
+    guard_snapshot.load()
+    await bot.add_cog(GuardSnapshot(bot))
@@ -12,6 +12,7 @@ from __future__ import annotations
 import os, json, asyncio, logging, time
 import discord
 from discord.ext import commands, tasks
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger("nixe.cogs.a00_lpg_cache_mirror_overlay")
 
@@ -38,7 +39,7 @@ class LPGCacheMirror(commands.Cog):
         if not self.parent_id:
             return 0
         try:
-            ch = self.bot.get_channel(self.parent_id) or await self.bot.fetch_channel(self.parent_id)
+            ch = await resolve_channel(self.bot, self.parent_id)
             if not ch:
                 return 0
             # try find existing active threads by name
@@ -64,7 +65,7 @@ class LPGCacheMirror(commands.Cog):
         if not tid:
             return
         try:
-            th = self.bot.get_channel(tid) or await self.bot.fetch_channel(tid)
+            th = await resolve_channel(self.bot, tid)
             if not th:
                 return
             sha = entry.get("sha256","?")[:10]
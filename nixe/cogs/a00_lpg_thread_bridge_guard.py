@@ -7,6 +7,7 @@ from discord.ext import commands
 from nixe.helpers.persona_loader import load_persona, pick_line
 from nixe.helpers.persona_gate import should_run_persona
 import nixe.helpers.gemini_bridge as gb
+from nixe.helpers.resolver import resolve_channel
 classify_lucky_pull_bytes = gb.classify_lucky_pull_bytes  # resolved via gemini_bridge (Groq-only for LPG)
 
 log = logging.getLogger("nixe.cogs.a00_lpg_thread_bridge_guard")
@@ -106,14 +107,10 @@ try:
 except Exception:  # pragma: no cover
     aiohttp = None
 from pathlib import Path
-try:
-    from PIL import Image
-except Exception:
-    Image = None
-try:
-    import numpy as np
-except Exception:
-    np = None
+from nixe.helpers.lazy_import import optional_lazy_module
+
+Image = optional_lazy_module("PIL.Image")
+np = optional_lazy_module("numpy")
 
 
 def _dct2(a):
@@ -218,7 +215,7 @@ async def _post_status_embed(
     # Hardcoded permanent-memory thread
     tid = 1435924665615908965
     try:
-        ch = bot.get_channel(tid) or await bot.fetch_channel(tid)
+        ch = await resolve_channel(bot, tid)
         if ch:
             # Guard: memory thread must only store LUCKY entries
             try:
@@ -921,9 +918,7 @@ class LPGThreadBridgeGuard(commands.Cog):
         mention = None
         try:
             if self.redirect_id:
-                ch = message.guild.get_channel(self.redirect_id) or await self.bot.fetch_channel(  # type: ignore[arg-type]
-                    self.redirect_id
-                )
+                ch = await resolve_channel(self.bot, self.redirect_id)
                 mention = ch.mention if ch else f"<#{self.redirect_id}>"
         except Exception as e:
             log.debug("[lpg-thread-bridge] redirect resolve failed: %r", e)
@@ -6,6 +6,7 @@ import discord
 from discord.ext import commands
 from nixe.helpers.phash_board import discover_db_message_id
 from nixe.state_runtime import get_phash_ids
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger(__name__)
 
@@ -33,7 +34,7 @@ class PhashDbEditFixOverlay(commands.Cog):
         # 1) Try thread first (common case)
         if DB_THREAD_ID:
             try:
-                th = self.bot.get_channel(DB_THREAD_ID) or await self.bot.fetch_channel(DB_THREAD_ID)
+                th = await resolve_channel(self.bot, DB_THREAD_ID)
                 if isinstance(th, (discord.Thread, discord.TextChannel)):
                     return await th.fetch_message(DB_MSG_ID)
             except Exception:
@@ -41,7 +42,7 @@ class PhashDbEditFixOverlay(commands.Cog):
         # 2) Fallback: main log channel
         if LOG_CH_ID:
             try:
-                ch = self.bot.get_channel(LOG_CH_ID) or await self.bot.fetch_channel(LOG_CH_ID)
+                ch = await resolve_channel(self.bot, LOG_CH_ID)
                 if isinstance(ch, (discord.Thread, discord.TextChannel)):
                     return await ch.fetch_message(DB_MSG_ID)
             except Exception:
@@ -49,7 +50,7 @@ class PhashDbEditFixOverlay(commands.Cog):
         # 3) Last resort: scan recent messages in log channel for marker
         if LOG_CH_ID:
             try:
-                ch = self.bot.get_channel(LOG_CH_ID) or await self.bot.fetch_channel(LOG_CH_ID)
+                ch = await resolve_channel(self.bot, LOG_CH_ID)
                 async for m in ch.history(limit=50):
                     if m.author.id == self.bot.user.id and PHASH_DB_MARKER in (m.content or ""):
                         return m
@@ -77,7 +78,7 @@ class PhashDbEditFixOverlay(commands.Cog):
                 did = await discover_db_message_id(self.bot)
                 if did:
                     try:
-                        ch = self.bot.get_channel(DB_THREAD_ID) or await self.bot.fetch_channel(DB_THREAD_ID)
+                        ch = await resolve_channel(self.bot, DB_THREAD_ID)
                         msg = await ch.fetch_message(did)
                     except Exception:
                         msg = None
@@ -97,7 +98,7 @@ class PhashDbEditFixOverlay(commands.Cog):
         # try fetch again if we have ids now
         if not msg and r_tid and r_mid:
             try:
-                ch = self.bot.get_channel(r_tid) or await self.bot.fetch_channel(r_tid)
+                ch = await resolve_channel(self.bot, r_tid)
                 msg = await ch.fetch_message(r_mid)
             except Exception:
                 msg = None
@@ -117,7 +118,7 @@ class PhashDbEditFixOverlay(commands.Cog):
         # try fetch again if we have ids now
         if not msg and r_tid and r_mid:
             try:
-                ch = self.bot.get_channel(r_tid) or await self.bot.fetch_channel(r_tid)
+                ch = await resolve_channel(self.bot, r_tid)
                 msg = await ch.fetch_message(r_mid)
             except Exception:
                 msg = None
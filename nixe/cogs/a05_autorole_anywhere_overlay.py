@@ -28,6 +28,8 @@ from typing import Dict, Optional, Set, Tuple
 import discord
 from discord.ext import commands
 
+from nixe.helpers.resolver import resolve_member
+
 LOG = logging.getLogger(__name__)
 
 DEFAULT_CFG = {
@@ -131,11 +133,8 @@ class AutoRoleAnywhereOverlay(commands.Cog):
             mid = int(getattr(author, "id", 0) or 0)
             if not mid:
                 return None
-            m = g.get_member(mid)
-            if m:
-                return m
-            # last resort fetch (can be rate-limited; we only do it when needed)
-            return await g.fetch_member(mid)
+            # cache first; fetch is single-flight and misses (left the guild) are remembered
+            return await resolve_member(g, mid)
         except Exception:
             return None
 
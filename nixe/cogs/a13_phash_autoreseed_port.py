@@ -2,7 +2,7 @@
 import os, json, asyncio, discord
 from discord.ext import commands, tasks
 from discord import AllowedMentions
-from nixe.helpers import img_hashing
+from nixe.helpers import img_hashing, thread_crawler
 
 PHASH_DB_MARKER = os.getenv("PHASH_DB_MARKER", "NIXE_PHASH_DB_V1").strip()
 DB_MSG_ID = int(os.getenv("PHASH_DB_MESSAGE_ID", "0") or "0")
@@ -132,54 +132,60 @@ class PhashAutoReseedPort(commands.Cog):
                 db_msg = None
 
         all_p, all_d, all_t = [], [], []
-        scanned_msgs = scanned_atts = 0
-        async for m in target_thread.history(limit=LIMIT_MSGS, oldest_first=True):
-            scanned_msgs += 1
-            if not m.attachments:
-                continue
-            for att in m.attachments:
-                name = (att.filename or "").lower()
-                if not any(name.endswith(ext) for ext in IMAGE_EXTS):
-                    continue
-                raw = await att.read()
-                if not raw:
-                    continue
-                scanned_atts += 1
-
-                hs = img_hashing.phash_list_from_bytes(
+        scanned_atts = 0
+
+        async def _on_att(_m, _att, raw: bytes) -> None:
+            nonlocal scanned_atts
+            scanned_atts += 1
+            hs = img_hashing.phash_list_from_bytes(
+                raw,
+                max_frames=MAX_FRAMES,
+                augment=AUGMENT,
+                augment_per_frame=AUG_PER,
+            )
+            if hs:
+                all_p.extend(hs)
+
+            dhf = getattr(img_hashing, "dhash_list_from_bytes", None)
+            if dhf:
+                ds = dhf(
                     raw,
                     max_frames=MAX_FRAMES,
                     augment=AUGMENT,
                     augment_per_frame=AUG_PER,
                 )
-                if hs:
-                    all_p.extend(hs)
-
-                dhf = getattr(img_hashing, "dhash_list_from_bytes", None)
-                if dhf:
-                    ds = dhf(
-                        raw,
-                        max_frames=MAX_FRAMES,
-                        augment=AUGMENT,
-                        augment_per_frame=AUG_PER,
-                    )
-                    if ds:
-                        all_d.extend(ds)
-
-                tfunc = getattr(img_hashing, "tile_phash_list_from_bytes", None)
-                if tfunc:
-                    ts = tfunc(
-                        raw,
-                        grid=TILE_GRID,
-                        max_frames=4,
-                        augment=AUGMENT,
-                        augment_per_frame=0,
-                    )
-                    if ts:
-                        all_t.extend(ts)
-
-                if (scanned_atts % 25) == 0:
-                    await asyncio.sleep(1)
+                if ds:
+                    all_d.extend(ds)
+
+            tfunc = getattr(img_hashing, "tile_phash_list_from_bytes", None)
+            if tfunc:
+                ts = tfunc(
+                    raw,
+                    grid=TILE_GRID,
+                    max_frames=4,
+                    augment=AUGMENT,
+                    augment_per_frame=0,
+                )
+                if ts:
+                    all_t.extend(ts)
+
+            if (scanned_atts % 25) == 0:
+                await asyncio.sleep(1)
+
+        # Incremental: only messages newer than the checkpoint. Without a DB message the
+        # board is rebuilt from scratch, so the whole thread must be hashed again.
+        # The checkpoint is committed only after the DB message holds the new hashes.
+        ck_key = f"a13_reseed:{target_thread.id}"
+        stats = await thread_crawler.crawl(
+            target_thread, ck_key,
+            on_attachment=_on_att,
+            want_attachment=lambda att: any((att.filename or "").lower().endswith(ext) for ext in IMAGE_EXTS),
+            full=db_msg is None, limit=LIMIT_MSGS, commit=False,
+        )
+        scanned_msgs = int(stats.get("scanned") or 0)
+        if db_msg is not None and not (all_p or all_d or all_t):
+            thread_crawler.commit_checkpoint(ck_key, target_thread, stats)
+            return
 
         existing_p, existing_d, existing_t = ([], [], [])
         if db_msg:
@@ -201,16 +207,21 @@ class PhashAutoReseedPort(commands.Cog):
 
         content = _render_db(existing_p, existing_d, existing_t)
 
+        written = False
         if db_msg:
             try:
                 await db_msg.edit(content=content)
+                written = True
             except Exception:
                 pass
         else:
             try:
                 db_msg = await parent.send(content)
+                written = True
             except Exception:
                 db_msg = None
+        if written:
+            thread_crawler.commit_checkpoint(ck_key, target_thread, stats)
 
         if NOTIFY_THREAD:
             try:
@@ -14,6 +14,9 @@ from nixe.helpers.phash_tools import hamming
 from nixe.state_runtime import get_phash_ids
 from nixe.helpers.ban_utils import emit_phish_detected
 from nixe.helpers.once import once_sync as _once
+from nixe.helpers.lazy_import import optional_lazy_module
+from nixe.helpers import guard_snapshot
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger("nixe.cogs.phash_phish_guard")
 
@@ -39,10 +42,7 @@ def _is_thread_channel(ch) -> bool:
         pass
     return False
 
-try:
-    from PIL import Image as _PIL_Image
-except Exception:
-    _PIL_Image = None
+_PIL_Image = optional_lazy_module("PIL.Image")
 
 
 def _transcode_to_png_bytes(raw: bytes) -> bytes:
@@ -203,6 +203,9 @@ class PhashPhishGuard(commands.Cog):
         # lazy bootstrap
         self._bootstrap_task = None
         self._booted = False
+        # Warm start: restored sets are applied immediately; _refresh_hashes() replaces them later.
+        guard_snapshot.register_u64_set("PHC", lambda: self._hashes_confirmed, self._restore_confirmed)
+        guard_snapshot.register_u64_set("PHA", lambda: self._hashes_autolearn, self._restore_autolearn)
         log.info(
             "[phash-phish] init bits_max=%s guards=%s skip=%s safe=%s",
             self.bits_max,
@@ -212,6 +215,15 @@ class PhashPhishGuard(commands.Cog):
         )
 
 
+    def _restore_confirmed(self, vals: Set[int]) -> None:
+        if not self._hashes_confirmed:
+            self._hashes_confirmed = set(vals)
+            log.warning("[phash-phish] warm start confirmed=%d (snapshot)", len(vals))
+
+    def _restore_autolearn(self, vals: Set[int]) -> None:
+        if not self._hashes_autolearn:
+            self._hashes_autolearn = set(vals)
+
     @commands.Cog.listener()
     async def on_ready(self):
         if getattr(self, '_booted', False):
@@ -266,7 +278,7 @@ class PhashPhishGuard(commands.Cog):
             # Thread-only mode: allow _refresh_hashes() to scan pins/history in the thread.
             if tid:
                 try:
-                    channel = self.bot.get_channel(tid) or await self.bot.fetch_channel(tid)
+                    channel = await resolve_channel(self.bot, tid)
                     return channel, None
                 except Exception:
                     return None, None
@@ -276,10 +288,10 @@ class PhashPhishGuard(commands.Cog):
         msg: Optional[discord.Message] = None
         try:
             if tid:
-                channel = self.bot.get_channel(tid) or await self.bot.fetch_channel(tid)
+                channel = await resolve_channel(self.bot, tid)
             # last resort: use phish log channel as a parent when only message id is known
             if channel is None and self.log_chan_id:
-                channel = self.bot.get_channel(self.log_chan_id) or await self.bot.fetch_channel(self.log_chan_id)
+                channel = await resolve_channel(self.bot, self.log_chan_id)
             if channel:
                 msg = await channel.fetch_message(mid)
         except Exception as e:
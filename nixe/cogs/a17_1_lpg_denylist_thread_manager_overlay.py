@@ -159,6 +159,7 @@ class LPGDenylistThreadManager(commands.Cog):
             return
         pairs = []
         scanned = 0
+        complete = False
         try:
             async for msg in th.history(limit=int(self.scan_limit), oldest_first=False):
                 scanned += 1
@@ -169,12 +170,21 @@ class LPGDenylistThreadManager(commands.Cog):
                 sha1 = m.group(1).lower()
                 ah = m.group(2).lower()
                 pairs.append((sha1, ah))
+            # Reached the start of the thread: the scan saw every deny entry.
+            complete = scanned < int(self.scan_limit)
         except Exception as e:
             log.error("[lpg-deny] load history failed: %r", e)
         if pairs:
             lpg_denylist.add_many(pairs)
+        dropped = 0
+        if complete:
+            # Snapshot entries deleted from the thread while offline must not come back.
+            dropped = lpg_denylist.drop_unconfirmed_restored()
         st = lpg_denylist.stats()
-        log.warning("[lpg-deny] loaded scanned=%s denied_sha1=%s denied_ahash=%s thread=%s", scanned, st["sha1"], st["ahash"], th.id)
+        log.warning(
+            "[lpg-deny] loaded scanned=%s complete=%s dropped_restored=%s denied_sha1=%s denied_ahash=%s thread=%s",
+            scanned, complete, dropped, st["sha1"], st["ahash"], th.id,
+        )
 
     async def enqueue_deny(self, sha1: str, ahash: str, src: str = "unlearn") -> None:
         """Public API called by other cogs: add deny and persist to thread."""
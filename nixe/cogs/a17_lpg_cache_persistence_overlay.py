@@ -21,11 +21,15 @@ import hashlib
 import logging
 import os
 import re
+import time
 from typing import Dict, Optional, Tuple
 
 import discord
 from discord.ext import commands, tasks
 
+from nixe.helpers import guard_snapshot, thread_crawler
+from nixe.helpers.resolver import resolve_channel
+
 log = logging.getLogger(__name__)
 
 # Permanent-memory thread (per user requirement)
@@ -122,6 +126,14 @@ class LPGCachePersistence(commands.Cog):
         self.purge_limit = _env_int('LPG_CACHE_PURGE_LIMIT', 0)  # 0 = use boot_scan_limit/unlimited
         self.purge_sleep_ms = _env_int('LPG_CACHE_PURGE_SLEEP_MS', 350)
 
+        # Warm boot (state restored from guard snapshot): only crawl messages newer
+        # than the snapshot checkpoint instead of re-scanning the whole thread.
+        self.boot_incremental = _env_bool("LPG_CACHE_BOOT_INCREMENTAL", True)
+        # A warm boot never sees messages deleted while offline; force a full scan (which
+        # reconciles the snapshot) every N warm boots or after N hours since the last one.
+        self.full_scan_every_boots = _env_int("LPG_CACHE_FULL_SCAN_EVERY_BOOTS", 10)
+        self.full_scan_every_hours = _env_int("LPG_CACHE_FULL_SCAN_EVERY_HOURS", 24)
+
 
         # Map for delete=unlearn->deny (mid -> (sha1, ahash))
         self._msgid_to_fp: Dict[int, Tuple[str, str]] = {}
@@ -149,13 +161,14 @@ class LPGCachePersistence(commands.Cog):
         if self.thread is None:
             await self._bind_thread()
             await self._purge_nonlucky_in_thread()
-            await self._bootstrap_from_thread()
+            if not await self._bootstrap_incremental():
+                await self._bootstrap_from_thread()
             if self.weekly_maintenance and self.minipc and not self._weekly.is_running():
                 self._weekly.start()
 
     async def _bind_thread(self):
         try:
-            ch = self.bot.get_channel(MEMORY_THREAD_ID) or await self.bot.fetch_channel(MEMORY_THREAD_ID)
+            ch = await resolve_channel(self.bot, MEMORY_THREAD_ID)
             if isinstance(ch, discord.Thread):
                 self.thread = ch
                 log.warning("[lpgmem] bound thread=%s (%s)", ch.name, ch.id)
@@ -220,6 +233,79 @@ class LPGCachePersistence(commands.Cog):
             log.warning('[lpgmem] purge scan failed: %r', e)
         log.info('[lpgmem] purge_nonlucky scanned=%d deleted=%d limit=%s', scanned, deleted, str(limit))
 
+    def _advance_checkpoint(self, mid: int) -> None:
+        """Remember the newest memory message reflected in the cache (stored in the snapshot)."""
+        if not self.thread or mid <= 0:
+            return
+        meta = guard_snapshot.get_meta("lpgmem")
+        if int(meta.get("thread_id") or 0) != int(self.thread.id):
+            meta = {}
+        if mid > int(meta.get("last_message_id") or 0):
+            guard_snapshot.set_meta("lpgmem", thread_id=int(self.thread.id), last_message_id=int(mid))
+
+    async def _bootstrap_incremental(self) -> bool:
+        """Warm boot: ingest only messages after the snapshot checkpoint. False = do a full scan."""
+        if not self.thread or not self.boot_incremental:
+            return False
+        meta = guard_snapshot.get_meta("lpgmem")
+        since = int(meta.get("last_message_id") or 0)
+        if not since or int(meta.get("thread_id") or 0) != int(self.thread.id):
+            return False
+        if not guard_snapshot.restored_lpg_sha1():
+            return False
+        warm_boots = int(meta.get("warm_boots") or 0)
+        full_age_h = (time.time() - float(meta.get("full_scan_at") or 0)) / 3600.0
+        if (self.full_scan_every_boots > 0 and warm_boots >= self.full_scan_every_boots) or (
+            self.full_scan_every_hours > 0 and full_age_h >= self.full_scan_every_hours
+        ):
+            log.info("[lpgmem] full scan due (warm_boots=%s last_full=%.1fh ago)", warm_boots, full_age_h)
+            return False
+        try:
+            from nixe.helpers import lpg_cache_memory as cache
+        except Exception:
+            return False
+
+        loaded = 0
+        unknown = 0
+
+        async def _on_msg(msg) -> None:
+            nonlocal loaded, unknown
+            emb = (msg.embeds[0] if getattr(msg, "embeds", None) else None)
+            footer_text = (getattr(getattr(emb, "footer", None), "text", "") if emb else "") or ""
+            m = _FOOTER_RE.search(footer_text)
+            if not m:
+                if getattr(msg, "attachments", None):
+                    unknown += 1
+                return
+            sha1, ah = m.group(1).lower(), m.group(2).lower()
+            score, provider, reason, _ph = _extract_fields_from_embed(emb)
+            cache.upsert_entry(
+                {
+                    "sha1": sha1,
+                    "ahash": ah,
+                    "ok": True,
+                    "score": float(score),
+                    "via": str(provider),
+                    "reason": str(reason),
+                    "w": 0,
+                    "h": 0,
+                    "ts": float(msg.created_at.timestamp()) if getattr(msg, "created_at", None) else 0.0,
+                }
+            )
+            self._msgid_to_fp[int(msg.id)] = (sha1, ah)
+            loaded += 1
+
+        stats = await thread_crawler.crawl(self.thread, "lpgmem", on_message=_on_msg, since_id=since)
+        if stats.get("error"):
+            return False
+        self._advance_checkpoint(int(stats.get("last_message_id") or 0))
+        guard_snapshot.set_meta("lpgmem", warm_boots=warm_boots + 1)
+        log.info(
+            "[lpgmem] incremental bootstrap since=%s scanned=%s loaded=%s no_footer=%s",
+            since, stats.get("scanned"), loaded, unknown,
+        )
+        return True
+
     async def _bootstrap_from_thread(self):
         if not self.thread:
             return
@@ -234,10 +320,16 @@ class LPGCachePersistence(commands.Cog):
         backfilled = 0
         scanned = 0
         limit = None if self.boot_scan_limit <= 0 else int(self.boot_scan_limit)
+        # Reconcile against the warm-start snapshot: sha1s seen in the thread, and
+        # messages whose fingerprint is unknown (no footer, not backfilled).
+        seen_sha1: set = set()
+        unknown = 0
+        newest_mid = 0
 
         try:
             async for msg in self.thread.history(limit=limit, oldest_first=False):
                 scanned += 1
+                newest_mid = max(newest_mid, int(getattr(msg, "id", 0) or 0))
                 sha1 = ""
                 ah = ""
                 # Parse footer if present
@@ -270,16 +362,18 @@ class LPGCachePersistence(commands.Cog):
                             }
                         )
                         self._msgid_to_fp[int(msg.id)] = (sha1, ah)
+                        seen_sha1.add(sha1)
                         loaded += 1
                     except Exception:
                         continue
                     continue
 
                 # No footer: optionally backfill by downloading attachment (bounded)
-                if backfilled >= self.backfill_per_boot:
-                    continue
                 if not msg.attachments:
                     continue
+                if backfilled >= self.backfill_per_boot:
+                    unknown += 1
+                    continue
                 try:
                     att = msg.attachments[0]
                     # Hard safety: skip huge attachments on render
@@ -297,7 +391,10 @@ class LPGCachePersistence(commands.Cog):
                     ah = str(ent.get("ahash") or "")
                     if sha1:
                         self._msgid_to_fp[int(msg.id)] = (sha1, ah)
+                        seen_sha1.add(sha1)
                         loaded += 1
+                    else:
+                        unknown += 1
                     backfilled += 1
 
                     # Optional: write footer back for faster future boots (minipc default ON)
@@ -311,20 +408,43 @@ class LPGCachePersistence(commands.Cog):
                         except Exception:
                             pass
                 except Exception:
+                    unknown += 1
                     continue
 
+            dropped = self._reconcile_snapshot(seen_sha1, complete=(limit is None or scanned < limit) and unknown == 0)
+            self._advance_checkpoint(newest_mid)
+            guard_snapshot.set_meta("lpgmem", warm_boots=0, full_scan_at=time.time())
             log.info(
-                "[lpgmem] bootstrap scanned=%s loaded=%s backfilled=%s (render=%s minipc=%s)",
+                "[lpgmem] bootstrap scanned=%s loaded=%s backfilled=%s snapshot_dropped=%s (render=%s minipc=%s)",
                 scanned,
                 loaded,
                 backfilled,
+                dropped,
                 self.render,
                 self.minipc,
             )
         except Exception as e:
             log.warning("[lpgmem] bootstrap failed: %r", e)
 
-    
+    def _reconcile_snapshot(self, seen_sha1: set, complete: bool) -> int:
+        """Drop snapshot-restored entries whose memory message is gone from the thread.
+
+        Only runs after a complete scan where every message yielded a fingerprint;
+        otherwise a missing sha1 could simply be an unscanned message.
+        """
+        if not complete:
+            return 0
+        try:
+            from nixe.helpers import guard_snapshot
+            from nixe.helpers import lpg_cache_memory as cache
+        except Exception:
+            return 0
+        dropped = 0
+        for sha1 in guard_snapshot.restored_lpg_sha1() - seen_sha1:
+            cache.remove_sha1(sha1)
+            dropped += 1
+        return dropped
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         # Track msg_id→sha1 for newly created memory entries so delete=unlearn is reliable.
@@ -349,6 +469,7 @@ class LPGCachePersistence(commands.Cog):
                 cache.register_msgid_fp(mid, sha1, ah)
             except Exception:
                 pass
+            self._advance_checkpoint(mid)
         except Exception:
             return
 
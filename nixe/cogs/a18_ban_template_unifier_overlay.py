@@ -1,12 +1,15 @@
 
 from __future__ import annotations
 import os, logging, discord, aiohttp, io
-from PIL import Image
 from discord.ext import commands
+from nixe.helpers.lazy_import import lazy_module
 from ..cogs.ban_embed import build_ban_embed, build_classification_embed, build_ban_evidence_payload, build_ban_evidence_file
 from ..config_ids import LOG_BOTPHISHING, TESTBAN_CHANNEL_ID
+from nixe.helpers.resolver import resolve_channel
 log = logging.getLogger("nixe.cogs.ban_template_unifier")
 
+Image = lazy_module("PIL.Image")
+
 def _pick_log_channel_id(guild: discord.Guild) -> int:
     for k in ("PHISH_LOG_CHANNEL_ID", "PHISH_LOG_CHAN_ID"):
         v = os.getenv(k)
@@ -120,7 +123,7 @@ class BanTemplateUnifier(commands.Cog):
         try:
             cid = _pick_log_channel_id(guild)
             if cid:
-                ch = guild.get_channel(cid) or await self.bot.fetch_channel(cid)
+                ch = await resolve_channel(self.bot, cid)
                 payload = build_ban_evidence_payload(guild=guild, target=user, moderator=moderator, reason=reason, evidence=ev)
                 fn = f"ban_evidence_{int(getattr(user,'id',0) or 0)}.json"
                 f = build_ban_evidence_file(payload, filename=fn)
@@ -6,6 +6,7 @@ from discord.ext import commands
 from ..cogs.ban_embed import build_ban_embed
 from nixe.helpers import phish_evidence_cache as _pec
 from ..config_ids import LOG_BOTPHISHING, TESTBAN_CHANNEL_ID
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger("nixe.cogs.first_touchdown_ban_enforcer")
 
@@ -58,7 +59,7 @@ async def _patch_instance(bot: commands.Bot, cog: commands.Cog):
             embed = build_ban_embed(target=m.author, moderator=moderator, reason=reason_default, guild=m.guild, evidence_url=None, simulate=False, evidence=ev)
             cid = _pick_log_channel_id()
             if cid:
-                ch = m.guild.get_channel(cid) or await bot.fetch_channel(cid)
+                ch = await resolve_channel(bot, cid)
                 sent = await ch.send(embed=embed)
                 if ttl > 0:
                     await asyncio.sleep(ttl)
@@ -19,6 +19,12 @@ def collect_metrics(bot) -> Dict[str, Any]:
     except Exception: pass
     try: m["guilds"] = len(bot.guilds)
     except Exception: pass
+    try: m["yt_watchlist_store"] = bot.get_cog("YouTubeWuWaLiveAnnouncer").watchlist_store_metrics()
+    except Exception: pass
+    try:
+        from nixe.helpers.host_governor import host_state
+        m["http_hosts"] = host_state()
+    except Exception: pass
     return m
 
 class MetricsOverlay(commands.Cog):
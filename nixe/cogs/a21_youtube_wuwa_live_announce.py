@@ -2,14 +2,20 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import io
 import json
 import hashlib
+import heapq
+import itertools
 import logging
 import os
 import pathlib
+import random
 import re
+import time
 import unicodedata
+from collections import deque
 import html as _html
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
@@ -25,9 +31,21 @@ except Exception:  # pragma: no cover
     _adlim = None
 import discord
 from discord.ext import commands, tasks
+from nixe.helpers.resolver import resolve_channel
+from nixe.helpers import host_governor as _hostgov
 
 log = logging.getLogger("nixe.cogs.a21_youtube_wuwa_live_announce")
 
+# Shared per-host token buckets + 429/1015 circuits for every outbound YouTube request.
+_HTTP_GOVERNOR = _hostgov.GOVERNOR
+
+
+def _url_host(url: str) -> str:
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except Exception:
+        return ""
+
 # ---------------------------------------------------------------------------
 # Cross-task de-dupe guard
 # Prevents duplicate announce posts when the loop is accidentally started twice
@@ -243,6 +261,43 @@ BOOT_GRACE_SECONDS = _env_int("NIXE_YT_WUWA_BOOT_GRACE_SECONDS", 30)
 ANNOUNCE_MAX_AGE_MINUTES = _env_int("NIXE_YT_WUWA_ANNOUNCE_MAX_AGE_MINUTES", 0)
 DEBUG = os.getenv("NIXE_YT_WUWA_DEBUG", "0").strip() == "1"
 
+# Streaming page fetch: /live and watch pages are read in chunks and the connection is closed
+# once ytInitialPlayerResponse is parsed (it sits in the first part of the document).
+STREAM_FETCH = os.getenv("NIXE_YT_WUWA_STREAM_FETCH", "1").strip() == "1"
+STREAM_MAX_BYTES = max(65536, _env_int("NIXE_YT_WUWA_STREAM_MAX_BYTES", 1500000))
+
+# Feed-first tier: poll each channel's Atom feed with conditional GET (ETag / Last-Modified) and
+# only scrape /live when the feed lists a new video id, a known scheduled start is near, or the
+# periodic safety scrape is due (the feed lags behind instant lives by a few minutes, so the
+# safety scrape defaults to every third poll).
+FEED_TIER = os.getenv("NIXE_YT_WUWA_FEED_TIER", "1").strip() == "1"
+FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+FEED_PREROLL_SECONDS = _env_int("NIXE_YT_WUWA_FEED_PREROLL_SECONDS", 300)
+FEED_LATE_SECONDS = _env_int("NIXE_YT_WUWA_FEED_LATE_SECONDS", 1800)
+FEED_FULL_SCRAPE_SECONDS = _env_int("NIXE_YT_WUWA_FEED_FULL_SCRAPE_SECONDS", POLL_SECONDS * 3)
+_FEED_VID_RE = re.compile(r"<yt:videoId>([A-Za-z0-9_-]{6,})</yt:videoId>")
+_FEED_SEEN_MAX = 50
+
+# Per-target poll scheduler: the loop ticks every SCHED_TICK_SECONDS and only checks targets
+# that are due. Idle targets back off from POLL_SECONDS to SCHED_MAX_SECONDS; targets with a
+# scheduled start are polled every SCHED_DENSE_SECONDS around it. Lives without a schedule are
+# only caught by idle polls, so the back-off is capped at a few polls (at most six).
+SCHED_TICK_SECONDS = max(1, _env_int("NIXE_YT_WUWA_SCHED_TICK_SECONDS", 5))
+SCHED_DENSE_SECONDS = max(1, _env_int("NIXE_YT_WUWA_SCHED_DENSE_SECONDS", 10))
+SCHED_MAX_SECONDS = min(POLL_SECONDS * 6, max(POLL_SECONDS, _env_int("NIXE_YT_WUWA_SCHED_MAX_SECONDS", POLL_SECONDS * 3)))
+SCHED_JITTER = min(0.5, max(0.0, _env_float("NIXE_YT_WUWA_SCHED_JITTER", 0.1)))
+
+# State writes are coalesced: mutations only mark the state dirty; it is written once per loop
+# tick, or STATE_FLUSH_SECONDS after the first mutation outside the loop, and on unload.
+STATE_FLUSH_SECONDS = max(0.5, _env_float("NIXE_YT_WUWA_STATE_FLUSH_SECONDS", 5.0))
+
+# Durable announce index (state["announce_index"]: video_id -> [channel_id, message_id, unix_ts]).
+# Built from channel history once per announce channel, then maintained at send time and topped
+# up from the messages after the last indexed one before a miss is trusted (other instances post
+# too). Entries past the age bound are pruned every ANNOUNCE_INDEX_PRUNE_SECONDS.
+ANNOUNCE_INDEX_MAX_AGE_DAYS = max(1, _env_int("NIXE_YT_WUWA_ANNOUNCE_INDEX_MAX_AGE_DAYS", 30))
+ANNOUNCE_INDEX_PRUNE_SECONDS = max(60, _env_int("NIXE_YT_WUWA_ANNOUNCE_INDEX_PRUNE_SECONDS", 3600))
+
 # If enabled, let Discord generate the native YouTube embed (play button overlay).
 # When disabled, Nixe uses a custom embed with a static thumbnail + "Watch" button.
 ANNOUNCE_NATIVE_EMBED = os.getenv("NIXE_YT_WUWA_ANNOUNCE_NATIVE_EMBED", "1").strip() == "1"
@@ -264,6 +319,8 @@ WATCHLIST_STORE_MARKER = "[yt-wuwa-watchlist]"
 WATCHLIST_STORE_ATTACHMENT_NAME = "youtube_wuwa_watchlist.json"
 WATCHLIST_CLEAN_THREAD = os.getenv("NIXE_YT_WUWA_WATCHLIST_CLEAN_THREAD", "1").strip() == "1"
 WATCHLIST_STORE_MAX_HISTORY_SCAN = _env_int("NIXE_YT_WUWA_WATCHLIST_STORE_MAX_HISTORY_SCAN", 50)
+# The store message is re-fetched on edit events; without one it is only re-checked this often.
+WATCHLIST_STORE_REFRESH_SECONDS = max(float(POLL_SECONDS), _env_float("NIXE_YT_WUWA_WATCHLIST_STORE_REFRESH_SECONDS", 600.0))
 
 
 
@@ -310,7 +367,7 @@ def _extract_channel_title_from_html(html: str) -> Optional[str]:
 
     # Fallback: try to extract channel title from ytInitialData channelMetadataRenderer
     try:
-        blob = _extract_yt_var_json(html, "ytInitialData") or _extract_json_blob(html, _YTID_RE)
+        blob = _find_yt_var_json(html, "ytInitialData")
         if isinstance(blob, dict):
             # Walk a few common paths
             md = (blob.get("metadata") or {}).get("channelMetadataRenderer") if isinstance(blob.get("metadata"), dict) else None
@@ -389,13 +446,24 @@ def _read_json_any(p: str) -> Optional[Dict[str, Any]]:
     return None
 
 def _write_json_best_effort(p: str, data: Dict[str, Any]) -> None:
+    # Serialize first, then tmp file + os.replace: a crash mid-write never leaves a torn file.
+    try:
+        raw = json.dumps(data, ensure_ascii=False, indent=2)
+    except Exception:
+        return
     for cand in _candidate_paths(p):
+        tmp = f"{cand}.tmp"
         try:
             os.makedirs(os.path.dirname(cand), exist_ok=True)
-            with open(cand, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(raw)
+            os.replace(tmp, cand)
             return
         except Exception:
+            try:
+                os.remove(tmp)
+            except Exception:
+                pass
             continue
 
 def _watchlist_cfg_digest(cfg: Optional[Dict[str, Any]]) -> str:
@@ -472,6 +540,153 @@ def _extract_yt_var_json(html: str, var_name: str) -> Optional[Dict[str, Any]]:
     except Exception:
         return None
     return None
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _find_yt_var_json(html: str, var_name: str, start: int = 0) -> Optional[Dict[str, Any]]:
+    """Decode the JSON object assigned to `var_name` (`var ytInitialPlayerResponse = {...};`).
+
+    Locates the marker with str.find and decodes with JSONDecoder.raw_decode straight
+    from the opening brace: no per-character Python loop and no copy of the blob.
+    Occurrences that are not an assignment of an object literal are skipped.
+    """
+    if not html or not var_name:
+        return None
+    n = len(html)
+    pos = max(0, start)
+    while True:
+        anchor = html.find(var_name, pos)
+        if anchor < 0:
+            return None
+        pos = anchor + len(var_name)
+        i = pos
+        # also matches window["ytInitialPlayerResponse"] = {...}
+        while i < n and html[i] in "\"']] \t\r\n":
+            i += 1
+        if i >= n or html[i] != "=" or html.startswith("==", i):
+            continue
+        i += 1
+        while i < n and html[i] in " \t\r\n":
+            i += 1
+        if i < n and html[i] == "{":
+            try:
+                obj, _end = _JSON_DECODER.raw_decode(html, i)
+            except ValueError:
+                continue
+            if isinstance(obj, dict):
+                return obj
+
+
+async def _parse_yt_var_json(html: Optional[str], var_name: str) -> Optional[Dict[str, Any]]:
+    """`_find_yt_var_json` in a worker thread (pages are several hundred KB)."""
+    if not html:
+        return None
+    return await asyncio.to_thread(_find_yt_var_json, html, var_name)
+
+
+# Object literal terminators seen after the embedded JSON; a decode is only attempted once one
+# of them has arrived after the marker, so a streamed page is not re-parsed for every chunk.
+_STREAM_END_HINTS = ("};", "}</script")
+
+
+class _YtVarStreamScanner:
+    """Resumable `_find_yt_var_json` over a page that arrives in chunks.
+
+    `feed()` only does the cheap part on the event loop: it keeps a small tail of the
+    previous chunk so markers split across chunk boundaries are found, remembers where the
+    first marker sits, and says when a terminator has arrived. `decode()` joins the buffer
+    and decodes from the marker; it is blocking and run in a worker thread.
+    """
+
+    def __init__(self, var_name: str):
+        self.var_name = var_name
+        self.result: Optional[Dict[str, Any]] = None
+        self._parts: List[str] = []
+        self._len = 0
+        self._tail = ""
+        self._anchor = -1
+        self._keep = max(len(var_name), max(len(h) for h in _STREAM_END_HINTS)) + 1
+
+    def text(self) -> str:
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def feed(self, chunk: str) -> bool:
+        """Buffer `chunk`; True when a decode is worth attempting (marker and a terminator seen)."""
+        if self.result is not None or not chunk:
+            return False
+        window = self._tail + chunk
+        base = self._len - len(self._tail)
+        self._parts.append(chunk)
+        self._len += len(chunk)
+        self._tail = window[-self._keep:]
+        if self._anchor < 0:
+            k = window.find(self.var_name)
+            if k < 0:
+                return False
+            self._anchor = base + k
+        return any(h in window for h in _STREAM_END_HINTS)
+
+    def decode(self) -> Optional[Dict[str, Any]]:
+        if self.result is None and self._anchor >= 0:
+            self.result = _find_yt_var_json(self.text(), self.var_name, self._anchor)
+        return self.result
+
+
+async def _stream_yt_var_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    var_name: str,
+    *,
+    max_bytes: int,
+    chunk_bytes: int = 65536,
+) -> Tuple[Optional[str], Optional[Dict[str, Any]], Dict[str, Any]]:
+    """GET `url` in chunks until `var_name` is decoded or `max_bytes` have been read.
+
+    The connection is closed as soon as either happens, so the rest of the page is never
+    downloaded. Returns (html read so far, decoded object, stats); html is None on HTTP error.
+    `stats["total"]` is the full body size when the server announced it (uncompressed
+    Content-Length), else None.
+    """
+    stats: Dict[str, Any] = {"read": 0, "total": None, "early": False, "status": None}
+    scanner = _YtVarStreamScanner(var_name)
+    async with session.get(url, allow_redirects=True) as r:
+        stats["status"] = r.status
+        if r.status != 200:
+            try:
+                body = await r.text()
+            except Exception:
+                body = ''
+            # kept for the host governor (429 / block page detection)
+            stats["body"] = body[:4000]
+            stats["retry_after"] = r.headers.get("Retry-After")
+            if DEBUG:
+                log.warning('[yt-wuwa] http %s %s status=%s body=%s', r.method, url, r.status, body[:200])
+            return None, None, stats
+        if r.content_length is not None and not r.headers.get("Content-Encoding"):
+            stats["total"] = int(r.content_length)
+        decoder = codecs.getincrementaldecoder(r.charset or "utf-8")(errors="replace")
+        found = None
+        while True:
+            data = await r.content.read(chunk_bytes)
+            if not data:
+                scanner.feed(decoder.decode(b"", final=True))
+                found = await asyncio.to_thread(scanner.decode)
+                break
+            stats["read"] += len(data)
+            if scanner.feed(decoder.decode(data)):
+                found = await asyncio.to_thread(scanner.decode)
+            if found is not None or stats["read"] >= max_bytes:
+                stats["early"] = not r.content.at_eof()
+                if stats["early"]:
+                    r.close()
+                break
+    return scanner.text(), found, stats
+
+
 def _extract_json_blob(html: str, rx: re.Pattern) -> Optional[Dict[str, Any]]:
     m = rx.search(html)
     if not m:
@@ -608,11 +823,404 @@ class Target:
             return f"https://www.youtube.com/channel/{self.channel_id}"
         return None
 
+def _is_display_name(nm: str) -> bool:
+    nm = (nm or "").strip()
+    return bool(nm) and not nm.startswith(("@", "＠")) and not _UC_ID_LIKE_RE.match(nm)
+
+
+def _identity_alias(alias: Any) -> str:
+    a = str(alias or "").strip()
+    if a.startswith("＠"):
+        a = "@" + a[1:]
+    return a.rstrip("/").lower()
+
+
+_UC_ALIAS_RE = re.compile(r"^uc[0-9a-z_-]{20,}$")
+
+
+def _is_strong_alias(alias: str) -> bool:
+    """Handles, URLs and channel ids name exactly one channel; free text (names, queries) does not."""
+    return alias.startswith("@") or "/" in alias or bool(_UC_ALIAS_RE.match(alias))
+
+
+_LEGACY_HANDLE_URL_RE = re.compile(r"/(@[^/?#]+)")
+_LEGACY_CHANNEL_URL_RE = re.compile(r"/channel/(UC[0-9A-Za-z_-]{20,})")
+
+
+def _legacy_channel_key(alias: str) -> str:
+    """The channel a legacy alias names on its own: "@handle" for a handle or handle URL, the
+    case-folded id for a UC id or /channel/ URL, the URL otherwise; "" for free text."""
+    a = _identity_alias(alias)
+    if not _is_strong_alias(a):
+        return ""
+    m = _LEGACY_HANDLE_URL_RE.search(a) or _LEGACY_CHANNEL_URL_RE.search(str(alias))
+    return _identity_alias(m.group(1)) if m else a
+
+
+def _legacy_channel_id(alias: str) -> str:
+    if _UC_ID_LIKE_RE.match(alias):
+        return alias
+    m = _LEGACY_CHANNEL_URL_RE.search(alias)
+    return m.group(1) if m else ""
+
+
+@dataclass
+class ChannelIdentity:
+    """Canonical record for one YouTube channel (keyed by channel_id once it is known)."""
+    channel_id: str = ""
+    title: str = ""
+    url: str = ""
+    handle: str = ""
+
+    def to_json(self) -> Dict[str, str]:
+        return {k: v for k, v in (("channel_id", self.channel_id), ("title", self.title),
+                                  ("url", self.url), ("handle", self.handle)) if v}
+
+
+class _ChannelIdentityStore:
+    """One ChannelIdentity per channel plus an alias -> record key map.
+
+    Backed by state["identities"] = {"channels": {key: record}, "aliases": {alias: key}}; the
+    key is the channel_id, or the channel URL / first alias until the id is learned (the
+    record is re-keyed then). Aliases are handles, URLs, queries and names, case-folded.
+    Only handles, URLs and channel ids identify a record when merging; names and queries are
+    lookup hints (two channels can share a display name) and one claimed by two records maps
+    to "" so it resolves to neither.
+    """
+
+    def __init__(self, state: Dict[str, Any]):
+        box = state.get("identities")
+        if not isinstance(box, dict):
+            box = state["identities"] = {}
+        self._channels_json: Dict[str, Dict[str, str]] = box.setdefault("channels", {})
+        self._aliases: Dict[str, str] = box.setdefault("aliases", {})
+        self._records: Dict[str, ChannelIdentity] = {}
+        for key, rec in list(self._channels_json.items()):
+            if isinstance(rec, dict):
+                ident = ChannelIdentity(**{k: str(rec.get(k) or "") for k in ("channel_id", "title", "url", "handle")})
+                if not _is_display_name(ident.title):
+                    ident.title = ""
+                self._records[key] = ident
+            else:
+                del self._channels_json[key]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def lookup(self, *aliases: Any) -> Optional[ChannelIdentity]:
+        for a in aliases:
+            if not a:
+                continue
+            key = self._aliases.get(a)
+            if key is None:
+                key = self._aliases.get(_identity_alias(a))
+            if key is not None:
+                rec = self._records.get(key)
+                if rec is not None:
+                    return rec
+        return None
+
+    def title_for(self, *aliases: Any) -> Optional[str]:
+        """First display name known for any of `aliases` (remember() never stores handles / UC ids)."""
+        al, recs = self._aliases, self._records
+        for a in aliases:
+            if not a:
+                continue
+            key = al.get(a)
+            if key is None:
+                key = al.get(_identity_alias(a))
+            rec = recs.get(key) if key is not None else None
+            if rec is not None and rec.title:
+                return rec.title
+        return None
+
+    def channel_id_for(self, *aliases: Any) -> str:
+        rec = self.lookup(*aliases)
+        return rec.channel_id if rec is not None else ""
+
+    def remember(self, aliases: List[Any], *, channel_id: str = "", title: str = "", url: str = "",
+                 handle: str = "") -> bool:
+        """Merge what is known about a channel; returns True when anything changed."""
+        channel_id = (channel_id or "").strip()
+        names = [_identity_alias(a) for a in aliases if a and str(a).strip()]
+        if channel_id:
+            names.insert(0, _identity_alias(channel_id))
+        if url:
+            names.append(_identity_alias(url))
+        if handle:
+            names.append(_identity_alias(handle))
+        names = list(dict.fromkeys(n for n in names if n))
+        if not names:
+            return False
+
+        strong = [n for n in names if _is_strong_alias(n)]
+        keys = [self._aliases[n] for n in strong if self._aliases.get(n) in self._records]
+        # a record keyed by one of these names / queries was made from that text alone
+        # (a query-only target): it is this channel's; other records sharing a name are not
+        keys = list(dict.fromkeys(keys + [n for n in names if n not in strong and n in self._records
+                                          and not self._records[n].channel_id]))
+        if channel_id:
+            # an alias shared with a different, known channel (e.g. a display name) does not merge them
+            keys = [k for k in keys if self._records[k].channel_id in ("", channel_id)]
+        changed = False
+        key = channel_id if channel_id in keys else (keys[0] if keys else None)
+        if channel_id and key is not None and key != channel_id:
+            key = self._rekey(key, channel_id)
+            changed = True
+        for other in keys:
+            if other != key and other in self._records and not self._records[other].channel_id:
+                # a pseudo record (no channel id yet) for the same channel: fold it in
+                self._rekey(other, key)
+                changed = True
+        if key is None:
+            key = channel_id or (_identity_alias(url) if url else names[0])
+        rec = self._records.get(key)
+        if rec is None:
+            rec = self._records[key] = ChannelIdentity()
+            changed = True
+        for field, val in (("channel_id", channel_id), ("url", url), ("handle", handle)):
+            if val and getattr(rec, field) != val:
+                setattr(rec, field, val)
+                changed = True
+        if title and _is_display_name(title) and rec.title != title:
+            rec.title = title
+            changed = True
+        for n in names:
+            cur = self._aliases.get(n)
+            if cur == key or (cur == "" and n not in strong):
+                continue
+            # a name / query already pointing at another channel becomes ambiguous
+            self._aliases[n] = "" if n not in strong and cur in self._records else key
+            changed = True
+        if changed:
+            self._channels_json[key] = rec.to_json()
+        return changed
+
+    def _rekey(self, old: str, new: str) -> str:
+        """Move record `old` under its channel id `new`, merging into an existing record."""
+        rec = self._records.pop(old)
+        self._channels_json.pop(old, None)
+        cur = self._records.get(new)
+        if cur is not None:
+            for field in ("title", "url", "handle"):
+                if not getattr(cur, field) and getattr(rec, field):
+                    setattr(cur, field, getattr(rec, field))
+            rec = cur
+        self._records[new] = rec
+        self._channels_json[new] = rec.to_json()
+        for a, k in list(self._aliases.items()):
+            if k == old:
+                self._aliases[a] = new
+        return new
+
+    def migrate_legacy(self, state: Dict[str, Any]) -> int:
+        """Fold the old alias-keyed maps into the store and drop them from `state`.
+
+        Handles state["resolved"] entries of both shapes (dict and bare display-name
+        string), its "url_to_name" sub-map, yt_channel_name_cache and channel_ids.
+        """
+        moved = 0
+        resolved = state.pop("resolved", None)
+        if isinstance(resolved, dict):
+            url_to_name = resolved.pop("url_to_name", None)
+            # Bare strings were written for all aliases of one channel at once, with its
+            # display name as the value. Two channels can share that name, so group by the
+            # channel each handle / URL / id names instead; a bare name joins the group(s)
+            # carrying it (shared by two it resolves to neither).
+            bare: List[Tuple[str, str]] = []
+            for alias, v in resolved.items():
+                if isinstance(v, dict):
+                    self.remember([alias], channel_id=str(v.get("channel_id") or ""),
+                                  title=str(v.get("title") or v.get("name") or ""), url=str(v.get("url") or ""))
+                    moved += 1
+                elif isinstance(v, str) and v.strip():
+                    bare.append((str(alias), v.strip()))
+            if isinstance(url_to_name, dict):
+                bare.extend((str(u), nm.strip()) for u, nm in url_to_name.items()
+                            if u and isinstance(nm, str) and nm.strip())
+            groups: Dict[str, Tuple[str, List[str]]] = {}
+            names: List[Tuple[str, str]] = []
+            for alias, title in bare:
+                key = _legacy_channel_key(alias)
+                if key:
+                    groups.setdefault(key, (title, []))[1].append(alias)
+                else:
+                    names.append((alias, title))
+            for alias, title in names:
+                owners = [k for k, (t, _g) in groups.items() if t == title]
+                for k in owners:
+                    groups[k][1].append(alias)
+                if not owners:
+                    self.remember([alias], title=title)
+            for key, (title, group) in groups.items():
+                cids = {c for c in map(_legacy_channel_id, group) if c}
+                self.remember([key, *group], channel_id=cids.pop() if len(cids) == 1 else "", title=title)
+            moved += len(bare)
+        for cid, nm in (state.pop("yt_channel_name_cache", None) or {}).items():
+            if isinstance(nm, str):
+                self.remember([cid], channel_id=str(cid), title=nm)
+                moved += 1
+        for alias, cid in (state.pop("channel_ids", None) or {}).items():
+            if isinstance(cid, str) and cid:
+                self.remember([alias], channel_id=cid)
+                moved += 1
+        # Fold leftover name-only pseudo records into the one known channel carrying the same
+        # name; a record made from a handle / URL is its own channel even when the names match.
+        by_name: Dict[str, List[str]] = {}
+        for key, rec in self._records.items():
+            if rec.channel_id and rec.title:
+                by_name.setdefault(rec.title, []).append(key)
+        for key, rec in list(self._records.items()):
+            owners = by_name.get(rec.title) if not rec.channel_id and not _is_strong_alias(key) else None
+            if owners and len(owners) == 1:
+                self._rekey(key, owners[0])
+        return moved
+
+
+class _PollScheduler:
+    """Per-target poll schedule: a heap of (due, seq, key) with lazy invalidation.
+
+    Idle targets back off exponentially from `base` to `max_interval`. A target with a known
+    scheduled start wakes up `preroll` seconds before it and is polled every `dense` seconds
+    until `late` seconds after it. Intervals get +/- `jitter` so targets drift apart instead of
+    hitting YouTube in bursts. `clock` and `rng` are injectable for tests.
+    """
+
+    def __init__(self, *, base: float, dense: float, max_interval: float, preroll: float, late: float,
+                 jitter: float = 0.0, clock=time.time, rng=random.random):
+        self.base = float(base)
+        self.dense = float(dense)
+        self.max_interval = max(float(max_interval), self.base)
+        self.preroll = float(preroll)
+        self.late = float(late)
+        self.jitter = float(jitter)
+        self.clock = clock
+        self._rng = rng
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _push(self, key: str, due: float, interval: float, reason: str) -> None:
+        e = self._entries.setdefault(key, {"idle": 0})
+        seq = next(self._seq)
+        e.update(due=due, seq=seq, interval=interval, reason=reason)
+        heapq.heappush(self._heap, (due, seq, key))
+
+    def _jittered(self, interval: float) -> float:
+        if self.jitter <= 0:
+            return interval
+        return max(1.0, interval * (1.0 + self.jitter * (2.0 * self._rng() - 1.0)))
+
+    def sync(self, keys: List[str]) -> None:
+        """Track exactly `keys`; new ones become due within the next `dense` seconds."""
+        now = self.clock()
+        want = list(dict.fromkeys(k for k in keys if k))
+        wanted = set(want)
+        for k in [k for k in self._entries if k not in wanted]:
+            del self._entries[k]  # its heap entries are skipped as stale
+        for k in want:
+            if k not in self._entries:
+                self._push(k, now + self._rng() * self.dense, 0.0, "new")
+        if len(self._heap) > 4 * max(16, len(self._entries)):
+            self._heap = [h for h in self._heap if self._entries.get(h[2], {}).get("seq") == h[1]]
+            heapq.heapify(self._heap)
+
+    def pop_due(self, now: Optional[float] = None) -> List[str]:
+        """Keys whose due time has passed; they stay in flight until `reschedule`."""
+        now = self.clock() if now is None else now
+        out: List[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            _due, seq, key = heapq.heappop(self._heap)
+            e = self._entries.get(key)
+            if e is None or e.get("seq") != seq:
+                continue
+            e["seq"] = -1
+            e["reason"] = "in-flight"
+            out.append(key)
+        return out
+
+    def reschedule(self, key: str, *, live: bool = False, start_ts: Optional[float] = None,
+                   failed: bool = False, now: Optional[float] = None) -> Optional[float]:
+        """Queue `key` again after a check; returns the next due time."""
+        e = self._entries.get(key)
+        if e is None:
+            return None
+        now = self.clock() if now is None else now
+        backoff = min(self.max_interval, self.base * (2 ** min(int(e.get("idle") or 0), 16)))
+        if start_ts is not None and now < start_ts + self.late:
+            wake = start_ts - self.preroll
+            if now >= wake:
+                e["idle"] = 0
+                interval, reason = self._jittered(self.dense), "scheduled"
+            else:
+                # never jitter past the pre-roll wake-up
+                interval = min(self._jittered(backoff), wake - now)
+                reason = "waiting-start" if interval >= wake - now else "idle"
+                e["idle"] = int(e.get("idle") or 0) + 1
+        elif live:
+            e["idle"] = 0
+            interval, reason = self._jittered(self.base), "live"
+        elif failed:
+            interval, reason = self._jittered(self.base), "retry"
+        else:
+            e["idle"] = int(e.get("idle") or 0) + 1
+            interval, reason = self._jittered(backoff), "idle"
+        self._push(key, now + interval, interval, reason)
+        return now + interval
+
+    def snapshot(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        now = self.clock() if now is None else now
+        rows = []
+        for key, e in self._entries.items():
+            in_flight = e.get("seq") == -1
+            rows.append({
+                "key": key,
+                "due_in": None if in_flight else round(float(e.get("due") or 0) - now, 1),
+                "interval": round(float(e.get("interval") or 0), 1),
+                "reason": e.get("reason"),
+                "idle": int(e.get("idle") or 0),
+            })
+        rows.sort(key=lambda r: (r["due_in"] is not None, r["due_in"] or 0.0))
+        return rows
+
+    def requeue_in_flight(self, now: Optional[float] = None) -> int:
+        """Retry keys popped by `pop_due` that never got a result (check skipped or crashed)."""
+        keys = [k for k, e in self._entries.items() if e.get("seq") == -1]
+        for k in keys:
+            self.reschedule(k, failed=True, now=now)
+        return len(keys)
+
+
+_SCHEDULER: Optional[_PollScheduler] = None
+
+
+def schedule_snapshot() -> Dict[str, Any]:
+    """Debug view of the poll queue (served at /yt/schedule)."""
+    sch = _SCHEDULER
+    if sch is None:
+        return {"ok": False, "error": "announcer not loaded"}
+    return {"ok": True, "now": int(sch.clock()), "targets": len(sch), "queue": sch.snapshot()}
+
+
 class YouTubeWuWaLiveAnnouncer(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.session: Optional[aiohttp.ClientSession] = None
         self.sem = asyncio.Semaphore(max(1, CONCURRENCY))
+        # Per-poll page fetch counters (debug log) + last full page size per kind, used to
+        # estimate bytes saved when the response is compressed and has no usable length.
+        self._fetch_stats: Dict[str, int] = {}
+        self._page_bytes: Dict[str, int] = {}
+        self.scheduler = _PollScheduler(
+            base=POLL_SECONDS, dense=SCHED_DENSE_SECONDS, max_interval=SCHED_MAX_SECONDS,
+            preroll=FEED_PREROLL_SECONDS, late=FEED_LATE_SECONDS, jitter=SCHED_JITTER,
+        )
+        global _SCHEDULER
+        _SCHEDULER = self.scheduler
+        self._watchlist_pulled_at: float = 0.0
         self.boot_time = datetime.now(timezone.utc)
 
         self.watchlist_thread_id: int = 0
@@ -626,10 +1234,30 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         # Pre-seed thread id so on_message can work even before _ensure_watchlist_thread() runs.
         if WATCHLIST_THREAD_ID_OVERRIDE:
             self.watchlist_thread_id = int(WATCHLIST_THREAD_ID_OVERRIDE)
-        self.state: Dict[str, Any] = _read_json_any(STATE_PATH) or {}
+        self._state_path = STATE_PATH  # bound once: a later change of STATE_PATH never redirects writes
+        self.state: Dict[str, Any] = _read_json_any(self._state_path) or {}
         self.state.setdefault("announced", {})   # key -> last video_id
         self.state.setdefault("announced_vids", {})  # video_id -> unix_ts
-        self.state.setdefault("resolved", {})    # query/name -> {"channel_id","title","url"}
+        self.state.setdefault("feed", {})        # channel_id -> {"etag","last_modified","seen","upcoming","scraped_at"}
+        # channel_id -> ChannelIdentity, plus handle/url/query -> channel_id (replaces "resolved",
+        # "channel_ids" and "yt_channel_name_cache", which are migrated here once).
+        self._feed_stats: Dict[str, int] = {}
+        self._state_dirty = False
+        self._state_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._state_writes = 0
+        self.identities = _ChannelIdentityStore(self.state)
+        if self.identities.migrate_legacy(self.state):
+            # written with the first loop tick (or on unload), never from the constructor
+            log.info('[yt-wuwa] migrated legacy channel caches -> %d identities', len(self.identities))
+            self._mark_state_dirty()
+        # Watchlist store cache: (message_id, edited_at, attachment.id, size) -> parsed cfg.
+        self._store_sig: Optional[Tuple[int, str, int, int]] = None
+        self._store_cfg: Optional[Dict[str, Any]] = None
+        self._store_checked_at: float = 0.0
+        self._store_edit_seen: bool = False
+        self._store_avoided: deque = deque()     # monotonic ts of downloads skipped (last hour)
+        self._store_downloads: deque = deque()   # monotonic ts of attachment downloads (last hour)
+        self._store_avoided_total = 0
 
         self.watch: Dict[str, Any] = {}
         self.targets: List[Target] = []
@@ -645,6 +1273,11 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         # do not re-announce already-posted live videos.
         self._announce_vid_cache: set[str] = set()
         self._announce_vid_cache_ready: bool = False
+        self.state.setdefault("announce_index", {})        # video_id -> [channel_id, message_id, unix_ts]
+        self.state.setdefault("announce_index_warm", {})   # announce channel id -> unix_ts of the history build
+        self.state.setdefault("announce_index_tail", {})   # announce channel id -> newest message id indexed
+        self._prune_announce_index()
+        self._index_pruned_at: float = time.monotonic()
         # Safety cap: keep this bounded to avoid long scans on very busy channels.
         self._announce_history_scan_limit: int = max(0, min(5000, _env_int("NIXE_YT_WUWA_ANNOUNCE_HISTORY_SCAN_LIMIT", 500)))
 
@@ -704,11 +1337,38 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         except Exception:
             pass
 
+    def _mark_state_dirty(self) -> None:
+        """Record a state mutation; the write happens in `_flush_state`."""
+        self._state_dirty = True
+        if self._state_flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._state_flush_handle = loop.call_later(STATE_FLUSH_SECONDS, self._flush_state)
+
+    def _flush_state(self) -> bool:
+        """Write the state file if anything changed since the last write."""
+        if self._state_flush_handle is not None:
+            self._state_flush_handle.cancel()
+            self._state_flush_handle = None
+        if not self._state_dirty:
+            return False
+        self._state_dirty = False
+        _write_json_best_effort(self._state_path, self.state)
+        self._state_writes += 1
+        return True
+
     def cog_unload(self):
         try:
             self.loop.cancel()
         except Exception:
             pass
+        try:
+            self._flush_state()
+        except Exception:
+            pass
         try:
             if getattr(self, '_send_worker_task', None):
                 self._send_worker_task.cancel()
@@ -1205,7 +1865,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         Hard requirements:
           - Self-healing: also removes duplicates already present in `existing`.
           - Unicode-safe: handle parsing + dedupe supports non-ASCII (e.g., Japanese handles).
-          - Render-safe: leverages resolved cache (self.state['resolved']) to collapse handle/url/cid variants.
+          - Render-safe: leverages the identity store (self.identities) to collapse handle/url/cid variants.
 
         Returns:
           merged_list, added_count, added_items
@@ -1290,19 +1950,13 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
             return uniq
 
         def apply_resolved_cache(d: Dict[str, str]) -> None:
-            # Use the persistent resolve cache to collapse variants (handle/url -> channel_id).
-            try:
-                res_map = self.state.get("resolved", {}) if isinstance(getattr(self, "state", None), dict) else {}
-            except Exception:
-                res_map = {}
-
+            # Use the identity store to collapse variants (handle/url -> channel_id).
+            store = getattr(self, "identities", None)
             q = (d.get("query") or "").strip()
-            if q and isinstance(res_map, dict):
-                rr = res_map.get(q)
-                if isinstance(rr, dict):
-                    cid = (rr.get("channel_id") or "").strip()
-                    title = (rr.get("title") or rr.get("name") or "").strip()
-                    url = (rr.get("url") or "").strip()
+            if q and store is not None:
+                rr = store.lookup(q)
+                if rr is not None:
+                    cid, title, url = rr.channel_id, rr.title, rr.url
                     if cid and not (d.get("channel_id") or "").strip():
                         d["channel_id"] = cid
                     if url and not (d.get("url") or "").strip():
@@ -1455,7 +2109,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         # If overridden, just fetch it.
         if WATCHLIST_THREAD_ID_OVERRIDE:
             try:
-                ch = self.bot.get_channel(WATCHLIST_THREAD_ID_OVERRIDE) or await self.bot.fetch_channel(WATCHLIST_THREAD_ID_OVERRIDE)
+                ch = await resolve_channel(self.bot, WATCHLIST_THREAD_ID_OVERRIDE)
                 if isinstance(ch, discord.Thread):
                     self.watchlist_thread_id = ch.id
                     self.watchlist_thread = ch
@@ -1616,9 +2270,15 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         try:
             await self._ensure_session()
             oembed_url = f"https://www.youtube.com/oembed?url={quote_plus(url)}&format=json"
+            host = _url_host(oembed_url)
+            if not await _HTTP_GOVERNOR.acquire(host):
+                return None
             async with self.session.get(oembed_url) as resp:
                 if resp.status != 200:
+                    body = await resp.text() if resp.status >= 400 else ""
+                    _HTTP_GOVERNOR.record(host, resp.status, resp.headers, body)
                     return None
+                _HTTP_GOVERNOR.record(host, resp.status)
                 data = await resp.json(content_type=None)
                 author = (data.get("author_name") or "").strip()
                 if not author:
@@ -1775,11 +2435,42 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
             except Exception:
                 return b"{}"
 
+    def _remember_own_store_write(self, msg: Any, payload: bytes) -> None:
+        """Point the attachment cache at what our own store edit/send just wrote.
+
+        Without this a missed edit event leaves the previous cfg cached, and the next pull
+        would write it back over WATCHLIST_PATH. If the new attachment cannot be identified
+        the cache is dropped instead (next load downloads once).
+        """
+        self._store_sig, self._store_cfg = None, None
+        try:
+            for a in list(getattr(msg, "attachments", []) or []):
+                if (a.filename or "").lower() == WATCHLIST_STORE_ATTACHMENT_NAME.lower():
+                    edited = getattr(msg, "edited_at", None)
+                    obj = json.loads(payload.decode("utf-8", errors="replace"))
+                    if isinstance(obj, dict):
+                        self._store_sig = (int(msg.id), edited.isoformat() if edited else "", int(a.id), int(a.size or 0))
+                        self._store_cfg = obj
+                        self._store_checked_at = time.monotonic()
+                    break
+        except Exception:
+            self._store_sig, self._store_cfg = None, None
+
     async def _load_watchlist_from_store_attachment(self, th: discord.Thread) -> Optional[Dict[str, Any]]:
-        """Best-effort: read canonical watchlist cfg from the bot store message attachment."""
+        """Best-effort: read canonical watchlist cfg from the bot store message attachment.
+
+        The attachment is only downloaded when (message_id, edited_at, attachment.id, size)
+        changed; while nothing was edited the cached cfg is returned without any REST call.
+        """
         try:
             mid = int(self.state.get("watchlist_store_mid") or 0)
             msg: Optional[discord.Message] = None
+            if (mid and self._store_cfg is not None and self._store_sig and self._store_sig[0] == mid
+                    and not self._store_edit_seen
+                    and time.monotonic() - self._store_checked_at < WATCHLIST_STORE_REFRESH_SECONDS):
+                self._note_store_avoided()
+                return dict(self._store_cfg)
+            self._store_edit_seen = False
             if mid:
                 try:
                     msg = await th.fetch_message(mid)
@@ -1796,7 +2487,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     if _is_canonical_watchlist_store_marker(m.content or ""):
                         msg = m
                         self.state["watchlist_store_mid"] = m.id
-                        _write_json_best_effort(STATE_PATH, self.state)
+                        self._mark_state_dirty()
                         break
 
             if msg is None:
@@ -1807,10 +2498,18 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
             for a in atts:
                 try:
                     if (a.filename or "").lower() == WATCHLIST_STORE_ATTACHMENT_NAME.lower():
+                        edited = getattr(msg, "edited_at", None)
+                        sig = (int(msg.id), edited.isoformat() if edited else "", int(a.id), int(a.size or 0))
+                        self._store_checked_at = time.monotonic()
+                        if sig == self._store_sig and self._store_cfg is not None:
+                            self._note_store_avoided()
+                            return dict(self._store_cfg)
                         raw = await a.read()
+                        self._note_last_hour(self._store_downloads)
                         obj = json.loads(raw.decode("utf-8", errors="replace"))
                         if isinstance(obj, dict):
                             self._last_watchlist_store_digest = _watchlist_cfg_digest(obj)
+                            self._store_sig, self._store_cfg = sig, dict(obj)
                             return obj
                 except Exception:
                     continue
@@ -1847,6 +2546,39 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         except Exception:
             return None
 
+    @staticmethod
+    def _note_last_hour(dq: deque, now: Optional[float] = None) -> None:
+        """Append a monotonic timestamp and drop the ones older than an hour (bounded without reads)."""
+        now = time.monotonic() if now is None else now
+        dq.append(now)
+        while dq and dq[0] < now - 3600.0:
+            dq.popleft()
+
+    def _note_store_avoided(self) -> None:
+        self._note_last_hour(self._store_avoided)
+        self._store_avoided_total += 1
+
+    def watchlist_store_metrics(self) -> Dict[str, int]:
+        """Watchlist store attachment downloads done / avoided over the last hour."""
+        cutoff = time.monotonic() - 3600.0
+        for dq in (self._store_avoided, self._store_downloads):
+            while dq and dq[0] < cutoff:
+                dq.popleft()
+        return {
+            "downloads_avoided_per_hour": len(self._store_avoided),
+            "downloads_per_hour": len(self._store_downloads),
+            "downloads_avoided_total": self._store_avoided_total,
+        }
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        # Edits to the store message (by anyone, including our own sync) invalidate the cache.
+        try:
+            if int(payload.message_id) == int(self.state.get("watchlist_store_mid") or 0):
+                self._store_edit_seen = True
+        except Exception:
+            pass
+
     async def _pull_watchlist_from_thread_store(self) -> None:
         """Refresh local watchlist JSON from the Discord thread attachment.
 
@@ -1905,7 +2637,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     continue
                 if _is_canonical_watchlist_store_marker(m.content or ""):
                     self.state["watchlist_store_mid"] = m.id
-                    _write_json_best_effort(STATE_PATH, self.state)
+                    self._mark_state_dirty()
                     return m
         except Exception:
             pass
@@ -1942,7 +2674,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
             file = discord.File(fp=fp, filename=WATCHLIST_STORE_ATTACHMENT_NAME)
             m = await th.send(WATCHLIST_STORE_MARKER, embed=emb, view=view, file=file, allowed_mentions=discord.AllowedMentions.none())
             self.state["watchlist_store_mid"] = m.id
-            _write_json_best_effort(STATE_PATH, self.state)
+            self._mark_state_dirty()
             return m
         except Exception as e:
             log.warning("[yt-wuwa] failed to create watchlist store message: %r", e)
@@ -2015,7 +2747,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     pass
                 self._last_watchlist_store_digest = desired_digest
                 self.state["watchlist_store_mid"] = store.id
-                _write_json_best_effort(STATE_PATH, self.state)
+                self._mark_state_dirty()
                 return
 
             payload = self._build_watchlist_attachment_bytes(cfg_out)
@@ -2024,16 +2756,18 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
 
             try:
                 # discord.py 2.x may support replacing attachments via Message.edit(attachments=[...]).
-                await store.edit(content=WATCHLIST_STORE_MARKER, embed=emb, view=view, attachments=[file], allowed_mentions=discord.AllowedMentions.none())
+                edited = await store.edit(content=WATCHLIST_STORE_MARKER, embed=emb, view=view, attachments=[file], allowed_mentions=discord.AllowedMentions.none())
+                self._remember_own_store_write(edited, payload)
                 self._last_watchlist_store_digest = desired_digest
                 self.state["watchlist_store_mid"] = store.id
-                _write_json_best_effort(STATE_PATH, self.state)
+                self._mark_state_dirty()
             except Exception:
                 # Fallback: cannot replace the attachment in-place; create one new canonical store message.
                 m2 = await th.send(WATCHLIST_STORE_MARKER, embed=emb, view=view, file=file, allowed_mentions=discord.AllowedMentions.none())
+                self._remember_own_store_write(m2, payload)
                 self.state["watchlist_store_mid"] = m2.id
                 self._last_watchlist_store_digest = desired_digest
-                _write_json_best_effort(STATE_PATH, self.state)
+                self._mark_state_dirty()
 
                 # Archive the previous store message in-place (keep it for safety; never delete thread history).
                 try:
@@ -2390,21 +3124,184 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
     async def _http_get_text(self, url: str) -> Optional[str]:
         await self._ensure_session()
         assert self.session is not None
+        host = _url_host(url)
+        if not await _HTTP_GOVERNOR.acquire(host):
+            return None
         async with self.sem:
             try:
                 async with self.session.get(url, allow_redirects=True) as r:
                     if r.status != 200:
+                        try:
+                            body = await r.text()
+                        except Exception:
+                            body = ''
+                        _HTTP_GOVERNOR.record(host, r.status, r.headers, body)
                         if DEBUG:
-                            try:
-                                body = await r.text()
-                            except Exception:
-                                body = ''
                             log.warning('[yt-wuwa] http %s %s status=%s body=%s', r.method, url, r.status, body[:200])
                         return None
+                    _HTTP_GOVERNOR.record(host, r.status)
                     return await r.text()
             except Exception:
                 return None
 
+    async def _http_get_player(self, url: str, kind: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Fetch a /live or watch page; returns (html, ytInitialPlayerResponse).
+
+        In streaming mode html is only the part read before the player response was
+        complete (or STREAM_MAX_BYTES was hit), which is enough for the videoId fallback.
+        """
+        if not STREAM_FETCH:
+            html = await self._http_get_text(url)
+            return html, await _parse_yt_var_json(html, 'ytInitialPlayerResponse')
+        await self._ensure_session()
+        assert self.session is not None
+        host = _url_host(url)
+        if not await _HTTP_GOVERNOR.acquire(host):
+            return None, None
+        async with self.sem:
+            try:
+                html, player, st = await _stream_yt_var_json(
+                    self.session, url, 'ytInitialPlayerResponse', max_bytes=STREAM_MAX_BYTES
+                )
+            except Exception:
+                return None, None
+        _HTTP_GOVERNOR.record(host, st.get("status"), {"Retry-After": st.get("retry_after") or ""}, st.get("body") or "")
+        if st.get("status") == 200:
+            self._note_page_fetch(kind, st)
+        return html, player
+
+    def _note_page_fetch(self, kind: str, st: Dict[str, Any]) -> None:
+        fs = self._fetch_stats
+        read = int(st.get("read") or 0)
+        fs["pages"] = fs.get("pages", 0) + 1
+        fs["read"] = fs.get("read", 0) + read
+        if not st.get("early"):
+            self._page_bytes[kind] = read
+            return
+        fs["early"] = fs.get("early", 0) + 1
+        total = st.get("total") or self._page_bytes.get(kind)
+        if total:
+            fs["saved"] = fs.get("saved", 0) + max(0, int(total) - read)
+        else:
+            fs["saved_unknown"] = fs.get("saved_unknown", 0) + 1
+
+    async def _fetch_feed(self, channel_id: str, fs: Dict[str, Any]) -> Tuple[Optional[int], List[str]]:
+        """Conditional GET of the channel Atom feed; validators are read from / stored in `fs`."""
+        await self._ensure_session()
+        assert self.session is not None
+        headers: Dict[str, str] = {}
+        if fs.get("etag"):
+            headers["If-None-Match"] = str(fs["etag"])
+        if fs.get("last_modified"):
+            headers["If-Modified-Since"] = str(fs["last_modified"])
+        feed_url = FEED_URL.format(channel_id)
+        host = _url_host(feed_url)
+        if not await _HTTP_GOVERNOR.acquire(host):
+            return None, []
+        async with self.sem:
+            try:
+                async with self.session.get(feed_url, headers=headers) as r:
+                    if r.status != 200:
+                        body = await r.text() if r.status >= 400 else ""
+                        _HTTP_GOVERNOR.record(host, r.status, r.headers, body)
+                        return r.status, []
+                    _HTTP_GOVERNOR.record(host, r.status)
+                    body = await r.text()
+                    for hdr, key in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+                        if r.headers.get(hdr):
+                            fs[key] = r.headers[hdr]
+                        else:
+                            fs.pop(key, None)
+            except Exception:
+                return None, []
+        return 200, _FEED_VID_RE.findall(body)
+
+    def _upcoming_start(self, t: Target) -> Optional[float]:
+        cid = self._feed_channel_id(t)
+        up = ((self.state.get("feed") or {}).get(cid) or {}).get("upcoming") if cid else None
+        try:
+            return float(up["start"]) if up and up.get("start") else None
+        except Exception:
+            return None
+
+    def _feed_channel_id(self, t: Target) -> str:
+        return t.channel_id or self.identities.channel_id_for(t.key())
+
+    async def _feed_gate(self, t: Target, now: Optional[float] = None) -> bool:
+        """Feed-first tier: True when `t` needs the full /live scrape this poll.
+
+        Targets whose channel id is not known yet always escalate; the scrape learns it.
+        A feed error also escalates so an outage of the feed never hides a live.
+        """
+        cid = self._feed_channel_id(t)
+        if not FEED_TIER or not cid:
+            return True
+        if now is None:
+            now = datetime.now(timezone.utc).timestamp()
+        fs = self.state.setdefault("feed", {}).setdefault(cid, {})
+        stats = self._feed_stats
+        stats["checks"] = stats.get("checks", 0) + 1
+
+        reason = ""
+        try:
+            start = float((fs.get("upcoming") or {}).get("start") or 0)
+        except Exception:
+            start = 0.0
+        if start and start - FEED_PREROLL_SECONDS <= now <= start + FEED_LATE_SECONDS:
+            reason = "scheduled"
+        elif start and now > start + FEED_LATE_SECONDS:
+            fs.pop("upcoming", None)
+
+        status, ids = await self._fetch_feed(cid, fs)
+        if status == 200:
+            seen = [str(v) for v in (fs.get("seen") or [])]
+            new = [v for v in dict.fromkeys(ids) if v not in seen]
+            if new:
+                reason = reason or ("new" if seen else "baseline")
+            fs["seen"] = (new + seen)[:_FEED_SEEN_MAX]
+        elif status == 304:
+            stats["not_modified"] = stats.get("not_modified", 0) + 1
+        else:
+            reason = reason or "feed-error"
+        if not reason and now - float(fs.get("scraped_at") or 0) >= FEED_FULL_SCRAPE_SECONDS:
+            reason = "refresh"
+
+        if reason:
+            fs["scraped_at"] = int(now)
+            stats["escalations"] = stats.get("escalations", 0) + 1
+        if reason or status == 200:
+            self._mark_state_dirty()
+        if DEBUG and reason:
+            log.info('[yt-wuwa] feed %s -> scrape /live (%s)', cid, reason)
+        return bool(reason)
+
+    def _note_player(self, t: Target, player: Dict[str, Any], vid: Optional[str], is_live_now: bool, start_ts: Optional[datetime]) -> None:
+        """Learn the channel id and any upcoming start from a player response for the feed tier."""
+        try:
+            cid = str(((player.get("videoDetails") or {}).get("channelId")) or "")
+        except Exception:
+            cid = ""
+        changed = False
+        if cid and not t.channel_id:
+            changed = self.identities.remember([t.key(), t.handle, t.query], channel_id=cid)
+        cid = t.channel_id or cid
+        if not cid or not vid:
+            if changed:
+                self._mark_state_dirty()
+            return
+        fs = self.state.setdefault("feed", {}).setdefault(cid, {})
+        up = fs.get("upcoming") or {}
+        if not is_live_now and start_ts is not None:
+            ts = int(start_ts.timestamp())
+            if ts + FEED_LATE_SECONDS > datetime.now(timezone.utc).timestamp() and up != {"vid": vid, "start": ts}:
+                fs["upcoming"] = {"vid": vid, "start": ts}
+                changed = True
+        elif is_live_now and up.get("vid") == vid:
+            fs.pop("upcoming", None)
+            changed = True
+        if changed:
+            self._mark_state_dirty()
+
     def _extract_video_id_fallback(self, html: str) -> Optional[str]:
         """Best-effort extraction of a videoId from a /live page HTML when JSON parsing fails."""
         if not html:
@@ -2428,12 +3325,11 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         if t.channel_id or t.url:
             return t
 
-        res = self.state.get("resolved", {})
-        cached = (res.get(t.handle) if t.handle else None) or (res.get(t.url) if t.url else None) or res.get(t.channel_id) or res.get(t.query) or res.get(t.name)
-        if isinstance(cached, dict):
-            cid = str(cached.get("channel_id") or "")
-            title = str(cached.get("title") or t.name)
-            url = str(cached.get("url") or "")
+        cached = self.identities.lookup(t.handle, t.url, t.channel_id, t.query, t.name)
+        if cached is not None:
+            cid = cached.channel_id
+            title = cached.title or t.name
+            url = cached.url
             if cid:
                 t.channel_id = cid
             if url:
@@ -2447,7 +3343,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         html = await self._http_get_text(search_url)
         if not html:
             return t
-        data = _extract_yt_var_json(html, 'ytInitialData') or _extract_json_blob(html, _YTINITDATA_RE)
+        data = await _parse_yt_var_json(html, 'ytInitialData')
         if not data:
             return t
 
@@ -2462,10 +3358,16 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         t.url = f"https://www.youtube.com/channel/{cid}"
         t.name = title or t.name
 
-        self.state["resolved"][t.query] = {"channel_id": cid, "title": t.name, "url": t.url}
-        _write_json_best_effort(STATE_PATH, self.state)
+        self._remember_identity(t, t.name)
         return t
 
+    def _remember_identity(self, t: Target, title: str = "", url: str = "") -> None:
+        """Record what is known about `t` under its channel id, handle, url and query."""
+        base = (url or t.url or t.base_url() or "").strip()
+        if self.identities.remember([t.key(), t.handle, t.query, t.name, base], channel_id=t.channel_id,
+                                    title=title, url=t.url or (base if "/channel/" in base else ""), handle=t.handle):
+            self._mark_state_dirty()
+
     async def _check_live(self, t: Target) -> Optional[Tuple[Target, str, str, Optional[datetime], str]]:
         """
         Returns (target, video_id, title, start_ts_utc, creator_name) if live now and matches whitelist.
@@ -2481,48 +3383,31 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                 (t.handle or "").strip() and (t.name or "").strip() == (t.handle or "").strip()
             )
             if need_name:
-                res = self.state.setdefault("resolved", {})
-                cached = None
-                if t.handle:
-                    cached = res.get(t.handle)
-                if not cached and t.query:
-                    cached = res.get(t.query)
-                if not cached:
-                    cached = res.get(t.name)
-                nm = None
-                if isinstance(cached, dict):
-                    nm = (cached.get("title") or "").strip() or None
+                nm = self.identities.title_for(t.handle, t.query, t.name)
                 if not nm:
                     nm = await self._try_fetch_channel_name_oembed(base)
+                    if nm:
+                        self._remember_identity(t, nm, base)
                 if nm:
                     t.name = nm
-                    if t.handle:
-                        res[t.handle] = {"channel_id": t.channel_id, "title": t.name, "url": (t.url or base)}
-                    if t.query:
-                        res.setdefault(t.query, {"channel_id": t.channel_id, "title": t.name, "url": (t.url or base)})
-                    _write_json_best_effort(STATE_PATH, self.state)
         except Exception:
             pass
         live_url = base.rstrip("/") + "/live"
-        html = await self._http_get_text(live_url)
+        html, player = await self._http_get_player(live_url, "live")
         if not html:
             return None
 
         # Fast path: parse ytInitialPlayerResponse (scrape)
-        player = _extract_yt_var_json(html, 'ytInitialPlayerResponse') or _extract_json_blob(html, _YTIPR_RE)
         if player:
             vid, title, is_live_now, start_ts, ch_name = _yt_live_info(player)
+            self._note_player(t, player, vid, is_live_now, start_ts)
             # Prefer channel display name from the player response (no extra HTTP, works even if oEmbed is blocked).
             try:
                 nm0 = (ch_name or "").strip()
                 if nm0 and (not nm0.startswith(("@", "＠"))) and (not _UC_ID_LIKE_RE.match(nm0)):
                     t.name = nm0
                     # cache resolved name for stability across restarts
-                    res = self.state.setdefault("resolved", {})
-                    for kk in [t.channel_id, t.url or t.base_url() or "", t.handle, t.query, t.name]:
-                        if kk:
-                            res.setdefault(str(kk), {"channel_id": t.channel_id, "title": t.name, "url": (t.url or t.base_url() or "")})
-                    _write_json_best_effort(STATE_PATH, self.state)
+                    self._remember_identity(t, nm0)
             except Exception:
                 pass
             if not (vid and title and is_live_now):
@@ -2536,16 +3421,16 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                 return None
 
             watch_url = f"https://www.youtube.com/watch?v={vid}"
-            watch_html = await self._http_get_text(watch_url)
+            watch_html, player2 = await self._http_get_player(watch_url, "watch")
             if not watch_html:
                 return None
 
-            player2 = _extract_yt_var_json(watch_html, 'ytInitialPlayerResponse') or _extract_json_blob(watch_html, _YTIPR_RE)
             player = player2
             if not player2:
                 return None
 
             vid2, title2, is_live_now2, start_ts2, ch_name2 = _yt_live_info(player2)
+            self._note_player(t, player2, vid2, is_live_now2, start_ts2)
             if not (vid2 and title2 and is_live_now2):
                 return None
 
@@ -2556,12 +3441,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                 nm0 = (ch_name2 or "").strip()
                 if nm0 and (not nm0.startswith(("@", "＠"))) and (not _UC_ID_LIKE_RE.match(nm0)):
                     t.name = nm0
-                    res = self.state.setdefault("resolved", {})
-                    for kk in [t.channel_id, t.url or t.base_url() or "", t.handle, t.query, t.name]:
-                        if kk:
-                            res[str(kk)] = nm0
-                    res.setdefault("url_to_name", {})[str(t.base_url() or t.url or "")] = nm0
-                    _write_json_best_effort(STATE_PATH, self.state)
+                    self._remember_identity(t, nm0)
             except Exception:
                 pass
 
@@ -2578,21 +3458,8 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                 need_name2 = True
 
             if need_name2:
-                res = self.state.setdefault("resolved", {})
-
-                def _pick_cached(keys):
-                    for kk in keys:
-                        if not kk:
-                            continue
-                        cc = res.get(str(kk))
-                        if isinstance(cc, dict):
-                            cand = (cc.get("title") or "").strip()
-                            if cand and (not cand.startswith(("@", "＠"))) and (not _UC_ID_LIKE_RE.match(cand)):
-                                return cand
-                    return None
-
                 base_url = (t.url or t.base_url() or "").strip()
-                nm = _pick_cached([t.channel_id, base_url, t.handle, t.query, t.name])
+                nm = self.identities.title_for(t.channel_id, base_url, t.handle, t.query, t.name)
 
                 # Most reliable: oEmbed on the exact watch URL for the video we are about to announce.
                 if not nm and vid:
@@ -2613,10 +3480,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     t.name = nm
                     # Cache under stable identifiers so we avoid repeated fetches.
                     try:
-                        for kk in {t.channel_id, base_url, t.handle, t.query}:
-                            if kk:
-                                res[str(kk)] = {"channel_id": t.channel_id, "title": t.name, "url": base_url}
-                        _write_json_best_effort(STATE_PATH, self.state)
+                        self._remember_identity(t, nm, base_url)
                     except Exception:
                         pass
 
@@ -2653,23 +3517,19 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         # If still invalid, try cached channel display name (survives restarts via STATE_PATH).
         try:
             cid_cache_key = (getattr(t, "channel_id", None) or getattr(t, "base_id", None) or "").strip()
-            if cid_cache_key:
-                ccache = self.state.get("yt_channel_name_cache", {})
-                if (creator_name.startswith(("@", "＠")) or _UC_ID_LIKE_RE.match(creator_name)) and isinstance(ccache, dict):
-                    cached_nm = (ccache.get(cid_cache_key) or "").strip()
-                    if cached_nm and (not cached_nm.startswith(("@", "＠"))) and (not _UC_ID_LIKE_RE.match(cached_nm)):
-                        creator_name = cached_nm
+            if cid_cache_key and (creator_name.startswith(("@", "＠")) or _UC_ID_LIKE_RE.match(creator_name)):
+                cached_nm = self.identities.title_for(cid_cache_key)
+                if cached_nm:
+                    creator_name = cached_nm
         except Exception:
             pass
 
         # Update cache when we have a good resolved name.
         try:
             cid_cache_key = (getattr(t, "channel_id", None) or getattr(t, "base_id", None) or "").strip()
-            if cid_cache_key and creator_name and (not creator_name.startswith(("@", "＠"))) and (not _UC_ID_LIKE_RE.match(creator_name)):
-                ccache = self.state.setdefault("yt_channel_name_cache", {})
-                if isinstance(ccache, dict) and ccache.get(cid_cache_key) != creator_name:
-                    ccache[cid_cache_key] = creator_name
-                    _write_json_best_effort(STATE_PATH, self.state)
+            if cid_cache_key and _is_display_name(creator_name):
+                if self.identities.remember([cid_cache_key], channel_id=t.channel_id, title=creator_name):
+                    self._mark_state_dirty()
         except Exception:
             pass
 
@@ -2734,6 +3594,10 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         """
         if getattr(self, "_announce_vid_cache_ready", False):
             return
+        # Durable index already built for this channel: no history scan after restarts.
+        if str(getattr(channel, "id", "")) in (self.state.get("announce_index_warm") or {}):
+            self._announce_vid_cache_ready = True
+            return
 
         try:
             limit = int(getattr(self, "_announce_history_scan_limit", 500) or 500)
@@ -2752,30 +3616,103 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                 self._announce_vid_cache_ready = True
                 return
 
+            newest = 0
             async for msg in channel.history(limit=limit):
                 try:
+                    newest = max(newest, int(getattr(msg, "id", 0) or 0))
                     if not msg or not getattr(msg, "author", None):
                         continue
                     if getattr(msg.author, "id", None) != me_id:
                         continue
                     vid = self._extract_video_id_from_message(msg)
-                    if vid:
-                        try:
-                            self._announce_vid_cache.add(str(vid))
-                        except Exception:
-                            pass
                     if vid:
                         self._announce_vid_cache.add(str(vid))
+                        # history is newest-first: the oldest message per video wins, like the cleanup
+                        created = getattr(msg, "created_at", None)
+                        self._index_announce(str(vid), channel.id, msg.id, created.timestamp() if created else None)
                 except Exception:
                     continue
+            self.state.setdefault("announce_index_warm", {})[str(channel.id)] = int(time.time())
+            if newest:
+                self.state.setdefault("announce_index_tail", {})[str(channel.id)] = newest
+            self._prune_announce_index()
+            self._mark_state_dirty()
         except Exception:
             # Missing perms / transient errors: do not block. Mark ready to avoid repeated scans.
             pass
 
         self._announce_vid_cache_ready = True
 
+    def _index_announce(self, video_id: str, channel_id: Any, message_id: Any, ts: Optional[float] = None) -> None:
+        idx = self.state.setdefault("announce_index", {})
+        idx[str(video_id)] = [int(channel_id or 0), int(message_id or 0), int(ts if ts is not None else time.time())]
+        self._mark_state_dirty()
+
+    def _prune_announce_index(self, now: Optional[float] = None) -> int:
+        """Drop index entries older than ANNOUNCE_INDEX_MAX_AGE_DAYS."""
+        idx = self.state.get("announce_index")
+        if not isinstance(idx, dict):
+            self.state["announce_index"] = {}
+            return 0
+        cutoff = (time.time() if now is None else now) - ANNOUNCE_INDEX_MAX_AGE_DAYS * 86400
+        old = [v for v, e in idx.items() if not isinstance(e, list) or len(e) < 3 or float(e[2] or 0) < cutoff]
+        for v in old:
+            del idx[v]
+        if old:
+            self._mark_state_dirty()
+        return len(old)
+
+    async def _top_up_announce_index(self, channel: discord.TextChannel) -> int:
+        """Index this bot's announces posted after the newest indexed message; returns how many.
+
+        Another instance sharing the bot account posts into the same channel without touching
+        this instance's index, so a miss is only final after this one history request.
+        """
+        me_id = getattr(getattr(self.bot, "user", None), "id", None)
+        if not me_id:
+            return 0
+        cid = str(getattr(channel, "id", ""))
+        tails = self.state.setdefault("announce_index_tail", {})
+        after = int(tails.get(cid) or 0)
+        kwargs: Dict[str, Any] = {"after": discord.Object(id=after), "oldest_first": True} if after else {}
+        newest, found = after, 0
+        try:
+            async for msg in channel.history(limit=_DEDUP_HISTORY_LIMIT, **kwargs):
+                try:
+                    newest = max(newest, int(getattr(msg, "id", 0) or 0))
+                    if getattr(getattr(msg, "author", None), "id", None) != me_id:
+                        continue
+                    vid = self._extract_video_id_from_message(msg)
+                    if vid and str(vid) not in (self.state.get("announce_index") or {}):
+                        created = getattr(msg, "created_at", None)
+                        self._index_announce(str(vid), channel.id, msg.id, created.timestamp() if created else None)
+                        self._announce_vid_cache.add(str(vid))
+                        found += 1
+                except Exception:
+                    continue
+        except Exception:
+            pass  # missing perms / transient: keep what was read, the tail only moves forward
+        if newest != after:
+            tails[cid] = newest
+            self._mark_state_dirty()
+        return found
+
+    def _index_has_video(self, channel: Any, video_id: str) -> Optional[bool]:
+        """O(1) dedupe from the durable index; None when the index is not built for `channel`."""
+        cid = getattr(channel, "id", None)
+        ent = (self.state.get("announce_index") or {}).get(str(video_id))
+        if ent and int(ent[0] or 0) == int(cid or 0):
+            return True
+        if str(cid) in (self.state.get("announce_index_warm") or {}):
+            return False
+        return None
+
     async def _announce_channel_has_video(self, channel: discord.TextChannel, video_id: str) -> bool:
-        """Return True if this bot has already announced video_id in channel (recent history scan)."""
+        """Return True if this bot has already announced video_id in channel.
+
+        Answered from the durable announce index; the recent-history scan only runs while the
+        index could not be built for this channel (e.g. missing history permission).
+        """
         # Fast-path: warm-cache hits (survives restarts as long as the prior announce is still in channel history).
         try:
             if str(video_id) in getattr(self, "_announce_vid_cache", set()):
@@ -2791,6 +3728,11 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     return True
         except Exception:
             pass
+        hit = self._index_has_video(channel, video_id)
+        if hit is False and await self._top_up_announce_index(channel):
+            hit = self._index_has_video(channel, video_id)
+        if hit is not None:
+            return hit
         try:
             me = getattr(self.bot, "user", None)
             me_id = getattr(me, "id", None)
@@ -2839,6 +3781,8 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
             # Keep oldest (smallest snowflake id), delete the rest.
             matches.sort(key=lambda m: int(getattr(m, "id", 0) or 0))
             keep_id = matches[0].id
+            created = getattr(matches[0], "created_at", None)
+            self._index_announce(str(video_id), channel.id, keep_id, created.timestamp() if created else None)
             for m in matches[1:]:
                 if m.id == keep_id:
                     continue
@@ -2928,12 +3872,12 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     content=content,
                     allowed_mentions=allowed_mentions,
                 )
-                if msg is None:
-                    return
                 if msg is None:
                     return
                 try:
                     self._announce_vid_cache.add(str(video_id))
+                    self._index_announce(str(video_id), channel.id, getattr(msg, "id", 0))
+                    self._flush_state()  # a sent announce is durable at once, not after the debounce
                 except Exception:
                     pass
                 try:
@@ -2963,12 +3907,12 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                 view=view,
                 allowed_mentions=allowed_mentions,
             )
-            if msg is None:
-                return
             if msg is None:
                 return
             try:
                 self._announce_vid_cache.add(str(video_id))
+                self._index_announce(str(video_id), channel.id, getattr(msg, "id", 0))
+                self._flush_state()
             except Exception:
                 pass
             try:
@@ -3070,7 +4014,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     for k in keys:
                         ann_map[k] = vid
                     ann_vids[str(vid)] = int(now.timestamp())
-                    _write_json_best_effort(STATE_PATH, self.state)
+                    self._mark_state_dirty()
                     age_min = int((now - start_ts).total_seconds() // 60)
                     log.info("[yt-wuwa] suppress old-live after boot: %s vid=%s age_min=%s", t.name, vid, age_min)
                     return False
@@ -3081,7 +4025,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     for k in keys:
                         ann_map[k] = vid
                     ann_vids[str(vid)] = int(now.timestamp())
-                    _write_json_best_effort(STATE_PATH, self.state)
+                    self._mark_state_dirty()
                     age_min = int((now - start_ts).total_seconds() // 60)
                     log.info("[yt-wuwa] suppress stale-live: %s vid=%s age_min=%s", t.name, vid, age_min)
                     return False
@@ -3095,7 +4039,7 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     for k in keys:
                         ann_map[k] = vid
                     ann_vids[vid_s] = int(datetime.now(timezone.utc).timestamp())
-                    _write_json_best_effort(STATE_PATH, self.state)
+                    self._mark_state_dirty()
                     return False
             except Exception:
                 pass
@@ -3129,7 +4073,8 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
             for k in keys:
                 ann_map[k] = vid
             ann_vids[str(vid)] = int(datetime.now(timezone.utc).timestamp())
-            _write_json_best_effort(STATE_PATH, self.state)
+            self._mark_state_dirty()
+            self._flush_state()
             delay_min = None
             if start_ts is not None:
                 try:
@@ -3162,10 +4107,16 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
         except Exception:
             pass
 
+        async def _probe(tt: Target):
+            # Poll runs go through the feed tier first; manual checks always scrape.
+            if source == "poll" and not await self._feed_gate(tt):
+                return None
+            return await self._check_live(tt)
+
         async def _run_one(tt: Target):
             try:
                 timeout = CHECK_TIMEOUT_SECONDS
-                return await asyncio.wait_for(self._check_live(tt), timeout=timeout)
+                return await asyncio.wait_for(_probe(tt), timeout=timeout)
             except Exception as e:
                 if DEBUG:
                     try:
@@ -3175,11 +4126,15 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                     log.info('[yt-wuwa] check timeout/err for %s: %r', q, e)
                 return None
 
-        tasks_list = [asyncio.create_task(_run_one(t)) for t in items]
+        # scheduler keys are taken before _resolve_channel fills in channel ids
+        task_targets = {asyncio.create_task(_run_one(t)): (t, t.key()) for t in items}
+        tasks_list = list(task_targets)
         deadline = LOOP_DEADLINE_SECONDS
         done, pending = await asyncio.wait(tasks_list, timeout=deadline)
         for p in pending:
             p.cancel()
+            if source == "poll":
+                self.scheduler.reschedule(task_targets[p][1], failed=True)
 
         announced = 0
         for d in done:
@@ -3189,28 +4144,65 @@ class YouTubeWuWaLiveAnnouncer(commands.Cog):
                 r = d.result()
             except Exception:
                 continue
+            if source == "poll":
+                tt, key = task_targets[d]
+                self.scheduler.reschedule(key, live=r is not None, start_ts=self._upcoming_start(tt))
             if await self._maybe_announce_live_result(ch, r, source=source):
                 announced += 1
         return announced
 
-    @tasks.loop(seconds=POLL_SECONDS)
+    @tasks.loop(seconds=SCHED_TICK_SECONDS)
     async def loop(self):
-        # Source of truth: Discord thread attachment. Pull it so edits in Discord take effect.
-        try:
-            await self._pull_watchlist_from_thread_store()
-        except Exception:
-            pass
+        # Watchlist refresh keeps the old POLL_SECONDS cadence; target checks follow the scheduler.
+        if time.monotonic() - self._watchlist_pulled_at >= POLL_SECONDS:
+            self._watchlist_pulled_at = time.monotonic()
+            # Source of truth: Discord thread attachment. Pull it so edits in Discord take effect.
+            try:
+                await self._pull_watchlist_from_thread_store()
+            except Exception:
+                pass
 
-        # Reload from disk (also allows local hot-edits if present)
-        try:
-            self._reload_watchlist()
-        except Exception:
-            pass
+            # Reload from disk (also allows local hot-edits if present)
+            try:
+                self._reload_watchlist()
+            except Exception:
+                pass
+
+        if time.monotonic() - self._index_pruned_at >= ANNOUNCE_INDEX_PRUNE_SECONDS:
+            self._index_pruned_at = time.monotonic()
+            self._prune_announce_index()
 
+        self.scheduler.sync([t.key() for t in self.targets])
+        due = set(self.scheduler.pop_due())
+        if not due:
+            return
+        batch: List[Target] = []
+        for t in self.targets:
+            if t.key() in due:
+                due.discard(t.key())
+                batch.append(t)
+
+        self._fetch_stats = {}
+        self._feed_stats = {}
         try:
-            await self._check_and_announce_targets_once(list(self.targets), source="poll")
+            await self._check_and_announce_targets_once(batch, source="poll")
         except Exception:
             pass
+        self.scheduler.requeue_in_flight()
+        self._flush_state()
+        if DEBUG and self._feed_stats:
+            fd = self._feed_stats
+            log.info(
+                '[yt-wuwa] poll feed: checks=%d not_modified=%d escalations=%d',
+                fd.get("checks", 0), fd.get("not_modified", 0), fd.get("escalations", 0),
+            )
+        if DEBUG and self._fetch_stats:
+            fs = self._fetch_stats
+            log.info(
+                '[yt-wuwa] poll fetch: pages=%d early_stop=%d read=%dKB saved=%dKB%s',
+                fs.get("pages", 0), fs.get("early", 0), fs.get("read", 0) // 1024, fs.get("saved", 0) // 1024,
+                (f' (+{fs["saved_unknown"]} early stops with unknown page size)' if fs.get("saved_unknown") else ''),
+            )
 
     @loop.before_loop
     async def before_loop(self):
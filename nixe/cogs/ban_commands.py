@@ -5,6 +5,7 @@ import discord
 from discord.ext import commands
 from ..config_ids import LOG_BOTPHISHING, TESTBAN_CHANNEL_ID
 from .ban_embed import build_ban_embed
+from nixe.helpers.resolver import resolve_channel
 def _can_send(ch: discord.abc.GuildChannel, me: discord.Member) -> bool:
     try:
         perms = ch.permissions_for(me)
@@ -47,7 +48,7 @@ class BanCommands(commands.Cog):
         for cid in (TESTBAN_CHANNEL_ID, LOG_BOTPHISHING):
             if not cid: continue
             with contextlib.suppress(Exception):
-                ch = ctx.guild.get_channel(cid) or await self.bot.fetch_channel(cid)
+                ch = await resolve_channel(self.bot, cid)
                 if ch and isinstance(ch, (discord.TextChannel, discord.Thread)) and _can_send(ch, me):
                     target_ch = ch; break
         if target_ch is None:
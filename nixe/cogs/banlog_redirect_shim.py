@@ -1,12 +1,13 @@
 import os, logging
 from discord.ext import commands
+from nixe.helpers.resolver import resolve_channel
 log=logging.getLogger(__name__)
 BLOCKED=int(os.getenv('LOG_CHANNEL_ID','0') or 0)
 async def nixe_get(guild):
     pref=int(os.getenv('NIXE_BAN_LOG_CHANNEL_ID', os.getenv('LOG_CHANNEL_ID','0')) or 0)
     if pref:
         try:
-            ch=guild.get_channel(pref) or await guild.fetch_channel(pref)
+            ch=await resolve_channel(guild, pref)
             if ch and getattr(ch,'id',0)!=BLOCKED: return ch
         except Exception: pass
     name=(os.getenv('MOD_LOG_CHANNEL_NAME','nixe-only') or 'nixe-only').lower()
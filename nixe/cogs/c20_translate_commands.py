@@ -34,18 +34,25 @@ Optional configs (runtime_env.json or env):
   REVERSE_IMAGE_MAX_IMAGES=3
   REVERSE_IMAGE_EPHEMERAL=1
   REVERSE_IMAGE_COOLDOWN_SEC=5
+  TRANSLATE_MEMORY_ENABLE=1       (reuse finished translations; see nixe.translate.memory)
+  TRANSLATE_MEMORY_TTL_SEC=604800
+  TRANSLATE_PROVIDER_CONCURRENCY=3          (shared limit; long texts translate chunks in parallel)
+  TRANSLATE_PROVIDER_MIN_INTERVAL_SEC=0.25
+  TRANSLATE_STREAM_ENABLE=1                 (stream single-style text output into the reply)
+  TRANSLATE_STREAM_EDIT_INTERVAL_SEC=1.2
 """
 
 from __future__ import annotations
 
-import os, json, logging, re, asyncio, base64, io
+import os, json, logging, re, asyncio, base64, io, functools, time
 from typing import Optional, Tuple, List, Dict, Any
 from urllib import parse as urllib_parse
 
 import discord
 import aiohttp
-from nixe.translate import resolve_lang
+from nixe.translate import resolve_lang, detect_lang, is_target_language
 from nixe.translate.local_dict_store import LocalDictStore, is_short_input
+from nixe.translate import memory as _tm
 from discord import app_commands
 from discord.ext import commands
 
@@ -173,6 +180,71 @@ async def _safe_followup_send(
     return None
 
 
+class _StreamPreview:
+    """Throttled progressive edits of the deferred interaction response.
+
+    The first edit goes out as soon as text arrives; later edits at most every
+    `interval` seconds (Discord allows ~5 edits / 5s per message). `finish()`
+    swaps in the final packed embed on the same message.
+    """
+
+    def __init__(self, interaction: discord.Interaction, title: str, interval: float):
+        self.interaction = interaction
+        self.title = title
+        self.interval = max(0.5, float(interval or 1.0))
+        self.edited = False
+        self._text = ""
+        self._shown = ""
+        self._dirty = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._failed = False
+
+    def update(self, text: str) -> None:
+        if self._failed:
+            return
+        self._text = text
+        self._dirty.set()
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            text = self._text
+            if text and text != self._shown:
+                desc = text if len(text) <= 3990 else ("…" + text[-3980:])
+                try:
+                    await self.interaction.edit_original_response(
+                        embed=discord.Embed(title=self.title, description=desc + " ▌")
+                    )
+                    self.edited = True
+                    self._shown = text
+                except Exception as e:
+                    # Rate limited / unknown webhook: stop previewing, final send still happens.
+                    log.debug("[translate] stream preview edit failed: %r", e)
+                    self._failed = True
+                    return
+            await asyncio.sleep(self.interval)
+
+    async def finish(self, embed: Optional[discord.Embed] = None, files: Optional[List[discord.File]] = None, content: Optional[str] = None) -> bool:
+        """Replace the preview with the final output. False if nothing was previewed (caller sends normally)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except BaseException:
+                pass
+        if not self.edited:
+            return False
+        try:
+            await self.interaction.edit_original_response(content=content, embed=embed, attachments=list(files or []))
+            return True
+        except Exception as e:
+            log.debug("[translate] stream final edit failed: %r", e)
+            return False
+
+
 log = logging.getLogger(__name__)
 
 # -------------------------
@@ -317,6 +389,20 @@ def _normalize_for_compare(s: str) -> str:
     s = re.sub(r"\s+", " ", s).strip().lower()
     return s
 
+def _langid(text: str, target: str) -> Tuple[str, bool]:
+    """(detected source code, already in target?) from the local language identifier.
+
+    TRANSLATE_LANGID_MIN_CONF (0.6) is the confidence needed to skip the provider call.
+    """
+    if not _as_bool("TRANSLATE_LANGID_ENABLE", True) or not (text or "").strip():
+        return "", False
+    code, conf = detect_lang(text)
+    prof = resolve_lang(target)
+    min_conf = _as_float("TRANSLATE_LANGID_MIN_CONF", 0.6)
+    already = bool(code) and prof is not None and code == prof.code and conf >= min_conf and len(text.strip()) >= 12
+    return code, already
+
+
 def _seems_untranslated(src: str, out: str, target_lang: str) -> bool:
     ns = _normalize_for_compare(src)
     no = _normalize_for_compare(out)
@@ -611,10 +697,96 @@ def _pick_groq_qc_key() -> str:
 
 
 
+# -------------------------
+# Translation memory
+# -------------------------
+
+# Bump when prompt wording in this file changes so remembered outputs are not reused.
+TM_PROMPT_VERSION = "1"
+
+
+def _tm_sig(provider: str, model_key: str, model_default: str, *env_keys: str):
+    return lambda: _tm.provider_signature(provider, _env(model_key, model_default), TM_PROMPT_VERSION, env_keys)
+
+
+def _tm_good_text(out: Any) -> bool:
+    return isinstance(out, str) and bool(out.strip()) and out.strip() != "(empty)"
+
+
+def _tm_good_multi(data: Any) -> bool:
+    return (
+        isinstance(data, dict)
+        and bool((data.get("formal") or "").strip() or (data.get("casual") or "").strip())
+        and data.get("reason") != "non_json_output"
+    )
+
+
+# -------------------------
+# Shared provider limit + concurrent chunks
+# -------------------------
+
+# One limit for every translate provider call (context menus, slash, free-form
+# triggers), so chunk fan-out cannot burst past the provider quota.
+_PROVIDER_SEM: Optional[asyncio.Semaphore] = None
+_PROVIDER_PACE = {"last": 0.0}
+_PROVIDER_PACE_LOCK: Optional[asyncio.Lock] = None
+
+
+def _provider_sem() -> asyncio.Semaphore:
+    global _PROVIDER_SEM
+    if _PROVIDER_SEM is None:
+        _PROVIDER_SEM = asyncio.Semaphore(max(1, int(_as_float("TRANSLATE_PROVIDER_CONCURRENCY", 3) or 3)))
+    return _PROVIDER_SEM
+
+
+async def _provider_pace() -> None:
+    """Space request starts by TRANSLATE_PROVIDER_MIN_INTERVAL_SEC (default 0.25s)."""
+    global _PROVIDER_PACE_LOCK
+    gap = max(0.0, _as_float("TRANSLATE_PROVIDER_MIN_INTERVAL_SEC", 0.25))
+    if gap <= 0:
+        return
+    if _PROVIDER_PACE_LOCK is None:
+        _PROVIDER_PACE_LOCK = asyncio.Lock()
+    async with _PROVIDER_PACE_LOCK:
+        wait = _PROVIDER_PACE["last"] + gap - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        _PROVIDER_PACE["last"] = time.monotonic()
+
+
+def _provider_limited(fn):
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any):
+        async with _provider_sem():
+            await _provider_pace()
+            return await fn(*args, **kwargs)
+
+    return wrapper
+
+
+async def _translate_chunks(call, chunks: List[Any]) -> List[Tuple[bool, Any]]:
+    """Run `call(chunk)` for all chunks concurrently; results keep chunk order.
+
+    Concurrency is bounded by the shared provider limit inside the helpers, and
+    the strict-mode retry in `_gemini_translate_text` only fires for the chunks
+    whose output still looks untranslated.
+    """
+    if len(chunks) == 1:
+        return [await call(chunks[0])]
+    res = await asyncio.gather(*(call(ch) for ch in chunks), return_exceptions=True)
+    return [(False, f"chunk failed: {r!r}") if isinstance(r, BaseException) else r for r in res]
+
+
 # -------------------------
 # Gemini / Groq text translate
 # -------------------------
 
+@_tm.memoize(
+    "plain",
+    _tm_sig("gemini", "TRANSLATE_GEMINI_MODEL", "gemini-2.5-flash-lite", "TRANSLATE_SCHEMA", "TRANSLATE_SYS_MSG", "TRANSLATE_SYS_MSG_STRICT"),
+    _tm_good_text,
+)
+@_provider_limited
 async def _gemini_translate_text(text: str, target_lang: str, glossary: str = "") -> Tuple[bool, str]:
     key = _pick_gemini_key()
     if not key:
@@ -674,13 +846,20 @@ async def _gemini_translate_text(text: str, target_lang: str, glossary: str = ""
             return False, f"Gemini request failed: {e!r}"
 
     ok, out = await _call(base_sys)
-    if ok and _seems_untranslated(text, out, target_lang):
+    if ok and _seems_untranslated(text, out, target_lang) and not is_target_language(out, target_lang):
         ok2, out2 = await _call(strict_sys)
         if ok2 and out2:
             out = out2
     return ok, out
 
 
+@_tm.memoize(
+    "multi",
+    _tm_sig("gemini", "TRANSLATE_GEMINI_MODEL", "gemini-2.5-flash-lite", "TRANSLATE_JA_SCHEMA", "TRANSLATE_JA_SYS_MSG"),
+    _tm_good_multi,
+    target="ja",
+)
+@_provider_limited
 async def _gemini_translate_text_ja_multi(text: str) -> Tuple[bool, Dict[str, str]]:
     """
     Gemini helper for Japanese dual-style translation + romaji.
@@ -903,6 +1082,8 @@ async def _groq_chat_completion_rest(
         return False, f"groq_request_failed:{e!r}"
 
 
+@_tm.memoize("plain", _tm_sig("groq", "TRANSLATE_GROQ_MODEL", "llama-3.1-8b-instant"), _tm_good_text)
+@_provider_limited
 async def _groq_translate_text(text: str, target_lang: str) -> Tuple[bool, str]:
     """Optional Groq text translate (only used if you explicitly switch provider)."""
     key = _pick_groq_key()
@@ -928,6 +1109,107 @@ async def _groq_translate_text(text: str, target_lang: str) -> Tuple[bool, str]:
         return False, out
     return True, out or "(empty)"
 
+# -------------------------
+# Streaming text translate (progressive output)
+# -------------------------
+
+DeltaCallback = Any  # Callable[[str], None]; receives the accumulated text so far
+
+
+async def _iter_sse_data(resp) -> Any:
+    """Yield `data:` payloads of a Server-Sent Events response (stops at [DONE])."""
+    async for raw in resp.content:
+        line = raw.decode("utf-8", "replace").strip()
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        if data:
+            yield data
+
+
+def _stream_sys_msg(target_lang: str) -> str:
+    # Plain text (not the JSON schema of the non-streaming prompt) so partial output is displayable.
+    return _env(
+        "TRANSLATE_STREAM_SYS_MSG",
+        f"You are a translation engine. Translate the user's text into {target_lang}. "
+        "Do NOT leave any part in the source language except proper nouns, usernames, or URLs. "
+        f"If the text is already in {target_lang}, return it unchanged. "
+        "Output ONLY the translation as plain text. No JSON, no commentary, no code fences."
+    )
+
+
+@_provider_limited
+async def _gemini_stream_call(text: str, target_lang: str, glossary: str = "", on_delta: DeltaCallback = None) -> Tuple[bool, str]:
+    key = _pick_gemini_key()
+    if not key:
+        return False, "missing TRANSLATE_GEMINI_API_KEY"
+    model = _env("TRANSLATE_GEMINI_MODEL", "gemini-2.5-flash-lite")
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={key}"
+    sys_msg = _stream_sys_msg(target_lang)
+    payload = {
+        "contents": [
+            {"role": "user", "parts": [{"text": (sys_msg + ("\n\n" + glossary if glossary else "")) + "\n\nTEXT:\n" + text}]}
+        ],
+        "generationConfig": {"temperature": 0.2, "maxOutputTokens": 2048},
+    }
+    acc = ""
+    try:
+        timeout = aiohttp.ClientTimeout(total=float(_env("TRANSLATE_TIMEOUT_SEC", "20")) * 2, sock_read=float(_env("TRANSLATE_TIMEOUT_SEC", "20")))
+        async with aiohttp.ClientSession(timeout=timeout) as sess:
+            async with sess.post(url, json=payload) as resp:
+                if resp.status != 200:
+                    body = await resp.text()
+                    return False, f"Gemini HTTP {resp.status}: {body[:200]}"
+                async for data in _iter_sse_data(resp):
+                    try:
+                        j = json.loads(data)
+                    except Exception:
+                        continue
+                    cand = (j.get("candidates") or [{}])[0]
+                    for p in (((cand.get("content") or {}).get("parts")) or []):
+                        if isinstance(p, dict) and "text" in p:
+                            acc += str(p["text"])
+                    if on_delta is not None and acc:
+                        on_delta(acc)
+    except Exception as e:
+        if not acc:
+            return False, f"Gemini stream failed: {e!r}"
+        log.warning("[translate] gemini stream cut after %d chars: %r", len(acc), e)
+    out = _clean_output(acc).strip()
+    return True, out or "(empty)"
+
+
+@_tm.memoize(
+    "stream",
+    _tm_sig("gemini", "TRANSLATE_GEMINI_MODEL", "gemini-2.5-flash-lite", "TRANSLATE_STREAM_SYS_MSG"),
+    _tm_good_text,
+    ignore=("on_delta",),
+)
+async def _translate_text_stream(text: str, target_lang: str, glossary: str = "", on_delta: DeltaCallback = None) -> Tuple[bool, str]:
+    """Streaming single-style translate; `on_delta(accumulated)` is called as text arrives.
+
+    Output that still looks untranslated goes through the non-streaming helper
+    (which has the strict-mode retry), so only that chunk pays for a second call.
+    A stream that fails before any text arrives also falls back to that helper.
+    """
+    ok, out = await _gemini_stream_call(text, target_lang, glossary, on_delta=on_delta)
+    if not ok:
+        log.warning("[translate] stream failed, falling back to plain call: %s", str(out)[:200])
+        ok, out = await _gemini_translate_text(text, target_lang, glossary)
+        if ok and out and on_delta is not None:
+            on_delta(out)
+        return ok, out
+    if _seems_untranslated(text, out, target_lang) and not is_target_language(out, target_lang):
+        ok2, out2 = await _gemini_translate_text(text, target_lang, glossary)
+        if ok2 and out2:
+            out = out2
+            if on_delta is not None:
+                on_delta(out)
+    return ok, out
+
+
 # -------------------------
 # Gemini Vision OCR + translate image
 # -------------------------
@@ -1041,6 +1323,13 @@ async def _groq_qc_and_fix_id(source_text: str, translated_id: str) -> Tuple[boo
     # If pass=true but no fixed_translation, keep original.
     return True, translated_id, reason
 
+@_tm.memoize(
+    "multi",
+    _tm_sig("gemini", "TRANSLATE_GEMINI_MODEL", "gemini-2.5-flash-lite", "TRANSLATE_KO_SCHEMA", "TRANSLATE_KO_SYS_MSG"),
+    _tm_good_multi,
+    target="ko",
+)
+@_provider_limited
 async def _gemini_translate_text_ko_multi(text: str) -> Tuple[bool, Dict[str, str]]:
     """Gemini helper for Korean dual-style translation + romanization."""
     key = _pick_gemini_key()
@@ -1158,6 +1447,13 @@ async def _gemini_translate_text_ko_multi(text: str) -> Tuple[bool, Dict[str, st
         }
 
 
+@_tm.memoize(
+    "multi",
+    _tm_sig("gemini", "TRANSLATE_GEMINI_MODEL", "gemini-2.5-flash-lite", "TRANSLATE_ZH_SCHEMA", "TRANSLATE_ZH_SYS_MSG"),
+    _tm_good_multi,
+    target="zh",
+)
+@_provider_limited
 async def _gemini_translate_text_zh_multi(text: str) -> Tuple[bool, Dict[str, str]]:
     """Gemini helper for Chinese dual-style translation + pinyin romanization."""
     key = _pick_gemini_key()
@@ -1388,6 +1684,13 @@ class TranslateCommands(commands.Cog):
         self._register_lock = asyncio.Lock()
         self._target_overrides: Dict[int, str] = {}
         self._ensure_task: asyncio.Task | None = None
+        self._dict_task: asyncio.Task | None = None
+
+    async def cog_load(self) -> None:
+        # Download dicts + queue offset-index builds in the background; lookups
+        # fall back to the provider until the indexes are ready.
+        if self._dict_store.enabled:
+            self._dict_task = asyncio.create_task(self._dict_store.bootstrap())
 
     def _cooldown_ok(self, user_id: int) -> Tuple[bool, float]:
         cd = _as_float("TRANSLATE_COOLDOWN_SEC", 5.0)
@@ -2059,9 +2362,15 @@ class TranslateCommands(commands.Cog):
         dual_casual = ""
         dual_romaji = ""
         dual_fields_to_add: List[Tuple[str, str]] = []
+        stream_preview: Optional[_StreamPreview] = None
 
 
         if text_for_chat:
+            # Language ID lokal: teks yang sudah dalam bahasa target tidak dikirim ke provider.
+            src_lang, already_target = _langid(text_for_chat, target_code)
+            if already_target:
+                ja_dual_enable = ko_dual_enable = zh_dual_enable = False
+
             # Build optional glossary block from LangNixe dictionaries (if enabled in env).
             glossary_block = ""
             try:
@@ -2071,7 +2380,10 @@ class TranslateCommands(commands.Cog):
                         tcode = resolve_lang(tcode).code
                     except Exception:
                         tcode = str(target).strip().lower()
-                glossary_block = await self._dict_store.build_glossary_block(text_for_chat, target_code=tcode)
+                if not already_target:
+                    glossary_block = await self._dict_store.build_glossary_block(
+                        text_for_chat, target_code=tcode, source_code=src_lang
+                    )
             except Exception:
                 glossary_block = ""
 
@@ -2087,28 +2399,30 @@ class TranslateCommands(commands.Cog):
                     formal_parts: List[str] = []
                     casual_parts: List[str] = []
                     romaji_parts: List[str] = []
-                    for ch in chunks:
-                        if ja_dual_enable:
-                            ok_multi, res = await _gemini_translate_text_ja_multi(ch)
-                        elif ko_dual_enable:
-                            ok_multi, res = await _gemini_translate_text_ko_multi(ch)
-                        elif zh_dual_enable:
-                            ok_multi, res = await _gemini_translate_text_zh_multi(ch)
-                        else:
-                            ok_multi, res = False, {"reason": "invalid_dual_state"}
-
+                    if ja_dual_enable:
+                        multi_fn = _gemini_translate_text_ja_multi
+                    elif ko_dual_enable:
+                        multi_fn = _gemini_translate_text_ko_multi
+                    else:
+                        multi_fn = _gemini_translate_text_zh_multi
+                    # semua chunk paralel (dibatasi limit provider bersama), hasil tetap urut
+                    multi_results = await _translate_chunks(multi_fn, chunks)
+                    for ok_multi, res in multi_results:
                         if not ok_multi:
                             if debug:
                                 log.warning(
                                     "[translate] multi-style failed; fallback to single translation: %s",
-                                    res.get("reason"),
+                                    res.get("reason") if isinstance(res, dict) else res,
                                 )
-                            # fallback: single-mode translate seluruh teks supaya hasil tetap ada
-                            ok_single, out_single = await _gemini_translate_text(text_for_chat, target, glossary_block)
-                            if not ok_single:
-                                await interaction.followup.send(out_single, ephemeral=ephemeral)
+                            # fallback: single-mode translate semua chunk supaya hasil tetap ada
+                            single_results = await _translate_chunks(
+                                lambda c: _gemini_translate_text(c, target, glossary_block), chunks
+                            )
+                            bad = next((out for ok_s, out in single_results if not ok_s), None)
+                            if bad is not None:
+                                await interaction.followup.send(bad, ephemeral=ephemeral)
                                 return
-                            translated_chat = out_single.strip()
+                            translated_chat = "\n".join(out for _ok, out in single_results).strip()
                             ja_dual_enable = ko_dual_enable = zh_dual_enable = False
                             dual_kind = None
                             dual_formal = dual_casual = dual_romaji = ""
@@ -2132,14 +2446,38 @@ class TranslateCommands(commands.Cog):
                         if romaji_parts:
                             dual_romaji = "\n".join(p for p in romaji_parts if p).strip()
 
-                if not (ja_dual_enable or ko_dual_enable or zh_dual_enable):
+                if already_target:
+                    translated_chat = text_for_chat
+                elif not (ja_dual_enable or ko_dual_enable or zh_dual_enable):
                     # mode lama: satu hasil terjemahan saja
+                    # provider untuk translate dikunci ke Gemini; Groq hanya untuk phishing.
+                    # Chunk paralel, urutan dijaga; retry strict hanya untuk chunk yang belum terjemah.
+                    if _as_bool("TRANSLATE_STREAM_ENABLE", True):
+                        # Streaming: embed di-edit bertahap (throttled) selagi teks masuk.
+                        stream_preview = _StreamPreview(
+                            interaction, "Translation", _as_float("TRANSLATE_STREAM_EDIT_INTERVAL_SEC", 1.2)
+                        )
+                        stream_bufs = [""] * len(chunks)
+                        head = "\n\n".join(b.strip() for b in image_blocks if (b or "").strip())
+
+                        def _chunk_call(idx: int, c: str):
+                            def _on_delta(acc: str) -> None:
+                                stream_bufs[idx] = acc
+                                body = "\n".join(x for x in stream_bufs if x)
+                                stream_preview.update((head + "\n\n" + body).strip() if head else body)
+
+                            return _translate_text_stream(c, target, glossary_block, on_delta=_on_delta)
+
+                        chunk_results = await _translate_chunks(lambda ic: _chunk_call(*ic), list(enumerate(chunks)))
+                    else:
+                        chunk_results = await _translate_chunks(
+                            lambda c: _gemini_translate_text(c, target, glossary_block), chunks
+                        )
                     out_parts = []
-                    for ch in chunks:
-                        # provider untuk translate dikunci ke Gemini; Groq hanya untuk phishing.
-                        ok, out = await _gemini_translate_text(ch, target, glossary_block)
+                    for ok, out in chunk_results:
                         if not ok:
-                            await interaction.followup.send(out, ephemeral=ephemeral)
+                            if not (stream_preview and await stream_preview.finish(content=out)):
+                                await interaction.followup.send(out, ephemeral=ephemeral)
                             return
                         out_parts.append(out)
                     translated_chat = "\n".join(out_parts).strip()
@@ -2212,11 +2550,9 @@ class TranslateCommands(commands.Cog):
 
         full_text = "\n\n".join(blocks).strip()
         if not full_text:
-            await _safe_followup_send(
-                interaction,
-                content="Tidak ada teks yang bisa diterjemahkan dari pesan ini.",
-                ephemeral=ephemeral,
-            )
+            no_text = "Tidak ada teks yang bisa diterjemahkan dari pesan ini."
+            if not (stream_preview and await stream_preview.finish(content=no_text)):
+                await _safe_followup_send(interaction, content=no_text, ephemeral=ephemeral)
             return
 
         # Bangun embed final dari nol supaya:
@@ -2250,6 +2586,9 @@ class TranslateCommands(commands.Cog):
             footer_bits = [f"text={provider}", "image=gemini", f"target={target}"]
             final_embed.set_footer(text=" • ".join(footer_bits))
 
+        # Kalau sudah ada preview streaming, pesan yang sama di-edit jadi embed final.
+        if stream_preview and await stream_preview.finish(embed=final_embed, files=files):
+            return
         await _safe_followup_send(interaction, embed=final_embed, files=files, ephemeral=ephemeral)
 
 
@@ -2382,13 +2721,23 @@ class TranslateCommands(commands.Cog):
                 target_display = str(target_lang)
                 target_code = str(target_lang or "").strip().lower()
 
+            src_lang, already_target = _langid(text_to_translate, target_code)
+            if already_target:
+                await message.channel.send(
+                    f"Teks sudah dalam bahasa target ({target_display}), tidak perlu diterjemahkan.",
+                    reference=message,
+                )
+                return
+
             provider = _pick_provider()  # saat ini selalu "gemini"
             files: List[discord.File] = []
 
             # Optional glossary hinting (LangNixe) for single-mode translate.
             glossary_block = ""
             try:
-                glossary_block = await self._dict_store.build_glossary_block(text_to_translate, target_code=target_code)
+                glossary_block = await self._dict_store.build_glossary_block(
+                    text_to_translate, target_code=target_code, source_code=src_lang
+                )
             except Exception:
                 glossary_block = ""
 
@@ -2446,11 +2795,15 @@ class TranslateCommands(commands.Cog):
                     embed.add_field(name="Formal", value=(formal or "(empty)")[:1024], inline=False)
                     embed.add_field(name="Casual", value=(casual or "(empty)")[:1024], inline=False)
                 else:
-                    ok_single, out_single = await _gemini_translate_text(text_to_translate, target_lang, glossary_block)
-                    if not ok_single:
-                        await message.channel.send(out_single, reference=message)
+                    chunks = _chunk_text(text_to_translate, int(_as_float("TRANSLATE_MAX_CHARS", 1800) or 1800))
+                    results = await _translate_chunks(
+                        lambda c: _gemini_translate_text(c, target_lang, glossary_block), chunks
+                    )
+                    bad = next((out for ok_s, out in results if not ok_s), None)
+                    if bad is not None:
+                        await message.channel.send(bad, reference=message)
                         return
-                    translated = (out_single or "").strip()
+                    translated = "\n".join((out or "").strip() for _ok, out in results).strip()
                     embed = discord.Embed(title=f"Translation → {target_display}")
                     full_text = (translated or "(empty)").strip()
                     embed, files = _pack_text_into_embed(
@@ -6,6 +6,7 @@ from discord.ext import commands
 
 from nixe.helpers.persona import yandere
 from nixe.helpers.lucky_classifier import classify_image_meta
+from nixe.helpers.resolver import resolve_channel
 
 CFG_PATH = pathlib.Path(__file__).resolve().parents[1] / "config" / "gacha_guard.json"
 
@@ -69,7 +70,7 @@ class GachaLuckGuardRandomOnly(commands.Cog):
                 # redirect original images if redirect_channel set
                 if self.redirect_channel:
                     try:
-                        target = msg.guild.get_channel(self.redirect_channel) or await self.bot.fetch_channel(self.redirect_channel)
+                        target = await resolve_channel(self.bot, self.redirect_channel)
                         files = [await a.to_file() for a in images]
                         content = f"{user_mention} dipindah ke sini karena {reason}."
                         await target.send(content=content, files=files)
@@ -80,7 +81,7 @@ class GachaLuckGuardRandomOnly(commands.Cog):
             if best_conf >= self.min_conf_redirect and self.redirect_channel:
                 # forward only, do not delete
                 try:
-                    target = msg.guild.get_channel(self.redirect_channel) or await self.bot.fetch_channel(self.redirect_channel)
+                    target = await resolve_channel(self.bot, self.redirect_channel)
                     files = [await a.to_file() for a in images]
                     await target.send(content=f"{msg.author.mention} kontenmu dipindah (uncertain).", files=files)
                 except Exception:
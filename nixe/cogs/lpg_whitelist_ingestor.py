@@ -5,6 +5,9 @@ from typing import Any, Dict, List
 import discord
 from discord.ext import commands, tasks
 
+from nixe.helpers import thread_crawler
+from nixe.helpers.resolver import resolve_channel
+
 log = logging.getLogger("nixe.cogs.lpg_whitelist_ingestor")
 
 def _parse_int(val: str | int | None, default: int = 0) -> int:
@@ -115,7 +118,7 @@ class LPGWhitelistIngestor(commands.Cog):
         try:
             parent = None
             if self.parent_id:
-                parent = guild.get_channel(self.parent_id) or await self.bot.fetch_channel(self.parent_id)
+                parent = await resolve_channel(self.bot, self.parent_id)
             # gather active + archived threads to search
             threads: List[discord.Thread] = []
             for th in guild.threads:
@@ -152,32 +155,43 @@ class LPGWhitelistIngestor(commands.Cog):
         items: List[Dict[str, Any]] = (data or {}).get("attachments", [])
         seen = {(it.get("message_id"), it.get("attachment_id")) for it in items}
         added = 0
-
-        try:
-            async for msg in thr.history(limit=self.scan_limit, oldest_first=True):
-                for att in (msg.attachments or []):
-                    if not _is_image(att):
-                        continue
-                    key = (msg.id, att.id)
-                    if key in seen:
-                        continue
-                    entry = {
-                        "message_id": msg.id,
-                        "attachment_id": att.id,
-                        "filename": att.filename,
-                        "size": att.size,
-                        "content_type": att.content_type,
-                        "url": att.url,
-                        "proxy_url": att.proxy_url,
-                        "created_at": int(msg.created_at.timestamp()) if msg.created_at else None,
-                    }
-                    items.append(entry)
-                    seen.add(key)
-                    added += 1
-        except Exception as e:
-            log.warning("[lpg-wl-ingest] scan failed: %r", e)
+        # Checkpoint lives in the DB file itself so it can never run ahead of the stored items.
+        since = 0
+        if int(data.get("thread_id") or thr.id) == thr.id:
+            since = _parse_int(data.get("last_message_id"), 0)
+
+        async def _on_msg(msg) -> None:
+            nonlocal added
+            for att in (msg.attachments or []):
+                if not _is_image(att):
+                    continue
+                key = (msg.id, att.id)
+                if key in seen:
+                    continue
+                entry = {
+                    "message_id": msg.id,
+                    "attachment_id": att.id,
+                    "filename": att.filename,
+                    "size": att.size,
+                    "content_type": att.content_type,
+                    "url": att.url,
+                    "proxy_url": att.proxy_url,
+                    "created_at": int(msg.created_at.timestamp()) if msg.created_at else None,
+                }
+                items.append(entry)
+                seen.add(key)
+                added += 1
+
+        stats = await thread_crawler.crawl(
+            thr, f"lpg_whitelist:{thr.id}", on_message=_on_msg,
+            since_id=since, limit=self.scan_limit,
+        )
+        if stats.get("error"):
+            log.warning("[lpg-wl-ingest] scan failed: %s", stats["error"])
 
         data["attachments"] = items
+        data["thread_id"] = thr.id
+        data["last_message_id"] = int(stats.get("last_message_id") or since or 0)
         self._save_db(data)
         total = len(items)
         if added or total != self._last_count:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging, os, json
 import discord
 from discord.ext import commands
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger("nixe.cogs.lpg_whitelist_thread_manager")
 
@@ -54,7 +55,7 @@ class WhitelistThreadManager(commands.Cog):
         # Respect explicit NO_NEW_THREADS flag to avoid creating extra threads if admin wants a fixed one.
         no_new = (os.getenv("LPG_WHITELIST_NO_NEW_THREADS") or "0").strip().lower() in ("1", "true", "yes", "on")
         try:
-            parent = self.bot.get_channel(self.parent_chan_id) or await self.bot.fetch_channel(self.parent_chan_id)
+            parent = await resolve_channel(self.bot, self.parent_chan_id)
         except Exception as e:
             log.warning("[lpg-wl] failed to resolve parent channel: %r", e)
             return
@@ -11,11 +11,12 @@ from nixe.config_phash import (
     PHASH_DB_MESSAGE_ID as DB_MESSAGE_ID,
     PHASH_DB_STRICT_EDIT as STRICT_EDIT,
 )
+from nixe.helpers.resolver import resolve_channel
 
 async def _adopt_pinned_if_missing(bot, thread_id: int):
     """Try to adopt an existing pinned message in the DB thread when STRICT_EDIT is on."""
     try:
-        chan = bot.get_channel(thread_id) or await bot.fetch_channel(thread_id)
+        chan = await resolve_channel(bot, thread_id)
     except Exception as e:
         log.warning("phash-db: cannot resolve thread %s: %r", thread_id, e)
         return None
@@ -5,6 +5,7 @@ from discord.ext import commands
 from nixe.state_runtime import set_phash_ids
 import discord
 from nixe import config
+from nixe.helpers.resolver import resolve_channel
 log = logging.getLogger(__name__)
 STRICT_EDIT = (os.getenv('PHASH_DB_STRICT_EDIT','0')=='1')
 NO_FALLBACK = (os.getenv('NIXE_PHASH_DISABLE_LOG_FALLBACK','1')=='1')
@@ -38,7 +39,7 @@ class PhashDbThreadManager(commands.Cog):
         if not chan_id:
             log.warning("PHISH_LOG_CHAN_ID/LOG_CHANNEL_ID not set; skip phash-db ensure"); return
 
-        chan = self.bot.get_channel(chan_id) or await self.bot.fetch_channel(chan_id)
+        chan = await resolve_channel(self.bot, chan_id)
         if not isinstance(chan, (discord.TextChannel, discord.ForumChannel)):
             log.warning("Channel %s is not Text/Forum", chan_id); return
 
@@ -47,7 +48,7 @@ class PhashDbThreadManager(commands.Cog):
                      (int(os.getenv('NIXE_PHASH_DB_THREAD_ID')) if (os.getenv('NIXE_PHASH_DB_THREAD_ID') or '').isdigit() else None))
         thread = None
         if thread_id:
-            thread = self.bot.get_channel(thread_id) or await self.bot.fetch_channel(thread_id)
+            thread = await resolve_channel(self.bot, thread_id)
 
         if thread is None and getattr(chan, "threads", None):
             for t in chan.threads:
@@ -5,6 +5,7 @@ import os, logging, asyncio, discord
 from discord.ext import commands
 from nixe.state_runtime import get_phash_ids
 from nixe.helpers.img_hashing import phash_list_from_bytes, dhash_list_from_bytes
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger(__name__)
 
@@ -69,7 +70,7 @@ class PhashImagephisingWatcher(commands.Cog):
         if not dynamic_dest:
             return None
         try:
-            d = self.bot.get_channel(dynamic_dest) or await self.bot.fetch_channel(dynamic_dest)
+            d = await resolve_channel(self.bot, dynamic_dest)
             if isinstance(d, discord.Thread) and getattr(d, "archived", False):
                 try:
                     await d.edit(archived=False, locked=False, reason="auto-unarchive phash db thread")
@@ -98,7 +99,7 @@ class PhashImagephisingWatcher(commands.Cog):
         if not dest:
             if not NO_FALLBACK and LOG_CH_ID:
                 try:
-                    d = self.bot.get_channel(LOG_CH_ID) or await self.bot.fetch_channel(LOG_CH_ID)
+                    d = await resolve_channel(self.bot, LOG_CH_ID)
                     dest = d if isinstance(d, (discord.Thread, discord.TextChannel)) else None
                 except Exception:
                     dest = None
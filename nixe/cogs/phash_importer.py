@@ -5,6 +5,9 @@ import os, io, asyncio, logging
 import discord
 from discord.ext import commands
 
+from nixe.helpers import thread_crawler
+from nixe.helpers.resolver import resolve_channel
+
 log = logging.getLogger("nixe.cogs.phash_importer")
 
 INBOX_ID = int(os.getenv("PHASH_INBOX_CHANNEL_ID", "0"))
@@ -22,33 +25,43 @@ class PhashImporter(commands.Cog):
 
     @commands.command(name="phash_import_now")
     @commands.has_permissions(administrator=True)
-    async def phash_import_now(self, ctx: commands.Context, source_thread_id: int = 0):
+    async def phash_import_now(self, ctx: commands.Context, source_thread_id: int = 0, mode: str = ""):
+        """Import images newer than the last run (`full` re-imports the whole thread)."""
         src_id = source_thread_id or SOURCE_THREAD_ID
         if not INBOX_ID:
             return await ctx.reply("PHASH_INBOX_CHANNEL_ID belum di-set.")
         if not src_id:
             return await ctx.reply("Berikan thread id sumber atau set PHASH_SOURCE_THREAD_ID.")
 
-        inbox = ctx.guild.get_channel(INBOX_ID) or await self.bot.fetch_channel(INBOX_ID)
+        inbox = await resolve_channel(self.bot, INBOX_ID)
         src = await self.bot.fetch_channel(src_id)
         if not isinstance(src, discord.Thread):
             return await ctx.reply(f"{src_id} bukan thread.")
 
         sent = 0
-        async for msg in src.history(limit=None, oldest_first=True):
-            for att in msg.attachments:
-                if _is_image(att):
-                    try:
-                        data = await att.read()
-                        file = discord.File(io.BytesIO(data), filename=att.filename)
-                        meta = f"[imported from thread {src_id} msg {msg.id}] {att.url}"
-                        await inbox.send(content=meta, file=file)
-                        sent += 1
-                        await asyncio.sleep(0.4)
-                    except Exception as e:
-                        log.warning("skip one attachment: %r", e)
-                        await asyncio.sleep(0.5)
-        await ctx.reply(f"Imported {sent} images from thread {src_id} into inbox <#{INBOX_ID}>.")
+
+        async def _on_att(msg, att, data: bytes) -> None:
+            nonlocal sent
+            try:
+                file = discord.File(io.BytesIO(data), filename=att.filename)
+                meta = f"[imported from thread {src_id} msg {msg.id}] {att.url}"
+                await inbox.send(content=meta, file=file)
+                sent += 1
+                await asyncio.sleep(0.4)
+            except Exception as e:
+                log.warning("skip one attachment: %r", e)
+                await asyncio.sleep(0.5)
+
+        # Downloads run concurrently per batch; sends stay sequential (rate limits).
+        stats = await thread_crawler.crawl(
+            src, f"phash_import:{src_id}",
+            on_attachment=_on_att, want_attachment=_is_image,
+            full=(mode or "").lower() == "full",
+        )
+        await ctx.reply(
+            f"Imported {sent} images from thread {src_id} into inbox <#{INBOX_ID}> "
+            f"(scanned {stats['scanned']} new msgs since {stats['resumed_from'] or 'start'})."
+        )
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(PhashImporter(bot))
@@ -13,18 +13,12 @@ import discord
 from discord.ext import commands
 
 from nixe.helpers.ban_utils import emit_phish_detected
+from nixe.helpers.lazy_import import optional_lazy_module
 
 log = logging.getLogger("nixe.cogs.phash_match_guard")
 
-try:
-    from PIL import Image as _PIL_Image  # type: ignore
-except Exception:  # pragma: no cover
-    _PIL_Image = None
-
-try:
-    import imagehash as _imagehash  # type: ignore
-except Exception:  # pragma: no cover
-    _imagehash = None
+_PIL_Image = optional_lazy_module("PIL.Image")
+_imagehash = optional_lazy_module("imagehash")
 
 HEX16 = re.compile(r"^[0-9a-f]{16}$", re.I)
 
@@ -4,6 +4,7 @@ import os, io, asyncio, logging
 
 import discord
 from discord.ext import commands
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger("nixe.cogs.phash_relay_inbox")
 
@@ -33,7 +34,7 @@ class PhashRelayInbox(commands.Cog):
             if message.id in self._seen:
                 return
             self._seen.add(message.id)
-            inbox = message.guild.get_channel(INBOX_ID) or await self.bot.fetch_channel(INBOX_ID)
+            inbox = await resolve_channel(self.bot, INBOX_ID)
             for att in message.attachments:
                 if _is_image(att):
                     data = await att.read()
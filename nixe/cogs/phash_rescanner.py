@@ -7,8 +7,9 @@ from typing import Set, Optional
 from discord.ext import commands
 from nixe.state_runtime import get_phash_ids
 
-from nixe.helpers import img_hashing
+from nixe.helpers import img_hashing, thread_crawler
 from nixe.helpers.phash_board import get_pinned_db_message, edit_pinned_db
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger(__name__)
 
@@ -84,18 +85,18 @@ class PhashRescanner(commands.Cog):
             existing |= _extract(msg.content)
         return existing
 
-    async def _run_backfill(self, limit: Optional[int]):
+    async def _run_backfill(self, limit: Optional[int], full: bool = False):
         # resolve source thread
         src: Optional[discord.Thread] = None
         try:
             if SRC_THREAD_ID:
-                ch = self.bot.get_channel(SRC_THREAD_ID) or await self.bot.fetch_channel(SRC_THREAD_ID)
+                ch = await resolve_channel(self.bot, SRC_THREAD_ID)
                 if isinstance(ch, discord.Thread):
                     src = ch
             else:
                 tid, mid = get_phash_ids()
                 rtid = tid or DB_THREAD_ID
-                dbth = self.bot.get_channel(rtid) or await self.bot.fetch_channel(rtid)
+                dbth = await resolve_channel(self.bot, rtid)
                 parent = getattr(dbth, "parent", None)
                 if parent:
                     async for t in parent.archived_threads(limit=200, private=False):
@@ -112,29 +113,36 @@ class PhashRescanner(commands.Cog):
             return
 
         existing = await self._resolve_board_tokens()
+        # Empty board: checkpoint is meaningless, hash the whole thread again.
+        full = full or not existing
 
         new_tokens: Set[str] = set()
-        async for m in src.history(limit=limit):
-            for att in getattr(m, "attachments", ()) or ():
-                nm = (att.filename or "").lower()
-                if not any(nm.endswith(ext) for ext in IMAGE_EXTS): 
-                    continue
-                try:
-                    raw = await att.read()
-                except Exception:
-                    raw = b""
-                if not raw:
-                    continue
-                for h in img_hashing.phash_list_from_bytes(raw, max_frames=MAX_FRAMES):
-                    if h not in existing:
-                        new_tokens.add(h)
+
+        async def _on_att(_m, _att, raw: bytes) -> None:
+            for h in img_hashing.phash_list_from_bytes(raw, max_frames=MAX_FRAMES):
+                if h not in existing:
+                    new_tokens.add(h)
+
+        # Only messages after the last checkpoint are fetched/downloaded; a limited
+        # rescan takes the newest `limit` of them. The checkpoint is committed only
+        # once the board holds the hashes.
+        key = f"phash_rescanner:{src.id}"
+        stats = await thread_crawler.crawl(
+            src, key,
+            on_attachment=_on_att,
+            want_attachment=lambda att: any((att.filename or "").lower().endswith(ext) for ext in IMAGE_EXTS),
+            full=full, limit=limit, newest_first=bool(limit), commit=False,
+        )
 
         if not new_tokens:
+            thread_crawler.commit_checkpoint(key, src, stats)
             log.info("[phash-rescanner] backfill: nothing new")
             return
 
         merged = existing | new_tokens
         ok = await edit_pinned_db(self.bot, merged)
+        if ok:
+            thread_crawler.commit_checkpoint(key, src, stats)
         log.info("[phash-rescanner] backfill merge: +%d -> %s", len(new_tokens), "OK" if ok else "SKIPPED")
 
     # permissions decorator (toggleable)
@@ -146,7 +154,7 @@ class PhashRescanner(commands.Cog):
     @commands.guild_only()
     @commands.command(name="phash_rescan", aliases=["phash-rescan","phashrescan","rescanphash","pr"])
     @dec_perms
-    async def phash_rescan_cmd(self, ctx: commands.Context, limit: int = 0):
+    async def phash_rescan_cmd(self, ctx: commands.Context, limit: int = 0, mode: str = ""):
         # quick reaction feedback even if send fails
         try:
             await ctx.message.add_reaction("🔄")
@@ -164,7 +172,8 @@ class PhashRescanner(commands.Cog):
         except Exception:
             pass
         try:
-            await self._run_backfill(limit or None)
+            # `&phash_rescan 0 full` ignores the checkpoint and rescans the whole thread.
+            await self._run_backfill(limit or None, full=(mode or "").lower() == "full")
         except Exception as e:
             log.exception("[phash-rescanner] rescan failed: %s", e)
             try:
@@ -7,6 +7,7 @@ import aiohttp
 from discord.ext import commands
 
 from nixe.helpers import banlog
+from nixe.helpers.resolver import resolve_member
 
 log = logging.getLogger("nixe.cogs.phish_ban_embed")
 
@@ -172,7 +173,7 @@ class PhishBanEmbed(commands.Cog):
             user = None
             if guild and uid:
                 try:
-                    user = guild.get_member(int(uid)) or await guild.fetch_member(int(uid))
+                    user = await resolve_member(guild, int(uid))
                 except Exception:
                     user = None
             # Ban gating: require pHash confirmed AND (optionally) Groq OCR/Vision confirmation
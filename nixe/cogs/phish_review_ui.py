@@ -16,6 +16,7 @@ from typing import Optional
 import discord
 from discord.ext import commands
 from nixe.helpers import phish_review_memory as _mem
+from nixe.helpers.resolver import resolve_member
 
 log = logging.getLogger(__name__)
 
@@ -192,7 +193,7 @@ class PhishReviewView(_BaseView):
         if not guild:
             return await self._ack(interaction, "Guild not found.")
         try:
-            user = guild.get_member(self.target_user_id) or await guild.fetch_member(self.target_user_id)
+            user = await resolve_member(guild, self.target_user_id)
         except Exception:
             user = None
         try:
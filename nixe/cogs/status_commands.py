@@ -185,5 +185,71 @@ class StatusCommands(commands.Cog):
 
         await ctx.reply(embed=embed, mention_author=False)
 
+    # ----------- Thread crawler status -----------
+    @commands.guild_only()
+    @commands.command(name="crawl-status")
+    async def crawl_status(self, ctx: commands.Context):
+        """Tampilkan progress crawler thread (checkpoint terakhir, jumlah pesan/attachment)."""
+        from nixe.helpers import thread_crawler
+        prog = thread_crawler.progress()
+        store = thread_crawler.default_store()
+        embed = discord.Embed(title="Thread Crawler", color=0x2196f3)
+        if not prog:
+            embed.description = "Belum ada crawl di proses ini."
+        for key, p in sorted(prog.items())[:20]:
+            ck = store.get(key)
+            state = "running" if p.get("running") else ("done" if p.get("complete") else "partial")
+            val = (
+                f"{state} scanned={p.get('scanned', 0)} att={p.get('attachments', 0)}\n"
+                f"from={p.get('resumed_from') or '-'} → {p.get('last_message_id') or '-'}"
+                f" (saved={ck.get('last_message_id') or '-'})"
+            )
+            if p.get("error"):
+                val += f"\nerr={str(p['error'])[:80]}"
+            embed.add_field(name=key[:256], value=val, inline=False)
+        await ctx.reply(embed=embed, mention_author=False)
+
+    # ----------- Translation memory -----------
+    @commands.guild_only()
+    @commands.command(name="translate-memory")
+    async def translate_memory_status(self, ctx: commands.Context):
+        """Tampilkan hit rate translation memory (LRU + SQLite)."""
+        from nixe.translate import memory as tm
+        rep = tm.report()
+        embed = discord.Embed(title="Translation Memory", color=0x9c27b0)
+        embed.add_field(name="Enabled", value=str(rep.get("enabled")), inline=True)
+        embed.add_field(name="Hit rate", value=f"{float(rep.get('hit_rate') or 0) * 100:.1f}%", inline=True)
+        embed.add_field(name="LRU entries", value=str(rep.get("lru_size", 0)), inline=True)
+        embed.add_field(
+            name="Counters",
+            value=(f"lru={rep.get('lru_hit', 0)} db={rep.get('db_hit', 0)} shared={rep.get('shared', 0)} "
+                   f"miss={rep.get('miss', 0)} stored={rep.get('store', 0)}"),
+            inline=False,
+        )
+        await ctx.reply(embed=embed, mention_author=False)
+
+    # ----------- Dictionary offset index -----------
+    @commands.guild_only()
+    @commands.command(name="dict-index")
+    async def dict_index_status(self, ctx: commands.Context):
+        """Tampilkan progress build offset index kamus lokal (background, resumable)."""
+        from nixe.translate.local_dict_store import index_progress
+        prog = index_progress()
+        embed = discord.Embed(title="Dictionary Index", color=0x795548)
+        if not prog:
+            embed.description = "Belum ada index yang dijadwalkan di proses ini."
+        for name, p in sorted(prog.items())[:20]:
+            val = f"{p.get('state', '?')}"
+            if p.get("parts_total"):
+                val += f" parts={p.get('parts_done', 0)}/{p.get('parts_total')} rows={p.get('rows', 0)}"
+            if p.get("resumed_parts"):
+                val += f" resumed={p.get('resumed_parts')}"
+            if p.get("current"):
+                val += f"\nnow={str(p['current'])[:80]}"
+            if p.get("error"):
+                val += f"\nerr={str(p['error'])[:80]}"
+            embed.add_field(name=name[:256], value=val, inline=False)
+        await ctx.reply(embed=embed, mention_author=False)
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(StatusCommands(bot))
@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import ast
 import asyncio
 import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import json
 import logging
 import os
 import pkgutil
-from typing import Iterable, List, Tuple
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 from nixe.helpers.bootstate import mark_cogs_loaded
 
@@ -29,6 +37,42 @@ SKIP_EXTENSIONS = {
     "nixe.cogs.image_phish_gemini_guard",
 }
 
+# Bump when the plan file layout changes; older plans are ignored.
+PLAN_VERSION = 2
+
+# A setup() that touches any of these depends on what loaded before it (e.g. the a15
+# loaders check bot.get_cog() and load_extension() the real cog). Such cogs are load
+# barriers: everything sorted before them finishes first, everything after starts later.
+_SETUP_ORDER_ATTRS = frozenset({
+    "get_cog", "cogs", "extensions", "load_extension", "unload_extension", "reload_extension",
+    "remove_cog", "get_command", "remove_command",
+})
+
+# Explicit barriers for dependencies the setup() scan cannot see (e.g. via helper functions).
+SEQUENTIAL_COGS = frozenset()
+
+# Heavy third-party deps imported at module scope by many cogs. Warming them in
+# worker threads while the a00 overlays load takes them off the critical path.
+DEFAULT_PREWARM_MODULES = ("aiohttp", "numpy", "PIL.Image", "imagehash", "groq")
+
+# Per-cog timings of the last load (see _log_report / get_load_report).
+LOAD_REPORT: Dict[str, object] = {}
+
+
+def _env_bool(key: str, default: str = "1") -> bool:
+    return (os.getenv(key, default) or "").strip().lower() in ("1", "true", "yes", "y", "on")
+
+
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int((os.getenv(key) or "").strip() or default)
+    except Exception:
+        return default
+
+
+def _plan_path() -> str:
+    return (os.getenv("NIXE_COGS_PLAN_PATH") or "data/cogs_load_plan.json").strip()
+
 
 def _parse_required_from_env() -> Tuple[str, ...]:
     raw = (os.getenv("NIXE_REQUIRED_COGS") or "").strip()
@@ -57,50 +101,323 @@ def _iter_cog_names(package_root: str) -> List[str]:
     names.sort()  # deterministic load order
     return names
 
+class _TimingLoader(importlib.abc.Loader):
+    """Delegating loader that records how long a cog module body takes to exec."""
+
+    def __init__(self, inner, sink: Dict[str, float]):
+        self._inner = inner
+        self._sink = sink
+
+    def create_module(self, spec):
+        return self._inner.create_module(spec)
+
+    def exec_module(self, module):
+        t0 = time.perf_counter()
+        try:
+            self._inner.exec_module(module)
+        finally:
+            self._sink[module.__name__] = time.perf_counter() - t0
+
+    def __getattr__(self, item):
+        return getattr(self._inner, item)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta-path hook active only while the loader runs; wraps cog specs in _TimingLoader."""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.import_s: Dict[str, float] = {}
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not fullname.startswith(self.prefix):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is None or spec.loader is None:
+            return None
+        spec.loader = _TimingLoader(spec.loader, self.import_s)
+        return spec
+
+
+def _package_dir(package_root: str) -> Optional[str]:
+    try:
+        spec = importlib.util.find_spec(package_root)
+        locs = list(spec.submodule_search_locations or []) if spec else []
+        return locs[0] if locs else None
+    except Exception:
+        return None
+
+
+def _module_mtime(pkg_dir: str, name: str) -> int:
+    try:
+        return os.stat(os.path.join(pkg_dir, name.rsplit(".", 1)[-1] + ".py")).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _setup_is_order_dependent(path: str) -> bool:
+    """True if the module's setup() looks up / loads / removes other cogs or commands."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return False
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "setup":
+            for n in ast.walk(node):
+                if isinstance(n, ast.Attribute) and n.attr in _SETUP_ORDER_ATTRS:
+                    return True
+    return False
+
+
+def _scan_barriers(pkg_dir: Optional[str], names: List[str], cached: Optional[dict] = None) -> Dict[str, List[int]]:
+    """module -> [file mtime, is_barrier]; files whose mtime is unchanged reuse `cached`."""
+    out: Dict[str, List[int]] = {}
+    env = {n.strip() for n in (os.getenv("NIXE_COGS_SEQUENTIAL") or "").split(",") if n.strip()}
+    for name in names:
+        mtime = _module_mtime(pkg_dir, name) if pkg_dir else 0
+        prev = (cached or {}).get(name)
+        if prev and int(prev[0]) == mtime and mtime:
+            flag = int(prev[1])
+        else:
+            path = os.path.join(pkg_dir, name.rsplit(".", 1)[-1] + ".py") if pkg_dir else ""
+            flag = int(bool(path) and _setup_is_order_dependent(path))
+        if name in SEQUENTIAL_COGS or name in env:
+            flag = 1
+        out[name] = [mtime, flag]
+    return out
+
+
+def _read_plan(package_root: str, pkg_dir: Optional[str]) -> Optional[dict]:
+    """Return the cached plan if it still matches the cogs directory, else None."""
+    if not pkg_dir or not _env_bool("NIXE_COGS_PLAN_ENABLE", "1"):
+        return None
+    try:
+        with open(_plan_path(), "r", encoding="utf-8") as f:
+            plan = json.load(f)
+        if int(plan.get("version") or 0) != PLAN_VERSION or plan.get("package") != package_root:
+            return None
+        # Directory mtime changes whenever a module is added, removed or renamed.
+        if int(plan.get("dir_mtime_ns") or 0) != os.stat(pkg_dir).st_mtime_ns:
+            return None
+        if list(plan.get("skip") or []) != sorted(SKIP_EXTENSIONS):
+            return None
+        if not isinstance(plan.get("names"), list):
+            return None
+        return plan
+    except Exception:
+        return None
+
+
+def _write_plan(package_root: str, pkg_dir: Optional[str], names: List[str], disabled: Dict[str, int],
+                deps: Optional[Dict[str, List[int]]] = None) -> None:
+    if not pkg_dir or not _env_bool("NIXE_COGS_PLAN_ENABLE", "1"):
+        return
+    path = _plan_path()
+    try:
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        data = {
+            "version": PLAN_VERSION,
+            "package": package_root,
+            "dir_mtime_ns": os.stat(pkg_dir).st_mtime_ns,
+            "skip": sorted(SKIP_EXTENSIONS),
+            "names": names,
+            # module -> file mtime when it was found disabled; an edit re-enables it.
+            "disabled": disabled,
+            # module -> [file mtime, setup() is order dependent]
+            "deps": deps or {},
+        }
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, path)
+    except Exception as e:
+        LOGGER.debug("cogs_loader: cannot write load plan %s: %r", path, e)
+
+
+def _resolve_plan(package_root: str) -> Tuple[List[str], Dict[str, int], Optional[str], bool, Dict[str, List[int]]]:
+    """Return (names, disabled, pkg_dir, from_cache, deps)."""
+    pkg_dir = _package_dir(package_root)
+    plan = _read_plan(package_root, pkg_dir)
+    if plan is not None:
+        names = [str(n) for n in plan["names"]]
+        disabled: Dict[str, int] = {}
+        for mod, mtime in (plan.get("disabled") or {}).items():
+            # Only trust the "disabled" verdict while the module file is unchanged.
+            if pkg_dir and _module_mtime(pkg_dir, mod) == int(mtime or 0):
+                disabled[mod] = int(mtime or 0)
+        return names, disabled, pkg_dir, True, _scan_barriers(pkg_dir, names, plan.get("deps"))
+    names = _iter_cog_names(package_root)
+    return names, {}, pkg_dir, False, _scan_barriers(pkg_dir, names)
+
+
+def _prewarm_worker(mod: str) -> None:
+    try:
+        importlib.import_module(mod)
+    except Exception:
+        pass
+
+
+def _start_prewarm() -> List[threading.Thread]:
+    """Import heavy shared deps in background threads (module import locks keep this safe)."""
+    if not _env_bool("NIXE_COGS_PREWARM", "1"):
+        return []
+    raw = (os.getenv("NIXE_COGS_PREWARM_MODULES") or "").strip()
+    mods = [m.strip() for m in raw.split(",") if m.strip()] if raw else list(DEFAULT_PREWARM_MODULES)
+    threads = []
+    for mod in mods:
+        if mod in sys.modules:
+            continue
+        t = threading.Thread(target=_prewarm_worker, args=(mod,), name=f"cogs-prewarm:{mod}", daemon=True)
+        t.start()
+        threads.append(t)
+    return threads
+
+
 async def _load_one(bot, name: str) -> None:
     await bot.load_extension(name)
     LOGGER.info("✅ Loaded cog: %s", name)
 
+
+def _is_no_entry_point(e: Exception) -> bool:
+    try:
+        from discord.ext.commands import errors as _errors
+        return isinstance(e, _errors.NoEntryPointError)
+    except Exception:
+        return type(e).__name__ == "NoEntryPointError"
+
+
+def _log_report(timings: Dict[str, Tuple[float, float]], wall_s: float, from_cache: bool,
+                barriers: Optional[List[str]] = None) -> None:
+    rows = sorted(timings.items(), key=lambda kv: kv[1][0] + kv[1][1], reverse=True)
+    LOAD_REPORT.clear()
+    LOAD_REPORT.update({
+        "wall_ms": round(wall_s * 1000.0, 1),
+        "sum_ms": round(sum(i + s for (i, s) in timings.values()) * 1000.0, 1),
+        "plan_cached": from_cache,
+        "barriers": list(barriers or []),
+        "cogs": [
+            {"name": n, "import_ms": round(i * 1000.0, 1), "setup_ms": round(s * 1000.0, 1)}
+            for (n, (i, s)) in rows
+        ],
+    })
+    top = max(0, _env_int("NIXE_COGS_REPORT_TOP", 15))
+    lines = [
+        f"  {n.rsplit('.', 1)[-1]:<48} import={i * 1000.0:8.1f}ms setup={s * 1000.0:8.1f}ms"
+        for (n, (i, s)) in rows[:top]
+    ]
+    LOGGER.info(
+        "[cogs-startup] %d cogs in %.1fms wall (sum %.1fms, plan=%s, barriers=%d); slowest:\n%s",
+        len(rows), LOAD_REPORT["wall_ms"], LOAD_REPORT["sum_ms"],
+        "cached" if from_cache else "discovered", len(barriers or []), "\n".join(lines),
+    )
+
+
+def get_load_report() -> Dict[str, object]:
+    """Return the timing report of the most recent load (empty before boot)."""
+    return dict(LOAD_REPORT)
+
+
 async def _load_all_impl(bot, package_root: str = "nixe.cogs") -> List[str]:
     required = set(_parse_required_from_env())
+    t_start = time.perf_counter()
 
     try:
-        names = _iter_cog_names(package_root)
+        names, disabled, pkg_dir, from_cache, deps = _resolve_plan(package_root)
     except Exception as e:
         LOGGER.error("cogs_loader: cannot enumerate %s: %r", package_root, e)
         raise
 
     loaded: List[str] = []
     errors: List[Tuple[str, str]] = []
+    timings: Dict[str, Tuple[float, float]] = {}
+    finder = _TimingFinder(package_root + ".")
+    prewarm = _start_prewarm()
 
-    # Force env overlay first (critical: it merges runtime_env.json into os.environ).
-    env_first = "nixe.cogs.a00_env_hybrid_overlay"
-    if env_first in names:
-        try:
-            await _load_one(bot, env_first)
-            loaded.append(env_first)
-        except Exception as e:
-            errors.append((env_first, repr(e)))
-    # Load the rest (sorted)
-    for name in names:
-        if name == env_first:
-            continue
+    async def _load_timed(name: str) -> None:
+        t0 = time.perf_counter()
         try:
             await _load_one(bot, name)
             loaded.append(name)
         except Exception as e:
+            if _is_no_entry_point(e) and pkg_dir and name not in required:
+                # No setup(): this module can never load; skip it next boot.
+                disabled[name] = _module_mtime(pkg_dir, name)
             # Don't silently skip: log as ERROR so you can see failures in INFO-level deployments.
             msg = str(e)
             # Common benign case: duplicate Cog name from legacy stub modules.
             if ("already loaded" in msg) and ("Cog named" in msg or "LinkPhishGuard" in msg):
                 LOGGER.warning("⚠️ Duplicate cog ignored for %s (%s)", name, msg)
-                continue
+                return
             # Only print tracebacks for required cogs; otherwise keep logs clean.
             if name in required:
                 LOGGER.error("❌ Failed to load %s: %r", name, e, exc_info=True)
             else:
                 LOGGER.error("❌ Failed to load %s: %r", name, e)
             errors.append((name, repr(e)))
+        finally:
+            total = time.perf_counter() - t0
+            imp = finder.import_s.get(name, 0.0)
+            timings[name] = (imp, max(0.0, total - imp))
+
+    barriers: List[str] = []
+    sys.meta_path.insert(0, finder)
+    try:
+        # Force env overlay first (critical: it merges runtime_env.json into os.environ).
+        env_first = "nixe.cogs.a00_env_hybrid_overlay"
+        if env_first in names:
+            await _load_timed(env_first)
+
+        todo = [n for n in names if n != env_first and n not in disabled]
+        # a00 overlays patch modules/env at import time; keep them strictly ordered.
+        ordered = [n for n in todo if n.rsplit(".", 1)[-1].startswith("a00")]
+        rest = [n for n in todo if n not in ordered]
+        for name in ordered:
+            await _load_timed(name)
+
+        barriers = [n for n in rest if (deps.get(n) or [0, 0])[1]]
+        if _env_bool("NIXE_COGS_PARALLEL", "1") and len(rest) > 1:
+            # Tasks start in sorted order, so module bodies still exec in the old order;
+            # only the awaits inside setup()/cog_load() overlap. A barrier cog waits for
+            # everything before it and loads alone, as it did in the sequential loader.
+            sem = asyncio.Semaphore(max(1, _env_int("NIXE_COGS_CONCURRENCY", 8)))
+
+            async def _guarded(name: str) -> None:
+                async with sem:
+                    await _load_timed(name)
+
+            batch: List[str] = []
+            for name in rest:
+                if name in barriers:
+                    await asyncio.gather(*[_guarded(n) for n in batch])
+                    batch = []
+                    await _load_timed(name)
+                else:
+                    batch.append(name)
+            await asyncio.gather(*[_guarded(n) for n in batch])
+        else:
+            for name in rest:
+                await _load_timed(name)
+    finally:
+        try:
+            sys.meta_path.remove(finder)
+        except ValueError:
+            pass
+
+    # Keep deterministic order for callers/logs regardless of completion order.
+    order = {n: i for i, n in enumerate(names)}
+    loaded.sort(key=lambda n: order.get(n, len(order)))
+    for t in prewarm:
+        if t.is_alive():
+            LOGGER.debug("cogs_loader: prewarm still running: %s", t.name)
+
+    _write_plan(package_root, pkg_dir, names, disabled, deps)
+    try:
+        _log_report(timings, time.perf_counter() - t_start, from_cache, barriers)
+    except Exception as e:
+        LOGGER.debug("cogs_loader: report failed: %r", e)
 
     # Fail-closed safety: required cogs must be loaded.
     missing = sorted([c for c in required if c not in loaded])
@@ -1,7 +1,10 @@
 from __future__ import annotations
 from io import BytesIO
-from PIL import Image
-import numpy as np
+from nixe.helpers.lazy_import import lazy_module
+
+Image = lazy_module("PIL.Image")
+np = lazy_module("numpy")
+
 def average_hash_bytes(b: bytes, size: int = 8) -> str:
     im = Image.open(BytesIO(b)).convert("L").resize((size,size), Image.BILINEAR)
     arr = np.asarray(im, dtype=np.float32)
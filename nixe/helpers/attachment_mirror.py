@@ -1,5 +1,6 @@
 # nixe/helpers/attachment_mirror.py — silent + resilient
 import io, os, discord
+from nixe.helpers.resolver import resolve_channel
 def _env_int(key: str, default: int = 0) -> int:
     try: return int(os.getenv(key, str(default)))
     except Exception: return default
@@ -11,10 +12,8 @@ async def mirror_attachments_for_log(bot: discord.Client, message: discord.Messa
                 v=_env_int(key,0)
                 if v: dest_id=v; break
         if not dest_id: return None
-        dest = message.guild.get_channel(dest_id) if message.guild else None
-        if dest is None:
-            try: dest = await bot.fetch_channel(dest_id)
-            except Exception: return None
+        dest = await resolve_channel(bot, dest_id)
+        if dest is None: return None
         if isinstance(dest, discord.Thread):
             try: await dest.join()
             except Exception: pass
@@ -17,6 +17,8 @@ from typing import Optional
 
 import discord
 
+from nixe.helpers.resolver import resolve_channel
+
 __all__ = ["get_log_channel", "get_ban_log_channel", "ensure_ban_thread"]
 
 log = logging.getLogger(__name__)
@@ -90,15 +92,12 @@ async def get_log_channel(guild: discord.Guild) -> Optional[discord.TextChannel]
 
     log_id, ban_log_id, blocked_id, pref_name = _cfg()
 
-    # 1) Explicit ban-log channel id
-    if ban_log_id:
-        ch = _ok(guild.get_channel(ban_log_id), blocked_id)
-        if ch:
-            return ch
-
-    # 2) Explicit LOG/PHISH log channel id
-    if log_id:
-        ch = _ok(guild.get_channel(log_id), blocked_id)
+    # 1) Explicit ban-log channel id, 2) explicit LOG/PHISH log channel id.
+    # Cache first; a miss goes through the shared resolver (cached, single-flight).
+    for cid in (ban_log_id, log_id):
+        if not cid:
+            continue
+        ch = _ok(await resolve_channel(guild, cid), blocked_id)
         if ch:
             return ch
 
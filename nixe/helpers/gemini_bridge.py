@@ -1,5 +1,12 @@
-import os, aiohttp, json, base64, asyncio, re, time, io, logging
-import httpx
+from __future__ import annotations
+
+import os, json, base64, asyncio, re, time, io, logging
+
+from nixe.helpers.lazy_import import lazy_module
+
+# Heavy HTTP clients are only needed once a classification actually runs.
+aiohttp = lazy_module("aiohttp")
+httpx = lazy_module("httpx")
 
 _log = logging.getLogger(__name__)
 
@@ -34,10 +41,6 @@ async def _async_httpx_client(*, timeout):
     except TypeError:
         return httpx.AsyncClient(timeout=timeout)
 
-try:
-    from groq import Groq  # type: ignore
-except Exception:  # pragma: no cover
-    Groq = None
 def _sniff_mime(image_bytes: bytes) -> str:
     """Best-effort mime sniff by magic bytes."""
     if not image_bytes:
@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+"""nixe.helpers.guard_snapshot
+
+Warm-start snapshot of in-memory guard state.
+
+After a restart the guards used to run with empty state until their Discord
+threads were re-scanned. This module writes a compact, versioned binary file
+(on graceful shutdown and periodically) and restores it at boot before any
+thread scan runs; the thread bootstraps then reconcile on top of it.
+
+File layout (little endian)::
+
+    header   : magic b"NXSNAP\\0\\0" | u32 version | u32 n_sections | f64 written_at
+    table    : n_sections x (4s tag | u64 offset | u64 length | u64 count | u32 crc32)
+    payloads : raw section bytes (fixed-size records / packed u64 arrays)
+
+Sections are loaded through mmap and decoded with struct.iter_unpack, so
+restoring tens of thousands of entries takes milliseconds. A section with a
+bad checksum is skipped; a file with another version is ignored entirely.
+
+Built-in sections:
+- LPGC / LPGS : lpg_cache_memory entries (+ string table for via/reason)
+- LPGM        : lpg_cache_memory msg_id -> (sha1, ahash)
+- DNYS / DNYA : lpg_denylist sha1 / ahash sets
+- META        : small JSON blob (per-store metadata, e.g. thread ids)
+
+Cogs with instance state register their own u64-set sections with
+register_u64_set(); data loaded before the cog exists is kept pending and
+applied on registration.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+_MAGIC = b"NXSNAP\0\0"
+_HEADER = struct.Struct("<8sIId")
+_ENTRY = struct.Struct("<4sQQQI")
+# sha1(20) ahash(u64) ts(f64) score(f32) w(u32) h(u32) ok(u8) via_idx(u32) reason_idx(u32)
+_LPG_REC = struct.Struct("<20sQdfIIBII")
+# msg_id(u64) sha1(20) ahash(u64)
+_MSGID_REC = struct.Struct("<Q20sQ")
+_U64 = struct.Struct("<Q")
+_SHA1 = struct.Struct("<20s")
+
+_LOCK = threading.Lock()
+_U64_PROVIDERS: Dict[str, Tuple[Callable[[], Iterable[int]], Callable[[Set[int]], None]]] = {}
+_PENDING_U64: Dict[str, Set[int]] = {}
+_META: Dict[str, dict] = {}
+_RESTORED_LPG_SHA1: Set[str] = set()
+_LAST: Dict[str, object] = {}
+
+
+def snapshot_path() -> str:
+    return (os.getenv("NIXE_GUARD_SNAPSHOT_PATH") or "data/guard_state.snap").strip()
+
+
+def enabled() -> bool:
+    return (os.getenv("NIXE_GUARD_SNAPSHOT_ENABLE", "1") or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+# -----------------------------
+# registration API
+# -----------------------------
+def register_u64_set(tag: str, dump: Callable[[], Iterable[int]], load: Callable[[Set[int]], None]) -> None:
+    """Register a set-of-ints section (e.g. pHash sets). Applies pending restored data."""
+    tag = _norm_tag(tag)
+    with _LOCK:
+        _U64_PROVIDERS[tag] = (dump, load)
+        pending = _PENDING_U64.pop(tag, None)
+    if pending:
+        try:
+            load(pending)
+        except Exception as e:
+            log.warning("[guard-snap] apply %s failed: %r", tag, e)
+
+
+def set_meta(store: str, **fields) -> None:
+    """Attach small per-store metadata (thread ids, checkpoints) to the next snapshot."""
+    with _LOCK:
+        _META.setdefault(store, {}).update(fields)
+
+
+def get_meta(store: str) -> dict:
+    with _LOCK:
+        return dict(_META.get(store) or {})
+
+
+def restored_lpg_sha1() -> Set[str]:
+    """sha1 keys that came from the snapshot (used by the LPG bootstrap to reconcile deletes)."""
+    return set(_RESTORED_LPG_SHA1)
+
+
+def last_status() -> dict:
+    return dict(_LAST)
+
+
+def _norm_tag(tag: str) -> str:
+    t = (tag or "").encode("ascii", "ignore")[:4].ljust(4, b" ")
+    return t.decode("ascii")
+
+
+# -----------------------------
+# encoders
+# -----------------------------
+def _hex_to_bytes(h: str, n: int) -> Optional[bytes]:
+    try:
+        b = bytes.fromhex(str(h or "").strip())
+        return b if len(b) == n else None
+    except ValueError:
+        return None
+
+
+def _hex_to_u64(h: str) -> int:
+    try:
+        return int(str(h or "0"), 16) & 0xFFFFFFFFFFFFFFFF
+    except ValueError:
+        return 0
+
+
+def _encode_lpg_cache() -> Tuple[Tuple[int, bytes], Tuple[int, bytes], Tuple[int, bytes]]:
+    from nixe.helpers import lpg_cache_memory as cache
+
+    strings: List[bytes] = []
+    index: Dict[str, int] = {}
+
+    def _sid(s: str) -> int:
+        s = str(s or "")[:512]
+        i = index.get(s)
+        if i is None:
+            i = index[s] = len(strings)
+            strings.append(s.encode("utf-8", "replace"))
+        return i
+
+    recs = bytearray()
+    n = 0
+    for ent in list(cache.iter_entries()):
+        sha = _hex_to_bytes(ent.get("sha1"), 20)
+        if sha is None:
+            continue
+        try:
+            recs += _LPG_REC.pack(
+                sha, _hex_to_u64(ent.get("ahash")), float(ent.get("ts") or 0.0),
+                float(ent.get("score") or 0.0), int(ent.get("w") or 0) & 0xFFFFFFFF,
+                int(ent.get("h") or 0) & 0xFFFFFFFF, 1 if ent.get("ok") else 0,
+                _sid(ent.get("via")), _sid(ent.get("reason")),
+            )
+            n += 1
+        except (struct.error, TypeError, ValueError):
+            continue
+    strtab = bytearray()
+    for b in strings:
+        strtab += struct.pack("<I", len(b)) + b
+
+    mids = bytearray()
+    m = 0
+    for mid, (sha1, ah) in list(cache.iter_msgid_fp()):
+        sha = _hex_to_bytes(sha1, 20)
+        if sha is None:
+            continue
+        mids += _MSGID_REC.pack(int(mid) & 0xFFFFFFFFFFFFFFFF, sha, _hex_to_u64(ah))
+        m += 1
+    return (n, bytes(recs)), (len(strings), bytes(strtab)), (m, bytes(mids))
+
+
+def _encode_denylist() -> Tuple[Tuple[int, bytes], Tuple[int, bytes]]:
+    from nixe.helpers import lpg_denylist
+
+    sha1s, ahashes = lpg_denylist.export_sets()
+    s = bytearray()
+    n = 0
+    for h in sorted(sha1s):
+        b = _hex_to_bytes(h, 20)
+        if b is not None:
+            s += b
+            n += 1
+    a = b"".join(_U64.pack(_hex_to_u64(h)) for h in sorted(ahashes))
+    return (n, bytes(s)), (len(ahashes), a)
+
+
+def _collect_sections() -> Dict[str, Tuple[int, bytes]]:
+    sections: Dict[str, Tuple[int, bytes]] = {}
+    try:
+        recs, strtab, mids = _encode_lpg_cache()
+        sections["LPGC"], sections["LPGS"], sections["LPGM"] = recs, strtab, mids
+    except Exception as e:
+        log.debug("[guard-snap] lpg cache encode failed: %r", e)
+    try:
+        sections["DNYS"], sections["DNYA"] = _encode_denylist()
+    except Exception as e:
+        log.debug("[guard-snap] denylist encode failed: %r", e)
+    with _LOCK:
+        providers = dict(_U64_PROVIDERS)
+        pending = {k: set(v) for k, v in _PENDING_U64.items()}
+        meta = json.dumps(_META, separators=(",", ":")).encode("utf-8")
+    for tag, (dump, _load) in providers.items():
+        try:
+            vals = sorted({int(v) & 0xFFFFFFFFFFFFFFFF for v in dump()})
+            sections[tag] = (len(vals), b"".join(_U64.pack(v) for v in vals))
+        except Exception as e:
+            log.debug("[guard-snap] %s encode failed: %r", tag, e)
+    # Keep restored-but-unclaimed sections (cog disabled this boot) instead of dropping them.
+    for tag, vals in pending.items():
+        if tag not in sections:
+            vals_s = sorted(vals)
+            sections[tag] = (len(vals_s), b"".join(_U64.pack(v) for v in vals_s))
+    sections["META"] = (1, meta)
+    return sections
+
+
+def encode_snapshot() -> bytes:
+    """Serialize current guard state into snapshot bytes (call on the event loop thread)."""
+    sections = _collect_sections()
+    tags = sorted(sections)
+    offset = _HEADER.size + _ENTRY.size * len(tags)
+    table = bytearray()
+    body = bytearray()
+    for tag in tags:
+        count, payload = sections[tag]
+        table += _ENTRY.pack(tag.encode("ascii"), offset + len(body), len(payload), int(count), zlib.crc32(payload))
+        body += payload
+    return _HEADER.pack(_MAGIC, SNAPSHOT_VERSION, len(tags), time.time()) + bytes(table) + bytes(body)
+
+
+def write_bytes(data: bytes, path: Optional[str] = None) -> str:
+    """Atomically write snapshot bytes (tmp + os.replace). Safe to run in a worker thread."""
+    path = path or snapshot_path()
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        try:
+            os.fsync(f.fileno())
+        except OSError:
+            pass
+    os.replace(tmp, path)
+    return path
+
+
+def save_now(path: Optional[str] = None) -> int:
+    """Encode and write synchronously. Returns bytes written (0 when disabled/failed)."""
+    if not enabled():
+        return 0
+    t0 = time.perf_counter()
+    try:
+        data = encode_snapshot()
+        write_bytes(data, path)
+    except Exception as e:
+        log.warning("[guard-snap] save failed: %r", e)
+        return 0
+    _LAST.update({"saved_at": time.time(), "saved_bytes": len(data), "save_ms": round((time.perf_counter() - t0) * 1000.0, 2)})
+    return len(data)
+
+
+async def save_async(path: Optional[str] = None) -> int:
+    """Encode on the loop (consistent view of state), write the file in a worker thread."""
+    import asyncio
+
+    if not enabled():
+        return 0
+    t0 = time.perf_counter()
+    try:
+        data = encode_snapshot()
+        await asyncio.to_thread(write_bytes, data, path)
+    except Exception as e:
+        log.warning("[guard-snap] save failed: %r", e)
+        return 0
+    _LAST.update({"saved_at": time.time(), "saved_bytes": len(data), "save_ms": round((time.perf_counter() - t0) * 1000.0, 2)})
+    return len(data)
+
+
+# -----------------------------
+# loader
+# -----------------------------
+def _read_sections(buf) -> Dict[str, Tuple[int, memoryview]]:
+    mv = memoryview(buf)
+    if len(mv) < _HEADER.size:
+        raise ValueError("snapshot too small")
+    magic, version, n, _written = _HEADER.unpack_from(mv, 0)
+    if magic != _MAGIC:
+        raise ValueError("bad magic")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"version {version} != {SNAPSHOT_VERSION}")
+    out: Dict[str, Tuple[int, memoryview]] = {}
+    for i in range(int(n)):
+        tag, off, length, count, crc = _ENTRY.unpack_from(mv, _HEADER.size + i * _ENTRY.size)
+        if off + length > len(mv):
+            continue
+        payload = mv[off:off + length]
+        if zlib.crc32(payload) != crc:
+            log.warning("[guard-snap] section %r checksum mismatch; skipped", tag)
+            continue
+        out[tag.decode("ascii", "replace")] = (int(count), payload)
+    return out
+
+
+def _decode_strings(payload: memoryview) -> List[str]:
+    out: List[str] = []
+    pos = 0
+    n = len(payload)
+    while pos + 4 <= n:
+        (ln,) = struct.unpack_from("<I", payload, pos)
+        pos += 4
+        out.append(bytes(payload[pos:pos + ln]).decode("utf-8", "replace"))
+        pos += ln
+    return out
+
+
+def _apply(sections: Dict[str, Tuple[int, memoryview]]) -> Dict[str, int]:
+    from nixe.helpers import lpg_cache_memory as cache
+    from nixe.helpers import lpg_denylist
+
+    counts: Dict[str, int] = {}
+    if "LPGC" in sections:
+        strings = _decode_strings(sections["LPGS"][1]) if "LPGS" in sections else []
+
+        def _s(i: int) -> str:
+            return strings[i] if 0 <= i < len(strings) else "-"
+
+        entries = []
+        for sha, ah, ts, score, w, h, ok, via_i, reason_i in _LPG_REC.iter_unpack(sections["LPGC"][1]):
+            entries.append({
+                "sha1": sha.hex(), "ahash": f"{ah:016x}", "ok": bool(ok), "score": float(score),
+                "via": _s(via_i), "reason": _s(reason_i), "w": int(w), "h": int(h), "ts": float(ts),
+            })
+        cache.restore_entries(entries)
+        _RESTORED_LPG_SHA1.update(e["sha1"] for e in entries)
+        counts["lpg_cache"] = len(entries)
+    if "LPGM" in sections:
+        n = 0
+        for mid, sha, ah in _MSGID_REC.iter_unpack(sections["LPGM"][1]):
+            cache.register_msgid_fp(int(mid), sha.hex(), f"{ah:016x}")
+            n += 1
+        counts["lpg_msgid"] = n
+    if "DNYS" in sections or "DNYA" in sections:
+        sha1s = [s.hex() for (s,) in _SHA1.iter_unpack(sections["DNYS"][1])] if "DNYS" in sections else []
+        ahs = [f"{a:016x}" for (a,) in _U64.iter_unpack(sections["DNYA"][1])] if "DNYA" in sections else []
+        lpg_denylist.import_sets(sha1s, ahs)
+        counts["denylist"] = len(sha1s) + len(ahs)
+    if "META" in sections:
+        try:
+            meta = json.loads(bytes(sections["META"][1]).decode("utf-8") or "{}")
+            if isinstance(meta, dict):
+                with _LOCK:
+                    for k, v in meta.items():
+                        if isinstance(v, dict):
+                            _META.setdefault(str(k), {}).update(v)
+        except Exception:
+            pass
+    builtin = {"LPGC", "LPGS", "LPGM", "DNYS", "DNYA", "META"}
+    for tag, (_count, payload) in sections.items():
+        if tag in builtin:
+            continue
+        vals = {v for (v,) in _U64.iter_unpack(payload)}
+        with _LOCK:
+            prov = _U64_PROVIDERS.get(tag)
+            if prov is None:
+                _PENDING_U64[tag] = vals
+        if prov is not None:
+            try:
+                prov[1](vals)
+            except Exception as e:
+                log.warning("[guard-snap] apply %s failed: %r", tag, e)
+        counts[tag.strip().lower()] = len(vals)
+    return counts
+
+
+def load(path: Optional[str] = None) -> Dict[str, int]:
+    """Restore guard state from the snapshot file (mmap). Returns per-store counts."""
+    path = path or snapshot_path()
+    if not enabled() or not os.path.exists(path):
+        return {}
+    t0 = time.perf_counter()
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= 0:
+                return {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Decoding copies everything it keeps, so the map can close afterwards.
+                sections = _read_sections(mm)
+                counts = _apply(sections)
+                sections.clear()
+    except Exception as e:
+        log.warning("[guard-snap] load %s failed: %r", path, e)
+        return {}
+    ms = round((time.perf_counter() - t0) * 1000.0, 2)
+    _LAST.update({"loaded_at": time.time(), "load_ms": ms, "loaded": dict(counts)})
+    log.warning("[guard-snap] restored %s in %.2fms from %s", counts, ms, path)
+    return counts
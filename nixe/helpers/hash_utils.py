@@ -1,7 +1,9 @@
 # nixe/helpers/hash_utils.py
 import io, hashlib
-from PIL import Image
-import numpy as np
+from nixe.helpers.lazy_import import lazy_module
+
+Image = lazy_module("PIL.Image")
+np = lazy_module("numpy")
 
 def ahash_hex_from_bytes(b: bytes, size: int = 8) -> str:
     im = Image.open(io.BytesIO(b)).convert("L").resize((size, size))
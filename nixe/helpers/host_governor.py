@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""Per-host request governor for outbound scraping (YouTube pages, oEmbed, feeds).
+
+Every host gets a token bucket; callers `await acquire(host)` before a request and
+`record(host, status, headers, body)` after it. A 429, or a Cloudflare 1015 /
+"unusual traffic" block page, opens a per-host circuit: requests to that host are
+refused until it closes, so one noisy target cannot get the bot's egress IP banned.
+Retry-After is honoured when present; plain 429s back off exponentially.
+
+Env:
+- NIXE_HTTP_HOST_RATE             tokens per second per host (default 2.0)
+- NIXE_HTTP_HOST_BURST            bucket size (default 5)
+- NIXE_HTTP_HOST_BACKOFF_SECONDS  first circuit length for a 429 without Retry-After (default 60)
+- NIXE_HTTP_HOST_CIRCUIT_SECONDS  circuit length on a 1015 / block page, and backoff cap (default 900)
+"""
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Mapping, Optional
+
+log = logging.getLogger(__name__)
+
+
+def _env_float(key: str, default: float) -> float:
+    try:
+        v = os.getenv(key)
+        if v is None or v == "":
+            return float(default)
+        return float(v)
+    except Exception:
+        return float(default)
+
+
+HOST_RATE = max(0.01, _env_float("NIXE_HTTP_HOST_RATE", 2.0))
+HOST_BURST = max(1.0, _env_float("NIXE_HTTP_HOST_BURST", 5.0))
+BACKOFF_SECONDS = max(1.0, _env_float("NIXE_HTTP_HOST_BACKOFF_SECONDS", 60.0))
+CIRCUIT_SECONDS = max(1.0, _env_float("NIXE_HTTP_HOST_CIRCUIT_SECONDS", 900.0))
+
+# Only rate-limit signatures: any Cloudflare-fronted 404 / 503 mentions "cloudflare", so the
+# vendor name alone never opens a circuit.
+_BLOCK_RE = re.compile(
+    r"error(?:\s+code)?\s*:?\s*1015\b"               # Cloudflare 1015 (rate limited)
+    r"|unusual traffic from your computer network"   # Google / YouTube interstitial
+    r"|google\.com/sorry/",                          # ...and its redirect target
+)
+
+
+def is_block_page(body: str) -> bool:
+    """True for Cloudflare 1015 / YouTube "unusual traffic" style rate-limit pages."""
+    return _BLOCK_RE.search((body or "")[:4000].lower()) is not None
+
+
+def parse_retry_after(value: Optional[str], now_wall: Optional[float] = None) -> Optional[float]:
+    """Retry-After as seconds from now (delta-seconds or HTTP-date); None if absent/invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        dt = email.utils.parsedate_to_datetime(value)
+    except Exception:
+        return None
+    if dt is None:
+        return None
+    return max(0.0, dt.timestamp() - (time.time() if now_wall is None else now_wall))
+
+
+class HostGovernor:
+    def __init__(self, *, rate: float = HOST_RATE, burst: float = HOST_BURST,
+                 backoff_seconds: float = BACKOFF_SECONDS, circuit_seconds: float = CIRCUIT_SECONDS,
+                 clock=time.monotonic, sleep=asyncio.sleep):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.backoff_seconds = float(backoff_seconds)
+        self.circuit_seconds = float(circuit_seconds)
+        self.clock = clock
+        self.sleep = sleep
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+
+    def _host(self, host: str) -> Dict[str, Any]:
+        h = self._hosts.get(host)
+        if h is None:
+            h = self._hosts[host] = {
+                "tokens": self.burst, "updated": self.clock(), "open_until": 0.0, "reason": "",
+                "strikes": 0, "requests": 0, "waited": 0.0, "refused": 0, "throttled": 0,
+            }
+        return h
+
+    def _refill(self, h: Dict[str, Any], now: float) -> None:
+        h["tokens"] = min(self.burst, h["tokens"] + (now - h["updated"]) * self.rate)
+        h["updated"] = now
+
+    def is_open(self, host: str) -> bool:
+        return self.clock() < self._host(host)["open_until"]
+
+    async def acquire(self, host: str) -> bool:
+        """Take a token for `host`, waiting if the bucket is empty. False while its circuit is open."""
+        h = self._host(host or "")
+        now = self.clock()
+        if now < h["open_until"]:
+            h["refused"] += 1
+            return False
+        self._refill(h, now)
+        h["tokens"] -= 1.0  # may go negative: concurrent callers queue behind each other
+        if h["tokens"] < 0:
+            wait = -h["tokens"] / self.rate
+            h["waited"] += wait
+            await self.sleep(wait)
+            if self.clock() < h["open_until"]:
+                h["refused"] += 1
+                return False
+        h["requests"] += 1
+        return True
+
+    def record(self, host: str, status: Optional[int], headers: Optional[Mapping[str, str]] = None,
+               body: str = "") -> None:
+        """Feed a response back; 429 / block pages open the host circuit."""
+        h = self._host(host or "")
+        now = self.clock()
+        blocked = bool(body) and status is not None and status >= 400 and is_block_page(body)
+        if status == 429 or blocked:
+            h["strikes"] += 1
+            h["throttled"] += 1
+            retry = parse_retry_after((headers or {}).get("Retry-After"))
+            if blocked:
+                span = max(self.circuit_seconds, retry or 0.0)
+                reason = "block-page"
+            elif retry is not None:
+                span = retry
+                reason = "retry-after"
+            else:
+                span = min(self.circuit_seconds, self.backoff_seconds * (2 ** (h["strikes"] - 1)))
+                reason = "429"
+            h["open_until"] = max(h["open_until"], now + span)
+            h["reason"] = reason
+            h["tokens"] = min(h["tokens"], 0.0)
+            log.warning("[host-gov] %s circuit open for %.0fs (%s, status=%s)", host, span, reason, status)
+        elif status is not None and status < 400:
+            h["strikes"] = 0
+
+    def state(self) -> Dict[str, Dict[str, Any]]:
+        now = self.clock()
+        out: Dict[str, Dict[str, Any]] = {}
+        for host, h in sorted(self._hosts.items()):
+            self._refill(h, now)
+            open_for = max(0.0, h["open_until"] - now)
+            out[host] = {
+                "circuit": "open" if open_for > 0 else "closed",
+                "open_for": round(open_for, 1),
+                "reason": h["reason"] if open_for > 0 else "",
+                "tokens": round(h["tokens"], 2),
+                "strikes": h["strikes"],
+                "requests": h["requests"],
+                "refused": h["refused"],
+                "throttled": h["throttled"],
+                "waited_s": round(h["waited"], 1),
+            }
+        return out
+
+
+GOVERNOR = HostGovernor()
+
+
+def host_state() -> Dict[str, Dict[str, Any]]:
+    return GOVERNOR.state()
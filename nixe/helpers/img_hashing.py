@@ -1,16 +1,11 @@
 import io
 from typing import List
 
-try:
-    from PIL import Image, ImageSequence
-except Exception:
-    Image = None
-    ImageSequence = None
+from nixe.helpers.lazy_import import optional_lazy_module
 
-try:
-    import imagehash
-except Exception:
-    imagehash = None
+Image = optional_lazy_module("PIL.Image")
+ImageSequence = optional_lazy_module("PIL.ImageSequence")
+imagehash = optional_lazy_module("imagehash")
 
 
 def _iter_frames(im, max_frames: int):
@@ -0,0 +1,101 @@
+"""
+nixe/helpers/lazy_import.py
+---------------------------
+Deferred imports for heavy optional deps (numpy, PIL, aiohttp, imagehash, httpx).
+
+    np = lazy_module("numpy")
+    Image = lazy_module("PIL.Image")
+
+The real module is imported on first attribute access, so scripts and the
+dashboard that only import a helper (but never hash an image) do not pay the
+import time / RSS of these libraries.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+from typing import Any, Dict, List, Optional
+
+_LOCK = threading.Lock()
+_REGISTRY: Dict[str, "LazyModule"] = {}
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports `name` on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = name
+        self.__dict__["_lazy_mod"] = None
+
+    def _lazy_load(self) -> types.ModuleType:
+        mod = self.__dict__["_lazy_mod"]
+        if mod is None:
+            # importlib holds per-module locks, so concurrent first use is safe.
+            mod = importlib.import_module(self.__dict__["_lazy_target"])
+            self.__dict__["_lazy_mod"] = mod
+        return mod
+
+    def __getattr__(self, item: str) -> Any:
+        if item.startswith("__") and item.endswith("__") and item not in ("__version__", "__file__", "__path__"):
+            raise AttributeError(item)
+        return getattr(self._lazy_load(), item)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._lazy_load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_mod"] is not None else "deferred"
+        return f"<lazy module {self.__dict__['_lazy_target']!r} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Return a shared lazy proxy for `name` (already-imported modules resolve immediately)."""
+    with _LOCK:
+        proxy = _REGISTRY.get(name)
+        if proxy is None:
+            proxy = LazyModule(name)
+            mod = sys.modules.get(name)
+            if mod is not None:
+                proxy.__dict__["_lazy_mod"] = mod
+            _REGISTRY[name] = proxy
+        return proxy
+
+
+def is_loaded(name: str) -> bool:
+    """True when the real module behind `name` has been imported (by anyone)."""
+    proxy = _REGISTRY.get(name)
+    if proxy is not None and proxy.__dict__["_lazy_mod"] is not None:
+        return True
+    return name in sys.modules
+
+
+def loaded_report() -> Dict[str, bool]:
+    """Map of registered lazy modules -> whether they have been imported yet."""
+    return {name: is_loaded(name) for name in sorted(_REGISTRY)}
+
+
+def require(name: str) -> Optional[types.ModuleType]:
+    """Import `name` now; return None when it is not installed."""
+    try:
+        return lazy_module(name)._lazy_load()
+    except Exception:
+        return None
+
+
+def optional_lazy_module(name: str) -> Optional[LazyModule]:
+    """Like lazy_module(), but None when the distribution is not installed.
+
+    Keeps the `Image is None` / `np is None` guards used across the cogs working
+    without importing the package at module load time.
+    """
+    try:
+        if importlib.util.find_spec(name.split(".", 1)[0]) is None:
+            return None
+    except (ImportError, ValueError):
+        return None
+    return lazy_module(name)
@@ -315,3 +315,34 @@ def get_similar(image_bytes: bytes, max_hamming: int = 6) -> Optional[Tuple[dict
     if best and bestd <= max_hamming:
         return best, bestd
     return None
+
+
+# -----------------------------
+# Snapshot support (see nixe.helpers.guard_snapshot)
+# -----------------------------
+def iter_entries():
+    """Iterate over cached entries (read-only view for snapshotting)."""
+    return iter(list(_CACHE.values()))
+
+
+def iter_msgid_fp():
+    """Iterate over (msg_id, (sha1, ahash)) pairs, oldest first."""
+    return iter(list(_MSGID_TO_FP.items()))
+
+
+def restore_entries(entries) -> int:
+    """Bulk-insert entries restored from a snapshot.
+
+    Unlike upsert_entry() this does not evict: restore runs before the persistence
+    overlay calls configure(), so the default cap would drop most of the snapshot.
+    Live entries already in the cache win over restored ones.
+    """
+    n = 0
+    for entry in entries or []:
+        sha1 = str(entry.get("sha1") or "")
+        if not sha1 or sha1 in _CACHE:
+            continue
+        _CACHE[sha1] = entry
+        _index_add(sha1, str(entry.get("ahash") or ""))
+        n += 1
+    return n
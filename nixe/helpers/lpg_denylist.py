@@ -24,6 +24,10 @@ _DENY_SHA1: set[str] = set()
 # ahash (16 hex) -> denied (exact bucket)
 _DENY_AHASH: set[str] = set()
 
+# Entries that so far only come from the warm-start snapshot (not yet seen in the thread).
+_RESTORED_SHA1: set[str] = set()
+_RESTORED_AHASH: set[str] = set()
+
 
 def _is_valid_ahash(a: str) -> bool:
     """Valid aHash is 16 hex chars and not the all-zero sentinel."""
@@ -43,15 +47,19 @@ def _is_valid_ahash(a: str) -> bool:
 def clear() -> None:
     _DENY_SHA1.clear()
     _DENY_AHASH.clear()
+    _RESTORED_SHA1.clear()
+    _RESTORED_AHASH.clear()
 
 
 def add(sha1: str, ahash: str | None = None) -> None:
     s = (sha1 or "").strip().lower()
     if s:
         _DENY_SHA1.add(s)
+        _RESTORED_SHA1.discard(s)
     a = (ahash or "").strip().lower()
     if _is_valid_ahash(a):
         _DENY_AHASH.add(a)
+        _RESTORED_AHASH.discard(a)
 
 
 def add_many(items: Iterable[Tuple[str, str]]) -> None:
@@ -73,3 +81,41 @@ def is_denied_ahash(ahash: str) -> bool:
 
 def stats() -> dict:
     return {"sha1": len(_DENY_SHA1), "ahash": len(_DENY_AHASH)}
+
+
+def export_sets() -> Tuple[set[str], set[str]]:
+    """Copy of (sha1 set, ahash set) for snapshotting."""
+    return set(_DENY_SHA1), set(_DENY_AHASH)
+
+
+def import_sets(sha1s: Iterable[str], ahashes: Iterable[str]) -> None:
+    """Merge restored entries (snapshot warm start); existing entries are kept.
+
+    Restored entries stay provisional until drop_unconfirmed_restored() runs after a
+    complete thread scan.
+    """
+    for s in sha1s or []:
+        s = (s or "").strip().lower()
+        if s and s not in _DENY_SHA1:
+            _DENY_SHA1.add(s)
+            _RESTORED_SHA1.add(s)
+    for a in ahashes or []:
+        a = (a or "").strip().lower()
+        if _is_valid_ahash(a) and a not in _DENY_AHASH:
+            _DENY_AHASH.add(a)
+            _RESTORED_AHASH.add(a)
+
+
+def drop_unconfirmed_restored() -> int:
+    """After a complete thread scan: remove restored entries the thread no longer has.
+
+    Entries seen in the scan (or added live since boot) went through add(), which
+    confirmed them; whatever is still provisional was deleted from the thread while the
+    bot was offline. Returns the number of entries dropped.
+    """
+    n = len(_RESTORED_SHA1) + len(_RESTORED_AHASH)
+    _DENY_SHA1.difference_update(_RESTORED_SHA1)
+    _DENY_AHASH.difference_update(_RESTORED_AHASH)
+    _RESTORED_SHA1.clear()
+    _RESTORED_AHASH.clear()
+    return n
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from io import BytesIO
 from typing import Tuple
-from PIL import Image
-import numpy as np
+from nixe.helpers.lazy_import import lazy_module
+
+Image = lazy_module("PIL.Image")
+np = lazy_module("numpy")
 
 def _to_hsv(img: Image.Image) -> np.ndarray:
     if img.mode not in ("RGB","RGBA"):
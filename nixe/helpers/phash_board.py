@@ -10,6 +10,7 @@ import asyncio
 import discord
 
 from nixe.state_runtime import get_phash_ids, set_phash_ids
+from nixe.helpers.resolver import resolve_channel
 
 
 log = logging.getLogger("nixe.helpers.phash_board")
@@ -105,7 +106,7 @@ async def get_pinned_db_message(bot) -> Optional[discord.Message]:
         return None
 
     try:
-        chan = bot.get_channel(thread_id) or await bot.fetch_channel(thread_id)
+        chan = await resolve_channel(bot, thread_id)
     except Exception as e:
         log.warning("phash-board: cannot resolve DB thread %s: %r", thread_id, e)
         return None
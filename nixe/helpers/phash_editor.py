@@ -1,5 +1,6 @@
 import os
 import asyncio
+from nixe.helpers.resolver import resolve_channel
 
 async def get_edit_target(bot):
     """Return (channel, message) to edit for pHash DB.
@@ -23,7 +24,7 @@ async def get_edit_target(bot):
         return (None, None) if strict else (None, None)
 
     try:
-        channel = bot.get_channel(thread_id) or await bot.fetch_channel(thread_id)
+        channel = await resolve_channel(bot, thread_id)
         m = await channel.fetch_message(msg_id)
         return channel, m
     except Exception:
@@ -1,7 +1,10 @@
 
 from __future__ import annotations
-from PIL import Image
 import io
+from nixe.helpers.lazy_import import lazy_module
+
+Image = lazy_module("PIL.Image")
+
 def dhash_bytes(image_bytes: bytes) -> int:
     try:
         img = Image.open(io.BytesIO(image_bytes)).convert("L").resize((9,8), Image.LANCZOS)
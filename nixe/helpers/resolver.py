@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""nixe.helpers.resolver
+
+Shared channel / thread / member resolution with caching.
+
+Replaces the ``bot.get_channel(id) or await bot.fetch_channel(id)`` and
+``guild.get_member(id) or await guild.fetch_member(id)`` pattern used across
+the cogs:
+
+- gateway cache first (``get_channel`` / ``get_member``), no REST call;
+- then a TTL cache of previously fetched objects (archived threads, members
+  not in the member cache);
+- negative cache for ids that came back NotFound / Forbidden, so a deleted
+  thread or a member who left does not cost one REST call per message;
+- single-flight: concurrent misses for the same id share one fetch (if the
+  fetching caller is cancelled, a waiter takes over the fetch).
+
+Failures return ``None`` (callers already treat a failed fetch as "skip").
+
+Env:
+  NIXE_RESOLVER_TTL_SEC=300       positive TTL for fetched objects
+  NIXE_RESOLVER_NEG_TTL_SEC=600   negative TTL for NotFound / Forbidden
+  NIXE_RESOLVER_MAX_ENTRIES=4096
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+_MISSING = object()
+_RETRY = object()  # handed to waiters when the fetching caller was cancelled
+
+
+def _env_float(k: str, default: float) -> float:
+    try:
+        return float(os.getenv(k, str(default)) or default)
+    except Exception:
+        return default
+
+
+class _TTLCache:
+    """Ordered dict of key -> (expires_at, value) with a size cap (least recently used evicted)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(16, int(max_entries))
+        self._d: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, now: float) -> Any:
+        ent = self._d.get(key)
+        if ent is None:
+            return _MISSING
+        if ent[0] <= now:
+            self._d.pop(key, None)
+            return _MISSING
+        self._d.move_to_end(key)
+        return ent[1]
+
+    def put(self, key: Hashable, value: Any, ttl: float, now: float) -> None:
+        self._d[key] = (now + max(0.0, ttl), value)
+        self._d.move_to_end(key)
+        while len(self._d) > self.max_entries:
+            self._d.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._d.pop(key, None)
+
+    def clear(self) -> None:
+        self._d.clear()
+
+    def __len__(self) -> int:
+        return len(self._d)
+
+
+_MAX = int(_env_float("NIXE_RESOLVER_MAX_ENTRIES", 4096))
+_POS = _TTLCache(_MAX)
+_NEG = _TTLCache(_MAX)
+_INFLIGHT: Dict[Hashable, "asyncio.Future[Any]"] = {}
+_STATS: Dict[str, int] = {"gateway": 0, "hit": 0, "neg_hit": 0, "fetch": 0, "shared": 0, "neg_store": 0, "error": 0}
+
+
+def _ttl() -> float:
+    return _env_float("NIXE_RESOLVER_TTL_SEC", 300.0)
+
+
+def _neg_ttl() -> float:
+    return _env_float("NIXE_RESOLVER_NEG_TTL_SEC", 600.0)
+
+
+def _is_negative(exc: BaseException) -> bool:
+    """NotFound / Forbidden (and InvalidData for unknown channel types) are cacheable misses."""
+    try:
+        import discord
+        return isinstance(exc, (discord.NotFound, discord.Forbidden, discord.InvalidData))
+    except Exception:
+        return type(exc).__name__ in ("NotFound", "Forbidden", "InvalidData")
+
+
+async def _single_flight(key: Hashable, fetch) -> Any:
+    while True:
+        now = time.monotonic()
+        val = _POS.get(key, now)
+        if val is not _MISSING:
+            _STATS["hit"] += 1
+            return val
+        if _NEG.get(key, now) is not _MISSING:
+            _STATS["neg_hit"] += 1
+            return None
+        fut = _INFLIGHT.get(key)
+        if fut is None:
+            break
+        _STATS["shared"] += 1
+        val = await asyncio.shield(fut)
+        if val is not _RETRY:
+            return val
+        # The leader was cancelled before it got an answer: check again / fetch ourselves.
+
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    _INFLIGHT[key] = fut
+    result = None
+    try:
+        _STATS["fetch"] += 1
+        result = await fetch()
+        if result is not None:
+            _POS.put(key, result, _ttl(), time.monotonic())
+    except asyncio.CancelledError:
+        result = _RETRY
+        raise
+    except Exception as e:
+        if _is_negative(e):
+            _NEG.put(key, True, _neg_ttl(), time.monotonic())
+            _STATS["neg_store"] += 1
+            log.debug("[resolver] %s -> negative (%s)", key, type(e).__name__)
+        else:
+            # Transient (5xx / network): not cached, next caller retries.
+            _STATS["error"] += 1
+            log.debug("[resolver] %s fetch failed: %r", key, e)
+        result = None
+    finally:
+        _INFLIGHT.pop(key, None)
+        if not fut.done():
+            fut.set_result(result)
+    return result
+
+
+async def resolve_channel(client: Any, channel_id: Any) -> Optional[Any]:
+    """Channel/thread by id: gateway cache -> TTL cache -> single-flight fetch_channel.
+
+    `client` is a Bot/Client (or a Guild for guild-scoped fetches).
+    """
+    try:
+        cid = int(channel_id or 0)
+    except (TypeError, ValueError):
+        return None
+    if cid <= 0 or client is None:
+        return None
+    getter = getattr(client, "get_channel", None)
+    if getter is not None:
+        ch = getter(cid)
+        if ch is None and hasattr(client, "get_thread"):
+            ch = client.get_thread(cid)
+        if ch is not None:
+            _STATS["gateway"] += 1
+            return ch
+    fetch = getattr(client, "fetch_channel", None)
+    if fetch is None:
+        return None
+    # Guild-scoped fetches fail for channels of other guilds; keep them apart from client-wide ones.
+    scope = int(getattr(client, "id", 0) or 0) if hasattr(client, "get_member") else 0
+    return await _single_flight(("ch", cid, scope), lambda: fetch(cid))
+
+
+async def resolve_member(guild: Any, user_id: Any) -> Optional[Any]:
+    """Guild member by id: member cache -> TTL cache -> single-flight fetch_member."""
+    try:
+        uid = int(user_id or 0)
+    except (TypeError, ValueError):
+        return None
+    if uid <= 0 or guild is None:
+        return None
+    m = guild.get_member(uid)
+    if m is not None:
+        _STATS["gateway"] += 1
+        return m
+    gid = int(getattr(guild, "id", 0) or 0)
+    return await _single_flight(("mem", gid, uid), lambda: guild.fetch_member(uid))
+
+
+def invalidate_channel(channel_id: Any) -> None:
+    try:
+        cid = int(channel_id or 0)
+    except (TypeError, ValueError):
+        return
+    for cache in (_POS, _NEG):
+        for key in [k for k in cache._d if k[0] == "ch" and k[1] == cid]:
+            cache.pop(key)
+
+
+def invalidate_member(guild_id: Any, user_id: Any) -> None:
+    try:
+        key = ("mem", int(guild_id or 0), int(user_id or 0))
+    except (TypeError, ValueError):
+        return
+    _POS.pop(key)
+    _NEG.pop(key)
+
+
+def clear() -> None:
+    _POS.clear()
+    _NEG.clear()
+
+
+def stats() -> Dict[str, int]:
+    out = dict(_STATS)
+    out["cached"] = len(_POS)
+    out["negative"] = len(_NEG)
+    out["inflight"] = len(_INFLIGHT)
+    return out
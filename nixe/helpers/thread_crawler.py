@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""nixe.helpers.thread_crawler
+
+Checkpointed, incremental crawler for thread-backed stores.
+
+Several cogs (phash rescanner, autoreseed port, importer, whitelist ingestor,
+LPG memory bootstrap) used to walk a Discord thread from the beginning on every
+run and re-download every attachment. This crawler remembers the newest message
+id it has fully processed per key and only asks Discord for messages after it
+(``history(after=...)``), so a rescan costs O(new messages).
+
+- Messages are processed oldest-first in small batches; the checkpoint advances
+  only after a whole batch has been handled, so a crash/restart resumes where it
+  stopped instead of starting over.
+- Callers that build something from the messages and write it elsewhere (phash
+  board, DB message) crawl with ``commit=False`` and call ``commit_checkpoint()``
+  after their write succeeded, so a failed write never skips messages.
+- Attachment downloads inside a batch run concurrently under a semaphore
+  (``concurrency``), handlers are still called in message order.
+- Progress for running/finished crawls is kept in-process (``progress()``) and
+  surfaced by the ``crawl-status`` command.
+
+Checkpoints live in a small JSON file (``NIXE_CRAWL_CHECKPOINT_PATH``, default
+``data/thread_checkpoints.json``). Stores that keep their own state locally can
+pass ``since_id`` and persist the returned ``last_message_id`` next to that state
+instead, so state and checkpoint can never diverge.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+MessageHandler = Callable[[Any], Awaitable[None]]
+AttachmentHandler = Callable[[Any, Any, bytes], Awaitable[None]]
+AttachmentFilter = Callable[[Any], bool]
+
+_PROGRESS: Dict[str, Dict[str, Any]] = {}
+
+
+def _default_path() -> str:
+    return (os.getenv("NIXE_CRAWL_CHECKPOINT_PATH") or "data/thread_checkpoints.json").strip()
+
+
+class CheckpointStore:
+    """Tiny JSON-file store: key -> {thread_id, last_message_id, scanned, updated_at}."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or _default_path()
+        self._lock = threading.RLock()
+        self._data: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+                self._data = raw if isinstance(raw, dict) else {}
+            except Exception:
+                self._data = {}
+        return self._data
+
+    def get(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._load().get(key) or {})
+
+    def set(self, key: str, **fields: Any) -> None:
+        with self._lock:
+            data = self._load()
+            ent = data.setdefault(key, {})
+            ent.update(fields)
+            ent["updated_at"] = int(time.time())
+            self._flush(data)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            data = self._load()
+            if data.pop(key, None) is not None:
+                self._flush(data)
+
+    def _flush(self, data: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            parent = os.path.dirname(self.path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            log.warning("[crawler] checkpoint write failed %s: %r", self.path, e)
+
+
+_DEFAULT_STORE: Optional[CheckpointStore] = None
+
+
+def default_store() -> CheckpointStore:
+    global _DEFAULT_STORE
+    if _DEFAULT_STORE is None or _DEFAULT_STORE.path != _default_path():
+        _DEFAULT_STORE = CheckpointStore()
+    return _DEFAULT_STORE
+
+
+def progress() -> Dict[str, Dict[str, Any]]:
+    """Copy of per-key crawl progress (running and last finished runs)."""
+    return {k: dict(v) for k, v in _PROGRESS.items()}
+
+
+def _env_int(k: str, default: int) -> int:
+    try:
+        return int(os.getenv(k, str(default)) or default)
+    except Exception:
+        return default
+
+
+async def _download_batch(
+    batch: List[Any], want: AttachmentFilter, sem: asyncio.Semaphore, max_bytes: int
+) -> List[List[Tuple[Any, bytes]]]:
+    async def _one(att) -> bytes:
+        if max_bytes and int(getattr(att, "size", 0) or 0) > max_bytes:
+            return b""
+        async with sem:
+            try:
+                return await att.read()
+            except Exception as e:
+                log.debug("[crawler] read failed att=%s: %r", getattr(att, "id", "?"), e)
+                return b""
+
+    jobs: List[Tuple[int, Any, "asyncio.Task[bytes]"]] = []
+    for i, msg in enumerate(batch):
+        for att in (getattr(msg, "attachments", None) or []):
+            try:
+                if not want(att):
+                    continue
+            except Exception:
+                continue
+            jobs.append((i, att, asyncio.ensure_future(_one(att))))
+    out: List[List[Tuple[Any, bytes]]] = [[] for _ in batch]
+    if jobs:
+        results = await asyncio.gather(*(t for (_i, _a, t) in jobs), return_exceptions=True)
+        for (i, att, _t), raw in zip(jobs, results):
+            if isinstance(raw, (bytes, bytearray)) and raw:
+                out[i].append((att, bytes(raw)))
+    return out
+
+
+def commit_checkpoint(
+    key: str, channel: Any, stats: Dict[str, Any], store: Optional[CheckpointStore] = None
+) -> None:
+    """Persist the checkpoint of a ``crawl(commit=False)`` run.
+
+    Call this only after the caller's own write (board edit, DB message) succeeded;
+    if that write fails the next run re-crawls the same messages instead of losing them.
+    """
+    store = store if store is not None else default_store()
+    last_id = int(stats.get("last_message_id") or 0)
+    if not last_id:
+        return
+    total = int(store.get(key).get("scanned_total") or 0) + int(stats.get("scanned") or 0)
+    store.set(key, thread_id=int(getattr(channel, "id", 0) or 0), last_message_id=last_id, scanned_total=total)
+
+
+async def crawl(
+    channel: Any,
+    key: str,
+    *,
+    on_message: Optional[MessageHandler] = None,
+    on_attachment: Optional[AttachmentHandler] = None,
+    want_attachment: Optional[AttachmentFilter] = None,
+    store: Optional[CheckpointStore] = None,
+    since_id: Optional[int] = None,
+    full: bool = False,
+    limit: Optional[int] = None,
+    newest_first: bool = False,
+    commit: bool = True,
+    concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    max_attachment_bytes: int = 0,
+) -> Dict[str, Any]:
+    """Process messages of `channel` newer than the checkpoint for `key`.
+
+    - ``since_id``: explicit checkpoint (bypasses the store for reading).
+    - ``full``: ignore any checkpoint and start from the beginning.
+    - ``limit``: max messages this run (the rest is picked up by the next run).
+    - ``newest_first``: with ``limit``, take the newest ``limit`` messages after the
+      checkpoint instead of the oldest (still handled oldest-first). The checkpoint
+      only moves when that window reached back to it, so no gap is ever skipped.
+    - ``commit=False``: only read the store; the caller persists the checkpoint with
+      ``commit_checkpoint()`` once whatever it built from the messages is written.
+    - ``on_attachment`` is only called for attachments accepted by
+      ``want_attachment`` and only when they downloaded successfully.
+
+    Returns stats: scanned, attachments, last_message_id, resumed_from, complete.
+    ``last_message_id`` is the id safe to resume from (== ``resumed_from`` when a
+    newest-first window left a gap).
+    """
+    store = store if store is not None else (default_store() if since_id is None else None)
+    cid = int(getattr(channel, "id", 0) or 0)
+    start_id = 0
+    if not full:
+        if since_id is not None:
+            start_id = int(since_id or 0)
+        elif store is not None:
+            ck = store.get(key)
+            # A checkpoint for another thread id (thread re-created) is meaningless.
+            if int(ck.get("thread_id") or cid) == cid:
+                start_id = int(ck.get("last_message_id") or 0)
+    write_store = store is not None and commit
+
+    conc = max(1, int(concurrency or _env_int("NIXE_CRAWL_CONCURRENCY", 4)))
+    bsize = max(1, int(batch_size or _env_int("NIXE_CRAWL_BATCH", 25)))
+    want = want_attachment or (lambda _a: True)
+    sem = asyncio.Semaphore(conc)
+
+    prog = _PROGRESS[key] = {
+        "key": key, "thread_id": cid, "running": True, "resumed_from": start_id,
+        "last_message_id": start_id, "scanned": 0, "attachments": 0,
+        "started_at": time.time(), "finished_at": None, "error": None,
+    }
+
+    after = None
+    if start_id:
+        import discord  # local: keeps this helper importable without discord for tooling
+        after = discord.Object(id=start_id)
+
+    last_id = start_id
+    # False when newest_first skipped older messages: handled ids are not a resumable checkpoint.
+    gapless = True
+    batch: List[Any] = []
+
+    async def _flush_batch() -> None:
+        nonlocal last_id
+        if not batch:
+            return
+        # Hand the batch over exactly once: a failing handler must not see it again.
+        todo = list(batch)
+        batch.clear()
+        blobs = await _download_batch(todo, want, sem, max_attachment_bytes) if on_attachment else [[] for _ in todo]
+        for msg, atts in zip(todo, blobs):
+            if on_message is not None:
+                await on_message(msg)
+            if on_attachment is not None:
+                for att, raw in atts:
+                    await on_attachment(msg, att, raw)
+                    prog["attachments"] += 1
+            mid = int(getattr(msg, "id", 0) or 0)
+            if mid > last_id:
+                last_id = mid
+            prog["scanned"] += 1
+        if gapless:
+            prog["last_message_id"] = last_id
+            if write_store and last_id:
+                store.set(key, thread_id=cid, last_message_id=last_id)
+
+    complete = False
+    try:
+        if newest_first and limit:
+            window = [m async for m in channel.history(limit=limit, after=after, oldest_first=False)]
+            window.reverse()
+            gapless = len(window) < int(limit)
+            for msg in window:
+                batch.append(msg)
+                if len(batch) >= bsize:
+                    await _flush_batch()
+        else:
+            async for msg in channel.history(limit=limit, after=after, oldest_first=True):
+                batch.append(msg)
+                if len(batch) >= bsize:
+                    await _flush_batch()
+        await _flush_batch()
+        complete = limit is None or prog["scanned"] < int(limit)
+    except Exception as e:
+        prog["error"] = repr(e)
+        log.warning("[crawler] %s stopped at %s: %r", key, last_id, e)
+        try:
+            # History failed mid-way: messages already fetched but not yet handed to a
+            # handler are still processed, so the next run resumes after them.
+            await _flush_batch()
+        except Exception:
+            pass
+    finally:
+        prog["running"] = False
+        prog["finished_at"] = time.time()
+        prog["complete"] = complete
+
+    ck_id = last_id if gapless else start_id
+    stats = {
+        "scanned": prog["scanned"], "attachments": prog["attachments"], "last_message_id": ck_id,
+        "resumed_from": start_id, "complete": complete, "error": prog["error"],
+    }
+    if write_store:
+        commit_checkpoint(key, channel, stats, store=store)
+    log.info("[crawler] %s scanned=%s attachments=%s from=%s to=%s complete=%s",
+             key, prog["scanned"], prog["attachments"], start_id, ck_id, complete)
+    return stats
@@ -3,6 +3,7 @@
 import os, asyncio, json, logging
 from typing import Optional
 import discord
+from nixe.helpers.resolver import resolve_channel
 
 log = logging.getLogger(__name__)
 
@@ -48,20 +49,20 @@ async def get_or_create_thread(
 
     tid = _THREAD_CACHE.get(thread_name)
     if tid:
-        ch = bot.get_channel(int(tid)) or await bot.fetch_channel(int(tid))
+        ch = await resolve_channel(bot, int(tid))
         if isinstance(ch, discord.Thread):
             return ch
 
     if cache_env_key:
         env_tid = (os.getenv(cache_env_key) or "").strip()
         if env_tid.isdigit():
-            ch = bot.get_channel(int(env_tid)) or await bot.fetch_channel(int(env_tid))
+            ch = await resolve_channel(bot, int(env_tid))
             if isinstance(ch, discord.Thread):
                 _THREAD_CACHE[thread_name] = int(env_tid)
                 return ch
 
     async with _get_lock(thread_name):
-        parent = bot.get_channel(int(parent_channel_id)) or await bot.fetch_channel(int(parent_channel_id))
+        parent = await resolve_channel(bot, int(parent_channel_id))
         if not isinstance(parent, discord.TextChannel):
             return None
 
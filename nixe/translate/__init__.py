@@ -1,6 +1,6 @@
 """
 Lightweight language metadata package for Nixe translate.
 """
-from .langs import LangProfile, LANG_PROFILES, resolve_lang
+from .langs import LangProfile, LANG_PROFILES, resolve_lang, detect_lang, is_target_language
 
-__all__ = ["LangProfile", "LANG_PROFILES", "resolve_lang"]
+__all__ = ["LangProfile", "LANG_PROFILES", "resolve_lang", "detect_lang", "is_target_language"]
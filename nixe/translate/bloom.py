@@ -0,0 +1,87 @@
+"""nixe.translate.bloom
+
+Small persisted Bloom filter for dictionary headwords.
+
+Used by LocalDictStore to answer "definitely not in this dictionary" without
+touching the index or the data files. False positives (DICT_BLOOM_FPR, default
+1%) just fall through to the normal index probe.
+
+File layout (little-endian):
+  magic "NXBLOOM1" | u64 m (bits) | u32 k | u64 n | u16 len(sig) | sig | bit array
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Optional
+
+_MAGIC = b"NXBLOOM1"
+_HEAD = struct.Struct("<8sQIQH")
+
+
+class BloomFilter:
+    __slots__ = ("m", "k", "n", "sig", "bits")
+
+    def __init__(self, m: int, k: int, sig: str = "", bits: Optional[bytearray] = None, n: int = 0):
+        self.m = max(8, int(m))
+        self.k = max(1, int(k))
+        self.n = int(n)
+        self.sig = sig
+        self.bits = bits if bits is not None else bytearray((self.m + 7) // 8)
+
+    @classmethod
+    def for_count(cls, n: int, fpr: float = 0.01, sig: str = "") -> "BloomFilter":
+        n = max(1, int(n))
+        fpr = min(0.5, max(1e-6, float(fpr)))
+        m = int(math.ceil(-n * math.log(fpr) / (math.log(2) ** 2)))
+        k = max(1, int(round((m / n) * math.log(2))))
+        return cls(m, k, sig=sig)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        d = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        m = self.m
+        for i in range(self.k):
+            yield (h1 + i * h2) % m
+
+    def add(self, item: str) -> None:
+        bits = self.bits
+        for p in self._positions(item):
+            bits[p >> 3] |= 1 << (p & 7)
+        self.n += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        for p in self._positions(item):
+            if not bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+    def save(self, path: Path) -> None:
+        sig = self.sig.encode("utf-8")
+        tmp = Path(str(path) + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEAD.pack(_MAGIC, self.m, self.k, self.n, len(sig)))
+            f.write(sig)
+            f.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["BloomFilter"]:
+        try:
+            raw = Path(path).read_bytes()
+            magic, m, k, n, slen = _HEAD.unpack_from(raw, 0)
+            if magic != _MAGIC:
+                return None
+            off = _HEAD.size
+            sig = raw[off:off + slen].decode("utf-8", "replace")
+            bits = bytearray(raw[off + slen:])
+            if len(bits) != (m + 7) // 8:
+                return None
+            return cls(m, k, sig=sig, bits=bits, n=n)
+        except Exception:
+            return None
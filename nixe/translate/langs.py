@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import math
+import re
+from collections import Counter
+from itertools import repeat
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -45,3 +49,225 @@ def resolve_lang(target: str) -> Optional[LangProfile]:
     if prof is not None:
         return prof
     return None
+
+
+# ---------------------------------------------------------------------------
+# Local language identification
+# ---------------------------------------------------------------------------
+#
+# Non-Latin scripts are decided by script counts (kana -> ja, hangul -> ko,
+# han -> zh, arabic -> ar). Latin text (id / en / su / jv) is scored with a
+# small naive-Bayes model over character 1-3 grams plus whole words, trained
+# lazily from the seed text below; an "other Latin" background profile catches
+# languages that are not modeled (de / nl / es / ...). No external data or
+# dependencies; a call on a chat-sized message takes well under a millisecond.
+
+_SEED_TEXT: Dict[str, str] = {
+    "en": (
+        "the and you that was for are with his they this have from one had word but not what all were "
+        "when your can said there use each which she how their will other about out many then them these "
+        "so some her would make like him into time has look two more write see number way could people "
+        "than first been call who its now find long down day did get come made may part "
+        "thank you so much for the help. good morning everyone, how are you doing today? "
+        "i think we should wait for the next banner before spending our pulls. "
+        "does anyone know when the event ends? the new character looks really strong. "
+        "please check the pinned message before asking questions in this channel. "
+        "i don't know what happened but the game keeps crashing after the update. "
+        "we are going to play together tonight if you want to join us. "
+        "that is not what i meant, sorry for the confusion. let me know if you need anything else. "
+        "the weather is nice today and i would like to go outside with my friends."
+    ),
+    "id": (
+        "yang dan di itu dengan untuk tidak ini dari dalam akan pada juga ke karena tersebut bisa ada "
+        "mereka lebih kami sudah saya kita seperti atau hanya oleh telah harus tetapi masih apa banyak "
+        "bagaimana kalau sedang belum sangat semua saat bahwa adalah menjadi membuat dapat orang "
+        "terima kasih banyak atas bantuannya. selamat pagi semuanya, apa kabar hari ini? "
+        "saya pikir kita harus menunggu banner berikutnya sebelum menghabiskan pull. "
+        "ada yang tahu kapan event ini berakhir? karakter baru itu kelihatannya sangat kuat. "
+        "tolong baca pesan yang disematkan sebelum bertanya di channel ini. "
+        "aku tidak tahu kenapa tapi gamenya terus keluar sendiri setelah pembaruan. "
+        "kami akan bermain bersama nanti malam kalau kamu mau ikut. "
+        "bukan itu maksud saya, maaf kalau membingungkan. kabari saja kalau butuh sesuatu lagi. "
+        "cuacanya cerah hari ini dan saya ingin pergi keluar bersama teman-teman. "
+        "gimana caranya dapat senjata itu? nggak usah khawatir, nanti saya bantu."
+    ),
+    "su": (
+        "abdi anjeun teu naon kumaha sareng jeung nu anu téh teh mah atuh kuring urang geus keur ieu éta "
+        "eta aya henteu moal tos parantos bade badé hoyong hayang kedah kudu ka di ti tina kana mun lamun "
+        "tapi ogé oge pisan teuing ngan wae waé sok kitu kieu dinya dieu ditu saha iraha naha sabaraha "
+        "hatur nuhun pisan kana bantosanana. wilujeng énjing sadayana, kumaha damang dinten ieu? "
+        "abdi mikir urang kedah ngantosan banner salajengna samemeh ngabéakeun pull. "
+        "aya nu terang iraha acara ieu réngsé? karakter anyar éta katingalina kuat pisan. "
+        "punten baca heula pesen anu dipasang samemeh naros di channel ieu. "
+        "kuring teu nyaho naha tapi kaulinanana sok kaluar nyalira saatos apdet. "
+        "urang bade ulin babarengan engké wengi upami anjeun hoyong ngiring. "
+        "sanés kitu maksad abdi, hapunten upami matak bingung. wartosan wae upami peryogi naon deui. "
+        "cuacana cerah dinten ieu sareng abdi hoyong angkat kaluar sareng réréncangan. "
+        "kumaha carana meunang pakarang éta? ulah hariwang, engké ku abdi dibantosan."
+    ),
+    "jv": (
+        "aku kowe ora apa opo piye karo sing iki kuwi wis lagi arep ning neng ing saka marang yen nek "
+        "nanging uga banget mung wae bae wong kabeh kanggo amarga dadi isih durung tau bisa iso "
+        "kula panjenengan mboten boten nggih inggih menika punika sampun badhe saged wonten kangge "
+        "matur nuwun sanget kanggo bantuane. sugeng enjang kabeh, piye kabare dina iki? "
+        "aku mikir awake dhewe kudu ngenteni banner sabanjure sadurunge ngentekake pull. "
+        "ana sing ngerti kapan acara iki rampung? karakter anyar kuwi ketoke kuat banget. "
+        "tulung diwaca dhisik pesen sing dipasang sadurunge takon ning channel iki. "
+        "aku ora ngerti kenapa nanging gamene metu dhewe terus bar dianyari. "
+        "awake dhewe arep dolanan bareng mengko bengi yen kowe gelem melu. "
+        "dudu ngono maksudku, ngapura yen marakake bingung. kandhani wae yen butuh apa maneh. "
+        "hawane padhang dina iki lan aku pengin metu karo kanca-kanca. "
+        "piye carane entuk gaman kuwi? ora usah kuwatir, mengko tak ewangi."
+    ),
+}
+
+# Background profile for Latin-script languages we do not translate from locally
+# (de / nl / es / fr / it / pt). It is scored like the real profiles but never
+# returned: when it fits the text best, the language is unknown.
+_OTHER_LATIN = "_other"
+_OTHER_LATIN_TEXT = (
+    # de
+    "der die das und ist nicht ich du er sie wir ihr es ein eine mit von zu auf für den dem des sich "
+    "auch noch nur schon aber oder wenn dann weil was wer wie wo wann warum hier da so sehr mal doch "
+    "haben hat habe bin bist sind war waren wird werden kann können muss heute morgen jetzt immer "
+    "danke für die hilfe. guten morgen zusammen, wie geht es euch heute? "
+    "ich glaube wir sollten auf das nächste banner warten. weiß jemand wann das event endet? "
+    "bitte lest die angepinnte nachricht bevor ihr fragen stellt. das spiel stürzt nach dem update ständig ab. "
+    "das habe ich nicht so gemeint, tut mir leid. ich bin gerade müde und gehe gleich schlafen. "
+    # nl
+    "de het een en is niet ik je jij hij zij wij we ze er van in op met voor aan te dat dit die wat wie "
+    "waar wanneer waarom hoe ook nog maar of als dan want al wel geen heel erg nu hier daar zijn was "
+    "heb hebt heeft kan kun moet wil weet weten gaat gaan doen komt vandaag morgen altijd "
+    "bedankt voor de hulp. goedemorgen allemaal, hoe gaat het vandaag met jullie? "
+    "ik denk dat we beter op de volgende banner kunnen wachten. weet iemand wanneer het event afloopt? "
+    "lees eerst het vastgezette bericht voordat je vragen stelt. het spel crasht steeds na de update. "
+    "zo bedoelde ik het niet, sorry voor de verwarring. ik ben moe en ga zo slapen. "
+    # es
+    "el la los las de que y en un una es no por con para se lo su al del como pero más muy ya yo tú "
+    "gracias por la ayuda. buenos días a todos, ¿cómo están hoy? creo que deberíamos esperar el próximo banner. "
+    "el juego se cierra solo después de la actualización. no era eso lo que quería decir, perdón. "
+    # fr
+    "le la les de des et est un une je tu il elle nous vous ils que qui pas ne pour dans sur avec mais "
+    "merci pour l'aide. bonjour à tous, comment ça va aujourd'hui? je pense qu'on devrait attendre la prochaine bannière. "
+    "le jeu plante tout le temps depuis la mise à jour. ce n'est pas ce que je voulais dire, désolé. "
+    # it
+    "il lo la gli le di che e è un una non per con ma più molto io tu lui lei noi voi sono sei ho hai "
+    "grazie per l'aiuto. buongiorno a tutti, come state oggi? penso che dovremmo aspettare il prossimo banner. "
+    "il gioco si chiude da solo dopo l'aggiornamento. non intendevo questo, scusate. "
+    # pt
+    "o a os as de que e em um uma é não por com para se do da mas mais muito eu você ele ela nós "
+    "obrigado pela ajuda. bom dia a todos, como vocês estão hoje? acho que devemos esperar o próximo banner. "
+    "o jogo fecha sozinho depois da atualização. não foi isso que eu quis dizer, desculpa."
+)
+
+_LANGID_WORD_RE = re.compile(r"[a-zà-öø-ÿ']+")
+_LANGID_STRIP_RE = re.compile(r"<a?:\w+:\d+>|<[@#&!]*\d+>|https?://\S+|`{3}.*?`{3}|`[^`]*`", re.S)
+# Absolute fit of the winning profile: trigram coverage + 2 x known-word coverage.
+# Modeled languages score >= ~0.65 on chat lines, unmodeled Latin ones (es/fr/de/it/pt) <= ~0.55.
+_FIT_WORD_WEIGHT = 2.0
+_MIN_FIT = 0.6
+_LANGID_MODEL: Optional[Dict[str, Tuple[Dict[str, float], float, Dict[str, float], float]]] = None
+
+
+def _ngrams(word: str) -> List[str]:
+    w = f" {word} "
+    return [w[i:i + n] for n in (1, 2, 3) for i in range(len(w) - n + 1) if w[i:i + n] != " "]
+
+
+def _train() -> Dict[str, Tuple[Dict[str, float], float, Dict[str, float], float]]:
+    """lang -> (char-gram log-probs, unseen gram log-prob, word log-probs, unseen word log-prob)."""
+    model = {}
+    for code, text in [*_SEED_TEXT.items(), (_OTHER_LATIN, _OTHER_LATIN_TEXT)]:
+        grams: Counter = Counter()
+        words = Counter(_LANGID_WORD_RE.findall(text.lower()))
+        for w, c in words.items():
+            for g in _ngrams(w):
+                grams[g] += c
+        g_total = sum(grams.values()) + len(grams) + 1
+        w_total = sum(words.values()) + len(words) + 1
+        model[code] = (
+            {g: math.log((c + 1) / g_total) for g, c in grams.items()},
+            math.log(1 / g_total),
+            {w: math.log((c + 1) / w_total) for w, c in words.items()},
+            math.log(1 / w_total),
+        )
+    return model
+
+
+_SCRIPT_RES = {
+    "kana": re.compile(r"[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9d]"),
+    "hangul": re.compile(r"[\uac00-\ud7af\u1100-\u11ff\u3130-\u318f]"),
+    "han": re.compile(r"[\u4e00-\u9fff\u3400-\u4dbf]"),
+    "arabic": re.compile(r"[\u0600-\u06ff\u0750-\u077f\ufb50-\ufdff\ufe70-\ufeff]"),
+    "latin": re.compile(r"[A-Za-z\u00c0-\u024f]"),
+}
+
+
+def _script_counts(text: str) -> Dict[str, int]:
+    return {k: len(rx.findall(text)) for k, rx in _SCRIPT_RES.items()}
+
+
+def detect_lang(text: str) -> Tuple[str, float]:
+    """Best-guess (code, confidence 0..1) among LANG_PROFILES, or ("", 0.0) if undecidable.
+
+    Latin text that none of the modeled profiles explains well (another language)
+    is undecidable too. Mentions, custom emoji, URLs and code are ignored.
+    """
+    global _LANGID_MODEL
+    t = _LANGID_STRIP_RE.sub(" ", text or "")
+    sc = _script_counts(t)
+    letters = sum(sc.values())
+    if letters < 2:
+        return "", 0.0
+    cjk = sc["kana"] + sc["han"]
+    # Kanji-only runs are common in Japanese too; any kana tips Han text to ja.
+    if cjk and cjk >= max(sc["hangul"], sc["arabic"], sc["latin"]):
+        return ("ja", round(cjk / letters, 4)) if sc["kana"] else ("zh", round(sc["han"] / letters, 4))
+    if sc["hangul"] and sc["hangul"] >= max(sc["arabic"], sc["latin"]):
+        return "ko", round(sc["hangul"] / letters, 4)
+    if sc["arabic"] and sc["arabic"] >= sc["latin"]:
+        return "ar", round(sc["arabic"] / letters, 4)
+
+    words = _LANGID_WORD_RE.findall(t.lower())
+    if not words:
+        return "", 0.0
+    if _LANGID_MODEL is None:
+        _LANGID_MODEL = _train()
+    grams_all = [g for w in words for g in _ngrams(w)]
+    n = len(grams_all)
+    scores: Dict[str, float] = {}
+    for code, (grams, g_unseen, wlp, w_unseen) in _LANGID_MODEL.items():
+        s = sum(map(grams.get, grams_all, repeat(g_unseen, n)))
+        s += 3.0 * sum(map(wlp.get, words, repeat(w_unseen, len(words))))
+        scores[code] = s
+    ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+    best, second = ranked[0], ranked[1]
+    if best[0] == _OTHER_LATIN:
+        return "", 0.0
+    # The margin only says which profile fits best, not that any fits: Spanish or
+    # French text still "wins" as en/id. Require the winner to actually explain the
+    # text (trigrams it has seen + words it knows), else the language is unknown.
+    grams, _g_unseen, wlp, _w_unseen = _LANGID_MODEL[best[0]]
+    tri = [g for g in grams_all if len(g) == 3]
+    known = sum(1 for w in words if w in wlp)
+    fit = sum(1 for g in tri if g in grams) / max(1, len(tri))
+    fit += _FIT_WORD_WEIGHT * known / len(words)
+    if fit < _MIN_FIT:
+        return "", 0.0
+    # Loanwords ("event", "server") can tip the n-gram score; the function words cannot.
+    other_wlp = _LANGID_MODEL[_OTHER_LATIN][2]
+    if sum(1 for w in words if w in other_wlp) > known:
+        return "", 0.0
+    # Average per-gram log-likelihood margin, squashed to 0..1.
+    margin = (best[1] - second[1]) / max(1, n)
+    conf = 1.0 - math.exp(-8.0 * margin)
+    return best[0], round(conf * (sc["latin"] / letters), 4)
+
+
+def is_target_language(text: str, target: str, min_confidence: float = 0.5, min_chars: int = 12) -> bool:
+    """True when `text` is confidently already in `target` (so a translation call can be skipped)."""
+    prof = resolve_lang(target)
+    if prof is None or len((text or "").strip()) < min_chars:
+        return False
+    code, conf = detect_lang(text)
+    return code == prof.code and conf >= min_confidence
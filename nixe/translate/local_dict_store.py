@@ -4,8 +4,23 @@ Offline-first short-input lookup using Kaikki/Wiktextract JSONL(.gz) dumps.
 
 This is intentionally *lightweight* (no huge in-memory load):
 - Keeps a small on-disk cache (sqlite) per source language file.
-- On cache miss, scans the JSONL(.gz) sequentially until it finds a matching "word".
-  This is slower for the first lookup, but fast afterward due to caching.
+- Builds a byte-offset index once per dump / split folder: word -> (file, offset, length)
+  over a seekable (uncompressed) copy of the data. A lookup is one index probe, one
+  positioned read and one json.loads; a miss is just the index probe.
+- Monolithic dumps are only indexed on request (DICT_OFFSET_INDEX_MONO=1); without an
+  index they are scanned sequentially and hits land in the per-dump sqlite cache.
+- Indexes are built by a background thread (queued from bootstrap or the first lookup)
+  and are resumable: a build manifest (.offidx_*.build.json) records finished parts with
+  their row counts and a content checksum of each source part. Until an index is ready, lookups miss and the
+  caller falls back to the provider. Progress: index_progress() / `&dict-index`.
+
+Offset index (optional overrides):
+  DICT_OFFSET_INDEX_MONO=0     opt-in: index monolithic dumps too. A .gz dump gets a full
+                               uncompressed copy under DICT_SEEKABLE_DIR (several GB for
+                               raw-wiktextract), so only enable it where disk allows.
+  DICT_SEEKABLE_DIR=<DICT_DIR>/.seek   where uncompressed copies of .gz parts live
+  DICT_BLOOM_FPR=0.01          false-positive rate of the per-index headword Bloom filter
+                               (persisted as .offidx_*.bloom; definite misses skip the index)
 
 Files expected (configurable):
   DICT_DIR=data/dicts
@@ -32,16 +47,21 @@ from __future__ import annotations
 
 import asyncio
 import gzip
+import hashlib
 import io
 import json
 import logging
 import os
+import queue
 import re
 import sqlite3
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from nixe.translate.bloom import BloomFilter
 from nixe.storage.gdrive import ensure_file_id, download_to_path, find_folder_id_by_name, download_folder_recursive
 
 log = logging.getLogger(__name__)
@@ -66,6 +86,11 @@ def _as_bool(v: Any, default: bool = False) -> bool:
 
 
 
+def _mono_index_enabled() -> bool:
+    """Offset-index monolithic dumps (needs an uncompressed copy of each .gz dump)."""
+    return _as_bool(_env("DICT_OFFSET_INDEX_MONO", "0"), False)
+
+
 def _gdrive_split_only() -> bool:
     """If true, skip monolithic file probing and treat Drive as split-folder only."""
     return _as_bool(_env("DICT_GDRIVE_SPLIT_ONLY", "0"), False)
@@ -158,6 +183,50 @@ def _split_folder_for(lang_code: str) -> str:
         return _env("DICT_MAP_ID_EN_FOLDER", _DEFAULT_SPLIT_FOLDERS["en"])
     return _DEFAULT_SPLIT_FOLDERS.get(code, code.upper() or "EN")
 
+_OFFSET_INDEX_VERSION = 1
+# Max bound parameters per IN (...) query (SQLite default limit is 999 on old builds).
+_SQL_IN_CHUNK = 500
+
+# Background index builder: one daemon thread drains a queue of build jobs so
+# the first lookup after a deploy never blocks on indexing.
+_BUILD_QUEUE: "queue.Queue[Tuple[Any, str, List[Tuple[str, Path]], str]]" = queue.Queue()
+_BUILD_QUEUED: set[str] = set()
+_BUILD_FAILED: Dict[str, Tuple[str, float]] = {}
+_BUILD_PROGRESS: Dict[str, Dict[str, Any]] = {}
+_BUILD_GUARD = threading.Lock()
+_BUILD_THREAD: Optional[threading.Thread] = None
+_BUILD_RETRY_SEC = 600.0
+
+
+def _build_worker() -> None:
+    while True:
+        store, name, sources, sig = _BUILD_QUEUE.get()
+        try:
+            store._run_build_job(name, sources, sig)
+        finally:
+            with _BUILD_GUARD:
+                _BUILD_QUEUED.discard(name)
+
+
+def _start_build_worker() -> None:
+    global _BUILD_THREAD
+    with _BUILD_GUARD:
+        if _BUILD_THREAD is not None and _BUILD_THREAD.is_alive():
+            return
+        _BUILD_THREAD = threading.Thread(target=_build_worker, name="dict-index-build", daemon=True)
+        _BUILD_THREAD.start()
+
+
+def index_progress() -> Dict[str, Dict[str, Any]]:
+    """Copy of per-index build progress (queued / building / bloom / ready / failed)."""
+    with _BUILD_GUARD:
+        pending = set(_BUILD_QUEUED)
+    out = {k: dict(v) for k, v in _BUILD_PROGRESS.items()}
+    for k in pending:
+        out.setdefault(k, {"state": "queued"})
+    return out
+
+
 class LocalDictStore:
     """Offline dictionary store with optional GDrive bootstrap."""
 
@@ -174,6 +243,21 @@ class LocalDictStore:
 
         self._lock = asyncio.Lock()
         self._bootstrapped = False
+        # name -> (source signature, index path) of verified offset indexes
+        self._offidx_ready: Dict[str, Tuple[str, Path]] = {}
+        self._offidx_locks: Dict[str, threading.Lock] = {}
+        self._offidx_guard = threading.Lock()
+        # index path -> headword Bloom filter
+        self._blooms: Dict[str, BloomFilter] = {}
+        # Long-lived SQLite connections (one per DB path), shared by executor threads.
+        self._conns: Dict[str, sqlite3.Connection] = {}
+        self._db_lock = threading.RLock()
+        self._cache_ready: set[str] = set()
+        # src_code -> (manifest file signature, parsed manifest)
+        self._manifests: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # index path -> (index signature, multi-token headword trie); built by the background builder
+        self._phrase_tries: Dict[str, Tuple[str, "_PhraseTrie"]] = {}
+        self._trie_lock = threading.Lock()
 
     async def bootstrap(self) -> None:
         """Ensure local dict files exist (optional Drive download). Safe to call repeatedly."""
@@ -238,26 +322,30 @@ class LocalDictStore:
                                 continue
                     
                             # If refresh enabled, compare remote manifest meta to skip unnecessary downloads
+                            # (read even when the local manifest is missing, so a resumed download
+                            # records the remote marker and the next boot does not fetch again)
                             marker = ""
-                            if refresh_split and local_manifest.exists() and local_manifest.stat().st_size > 0:
+                            if refresh_split:
                                 try:
                                     from nixe.storage.gdrive import find_file_id_by_name, fetch_meta
                                     mfid = await find_file_id_by_name(folder_id=sub_id, name="manifest.json")
                                     if mfid:
                                         meta = await fetch_meta(mfid)
                                         marker = f"{meta.get('modifiedTime','')}|{meta.get('size','')}"
-                                        if local_meta.exists() and local_meta.read_text(encoding="utf-8", errors="ignore").strip() == marker:
+                                        if (local_manifest.exists() and local_manifest.stat().st_size > 0 and local_meta.exists()
+                                                and local_meta.read_text(encoding="utf-8", errors="ignore").strip() == marker):
                                             continue
                                 except Exception as e:
                                     log.debug("[dict] refresh compare failed for %s: %r", folder_name, e)
                     
                             # Download (fresh or missing)
                             try:
-                                if local_dir.exists() and refresh_split:
-                                    # Ensure stale files don't remain
-                                    import shutil as _shutil
-                                    _shutil.rmtree(str(local_dir), ignore_errors=True)
-                                await download_folder_recursive(folder_id=sub_id, out_dir=str(local_dir))
+                                if refresh_split and local_manifest.exists():
+                                    # The remote changed: the folder is incomplete until the new manifest
+                                    # lands. Unchanged parts are verified and kept, partial ones resumed,
+                                    # and files gone from Drive are pruned after the download.
+                                    local_manifest.unlink()
+                                await download_folder_recursive(folder_id=sub_id, out_dir=str(local_dir), prune=refresh_split)
                                 log.info("[dict] downloaded split folder %s -> %s", folder_name, str(local_dir))
                                 if refresh_split:
                                     # Best-effort write marker
@@ -273,45 +361,76 @@ class LocalDictStore:
                     except Exception as e:
                         log.debug("[dict] split-folder bootstrap skipped: %r", e)
             self._bootstrapped = True
+            try:
+                n = await asyncio.to_thread(self.schedule_index_builds)
+                if n:
+                    log.info("[dict] offset index: %s dictionaries queued/ready", n)
+            except Exception as e:
+                log.debug("[dict] index scheduling skipped: %r", e)
 
     def _cache_db_path(self, lang_code: str, filename: str) -> Path:
         safe = re.sub(r"[^a-zA-Z0-9_.-]+", "_", filename)
         return self.dict_dir / f".cache_{lang_code}_{safe}.sqlite3"
 
+    def _conn(self, db_path: Path) -> sqlite3.Connection:
+        key = str(db_path)
+        with self._db_lock:
+            con = self._conns.get(key)
+            if con is None:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                # check_same_thread=False: executor threads share it, serialized by _db_lock.
+                con = sqlite3.connect(key, timeout=5, check_same_thread=False)
+                self._conns[key] = con
+            return con
+
+    def _drop_conn(self, db_path: Path) -> None:
+        with self._db_lock:
+            con = self._conns.pop(str(db_path), None)
+            self._cache_ready.discard(str(db_path))
+        if con is not None:
+            try:
+                con.close()
+            except Exception:
+                pass
+
     def _ensure_cache_db(self, db_path: Path) -> None:
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        con = sqlite3.connect(str(db_path))
-        try:
+        if str(db_path) in self._cache_ready:
+            return
+        with self._db_lock:
+            con = self._conn(db_path)
             con.execute(
                 "CREATE TABLE IF NOT EXISTS cache (word TEXT PRIMARY KEY, payload TEXT NOT NULL)"
             )
             con.commit()
-        finally:
-            con.close()
+            self._cache_ready.add(str(db_path))
 
     def _cache_get(self, db_path: Path, word: str) -> Optional[str]:
+        return self._cache_get_many(db_path, [word]).get(word)
+
+    def _cache_get_many(self, db_path: Path, words: List[str]) -> Dict[str, str]:
+        out: Dict[str, str] = {}
         try:
-            con = sqlite3.connect(str(db_path))
-            try:
-                cur = con.execute("SELECT payload FROM cache WHERE word = ?", (word,))
-                row = cur.fetchone()
-                return row[0] if row else None
-            finally:
-                con.close()
+            with self._db_lock:
+                con = self._conn(db_path)
+                for i in range(0, len(words), _SQL_IN_CHUNK):
+                    part = words[i:i + _SQL_IN_CHUNK]
+                    q = "SELECT word, payload FROM cache WHERE word IN (%s)" % ",".join("?" * len(part))
+                    out.update({w: p for w, p in con.execute(q, part)})
         except Exception:
-            return None
+            pass
+        return out
 
     def _cache_put(self, db_path: Path, word: str, payload: str) -> None:
+        self._cache_put_many(db_path, {word: payload})
+
+    def _cache_put_many(self, db_path: Path, items: Dict[str, str]) -> None:
+        if not items:
+            return
         try:
-            con = sqlite3.connect(str(db_path))
-            try:
-                con.execute(
-                    "INSERT OR REPLACE INTO cache(word, payload) VALUES(?,?)",
-                    (word, payload),
-                )
+            with self._db_lock:
+                con = self._conn(db_path)
+                con.executemany("INSERT OR REPLACE INTO cache(word, payload) VALUES(?,?)", list(items.items()))
                 con.commit()
-            finally:
-                con.close()
         except Exception:
             pass
 
@@ -352,168 +471,553 @@ class LocalDictStore:
 
     def _split_manifest(self, src_code: str) -> Optional[Dict[str, Any]]:
         man = self._split_dir(src_code) / "manifest.json"
-        if not man.exists():
+        sig = self._file_sig(man)
+        if not sig:
             return None
+        hit = self._manifests.get(src_code)
+        if hit and hit[0] == sig:
+            return hit[1]
         try:
-            return json.loads(man.read_text(encoding="utf-8", errors="ignore"))
+            manifest = json.loads(man.read_text(encoding="utf-8", errors="ignore"))
         except Exception:
             return None
+        self._manifests[src_code] = (sig, manifest)
+        return manifest
 
-    def _split_index_db_path(self, src_code: str) -> Path:
-        folder = _split_folder_for(src_code)
-        safe = re.sub(r"[^a-zA-Z0-9_.-]+", "_", folder)
-        return self.dict_dir / f".split_idx_{safe}.sqlite3"
+    # -------------------------
+    # Byte-offset index: word -> (file, offset, length) over seekable data files
+    # -------------------------
 
-    def _ensure_split_index(self, src_code: str, manifest: Dict[str, Any]) -> Path:
-        db_path = self._split_index_db_path(src_code)
-        if db_path.exists() and db_path.stat().st_size > 0:
-            return db_path
+    def _seek_dir(self) -> Path:
+        raw = _env("DICT_SEEKABLE_DIR", "").strip()
+        return Path(raw) if raw else (self.dict_dir / ".seek")
 
-        # Build a lightweight index: word -> relfile
-        self._ensure_cache_db(db_path)  # creates 'cache' table; we'll create our own table too.
-        con = sqlite3.connect(str(db_path))
-        try:
-            con.execute("CREATE TABLE IF NOT EXISTS idx (word TEXT PRIMARY KEY, relfile TEXT NOT NULL)")
-            con.commit()
+    def _offset_index_path(self, name: str) -> Path:
+        safe = re.sub(r"[^a-zA-Z0-9_.-]+", "_", name)
+        return self.dict_dir / f".offidx_{safe}.sqlite3"
 
-            out_files = manifest.get("output_files") or []
-            if not isinstance(out_files, list):
-                out_files = []
+    def _seekable_path(self, name: str, src: Path, rel: str) -> Path:
+        """Uncompressed parts are used in place; .gz parts get an uncompressed copy under DICT_SEEKABLE_DIR."""
+        if not src.name.endswith(".gz"):
+            return src
+        return self._seek_dir() / re.sub(r"[^a-zA-Z0-9_.-]+", "_", name) / rel[:-3]
 
-            split_base = self._split_dir(src_code)
+    @staticmethod
+    def _file_sig(p: Path) -> str:
+        try:
+            st = p.stat()
+            return f"{st.st_size}:{st.st_mtime_ns}"
+        except OSError:
+            return ""
 
-            inserted = 0
-            for of in out_files:
-                if not isinstance(of, dict):
-                    continue
-                rel = of.get("file")
-                if not isinstance(rel, str) or not rel:
-                    continue
-                p = split_base / rel
-                if not p.exists():
-                    continue
-                # Scan this part and index words
-                for obj in self._iter_json_lines(p):
-                    w = obj.get("word") or obj.get("title") or obj.get("term")
-                    if not isinstance(w, str) or not w:
-                        continue
+    @staticmethod
+    def _file_checksum(p: Path) -> str:
+        """Content hash of a source part (size:mtime survives a same-size re-download)."""
+        try:
+            h = hashlib.blake2b(digest_size=16)
+            with open(p, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+            return h.hexdigest()
+        except OSError:
+            return ""
+
+    def _offset_index_meta(self, db_path: Path) -> Dict[str, str]:
+        try:
+            con = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            try:
+                return {k: v for k, v in con.execute("SELECT k, v FROM meta")}
+            finally:
+                con.close()
+        except Exception:
+            return {}
+
+    def _index_data_file(self, con: sqlite3.Connection, src: Path, data_path: Path) -> int:
+        """Copy (if compressed) and index one JSONL file. Returns number of new headwords."""
+        rel_data = os.path.relpath(str(data_path), str(self.dict_dir))
+        out = None
+        tmp_data = None
+        if data_path != src:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_data = data_path.with_name(data_path.name + ".tmp")
+            out = open(tmp_data, "wb")
+            fin = gzip.open(src, "rb")
+        else:
+            fin = open(src, "rb")
+        n = 0
+        rows: List[Tuple[str, str, int, int]] = []
+        off = 0
+        try:
+            # A part redone after its source changed must not keep stale offsets.
+            con.execute("DELETE FROM idx WHERE file=?", (rel_data,))
+            for line in fin:
+                size = len(line)
+                if out is not None:
+                    out.write(line)
+                s = line.strip()
+                if s:
                     try:
-                        con.execute("INSERT OR IGNORE INTO idx(word, relfile) VALUES(?,?)", (w, rel))
-                        inserted += 1
-                        if inserted % 5000 == 0:
-                            con.commit()
+                        obj = json.loads(s)
                     except Exception:
-                        continue
+                        obj = None
+                    if isinstance(obj, dict):
+                        w = obj.get("word") or obj.get("title") or obj.get("term")
+                        if isinstance(w, str) and w:
+                            rows.append((w, rel_data, off, size))
+                off += size
+                if len(rows) >= 5000:
+                    n += self._insert_index_rows(con, rows)
+                    rows.clear()
+            if rows:
+                n += self._insert_index_rows(con, rows)
+        finally:
+            fin.close()
+            if out is not None:
+                out.close()
+        if tmp_data is not None:
+            os.replace(tmp_data, data_path)
+        return n
+
+    @staticmethod
+    def _insert_index_rows(con: sqlite3.Connection, rows: List[Tuple[str, str, int, int]]) -> int:
+        """Insert index rows; returns how many were new (first occurrence wins, like the sequential scan)."""
+        before = con.total_changes
+        con.executemany("INSERT OR IGNORE INTO idx(word, file, off, len) VALUES(?,?,?,?)", rows)
+        return con.total_changes - before
+
+    def _build_manifest_path(self, db_path: Path) -> Path:
+        return db_path.with_name(db_path.name + ".build.json")
+
+    def _build_offset_index(self, name: str, sources: List[Tuple[str, Path]], sig: str) -> Path:
+        """Build (or resume building) the offset index for `name`.
+
+        Work happens in `<index>.building`; a build manifest next to it records the
+        parts already indexed (row count + content checksum), so a build killed
+        midway resumes at the first unfinished part instead of starting over.
+        """
+        db_path = self._offset_index_path(name)
+        tmp = db_path.with_name(db_path.name + ".building")
+        bm_path = self._build_manifest_path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        bm: Dict[str, Any] = {}
+        try:
+            bm = json.loads(bm_path.read_text(encoding="utf-8"))
+        except Exception:
+            bm = {}
+        resume = (
+            tmp.exists()
+            and bm.get("sig") == sig
+            and bm.get("version") == _OFFSET_INDEX_VERSION
+            and isinstance(bm.get("parts"), dict)
+        )
+        if not resume:
+            if tmp.exists():
+                tmp.unlink()
+            bm = {"version": _OFFSET_INDEX_VERSION, "sig": sig, "parts": {}, "started_at": time.time()}
+
+        prog = _BUILD_PROGRESS.setdefault(name, {})
+        prog.update({
+            "state": "building", "parts_total": len(sources), "parts_done": 0, "rows": 0,
+            "resumed_parts": 0, "current": None, "started_at": time.time(), "error": None,
+        })
+
+        con = sqlite3.connect(str(tmp))
+        total = 0
+        try:
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute("CREATE TABLE IF NOT EXISTS idx (word TEXT PRIMARY KEY, file TEXT NOT NULL, off INTEGER NOT NULL, len INTEGER NOT NULL)")
+            con.execute("CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT NOT NULL)")
+            con.commit()
+            for rel, src in sources:
+                src_sum = self._file_checksum(src)
+                done = bm["parts"].get(rel)
+                if (
+                    isinstance(done, dict) and done.get("done") and src_sum
+                    and done.get("src_sum") == src_sum
+                    and self._seekable_path(name, src, rel).exists()
+                ):
+                    total += int(done.get("rows") or 0)
+                    prog["parts_done"] += 1
+                    prog["resumed_parts"] += 1
+                    prog["rows"] = total
+                    continue
+                n = 0
+                if src.exists():
+                    prog["current"] = rel
+                    n = self._index_data_file(con, src, self._seekable_path(name, src, rel))
+                    con.commit()
+                total += n
+                bm["parts"][rel] = {"done": True, "rows": n, "src_sum": src_sum}
+                self._write_json_atomic(bm_path, bm)
+                prog["parts_done"] += 1
+                prog["rows"] = total
+            con.executemany(
+                "INSERT OR REPLACE INTO meta(k, v) VALUES(?,?)",
+                [("version", str(_OFFSET_INDEX_VERSION)), ("sig", sig), ("words", str(total))],
+            )
             con.commit()
         finally:
             con.close()
+        # Only a finished index is ever visible under the real name.
+        self._drop_conn(db_path)
+        os.replace(tmp, db_path)
+        try:
+            bm_path.unlink()
+        except OSError:
+            pass
+        prog["current"] = None
+        log.info("[dict] offset index %s built: %s rows from %s file(s) (resumed %s)",
+                 name, total, len(sources), prog["resumed_parts"])
         return db_path
 
-    def _lookup_split_sync(self, word: str, src_code: str, target_code: str) -> Optional[str]:
-        manifest = self._split_manifest(src_code)
-        if not manifest:
-            return None
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _ensure_offset_index(self, name: str, sources: List[Tuple[str, Path]], sig: str) -> Optional[Path]:
+        """Return the offset index for `name` if it is built and current.
+
+        Never builds inline: a missing/stale index is queued for the background
+        builder and None is returned, so callers treat the word as not found and
+        the translate path falls back to the provider until the index is ready.
+        """
+        ready = self._offidx_ready.get(name)
+        if ready and ready[0] == sig:
+            return ready[1]
+        with self._offidx_guard:
+            lock = self._offidx_locks.setdefault(name, threading.Lock())
+        with lock:
+            ready = self._offidx_ready.get(name)
+            if ready and ready[0] == sig:
+                return ready[1]
+            db_path = self._offset_index_path(name)
+            meta = self._offset_index_meta(db_path) if db_path.exists() else {}
+            if meta.get("sig") != sig or meta.get("version") != str(_OFFSET_INDEX_VERSION):
+                self._request_build(name, sources, sig)
+                return None
+            bloom = self._ensure_bloom(db_path, sig, build=False)
+            if bloom is not None:
+                self._blooms[str(db_path)] = bloom
+            if bloom is None or not self._has_phrase_trie(db_path, sig):
+                self._request_build(name, sources, sig)  # index is current; only filter / trie are built
+            self._offidx_ready[name] = (sig, db_path)
+            _BUILD_PROGRESS.setdefault(name, {}).update({"state": "ready", "current": None})
+            return db_path
 
-        db_path = self._ensure_split_index(src_code, manifest)
-        relfile: Optional[str] = None
+    def _request_build(self, name: str, sources: List[Tuple[str, Path]], sig: str) -> None:
+        with _BUILD_GUARD:
+            if name in _BUILD_QUEUED:
+                return
+            failed = _BUILD_FAILED.get(name)
+            if failed and failed[0] == sig and time.time() - failed[1] < _BUILD_RETRY_SEC:
+                return
+            _BUILD_QUEUED.add(name)
+            prog = _BUILD_PROGRESS.setdefault(name, {})
+            if prog.get("state") != "building":
+                prog.update({"state": "queued", "queued_at": time.time()})
+        _BUILD_QUEUE.put((self, name, list(sources), sig))
+        _start_build_worker()
+
+    def _run_build_job(self, name: str, sources: List[Tuple[str, Path]], sig: str) -> None:
+        prog = _BUILD_PROGRESS.setdefault(name, {})
+        try:
+            db_path = self._offset_index_path(name)
+            meta = self._offset_index_meta(db_path) if db_path.exists() else {}
+            if meta.get("sig") != sig or meta.get("version") != str(_OFFSET_INDEX_VERSION):
+                db_path = self._build_offset_index(name, sources, sig)
+            prog.update({"state": "bloom", "current": None})
+            bloom = self._ensure_bloom(db_path, sig, build=True)
+            if bloom is not None:
+                self._blooms[str(db_path)] = bloom
+            if not self._has_phrase_trie(db_path, sig):
+                prog.update({"state": "phrases"})
+                self._build_phrase_trie(db_path, sig)
+            prog.update({"state": "ready", "finished_at": time.time()})
+            _BUILD_FAILED.pop(name, None)
+        except Exception as e:
+            prog.update({"state": "failed", "error": repr(e), "finished_at": time.time()})
+            _BUILD_FAILED[name] = (sig, time.time())
+            log.warning("[dict] offset index %s build failed: %r", name, e)
+
+    def schedule_index_builds(self) -> int:
+        """Queue background builds for every dictionary present locally. Returns jobs queued/ready."""
+        n = 0
+        for code in ("ja", "ko", "zh", "id", "en"):
+            if (self._split_dir(code) / "manifest.json").exists():
+                self._split_offset_index(code)
+                n += 1
+        if _mono_index_enabled():
+            for code, fname in (("ja", self.files.ja), ("ko", self.files.ko), ("zh", self.files.zh), ("id", self.files.id), ("en", self.files.en)):
+                fpath = self.dict_dir / fname if fname else None
+                if fpath is not None and fpath.exists():
+                    self._ensure_offset_index(f"mono_{code}_{fname}", [(fname, fpath)], self._file_sig(fpath))
+                    n += 1
+        return n
+
+    def _ensure_bloom(self, db_path: Path, sig: str, build: bool = True) -> Optional[BloomFilter]:
+        """Load the headword filter persisted next to the index, or (if `build`) build it from the index."""
+        bloom_path = db_path.with_suffix(".bloom")
+        bloom = BloomFilter.load(bloom_path) if bloom_path.exists() else None
+        if bloom is not None and bloom.sig == sig:
+            return bloom
+        if not build:
+            return None
         try:
-            con = sqlite3.connect(str(db_path))
+            fpr = float(_env("DICT_BLOOM_FPR", "0.01") or 0.01)
+        except Exception:
+            fpr = 0.01
+        try:
+            con = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
             try:
-                cur = con.execute("SELECT relfile FROM idx WHERE word = ?", (word,))
-                row = cur.fetchone()
-                relfile = row[0] if row else None
+                n = int(con.execute("SELECT COUNT(1) FROM idx").fetchone()[0] or 0)
+                bloom = BloomFilter.for_count(n, fpr=fpr, sig=sig)
+                for (w,) in con.execute("SELECT word FROM idx"):
+                    bloom.add(w)
             finally:
                 con.close()
-        except Exception:
-            relfile = None
-
-        if not relfile:
+            bloom.save(bloom_path)
+            log.info("[dict] bloom %s: words=%s bits=%s k=%s", bloom_path.name, bloom.n, bloom.m, bloom.k)
+            return bloom
+        except Exception as e:
+            log.warning("[dict] bloom build failed for %s: %r", db_path.name, e)
             return None
 
-        p = self._split_dir(src_code) / relfile
-        found: Optional[Dict[str, Any]] = None
-        for obj in self._iter_json_lines(p):
-            w = obj.get("word") or obj.get("title") or obj.get("term")
-            if isinstance(w, str) and w == word:
-                found = obj
-                break
-        if not found:
-            return None
+    def _has_phrase_trie(self, db_path: Path, sig: str) -> bool:
+        with self._trie_lock:
+            cur = self._phrase_tries.get(str(db_path))
+        return cur is not None and cur[0] == sig
 
-        trans = self._extract_translations(found, target_code=target_code)
-        gloss = self._extract_glosses(found)
+    def _build_phrase_trie(self, db_path: Path, sig: str) -> None:
+        """Scan the index for multi-token headwords (builder thread, own read-only connection)."""
+        trie = _PhraseTrie()
+        try:
+            con = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            try:
+                for (w,) in con.execute("SELECT word FROM idx WHERE instr(word, ' ') > 0"):
+                    trie.add(w)
+            finally:
+                con.close()
+        except Exception as e:
+            log.warning("[dict] phrase scan failed for %s: %r", db_path.name, e)
+            return
+        with self._trie_lock:
+            self._phrase_tries[str(db_path)] = (sig, trie)
+        log.info("[dict] phrase trie %s: %s multi-token headwords", db_path.name, trie.size)
+
+    def _maybe_indexed(self, db_path: Path, word: str) -> bool:
+        """False only when `word` is definitely absent (no disk access)."""
+        bloom = self._blooms.get(str(db_path))
+        return bloom is None or word in bloom
+
+    def _offset_get(self, db_path: Path, word: str) -> Optional[Dict[str, Any]]:
+        return self._offset_get_many(db_path, [word]).get(word)
+
+    def _offset_get_many(self, db_path: Path, words: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Index probe for many words (one IN query per chunk), then one open per data file."""
+        words = [w for w in words if self._maybe_indexed(db_path, w)]
+        if not words:
+            return {}
+        rows: List[Tuple[str, str, int, int]] = []
+        try:
+            with self._db_lock:
+                con = self._conn(db_path)
+                for i in range(0, len(words), _SQL_IN_CHUNK):
+                    part = words[i:i + _SQL_IN_CHUNK]
+                    q = "SELECT word, file, off, len FROM idx WHERE word IN (%s)" % ",".join("?" * len(part))
+                    rows.extend(con.execute(q, part))
+        except Exception:
+            return {}
+        out: Dict[str, Dict[str, Any]] = {}
+        by_file: Dict[str, List[Tuple[str, int, int]]] = {}
+        for w, rel, off, ln in rows:
+            by_file.setdefault(rel, []).append((w, int(off), int(ln)))
+        for rel, items in by_file.items():
+            try:
+                with open(self.dict_dir / rel, "rb") as fh:
+                    for w, off, ln in sorted(items, key=lambda t: t[1]):
+                        fh.seek(off)
+                        try:
+                            obj = json.loads(fh.read(ln))
+                        except Exception:
+                            continue
+                        if isinstance(obj, dict):
+                            out[w] = obj
+            except OSError:
+                continue
+        return out
 
+    def _payload_from_entry(self, found: Dict[str, Any], target_code: str) -> Optional[str]:
+        trans = self._extract_translations(found, target_code=target_code)
         if trans:
             return ", ".join(trans[:8])
+        gloss = self._extract_glosses(found)
         if gloss:
             return "; ".join(gloss[:3])
         return None
 
-    def lookup_term_sync(self, term: str, target_code: str) -> Optional[str]:
-        """Lookup a single term (no short-input gating)."""
-        if not self.enabled:
-            return None
-        word = (term or "").strip()
-        if not word:
+    def _split_offset_index(self, src_code: str) -> Optional[Path]:
+        folder = _split_folder_for(src_code)
+        man_path = self._split_dir(src_code) / "manifest.json"
+        sig = self._file_sig(man_path)
+        ready = self._offidx_ready.get(f"split_{folder}")
+        if ready and sig and ready[0] == sig:
+            return ready[1]
+        manifest = self._split_manifest(src_code)
+        if not manifest:
             return None
+        out_files = manifest.get("output_files") or []
+        sources: List[Tuple[str, Path]] = []
+        for of in out_files if isinstance(out_files, list) else []:
+            rel = of.get("file") if isinstance(of, dict) else None
+            if isinstance(rel, str) and rel:
+                sources.append((rel, self._split_dir(src_code) / rel))
+        return self._ensure_offset_index(f"split_{folder}", sources, sig)
+
+    def _lookup_split_sync(self, word: str, src_code: str, target_code: str) -> Optional[str]:
+        out: Dict[str, str] = {}
+        self._lookup_split_many(src_code, [word], target_code, out)
+        return out.get(word)
+
+    def _lookup_split_many(self, src_code: str, words: List[str], target_code: str, out: Dict[str, str]) -> None:
+        db_path = self._split_offset_index(src_code)
+        if db_path is None:
+            return
+        for w, found in self._offset_get_many(db_path, words).items():
+            payload = self._payload_from_entry(found, target_code)
+            if payload:
+                out[w] = payload
 
-        src_first = _detect_source_lang(word)
-        candidates: List[Tuple[str, str]] = []
+    def _candidates_for(self, src_first: str) -> List[Tuple[str, str]]:
         if src_first == "ja":
-            candidates = [("ja", self.files.ja), ("en", self.files.en)]
-        elif src_first == "ko":
-            candidates = [("ko", self.files.ko), ("en", self.files.en)]
-        elif src_first == "zh":
-            candidates = [("zh", self.files.zh), ("en", self.files.en)]
-        else:
-            candidates = [("id", self.files.id), ("en", self.files.en)]
-
-        for src_code, fname in candidates:
-            # Prefer split layout if available
-            man = self._split_dir(src_code) / "manifest.json"
-            if man.exists():
-                payload = self._lookup_split_sync(word, src_code=src_code, target_code=target_code)
-                if payload:
-                    return payload
-
-            # Fallback to monolithic file
-            if not fname:
-                continue
-            fpath = self.dict_dir / fname
-            db_path = self._cache_db_path(src_code, fname)
-            self._ensure_cache_db(db_path)
+            return [("ja", self.files.ja), ("en", self.files.en)]
+        if src_first == "ko":
+            return [("ko", self.files.ko), ("en", self.files.en)]
+        if src_first == "zh":
+            return [("zh", self.files.zh), ("en", self.files.en)]
+        if src_first == "en":
+            return [("en", self.files.en), ("id", self.files.id)]
+        return [("id", self.files.id), ("en", self.files.en)]
+
+    def _lookup_mono_many(self, src_code: str, fname: str, words: List[str], target_code: str, out: Dict[str, str]) -> None:
+        fpath = self.dict_dir / fname
+        mono_idx = None
+        if fpath.exists() and _mono_index_enabled():
+            mono_idx = self._ensure_offset_index(f"mono_{src_code}_{fname}", [(fname, fpath)], self._file_sig(fpath))
+            if mono_idx is None:
+                # Index still building in the background: don't scan a multi-GB dump
+                # on the lookup path, let the caller fall back to the provider.
+                return
+            words = [w for w in words if self._maybe_indexed(mono_idx, w)]
+        if not words:
+            return
 
-            cached = self._cache_get(db_path, word)
-            if cached:
-                return cached
+        db_path = self._cache_db_path(src_code, fname)
+        self._ensure_cache_db(db_path)
+        cached = self._cache_get_many(db_path, words)
+        out.update(cached)
+        need = [w for w in words if w not in cached]
+        if not need:
+            return
 
-            found: Optional[Dict[str, Any]] = None
+        found: Dict[str, Dict[str, Any]] = {}
+        if mono_idx is not None:
+            # Indexed: a word that is not in the index is not in the dump, no scan needed.
+            found = self._offset_get_many(mono_idx, need)
+        else:
+            # One sequential pass for all missing words (first occurrence wins).
+            want = set(need)
             for obj in self._iter_json_lines(fpath):
                 w = obj.get("word") or obj.get("title") or obj.get("term")
-                if isinstance(w, str) and w == word:
-                    found = obj
-                    break
-
-            if not found:
-                continue
-
-            trans = self._extract_translations(found, target_code=target_code)
-            gloss = self._extract_glosses(found)
+                if isinstance(w, str) and w in want and w not in found:
+                    found[w] = obj
+                    if len(found) == len(want):
+                        break
+
+        fresh: Dict[str, str] = {}
+        for w, obj in found.items():
+            payload = self._payload_from_entry(obj, target_code)
+            if payload:
+                fresh[w] = payload
+        self._cache_put_many(db_path, fresh)
+        out.update(fresh)
 
-            if trans:
-                payload = ", ".join(trans[:8])
-            elif gloss:
-                payload = "; ".join(gloss[:3])
-            else:
-                payload = ""
+    def lookup_terms_sync(self, words: Iterable[str], target_code: str, source_code: Optional[str] = None) -> Dict[str, str]:
+        """Batch lookup: {word: payload} for the words found (no short-input gating).
 
-            if payload:
-                self._cache_put(db_path, word, payload)
-                return payload
+        Same resolution order as `lookup_term_sync` (split layout, then the
+        monolithic dump, per candidate language), but each stage handles all
+        pending words with one query. `source_code` (from language ID of the
+        whole text) decides which dump Latin-script words try first.
+        """
+        out: Dict[str, str] = {}
+        if not self.enabled:
+            return out
+        latin_first = "en" if (source_code or "").lower() == "en" else "id"
+        groups: Dict[str, List[str]] = {}
+        for w in dict.fromkeys((w or "").strip() for w in words):
+            if w:
+                src = _detect_source_lang(w)
+                groups.setdefault(latin_first if src == "id" else src, []).append(w)
+
+        for src_first, pending in groups.items():
+            for src_code, fname in self._candidates_for(src_first):
+                if not pending:
+                    break
+                # Prefer split layout if available
+                if (self._split_dir(src_code) / "manifest.json").exists():
+                    self._lookup_split_many(src_code, pending, target_code, out)
+                    pending = [w for w in pending if w not in out]
+                # Fallback to monolithic file
+                if pending and fname:
+                    self._lookup_mono_many(src_code, fname, pending, target_code, out)
+                    pending = [w for w in pending if w not in out]
+        return out
+
+    def _ready_offset_indexes(self, src_first: str) -> List[Tuple[Path, str]]:
+        """(index path, signature) of the ready offset indexes for a source language's candidates."""
+        out: List[Tuple[Path, str]] = []
+        mono = _mono_index_enabled()
+        for src_code, fname in self._candidates_for(src_first):
+            if (self._split_dir(src_code) / "manifest.json").exists():
+                self._split_offset_index(src_code)
+                ready = self._offidx_ready.get(f"split_{_split_folder_for(src_code)}")
+                if ready:
+                    out.append((ready[1], ready[0]))
+            fpath = self.dict_dir / fname if fname else None
+            if mono and fpath is not None and fpath.exists():
+                name = f"mono_{src_code}_{fname}"
+                if self._ensure_offset_index(name, [(fname, fpath)], self._file_sig(fpath)) is not None:
+                    ready = self._offidx_ready[name]
+                    out.append((ready[1], ready[0]))
+        return out
+
+    def phrase_trie(self, src_first: str) -> Optional["_PhraseTrie"]:
+        """Multi-token headword trie(s) of the ready offset indexes; None (token-only) until built.
+
+        Tries are built by the background builder once an index is ready, never here.
+        """
+        indexes = self._ready_offset_indexes(src_first)
+        tries: List[_PhraseTrie] = []
+        with self._trie_lock:
+            for db_path, sig in indexes:
+                cur = self._phrase_tries.get(str(db_path))
+                if cur is not None and cur[0] == sig:
+                    tries.append(cur[1])
+        if not tries:
+            return None
+        return tries[0] if len(tries) == 1 else _PhraseTrieSet(tries)
 
-        return None
+    def lookup_term_sync(self, term: str, target_code: str) -> Optional[str]:
+        """Lookup a single term (no short-input gating)."""
+        word = (term or "").strip()
+        if not word:
+            return None
+        return self.lookup_terms_sync([word], target_code).get(word)
 
-    async def build_glossary_block(self, text: str, target_code: str) -> str:
+    async def build_glossary_block(self, text: str, target_code: str, source_code: Optional[str] = None) -> str:
         """Build a compact glossary block from the local dictionaries for use in MT prompts."""
         if not self.enabled or not _as_bool(_env("DICT_GLOSSARY_ENABLE", "0"), False):
             return ""
@@ -546,15 +1050,10 @@ class LocalDictStore:
             if len(uniq) >= max_terms * 4:
                 break
 
-        pairs: list[tuple[str, str]] = []
+        # one executor job for all candidates (batched index/cache queries)
         loop = asyncio.get_running_loop()
-        for w in uniq:
-            if len(pairs) >= max_terms:
-                break
-            # run sync lookup in executor (it can scan gzip)
-            hit = await loop.run_in_executor(None, self.lookup_term_sync, w, target_code)
-            if hit:
-                pairs.append((w, hit))
+        hits = await loop.run_in_executor(None, self.lookup_terms_sync, uniq, target_code, source_code)
+        pairs: list[tuple[str, str]] = [(w, hits[w]) for w in uniq if w in hits][:max_terms]
 
         if not pairs:
             return ""
@@ -798,6 +1297,67 @@ def _detect_src_sentence(text: str) -> str:
     return "en"
 
 
+_PHRASE_MAX_TOKENS = 6
+
+
+class _PhraseTrie:
+    """Token-level prefix trie of multi-token headwords ("terima kasih", "good morning").
+
+    Keys are lowercased tokens as produced by `_tokenize_en_id`; the terminal
+    entry (key "") holds the original headword used for the dictionary lookup.
+    """
+
+    __slots__ = ("root", "size")
+
+    def __init__(self) -> None:
+        self.root: Dict[str, Any] = {}
+        self.size = 0
+
+    def add(self, headword: str) -> None:
+        toks = _tokenize_en_id(headword)
+        if not (2 <= len(toks) <= _PHRASE_MAX_TOKENS) or not all(_is_word_token(t) for t in toks):
+            return
+        node = self.root
+        for t in toks:
+            node = node.setdefault(t.lower(), {})
+        prev = node.get("")
+        if prev is None:
+            self.size += 1
+        if prev is None or (prev != prev.lower() and headword == headword.lower()):
+            node[""] = headword  # prefer the lowercase spelling when both exist
+
+    def matches(self, low_tokens: List[str], i: int) -> List[Tuple[int, str]]:
+        """All (length, headword) phrases starting at token i, longest first."""
+        out: List[Tuple[int, str]] = []
+        node = self.root
+        for j in range(i, min(len(low_tokens), i + _PHRASE_MAX_TOKENS)):
+            node = node.get(low_tokens[j])
+            if node is None:
+                break
+            hw = node.get("")
+            if hw is not None and j > i:
+                out.append((j - i + 1, hw))
+        out.reverse()
+        return out
+
+
+class _PhraseTrieSet:
+    """`_PhraseTrie.matches` over several indexes' tries (the first index wins a shared length)."""
+
+    __slots__ = ("tries", "size")
+
+    def __init__(self, tries: List[_PhraseTrie]) -> None:
+        self.tries = tries
+        self.size = sum(t.size for t in tries)
+
+    def matches(self, low_tokens: List[str], i: int) -> List[Tuple[int, str]]:
+        best: Dict[int, str] = {}
+        for t in self.tries:
+            for n, hw in t.matches(low_tokens, i):
+                best.setdefault(n, hw)
+        return sorted(best.items(), reverse=True)
+
+
 class _SentenceAssembler:
     """
     Small helper so we can unit-test / use without changing the lookup cache semantics.
@@ -805,17 +1365,52 @@ class _SentenceAssembler:
     def __init__(self, store: "LocalDictStore"):
         self.store = store
 
-    def _lookup_token(self, tok: str, *, tgt: str) -> str:
-        # Reuse existing cache pipeline (lookup_sync enforces is_short_input; tok is short)
-        res = self.store.lookup_sync(tok, tgt)
-        return _pick_best_from_lookup_str(res or "", tgt=tgt)
+    def _translate_tokens(self, toks: List[str], token_map: Dict[str, str], src: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Greedy longest-match over the token stream with one batched dictionary lookup.
+
+        Multi-token headwords from the phrase trie win over single tokens when the
+        dictionary has a usable translation for them; everything else falls back
+        to the deterministic token map, then the single-token lookup.
+        """
+        low = [t.lower() for t in toks]
+        trie = self.store.phrase_trie(src)
+        spans = [trie.matches(low, i) if trie is not None else [] for i in range(len(toks))]
+        keys = [hw for cands in spans for _, hw in cands]
+        keys += [t for t, lt in zip(toks, low) if _is_word_token(t) and lt not in token_map]
+        found = self.store.lookup_terms_sync(keys, "ja") if keys else {}
+
+        out: List[str] = []
+        pairs: List[Tuple[str, str]] = []
+        i = 0
+        while i < len(toks):
+            t = toks[i]
+            if _is_punct(t):
+                out.append(t)
+                i += 1
+                continue
+            for n, hw in spans[i]:
+                tr = _pick_best_from_lookup_str(found.get(hw, ""), tgt="ja")
+                if tr and _has_cjk(tr):  # gloss-only phrase entries: try a shorter span
+                    pairs.append((" ".join(toks[i:i + n]), tr))
+                    out.append(tr)
+                    i += n
+                    break
+            else:
+                lt = low[i]
+                if lt in token_map:
+                    tr = token_map[lt]
+                else:
+                    tr = _pick_best_from_lookup_str(found.get(t, ""), tgt="ja") or t
+                pairs.append((t, tr))
+                if tr:
+                    out.append(tr)
+                i += 1
+        return out, pairs
 
     def translate_id_to_ja(self, text: str) -> Tuple[str, List[Tuple[str, str]]]:
         toks = _tokenize_en_id(text)
         lowt = [t.lower() for t in toks]
 
-        pairs: List[Tuple[str, str]] = []
-
         # Special-case: "Saya suka X dan Y" -> "私は XとY が好きです。"
         if len(lowt) >= 3 and lowt[0] in {"saya", "aku"} and "suka" in lowt:
             i_suka = lowt.index("suka")
@@ -823,51 +1418,25 @@ class _SentenceAssembler:
             obj_tokens = toks[i_suka+1:]
             # Remove trailing punctuation from object parse
             obj_tokens_clean = []
-            trailing_punct = ""
             for t in obj_tokens:
                 if _is_punct(t):
-                    trailing_punct = t
                     break
                 obj_tokens_clean.append(t)
 
-            obj_out: List[str] = []
-            for t in obj_tokens_clean:
-                lt = t.lower()
-                if lt in _ID_TOKEN_MAP:
-                    tr = _ID_TOKEN_MAP[lt]
-                else:
-                    tr = self._lookup_token(t, tgt="ja") or t
-                pairs.append((t, tr))
-                if tr:
-                    obj_out.append(tr)
-
+            obj_out, pairs = self._translate_tokens(obj_tokens_clean, _ID_TOKEN_MAP, "id")
             obj_phrase = _assemble_ja(obj_out).replace("。","").replace("、","")
             # Ensure conjunctions look ok (we map dan->と)
             out = f"{subject}は{obj_phrase}が好きです。"
             return out, pairs
 
-        # General fallback: token-wise map -> dict lookup -> assemble
-        out_tokens: List[str] = []
-        for t in toks:
-            if _is_punct(t):
-                out_tokens.append(t)
-                continue
-            lt = t.lower()
-            if lt in _ID_TOKEN_MAP:
-                tr = _ID_TOKEN_MAP[lt]
-            else:
-                tr = self._lookup_token(t, tgt="ja") or t
-            pairs.append((t, tr))
-            if tr:
-                out_tokens.append(tr)
-
+        # General fallback: phrase/token map -> dict lookup -> assemble
+        out_tokens, pairs = self._translate_tokens(toks, _ID_TOKEN_MAP, "id")
         out = _assemble_ja(out_tokens)
         return out, pairs
 
     def translate_en_to_ja(self, text: str) -> Tuple[str, List[Tuple[str, str]]]:
         toks = _tokenize_en_id(text)
         lowt = [t.lower() for t in toks]
-        pairs: List[Tuple[str, str]] = []
 
         # Special-case: "I like X and Y" -> "私は XとY が好きです。"
         if lowt and lowt[0] in {"i", "we", "you"} and "like" in lowt:
@@ -880,34 +1449,11 @@ class _SentenceAssembler:
                     break
                 obj_tokens_clean.append(t)
 
-            obj_out: List[str] = []
-            for t in obj_tokens_clean:
-                lt = t.lower()
-                if lt in _EN_TOKEN_MAP:
-                    tr = _EN_TOKEN_MAP[lt]
-                else:
-                    tr = self._lookup_token(t, tgt="ja") or t
-                pairs.append((t, tr))
-                if tr:
-                    obj_out.append(tr)
-
+            obj_out, pairs = self._translate_tokens(obj_tokens_clean, _EN_TOKEN_MAP, "en")
             obj_phrase = _assemble_ja(obj_out).replace("。","").replace("、","")
             out = f"{subject}は{obj_phrase}が好きです。"
             return out, pairs
 
-        out_tokens: List[str] = []
-        for t in toks:
-            if _is_punct(t):
-                out_tokens.append(t)
-                continue
-            lt = t.lower()
-            if lt in _EN_TOKEN_MAP:
-                tr = _EN_TOKEN_MAP[lt]
-            else:
-                tr = self._lookup_token(t, tgt="ja") or t
-            pairs.append((t, tr))
-            if tr:
-                out_tokens.append(tr)
-
+        out_tokens, pairs = self._translate_tokens(toks, _EN_TOKEN_MAP, "en")
         out = _assemble_ja(out_tokens)
-        return out, pairs
\ No newline at end of file
+        return out, pairs
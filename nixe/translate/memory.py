@@ -0,0 +1,317 @@
+"""nixe.translate.memory
+
+Translation memory for the translate cog.
+
+Users often translate the same message (patch notes, announcements) into the
+same language within minutes. Every repeat used to be a full Gemini/Groq call.
+This keeps finished translations keyed by:
+
+  sha256(normalized source) + target + style + provider signature
+
+where the provider signature is provider/model plus a hash of the prompt
+overrides and a prompt version, so changing a model or prompt naturally misses.
+
+- In-memory LRU in front of a small SQLite store with TTL (survives restarts).
+- Concurrent identical requests share one provider call (single-flight); if
+  the caller making that call is cancelled, a waiter makes it instead.
+- Only successful results are stored; failures always go to the provider.
+
+Env:
+  TRANSLATE_MEMORY_ENABLE=1
+  TRANSLATE_MEMORY_PATH=data/translate_memory.sqlite3
+  TRANSLATE_MEMORY_TTL_SEC=604800
+  TRANSLATE_MEMORY_LRU=512
+  TRANSLATE_MEMORY_MAX_ROWS=20000
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+_WS_RE = re.compile(r"[ \t 　]+")
+
+
+def _env(k: str, default: str = "") -> str:
+    v = os.getenv(k)
+    return default if v is None else str(v)
+
+
+def _env_int(k: str, default: int) -> int:
+    try:
+        return int(float(_env(k, str(default)) or default))
+    except Exception:
+        return default
+
+
+def enabled() -> bool:
+    return _env("TRANSLATE_MEMORY_ENABLE", "1").strip().lower() in ("1", "true", "yes", "on", "y")
+
+
+def normalize_source(text: str) -> str:
+    """NFC, trimmed lines, collapsed horizontal whitespace, no blank-line runs."""
+    s = unicodedata.normalize("NFC", str(text or "")).replace("\r\n", "\n").replace("\r", "\n")
+    lines = [_WS_RE.sub(" ", ln).strip() for ln in s.split("\n")]
+    out = []
+    for ln in lines:
+        if not ln and (not out or not out[-1]):
+            continue
+        out.append(ln)
+    return "\n".join(out).strip()
+
+
+def provider_signature(provider: str, model: str, prompt_version: str, env_keys: Iterable[str] = ()) -> str:
+    """provider/model@version#<hash of prompt overrides>."""
+    h = hashlib.sha1()
+    for k in env_keys:
+        h.update(k.encode("utf-8"))
+        h.update(b"=")
+        h.update(_env(k, "").encode("utf-8"))
+        h.update(b"\0")
+    return f"{provider}/{model}@{prompt_version}#{h.hexdigest()[:10]}"
+
+
+def make_key(text: str, target: str, style: str, signature: str, extra: str = "") -> str:
+    src = hashlib.sha256(normalize_source(text).encode("utf-8")).hexdigest()
+    tail = hashlib.sha1(extra.encode("utf-8")).hexdigest()[:10] if extra else "-"
+    return f"{src}|{(target or '').lower()}|{style}|{signature}|{tail}"
+
+
+class TranslationMemory:
+    """LRU over a SQLite TTL table.
+
+    Table schema:
+      tm(k TEXT PRIMARY KEY, v TEXT, exp REAL, ts REAL)
+    """
+
+    def __init__(self, db_path: str, ttl_sec: int = 604800, lru_size: int = 512, max_rows: int = 20000):
+        self.db_path = (db_path or "data/translate_memory.sqlite3").strip()
+        self.ttl_sec = max(60, int(ttl_sec or 0))
+        self.lru_size = max(0, int(lru_size or 0))
+        self.max_rows = int(max_rows or 0)
+        self._lock = threading.RLock()
+        self._lru: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        self.stats: Dict[str, int] = {"lru_hit": 0, "db_hit": 0, "miss": 0, "shared": 0, "store": 0}
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            parent = os.path.dirname(self.db_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            # check_same_thread=False: used from executor threads, guarded by our lock.
+            conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS tm (k TEXT PRIMARY KEY, v TEXT NOT NULL, exp REAL NOT NULL, ts REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tm_exp ON tm(exp)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _lru_get(self, key: str, now: float) -> Any:
+        ent = self._lru.get(key)
+        if ent is None:
+            return None
+        if ent[0] <= now:
+            self._lru.pop(key, None)
+            return None
+        self._lru.move_to_end(key)
+        return ent[1]
+
+    def _lru_put(self, key: str, value: Any, exp: float) -> None:
+        if not self.lru_size:
+            return
+        self._lru[key] = (exp, value)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def lru_get(self, key: str) -> Any:
+        """Memory-only lookup (no I/O); safe to call on the event loop."""
+        with self._lock:
+            val = self._lru_get(key, time.time())
+            if val is not None:
+                self.stats["lru_hit"] += 1
+            return val
+
+    def get_sync(self, key: str) -> Any:
+        """LRU, then SQLite. Misses are counted by the caller that goes to the provider."""
+        now = time.time()
+        with self._lock:
+            val = self._lru_get(key, now)
+            if val is not None:
+                self.stats["lru_hit"] += 1
+                return val
+            try:
+                row = self._db().execute("SELECT v, exp FROM tm WHERE k=?", (key,)).fetchone()
+            except Exception as e:
+                log.debug("[translate-memory] read failed: %r", e)
+                row = None
+            if row and float(row[1] or 0) > now:
+                try:
+                    val = json.loads(row[0])
+                except Exception:
+                    val = None
+                if val is not None:
+                    self._lru_put(key, val, float(row[1]))
+                    self.stats["db_hit"] += 1
+                    return val
+            return None
+
+    def put_sync(self, key: str, value: Any) -> None:
+        now = time.time()
+        exp = now + self.ttl_sec
+        with self._lock:
+            self._lru_put(key, value, exp)
+            self.stats["store"] += 1
+            try:
+                conn = self._db()
+                conn.execute(
+                    "INSERT INTO tm(k, v, exp, ts) VALUES(?,?,?,?) "
+                    "ON CONFLICT(k) DO UPDATE SET v=excluded.v, exp=excluded.exp, ts=excluded.ts",
+                    (key, json.dumps(value, ensure_ascii=False), exp, now),
+                )
+                self._writes += 1
+                if self._writes % 100 == 1:
+                    self._gc(conn, now)
+                conn.commit()
+            except Exception as e:
+                log.debug("[translate-memory] write failed: %r", e)
+
+    def _gc(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM tm WHERE exp <= ?", (now,))
+        if self.max_rows > 0:
+            row = conn.execute("SELECT COUNT(1) FROM tm").fetchone()
+            extra = int(row[0] or 0) - self.max_rows if row else 0
+            if extra > 0:
+                conn.execute("DELETE FROM tm WHERE k IN (SELECT k FROM tm ORDER BY ts ASC LIMIT ?)", (extra,))
+
+    def hit_rate(self) -> float:
+        hits = self.stats["lru_hit"] + self.stats["db_hit"] + self.stats["shared"]
+        total = hits + self.stats["miss"]
+        return (hits / total) if total else 0.0
+
+    def report(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = dict(self.stats)
+        out["hit_rate"] = round(self.hit_rate(), 4)
+        out["lru_size"] = len(self._lru)
+        out["path"] = self.db_path
+        return out
+
+
+_MEMORY: Optional[TranslationMemory] = None
+_INFLIGHT: Dict[str, "asyncio.Future[Any]"] = {}
+_RETRY = object()  # handed to waiters when the caller running the provider call was cancelled
+
+
+def get_memory() -> TranslationMemory:
+    global _MEMORY
+    if _MEMORY is None:
+        _MEMORY = TranslationMemory(
+            _env("TRANSLATE_MEMORY_PATH", "data/translate_memory.sqlite3"),
+            ttl_sec=_env_int("TRANSLATE_MEMORY_TTL_SEC", 604800),
+            lru_size=_env_int("TRANSLATE_MEMORY_LRU", 512),
+            max_rows=_env_int("TRANSLATE_MEMORY_MAX_ROWS", 20000),
+        )
+    return _MEMORY
+
+
+def report() -> Dict[str, Any]:
+    """Hit/miss counters and hit rate for status output."""
+    if _MEMORY is None:
+        return {"enabled": enabled(), "lru_hit": 0, "db_hit": 0, "miss": 0, "shared": 0, "store": 0, "hit_rate": 0.0}
+    out = _MEMORY.report()
+    out["enabled"] = enabled()
+    return out
+
+
+async def cached_call(
+    key: str,
+    call: Callable[[], Awaitable[Tuple[bool, Any]]],
+    is_good: Callable[[Any], bool],
+) -> Tuple[bool, Any]:
+    """Return a remembered (True, value) for `key`, else run `call` once and remember good results."""
+    mem = get_memory()
+    while True:
+        val = mem.lru_get(key)
+        if val is None:
+            val = await asyncio.to_thread(mem.get_sync, key)
+        if val is not None:
+            return True, val
+
+        fut = _INFLIGHT.get(key)
+        if fut is None:
+            break
+        mem.stats["shared"] += 1
+        res = await asyncio.shield(fut)
+        if res is not _RETRY:
+            return res
+        # The caller running the provider call was cancelled: look again / call ourselves.
+
+    mem.stats["miss"] += 1
+
+    fut = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = fut
+    res: Any = (False, None)
+    try:
+        res = await call()
+        ok, value = res
+        if ok and is_good(value):
+            await asyncio.to_thread(mem.put_sync, key, value)
+    except asyncio.CancelledError:
+        res = _RETRY
+        raise
+    finally:
+        _INFLIGHT.pop(key, None)
+        if not fut.done():
+            fut.set_result(res)
+    return res
+
+
+def memoize(
+    style: str,
+    signature: Callable[[], str],
+    is_good: Callable[[Any], bool],
+    target: Optional[str] = None,
+    ignore: Iterable[str] = (),
+):
+    """Decorator for `async fn(text, target_lang?, *extra) -> (ok, value)` provider helpers.
+
+    `target` fixes the target language for helpers without a target argument
+    (the JA/KO/ZH multi-style helpers). Extra positional/keyword args (glossary)
+    are part of the key, except keyword args named in `ignore` (callbacks).
+    """
+    skip = {"target_lang", *ignore}
+
+    def deco(fn):
+        @functools.wraps(fn)
+        async def wrapper(text: str, *args: Any, **kwargs: Any):
+            if not enabled() or not (text or "").strip():
+                return await fn(text, *args, **kwargs)
+            if target is None:
+                tgt, extra_args = (args[0] if args else kwargs.get("target_lang", "")), args[1:]
+            else:
+                tgt, extra_args = target, args
+            kw = sorted((k, v) for k, v in kwargs.items() if k not in skip)
+            extra = json.dumps([list(extra_args), kw], ensure_ascii=False, default=str) if (extra_args or kw) else ""
+            key = make_key(text, str(tgt), style, signature(), extra)
+            return await cached_call(key, lambda: fn(text, *args, **kwargs), is_good)
+
+        wrapper.__wrapped__ = fn  # type: ignore[attr-defined]
+        return wrapper
+
+    return deco
@@ -0,0 +1,108 @@
+"""Accuracy / speed benchmark for nixe.translate.langs.detect_lang.
+
+Usage:
+  python -m scripts.bench_langid [--loops N]
+
+The samples are held out from the seed text the model is trained on: short
+chat-style lines as they show up in the translate context menu.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nixe.translate.langs import detect_lang  # noqa: E402
+
+SAMPLES: List[Tuple[str, str]] = [
+    ("en", "Can someone help me with this quest? I have been stuck for an hour."),
+    ("en", "The patch notes say they fixed the audio bug on mobile."),
+    ("en", "I'm not sure which weapon is better for her, any advice?"),
+    ("en", "Server maintenance starts in two hours, make sure to claim your rewards."),
+    ("en", "Nice build! How long did it take you to farm those echoes?"),
+    ("en", "We need one more player for the boss fight, anyone free right now?"),
+    ("en", "Honestly the story in this chapter was way better than I expected."),
+    ("en", "Don't forget to spend your stamina before the daily reset."),
+    ("id", "Ada yang bisa bantu aku selesaikan misi ini? Udah sejam nggak maju-maju."),
+    ("id", "Catatan pembaruan bilang mereka sudah memperbaiki masalah suara di HP."),
+    ("id", "Aku belum yakin senjata mana yang lebih cocok buat dia, ada saran?"),
+    ("id", "Pemeliharaan server dimulai dua jam lagi, jangan lupa ambil hadiahnya."),
+    ("id", "Build yang bagus! Berapa lama kamu farming echo sebanyak itu?"),
+    ("id", "Kita butuh satu pemain lagi untuk lawan bos, ada yang lagi kosong?"),
+    ("id", "Jujur cerita di bab ini jauh lebih seru daripada yang saya kira."),
+    ("id", "Jangan lupa habiskan stamina sebelum reset harian ya."),
+    ("su", "Aya nu tiasa ngabantosan abdi ngabéréskeun misi ieu? Tos sajam teu maju-maju."),
+    ("su", "Abdi teu acan yakin pakarang mana nu langkung cocog kanggo manéhna."),
+    ("su", "Ulah hilap béakeun stamina samemeh reset unggal dinten nya."),
+    ("su", "Urang peryogi hiji deui pamaén pikeun ngalawan bos, saha nu keur lowong?"),
+    ("su", "Jujur carita dina bab ieu leuwih seru ti nu ku kuring disangka."),
+    ("su", "Kumaha damang? Parantos tuang teu acan?"),
+    ("jv", "Ana sing iso ngewangi aku ngrampungke misi iki? Wis sejam ora maju-maju."),
+    ("jv", "Aku durung yakin gaman endi sing luwih cocok kanggo dheweke."),
+    ("jv", "Aja lali ngentekake stamina sadurunge reset saben dina ya."),
+    ("jv", "Awake dhewe butuh siji pemain maneh kanggo nglawan bos, sapa sing lagi selo?"),
+    ("jv", "Jujur critane ing bab iki luwih seru tinimbang sing tak kira."),
+    ("jv", "Piye kabare? Wis mangan durung?"),
+    ("ja", "このクエスト手伝ってくれる人いますか？一時間ずっと詰まってます。"),
+    ("ja", "メンテナンスは二時間後に始まるので報酬を受け取っておいてください。"),
+    ("ja", "正直この章のストーリーは思ったよりずっと良かった。"),
+    ("ko", "이 퀘스트 좀 도와줄 사람 있어요? 한 시간째 막혀 있어요."),
+    ("ko", "점검이 두 시간 뒤에 시작되니까 보상 꼭 받으세요."),
+    ("ko", "솔직히 이번 장 스토리는 생각보다 훨씬 좋았어요."),
+    ("zh", "有人能帮我完成这个任务吗？我已经卡了一个小时了。"),
+    ("zh", "服务器维护两小时后开始，请记得领取奖励。"),
+    ("zh", "说实话这一章的剧情比我想象的好多了。"),
+    ("ar", "هل يمكن لأحد مساعدتي في هذه المهمة؟ أنا عالق منذ ساعة."),
+    ("ar", "تبدأ صيانة الخادم بعد ساعتين، تأكد من استلام مكافآتك."),
+    ("ar", "بصراحة قصة هذا الفصل كانت أفضل بكثير مما توقعت."),
+]
+
+
+def run(loops: int = 200) -> Dict[str, object]:
+    detect_lang("warm up")  # trains the model once
+    wrong: List[Tuple[str, str, str]] = []
+    per_lang: Dict[str, List[int]] = {}
+    for code, text in SAMPLES:
+        got, _conf = detect_lang(text)
+        hit = per_lang.setdefault(code, [0, 0])
+        hit[1] += 1
+        if got == code:
+            hit[0] += 1
+        else:
+            wrong.append((code, got, text))
+
+    t0 = time.perf_counter()
+    for _ in range(loops):
+        for _code, text in SAMPLES:
+            detect_lang(text)
+    dt = time.perf_counter() - t0
+    calls = loops * len(SAMPLES)
+    return {
+        "accuracy": (len(SAMPLES) - len(wrong)) / len(SAMPLES),
+        "per_lang": {k: f"{v[0]}/{v[1]}" for k, v in sorted(per_lang.items())},
+        "us_per_call": dt / calls * 1e6,
+        "wrong": wrong,
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--loops", type=int, default=200)
+    args = ap.parse_args()
+    res = run(args.loops)
+    print(f"accuracy: {res['accuracy'] * 100:.1f}%  ({len(SAMPLES)} samples)")
+    print(f"per language: {res['per_lang']}")
+    print(f"speed: {res['us_per_call']:.1f} us/call")
+    for code, got, text in res["wrong"]:  # type: ignore[union-attr]
+        print(f"  miss {code} -> {got or '?'}: {text}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
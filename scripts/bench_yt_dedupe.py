@@ -0,0 +1,145 @@
+"""Dedupe latency benchmark for the YouTube announcer, with and without the announce index.
+
+Usage:
+  python -m scripts.bench_yt_dedupe [--messages N] [--checks N] [--page-ms MS]
+
+A mocked announce channel holds N bot announce messages (plus some chatter). "Without the
+index" is the history fallback every check used to take (_DEDUP_HISTORY_LIMIT messages,
+re-parsed through _extract_video_id_from_message); "with the index" pays one history build
+and then answers hits from state["announce_index"], while a miss costs one (usually empty)
+history(after=...) top-up request. --page-ms adds simulated REST latency per history page.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt  # noqa: E402
+
+BOT_ID = 4242
+
+
+class FakeChannel:
+    """Announce channel stand-in: newest-first history in 100-message pages."""
+
+    def __init__(self, messages: List[Any], page_ms: float = 0.0, channel_id: int = 777):
+        self.id = channel_id
+        self.messages = messages
+        self.page_ms = page_ms
+        self.pages = 0
+
+    async def history(self, limit: int = 100, after: Any = None, oldest_first: Any = None):
+        msgs = self.messages
+        if after is not None:
+            msgs = [m for m in msgs if m.id > after.id]
+        if oldest_first:
+            msgs = msgs[::-1]
+        msgs = msgs[:limit]
+        for i in range(max(1, (len(msgs) + 99) // 100)):  # one request per page, even an empty one
+            self.pages += 1
+            if self.page_ms:
+                await asyncio.sleep(self.page_ms / 1000.0)
+            for msg in msgs[i * 100:(i + 1) * 100]:
+                yield msg
+
+
+def make_channel(n: int = 1000, page_ms: float = 0.0) -> FakeChannel:
+    now = datetime.now(timezone.utc)
+    msgs = []
+    for i in range(n):
+        created = now - timedelta(minutes=30 * i)
+        if i % 10 == 9:
+            msgs.append(SimpleNamespace(id=10_000_000 - i, author=SimpleNamespace(id=1), content="nice stream!",
+                                        embeds=[], created_at=created))
+            continue
+        vid = f"v{i:010d}"
+        link = f"https://www.youtube.com/watch?v={vid}"
+        emb = SimpleNamespace(url=link, title=f"Live {i}")
+        msgs.append(SimpleNamespace(id=10_000_000 - i, author=SimpleNamespace(id=BOT_ID),
+                                    content=f"Creator {i} is live: <{link}>", embeds=[emb], created_at=created))
+    return FakeChannel(msgs, page_ms=page_ms)
+
+
+@contextmanager
+def _state_dir(state_dir: str) -> Iterator[None]:
+    """Point the cog's state / watchlist files at `state_dir`; restored on exit."""
+    saved = yt.STATE_PATH, yt.WATCHLIST_PATH
+    yt.STATE_PATH = os.path.join(state_dir, "state.json")
+    yt.WATCHLIST_PATH = os.path.join(state_dir, "watchlist.json")
+    try:
+        yield
+    finally:
+        yt.STATE_PATH, yt.WATCHLIST_PATH = saved
+
+
+def _new_cog(state_dir: str):
+    """A cog whose state file lives in `state_dir`."""
+    with _state_dir(state_dir):
+        cog = yt.YouTubeWuWaLiveAnnouncer(SimpleNamespace(user=SimpleNamespace(id=BOT_ID)))
+    cog._announce_history_scan_limit = 5000
+    return cog
+
+
+async def _run(n: int, checks: int, page_ms: float) -> Dict[str, Any]:
+    probe = [f"v{(i * 37) % n:010d}" for i in range(checks // 2)] + [f"miss{i:07d}" for i in range(checks // 2)]
+    out: Dict[str, Any] = {"messages": n, "checks": len(probe)}
+    with tempfile.TemporaryDirectory() as d:
+        # without the index: the per-check history fallback
+        cog = _new_cog(d)
+        cog._announce_vid_cache_ready = True
+        ch = make_channel(n, page_ms)
+        t0 = time.perf_counter()
+        legacy_hits = sum([await cog._announce_channel_has_video(ch, v) for v in probe])
+        out["without_us"] = (time.perf_counter() - t0) / len(probe) * 1e6
+        out["without_pages"] = ch.pages
+        out["without_hits"] = legacy_hits
+
+        # with the index: one history build, then O(1) checks
+        cog = _new_cog(d)
+        ch = make_channel(n, page_ms)
+        t0 = time.perf_counter()
+        await cog._warm_announce_video_cache(ch)
+        out["build_ms"] = (time.perf_counter() - t0) * 1e3
+        out["build_pages"] = ch.pages
+        cog._announce_vid_cache.clear()  # measure the durable index, not the per-boot set
+        t0 = time.perf_counter()
+        hits = sum([await cog._announce_channel_has_video(ch, v) for v in probe])
+        out["with_us"] = (time.perf_counter() - t0) / len(probe) * 1e6
+        out["with_pages"] = ch.pages - out["build_pages"]
+        out["with_hits"] = hits
+        cog._flush_state()
+    return out
+
+
+def run(messages: int = 1000, checks: int = 200, page_ms: float = 0.0) -> Dict[str, Any]:
+    return asyncio.run(_run(messages, checks, page_ms))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--messages", type=int, default=1000)
+    ap.add_argument("--checks", type=int, default=200)
+    ap.add_argument("--page-ms", type=float, default=0.0)
+    args = ap.parse_args()
+    r = run(args.messages, args.checks, args.page_ms)
+    print(f"channel: {r['messages']} messages, {r['checks']} dedupe checks (half present)")
+    print(f"without index: {r['without_us']:.1f} us/check, {r['without_pages']} history pages, hits={r['without_hits']}")
+    print(f"with index:    {r['with_us']:.1f} us/check, {r['with_pages']} history pages, hits={r['with_hits']}"
+          f" (one-time build {r['build_ms']:.1f} ms / {r['build_pages']} pages)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
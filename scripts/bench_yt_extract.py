@@ -0,0 +1,140 @@
+"""Time / peak-memory benchmark for the YouTube embedded-JSON extractors.
+
+Usage:
+  python -m scripts.bench_yt_extract [--loops N] [saved_page.html ...]
+
+Compares the legacy balanced-brace scanner (_extract_yt_var_json) with the
+str.find + JSONDecoder.raw_decode extractor (_find_yt_var_json) used by the
+announcer. Without arguments a /live-like page is synthesized (deterministic,
+~600 KB: a large ytInitialData, nested player response, strings containing
+braces, escaped quotes and "ytInitialPlayerResponse" inside a comment). Pass
+pages saved from a browser ("view-source" -> save) to measure real fixtures.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nixe.cogs.a21_youtube_wuwa_live_announce import (  # noqa: E402
+    _extract_yt_var_json,
+    _find_yt_var_json,
+)
+
+VARS = ("ytInitialPlayerResponse", "ytInitialData")
+
+
+def synth_page(seed: int = 7, items: int = 900) -> str:
+    rnd = random.Random(seed)
+
+    def text(n: int) -> str:
+        words = ["Wuthering", "Waves", "live", "{echo}", "\"quoted\"", "Rover", "}{", "\\path", "設定", "🎮"]
+        return " ".join(rnd.choice(words) for _ in range(n))
+
+    shelf = [
+        {
+            "videoRenderer": {
+                "videoId": f"vid{i:08d}",
+                "title": {"runs": [{"text": text(8)}]},
+                "descriptionSnippet": {"runs": [{"text": text(30)}]},
+                "thumbnail": {"thumbnails": [{"url": f"https://i.ytimg.com/vi/vid{i:08d}/hq.jpg", "width": 480, "height": 360}]},
+                "badges": [{"metadataBadgeRenderer": {"label": "LIVE" if i % 50 == 0 else "New"}}],
+            }
+        }
+        for i in range(items)
+    ]
+    initial_data = {
+        "contents": {"twoColumnBrowseResultsRenderer": {"tabs": [{"tabRenderer": {"content": {"items": shelf}}}]}},
+        "metadata": {"channelMetadataRenderer": {"title": "Wuthering Waves", "description": text(40)}},
+    }
+    player = {
+        "videoDetails": {
+            "videoId": "LIVEvid0001",
+            "title": "[LIVE] Version update {special} \"stream\"",
+            "author": "Wuthering Waves",
+            "isLive": True,
+            "shortDescription": text(120),
+        },
+        "microformat": {"playerMicroformatRenderer": {"liveBroadcastDetails": {"isLiveNow": True, "startTimestamp": "2026-10-18T12:00:00+00:00"}}},
+        "streamingData": {"adaptiveFormats": [{"itag": k, "url": "https://example.invalid/" + "x" * 300} for k in range(60)]},
+    }
+    filler = "<div class=\"style-scope\">" + ("<span>pad</span>" * 2000) + "</div>\n"
+    return "".join([
+        "<!DOCTYPE html><html><head><script>var ytcfg = {\"a\": 1};</script>\n",
+        "<!-- ytInitialPlayerResponse is set below -->\n",
+        filler,
+        "<script>var ytInitialPlayerResponse = ", json.dumps(player, ensure_ascii=False),
+        ";var meta = document.createElement('meta');</script>\n",
+        filler,
+        "<script>var ytInitialData = ", json.dumps(initial_data, ensure_ascii=False), ";</script>\n",
+        filler,
+        "</head><body></body></html>",
+    ])
+
+
+def _measure(fn: Callable[[str, str], object], html: str, var: str, loops: int) -> Tuple[float, int, object]:
+    result = fn(html, var)
+    t0 = time.perf_counter()
+    for _ in range(loops):
+        fn(html, var)
+    dt = (time.perf_counter() - t0) / loops
+    tracemalloc.start()
+    fn(html, var)
+    _cur, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dt, peak, result
+
+
+def run(pages: List[Tuple[str, str]] = None, loops: int = 5) -> Dict[str, object]:
+    if not pages:
+        pages = [("synthetic", synth_page())]
+    rows: List[Dict[str, object]] = []
+    for name, html in pages:
+        for var in VARS:
+            old_t, old_peak, old_res = _measure(_extract_yt_var_json, html, var, loops)
+            new_t, new_peak, new_res = _measure(_find_yt_var_json, html, var, loops)
+            rows.append({
+                "page": name,
+                "var": var,
+                "bytes": len(html.encode("utf-8")),
+                "old_ms": old_t * 1e3,
+                "new_ms": new_t * 1e3,
+                "old_peak": old_peak,
+                "new_peak": new_peak,
+                "same": old_res == new_res,
+                "found": new_res is not None,
+            })
+    return {"rows": rows}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--loops", type=int, default=5)
+    ap.add_argument("pages", nargs="*")
+    args = ap.parse_args()
+    pages = []
+    for p in args.pages:
+        with open(p, "r", encoding="utf-8", errors="replace") as f:
+            pages.append((os.path.basename(p), f.read()))
+    res = run(pages, args.loops)
+    for r in res["rows"]:  # type: ignore[union-attr]
+        print(
+            f"{r['page']} [{r['bytes'] // 1024} KB] {r['var']}: "
+            f"scanner {r['old_ms']:.2f} ms / {r['old_peak'] // 1024} KB peak -> "
+            f"raw_decode {r['new_ms']:.2f} ms / {r['new_peak'] // 1024} KB peak "
+            f"(x{r['old_ms'] / max(r['new_ms'], 1e-9):.1f}, same={r['same']}, found={r['found']})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+"""Channel identity lookup benchmark for the YouTube announcer.
+
+Usage:
+  python -m scripts.bench_yt_identity [--targets N] [--rounds N]
+
+Builds a legacy state file the way older builds grew it for N targets: state["resolved"]
+with one entry per alias (dict entries from search/oEmbed, bare display-name strings from
+the watch-page fallback, a "url_to_name" sub-map), plus yt_channel_name_cache and
+channel_ids. "Legacy" is the per-poll name lookup those maps needed (walk channel id, url,
+handle, query, name; skip non-dict entries; reject handle / UC placeholders). "Store" is
+the same lookup through the migrated _ChannelIdentityStore. A legacy miss (bare-string
+entries are skipped) meant an oEmbed / channel-page fetch on the next live. Also reports
+the one-time migration cost and the JSON size of both layouts.
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt  # noqa: E402
+
+
+def make_legacy_state(n: int = 500) -> Dict[str, Any]:
+    resolved: Dict[str, Any] = {}
+    url_to_name: Dict[str, str] = {}
+    names: Dict[str, str] = {}
+    ids: Dict[str, str] = {}
+    for i in range(n):
+        cid = f"UC{i:022d}"
+        handle = f"@creator{i}"
+        url = f"https://www.youtube.com/{handle}"
+        title = f"Creator {i}"
+        rec = {"channel_id": cid, "title": title, "url": url}
+        if i % 3 == 0:
+            # watch-page fallback: bare strings under every alias
+            for k in (cid, url, handle, title):
+                resolved[k] = title
+            url_to_name[url] = title
+        else:
+            for k in (cid, url, handle, handle, title):
+                resolved.setdefault(k, dict(rec))
+        names[cid] = title
+        ids[handle] = cid
+    resolved["url_to_name"] = url_to_name
+    return {"resolved": resolved, "yt_channel_name_cache": names, "channel_ids": ids, "announced": {}}
+
+
+def targets(n: int) -> List[yt.Target]:
+    out = []
+    for i in range(n):
+        t = yt.Target(name=f"@creator{i}", query=f"@creator{i}", handle=f"@creator{i}")
+        if i % 2:
+            t.channel_id = f"UC{i:022d}"
+        out.append(t)
+    return out
+
+
+def _legacy_title(res: Dict[str, Any], t: yt.Target) -> Optional[str]:
+    base_url = (t.url or t.base_url() or "").strip()
+    for kk in (t.channel_id, base_url, t.handle, t.query, t.name):
+        if not kk:
+            continue
+        cc = res.get(str(kk))
+        if isinstance(cc, dict):
+            cand = (cc.get("title") or "").strip()
+            if cand and (not cand.startswith(("@", "＠"))) and (not yt._UC_ID_LIKE_RE.match(cand)):
+                return cand
+    return None
+
+
+def run(n: int = 500, rounds: int = 20) -> Dict[str, Any]:
+    legacy = make_legacy_state(n)
+    tgts = targets(n)
+    out: Dict[str, Any] = {"targets": n, "lookups": n * rounds}
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        legacy_hits = sum(1 for t in tgts if _legacy_title(legacy["resolved"], t))
+    out["legacy_us"] = (time.perf_counter() - t0) / (n * rounds) * 1e6
+    out["legacy_hits"] = legacy_hits
+    out["legacy_bytes"] = len(json.dumps(legacy, ensure_ascii=False))
+
+    state = copy.deepcopy(legacy)
+    t0 = time.perf_counter()
+    store = yt._ChannelIdentityStore(state)
+    store.migrate_legacy(state)
+    out["migrate_ms"] = (time.perf_counter() - t0) * 1e3
+    out["records"] = len(store)
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        hits = sum(1 for t in tgts if store.title_for(t.channel_id, t.base_url(), t.handle, t.query, t.name))
+    out["store_us"] = (time.perf_counter() - t0) / (n * rounds) * 1e6
+    out["store_hits"] = hits
+    out["store_bytes"] = len(json.dumps(state, ensure_ascii=False))
+
+    t0 = time.perf_counter()
+    yt._ChannelIdentityStore(json.loads(json.dumps(state)))
+    out["load_ms"] = (time.perf_counter() - t0) * 1e3
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--targets", type=int, default=500)
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args()
+    r = run(args.targets, args.rounds)
+    print(f"{r['targets']} targets, {r['lookups']} name lookups")
+    print(f"legacy maps: {r['legacy_us']:.2f} us/lookup, hits={r['legacy_hits']}, {r['legacy_bytes'] // 1024} KB state")
+    print(f"store:       {r['store_us']:.2f} us/lookup, hits={r['store_hits']}, {r['store_bytes'] // 1024} KB state,"
+          f" {r['records']} records (migrate {r['migrate_ms']:.1f} ms, load {r['load_ms']:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Import-time regression check.
+
+Imports each target module in a fresh interpreter (`python -X importtime`) and
+fails when its cumulative import time exceeds the budget or when it drags in a
+heavy dependency that should stay lazy (see nixe/helpers/lazy_import.py).
+
+Env:
+  NIXE_IMPORT_BUDGET_MS        budget per target in ms (default 400)
+  NIXE_IMPORT_BUDGET_TARGETS   comma list (default nixe.cogs_loader,nixe.web.asgi)
+  NIXE_IMPORT_BUDGET_FORBID    comma list (default numpy,PIL,imagehash,groq,httpx)
+
+Exit code 0 = within budget, 1 = regression.
+"""
+import os, sys, json, subprocess
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+DEFAULT_TARGETS = "nixe.cogs_loader,nixe.web.asgi"
+DEFAULT_FORBID = "numpy,PIL,imagehash,groq,httpx"
+
+_PROBE = r"""
+import sys, json, resource
+import {mod}
+print("@@" + json.dumps({{
+    "modules": sorted(k for k in sys.modules if "." not in k),
+    "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def _csv(key: str, default: str):
+    return [x.strip() for x in (os.getenv(key) or default).split(",") if x.strip()]
+
+
+def measure(mod: str) -> dict:
+    """Return {"ms": cumulative import ms, "modules": [...], "maxrss_kb": int} for `mod`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(mod=mod)],
+        cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {mod} failed: {proc.stderr.strip()[-400:]}")
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if len(parts) == 3 and parts[2] == mod:
+            try:
+                cumulative_us = int(parts[1])
+            except ValueError:
+                pass
+    info = {}
+    for line in proc.stdout.splitlines():
+        if line.startswith("@@"):
+            info = json.loads(line[2:])
+    return {"ms": cumulative_us / 1000.0, "modules": info.get("modules", []), "maxrss_kb": info.get("maxrss_kb", 0)}
+
+
+def check(targets=None, budget_ms=None, forbid=None) -> list:
+    """Return a list of human-readable failures (empty = OK)."""
+    targets = targets or _csv("NIXE_IMPORT_BUDGET_TARGETS", DEFAULT_TARGETS)
+    forbid = forbid if forbid is not None else _csv("NIXE_IMPORT_BUDGET_FORBID", DEFAULT_FORBID)
+    if budget_ms is None:
+        budget_ms = float(os.getenv("NIXE_IMPORT_BUDGET_MS", "400") or 400)
+    failures = []
+    for mod in targets:
+        res = measure(mod)
+        heavy = sorted(set(forbid) & set(res["modules"]))
+        print(f"[import-budget] {mod}: {res['ms']:.1f}ms (budget {budget_ms:.0f}ms) "
+              f"maxrss={res['maxrss_kb'] / 1024.0:.1f}MB heavy={heavy or '-'}")
+        if res["ms"] > budget_ms:
+            failures.append(f"{mod} took {res['ms']:.1f}ms > {budget_ms:.0f}ms")
+        if heavy:
+            failures.append(f"{mod} imports heavy deps eagerly: {heavy}")
+    return failures
+
+
+if __name__ == "__main__":
+    fails = check()
+    for f in fails:
+        print("[FAIL]", f)
+    if not fails:
+        print("[OK] import budget")
+    sys.exit(1 if fails else 0)
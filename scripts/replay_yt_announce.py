@@ -0,0 +1,518 @@
+"""Offline replay harness for the YouTube live announcer.
+
+Usage:
+  python -m scripts.replay_yt_announce [--targets N] [--hours H] [--seed S] [--pad-kb KB]
+
+A local aiohttp app plays back a deterministic recording of N channels: /@handle/live
+pages (offline channel page, upcoming or live player response), watch pages, oEmbed,
+channel pages and the uploads feed (with ETag / 304). Every https://www.youtube.com URL the
+cog requests is rewritten to that app, so nothing leaves the machine.
+
+The cog's real loop body (YouTubeWuWaLiveAnnouncer.loop) runs against a fake announce
+channel on a virtual clock: each tick advances SCHED_TICK_SECONDS, so an hour of polling
+replays in seconds. The scheduler, host governor, feed tier and announce bookkeeping all
+read that clock. Reported:
+
+  - requests per target per hour (and per endpoint)
+  - bytes downloaded (response body bytes the client actually read)
+  - loop duration p50 / p95 / max over ticks that made at least one request (wall time)
+  - announces, lives missed, announce delay p95 (virtual seconds after the stream started)
+  - duplicate announces (same video id posted more than once)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import discord
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt  # noqa: E402
+from nixe.helpers import host_governor as hostgov  # noqa: E402
+
+BOT_ID = 4242
+ANNOUNCE_CHANNEL = 990001
+START_TS = 1_790_000_000.0  # fixed virtual epoch, keeps runs reproducible
+_WATCH_RE = re.compile(r"watch\?v=([A-Za-z0-9_-]{11})")
+
+
+# ---------------------------------------------------------------------------
+# virtual clock
+# ---------------------------------------------------------------------------
+class ReplayClock:
+    def __init__(self, start: float = START_TS):
+        self.t = float(start)
+
+    def time(self) -> float:
+        return self.t
+
+    monotonic = time
+
+    def advance(self, seconds: float) -> None:
+        self.t += float(seconds)
+
+    async def sleep(self, seconds: float) -> None:
+        target = self.t + max(0.0, float(seconds))
+        await asyncio.sleep(0)
+        self.t = max(self.t, target)
+
+
+class _ReplayTime:
+    """`time` module stand-in whose wall / monotonic clocks are the replay clock."""
+
+    def __init__(self, clock: ReplayClock):
+        self._clock = clock
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(time, name)
+
+    def time(self) -> float:
+        return self._clock.time()
+
+    def monotonic(self) -> float:
+        return self._clock.monotonic()
+
+
+def _replay_datetime(clock: ReplayClock):
+    class ReplayDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(clock.time(), tz)
+
+    return ReplayDatetime
+
+
+# ---------------------------------------------------------------------------
+# recording
+# ---------------------------------------------------------------------------
+@dataclass
+class Stream:
+    vid: str
+    title: str
+    start: float
+    end: float
+    scheduled_at: float  # when the upcoming stream shows up on /live (== start: never scheduled)
+    in_feed_at: Optional[float] = None  # when it reaches the uploads feed (default: scheduled_at)
+
+    def listed(self, now: float) -> bool:
+        return (self.scheduled_at if self.in_feed_at is None else self.in_feed_at) <= now
+
+
+@dataclass
+class Channel:
+    handle: str
+    channel_id: str
+    name: str
+    upload: str  # latest VOD, what an offline /live page links to
+    streams: List[Stream] = field(default_factory=list)
+
+    def stream_at(self, now: float) -> Tuple[Optional[Stream], bool]:
+        """(stream shown on /live, is live now) at virtual time `now`."""
+        for s in self.streams:
+            if s.start <= now < s.end:
+                return s, True
+        for s in self.streams:
+            if s.scheduled_at <= now < s.start:
+                return s, False
+        return None, False
+
+
+# A live started without a schedule reaches the uploads feed this long after it starts.
+UNSCHEDULED_FEED_LAG = 600.0
+
+
+def make_recording(targets: int = 20, hours: float = 1.0, seed: int = 7) -> List[Channel]:
+    """Deterministic channel set: every 4th channel goes live inside the window after a
+    schedule, every 4th (offset 2) goes live inside it unannounced (no upcoming page, in the
+    feed UNSCHEDULED_FEED_LAG late), every 10th (offset 1) is already live when the replay
+    starts, the rest stay offline."""
+    rnd = random.Random(seed)
+    span = hours * 3600.0
+    out: List[Channel] = []
+    for i in range(targets):
+        ch = Channel(handle=f"@replay{i:03d}", channel_id=f"UC{i:022d}", name=f"Replay Creator {i}",
+                     upload=f"U{i:03d}{0:07d}")
+        if i % 4 == 0:
+            start = START_TS + rnd.uniform(0.1, 0.8) * span
+            ch.streams.append(Stream(f"L{i:03d}{1:07d}", f"【Wuthering Waves】 pulls #{i}", start,
+                                     start + 2700.0, start - 7200.0))
+        elif i % 4 == 2:
+            start = START_TS + rnd.uniform(0.1, 0.8) * span
+            ch.streams.append(Stream(f"L{i:03d}{3:07d}", f"Wuthering Waves surprise stream #{i}", start,
+                                     start + 2700.0, start, start + UNSCHEDULED_FEED_LAG))
+        elif i % 10 == 1:
+            start = START_TS - 600.0
+            ch.streams.append(Stream(f"L{i:03d}{2:07d}", f"WuWa co-op night #{i}", start,
+                                     start + 5400.0, start - 7200.0))
+        out.append(ch)
+    return out
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def _player(ch: Channel, vid: str, title: str, *, live: bool, start: Optional[float]) -> Dict[str, Any]:
+    details: Dict[str, Any] = {"startTimestamp": _iso(start)} if start is not None else {}
+    details["isLiveNow"] = live
+    return {
+        "videoDetails": {"videoId": vid, "title": title, "author": ch.name, "channelId": ch.channel_id,
+                         "isLive": live, "shortDescription": "replay"},
+        "microformat": {"playerMicroformatRenderer": {"ownerChannelName": ch.name, "liveBroadcastDetails": details}},
+        "streamingData": {"adaptiveFormats": [{"itag": k, "url": "https://example.invalid/" + "x" * 200}
+                                              for k in range(40)]},
+    }
+
+
+def _compact(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)  # YouTube inlines compact JSON
+
+
+def _page(pad: str, title: str, player: Optional[Dict[str, Any]], uploads: List[str],
+          channels: Tuple[Channel, ...] = ()) -> str:
+    items: List[Dict[str, Any]] = [{"channelRenderer": {"channelId": c.channel_id, "title": {"simpleText": c.name}}}
+                                   for c in channels]
+    items += [{"videoRenderer": {"videoId": v, "title": {"runs": [{"text": "vod"}]}}} for v in uploads]
+    parts = [f"<!DOCTYPE html><html><head><title>{title} - YouTube</title>", pad]
+    if player is not None:
+        parts += ["<script>var ytInitialPlayerResponse = ", _compact(player), ";var meta = 1;</script>"]
+    parts += ["<script>var ytInitialData = ", _compact({"contents": {"items": items}}), ";</script>", pad,
+              "</head><body></body></html>"]
+    return "".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# local YouTube
+# ---------------------------------------------------------------------------
+class ReplayServer:
+    def __init__(self, channels: List[Channel], clock: ReplayClock, pad_kb: int = 256):
+        self.channels = channels
+        self.clock = clock
+        self.pad = "<div>" + ("<span>pad</span>" * max(1, pad_kb * 64)) + "</div>"
+        self.by_handle = {c.handle.lower(): c for c in channels}
+        self.by_cid = {c.channel_id: c for c in channels}
+        self.by_vid: Dict[str, Channel] = {}
+        for c in channels:
+            self.by_vid[c.upload] = c
+            for s in c.streams:
+                self.by_vid[s.vid] = c
+        self.requests: Counter = Counter()      # (endpoint, handle) -> n
+        self.endpoints: Counter = Counter()
+        self.app = web.Application()
+        self.app.router.add_get("/{tail:.*}", self.handle)
+        self.server: Optional[TestServer] = None
+
+    async def start(self) -> str:
+        self.server = TestServer(self.app)
+        await self.server.start_server()
+        return str(self.server.make_url("")).rstrip("/")
+
+    async def close(self) -> None:
+        if self.server is not None:
+            await self.server.close()
+
+    def _note(self, endpoint: str, ch: Optional[Channel]) -> None:
+        self.endpoints[endpoint] += 1
+        self.requests[(endpoint, ch.handle if ch else "")] += 1
+
+    def _channel_for_path(self, parts: List[str]) -> Optional[Channel]:
+        if parts and parts[0] == "channel" and len(parts) > 1:
+            return self.by_cid.get(parts[1])
+        return self.by_handle.get(parts[0].lower()) if parts else None
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        now = self.clock.time()
+        parts = [p for p in request.path.split("/") if p]
+        if request.path == "/watch":
+            ch = self.by_vid.get(request.query.get("v", ""))
+            self._note("watch", ch)
+            return self._watch(ch, request.query.get("v", ""), now)
+        if request.path == "/oembed":
+            target = request.query.get("url", "")
+            m = _WATCH_RE.search(target)
+            ch = self.by_vid.get(m.group(1)) if m else self._channel_for_path([p for p in urlsplit(target).path.split("/") if p])
+            self._note("oembed", ch)
+            if not m or ch is None:
+                return web.Response(status=400, text="Bad Request")
+            return web.json_response({"author_name": ch.name, "title": "video", "type": "video"})
+        if request.path == "/feeds/videos.xml":
+            ch = self.by_cid.get(request.query.get("channel_id", ""))
+            self._note("feed", ch)
+            return self._feed(ch, request, now)
+        if request.path == "/results":
+            ch = self.by_handle.get(request.query.get("search_query", "").lower())
+            self._note("search", ch)
+            return web.Response(text=_page(self.pad, "search", None, [], (ch,) if ch else ()), content_type="text/html")
+        if parts and parts[-1] == "live":
+            ch = self._channel_for_path(parts[:-1])
+            self._note("live", ch)
+            return self._live(ch, now)
+        ch = self._channel_for_path(parts)
+        self._note("channel", ch)
+        if ch is None:
+            return web.Response(status=404, text="not found")
+        return web.Response(text=_page(self.pad, ch.name, None, [ch.upload]), content_type="text/html")
+
+    def _live(self, ch: Optional[Channel], now: float) -> web.Response:
+        if ch is None:
+            return web.Response(status=404, text="not found")
+        s, live = ch.stream_at(now)
+        player = _player(ch, s.vid, s.title, live=live, start=s.start) if s else None
+        return web.Response(text=_page(self.pad, ch.name, player, [ch.upload]), content_type="text/html")
+
+    def _watch(self, ch: Optional[Channel], vid: str, now: float) -> web.Response:
+        if ch is None:
+            return web.Response(status=404, text="not found")
+        s = next((x for x in ch.streams if x.vid == vid), None)
+        if s is None:
+            player = _player(ch, vid, "Last week's VOD", live=False, start=None)
+        else:
+            player = _player(ch, vid, s.title, live=s.start <= now < s.end, start=s.start)
+        return web.Response(text=_page(self.pad, ch.name, player, [ch.upload]), content_type="text/html")
+
+    def _feed(self, ch: Optional[Channel], request: web.Request, now: float) -> web.Response:
+        if ch is None:
+            return web.Response(status=404, text="not found")
+        vids = [s.vid for s in sorted(ch.streams, key=lambda x: -x.scheduled_at) if s.listed(now)]
+        vids.append(ch.upload)
+        etag = '"%s"' % "-".join(vids)
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        entries = "".join(f"<entry><yt:videoId>{v}</yt:videoId><title>t</title></entry>" for v in vids)
+        body = f'<?xml version="1.0"?><feed xmlns:yt="http://www.youtube.com/xml/schemas/2015">{entries}</feed>'
+        return web.Response(text=body, content_type="application/atom+xml", headers={"ETag": etag})
+
+
+class _Counted:
+    """`async with session.get(...)` wrapper adding the body bytes actually received."""
+
+    def __init__(self, owner: "_ReplaySession", ctx):
+        self._owner = owner
+        self._ctx = ctx
+        self._resp: Optional[aiohttp.ClientResponse] = None
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        self._resp = await self._ctx.__aenter__()
+        return self._resp
+
+    async def __aexit__(self, *exc):
+        if self._resp is not None:
+            self._owner.received += self._resp.content.total_bytes
+        return await self._ctx.__aexit__(*exc)
+
+
+class _ReplaySession:
+    """ClientSession wrapper that points https://www.youtube.com at the replay server.
+
+    Any other URL is refused (and recorded in `external`) so a replay never touches the network.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, base: str):
+        self._session = session
+        self._base = base
+        self.received = 0
+        self.external: List[str] = []
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    def get(self, url: str, **kwargs):
+        url = str(url)
+        if url.startswith("https://www.youtube.com"):
+            url = self._base + url[len("https://www.youtube.com"):]
+        elif not url.startswith(self._base):
+            self.external.append(url)
+            raise aiohttp.ClientConnectionError(f"replay: external request refused: {url}")
+        return _Counted(self, self._session.get(url, **kwargs))
+
+    async def close(self) -> None:
+        await self._session.close()
+
+
+# ---------------------------------------------------------------------------
+# Discord side
+# ---------------------------------------------------------------------------
+class ReplayChannel(discord.TextChannel):
+    """Announce channel stand-in: records sends, serves newest-first history."""
+
+    def __init__(self, clock: ReplayClock, channel_id: int = ANNOUNCE_CHANNEL):  # noqa: super() not called
+        self.id = channel_id
+        self._clock = clock
+        self._messages: List[Any] = []
+        self.posts: List[Tuple[float, str]] = []  # (virtual ts, video id) for every send
+
+    async def send(self, content: Optional[str] = None, **kwargs):
+        msg = SimpleNamespace(id=len(self.posts) + 1, author=SimpleNamespace(id=BOT_ID), content=content or "",
+                              embeds=[kwargs["embed"]] if kwargs.get("embed") else [],
+                              created_at=datetime.fromtimestamp(self._clock.time(), timezone.utc))
+
+        async def delete():
+            if msg in self._messages:
+                self._messages.remove(msg)
+
+        msg.delete = delete
+        self._messages.insert(0, msg)
+        m = _WATCH_RE.search(msg.content)
+        self.posts.append((self._clock.time(), m.group(1) if m else ""))
+        return msg
+
+    async def history(self, limit: Optional[int] = 100, after: Any = None, oldest_first: Optional[bool] = None):
+        msgs = list(self._messages)
+        if after is not None:
+            msgs = [m for m in msgs if m.id > after.id]
+        if oldest_first:
+            msgs.reverse()
+        for msg in msgs[:limit]:
+            yield msg
+
+
+# ---------------------------------------------------------------------------
+# replay
+# ---------------------------------------------------------------------------
+def _pct(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    return s[min(len(s) - 1, int(round(q * (len(s) - 1))))]
+
+
+async def _replay(targets: int, hours: float, seed: int, pad_kb: int, state_dir: str) -> Dict[str, Any]:
+    clock = ReplayClock()
+    channels = make_recording(targets, hours, seed)
+    server = ReplayServer(channels, clock, pad_kb)
+    base = await server.start()
+
+    with open(os.path.join(state_dir, "watchlist.json"), "w", encoding="utf-8") as f:
+        json.dump({"announce_channel_id": ANNOUNCE_CHANNEL, "title_whitelist_regex": yt.DEFAULT_TITLE_REGEX,
+                   "targets": [{"query": c.handle, "handle": c.handle, "name": ""} for c in channels]}, f)
+
+    patches = {
+        (yt, "time"): _ReplayTime(clock),
+        (yt, "datetime"): _replay_datetime(clock),
+        (yt, "_HTTP_GOVERNOR"): hostgov.HostGovernor(clock=clock.monotonic, sleep=clock.sleep),
+        (yt, "STATE_PATH"): os.path.join(state_dir, "state.json"),
+        (yt, "WATCHLIST_PATH"): os.path.join(state_dir, "watchlist.json"),
+        (yt, "DISCORD_SEND_THROTTLE_SECONDS"): 0.0,
+        (yt, "ENV_REGEX_OVERRIDE"): "",
+    }
+    saved = {k: getattr(*k) for k in patches}
+    env_before = os.environ.get("NIXE_YT_WUWA_ANNOUNCE_ENABLE")
+    os.environ["NIXE_YT_WUWA_ANNOUNCE_ENABLE"] = "1"
+    for (mod, attr), val in patches.items():
+        setattr(mod, attr, val)
+
+    ch = ReplayChannel(clock)
+    bot = SimpleNamespace(user=SimpleNamespace(id=BOT_ID),
+                          get_channel=lambda cid: ch if cid == ANNOUNCE_CHANNEL else None)
+
+    async def fetch_channel(cid):
+        raise discord.NotFound(SimpleNamespace(status=404, reason="replay"), "unknown channel")
+
+    bot.fetch_channel = fetch_channel
+    durations: List[float] = []
+    ticks = 0
+    try:
+        cog = yt.YouTubeWuWaLiveAnnouncer(bot)
+        cog.scheduler.clock = clock.time
+        cog.scheduler._rng = random.Random(seed).random
+        session = cog.session = _ReplaySession(aiohttp.ClientSession(headers={"User-Agent": yt.USER_AGENT}), base)
+        cog._send_worker_task = asyncio.create_task(cog._send_worker())
+
+        end = clock.time() + hours * 3600.0
+        while clock.time() < end:
+            before = sum(server.endpoints.values())
+            t0 = time.perf_counter()
+            await cog.loop.coro(cog)
+            dt = time.perf_counter() - t0
+            if sum(server.endpoints.values()) > before:
+                durations.append(dt)
+            ticks += 1
+            clock.advance(yt.SCHED_TICK_SECONDS)
+
+        cog._send_worker_task.cancel()
+        cog._flush_state()
+        await cog.session.close()
+    finally:
+        for (mod, attr), val in saved.items():
+            setattr(mod, attr, val)
+        if env_before is None:
+            os.environ.pop("NIXE_YT_WUWA_ANNOUNCE_ENABLE", None)
+        else:
+            os.environ["NIXE_YT_WUWA_ANNOUNCE_ENABLE"] = env_before
+        await server.close()
+
+    posted = Counter(v for _, v in ch.posts if v)
+    first_post = {}
+    for ts, v in ch.posts:
+        first_post.setdefault(v, ts)
+    lives = [(c, s) for c in channels for s in c.streams if s.start < START_TS + hours * 3600.0]
+    delays = [first_post[s.vid] - max(s.start, START_TS) for _, s in lives if s.vid in first_post]
+    total = sum(server.endpoints.values())
+    return {
+        "targets": targets,
+        "hours": hours,
+        "ticks": ticks,
+        "busy_ticks": len(durations),
+        "requests": total,
+        "requests_per_target_hour": total / max(1, targets) / max(hours, 1e-9),
+        "endpoints": dict(server.endpoints),
+        "bytes": session.received,
+        "loop_p50_ms": _pct(durations, 0.50) * 1e3,
+        "loop_p95_ms": _pct(durations, 0.95) * 1e3,
+        "loop_max_ms": max(durations, default=0.0) * 1e3,
+        "lives": len(lives),
+        "announced": len(posted),
+        "missed": sum(1 for _, s in lives if s.vid not in posted),
+        "announce_delay_p95_s": _pct(delays, 0.95),
+        "duplicates": sum(n - 1 for n in posted.values()),
+        "external_requests": len(session.external),
+    }
+
+
+def run(targets: int = 20, hours: float = 1.0, seed: int = 7, pad_kb: int = 256) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as d:
+        return asyncio.run(_replay(targets, hours, seed, pad_kb, d))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--targets", type=int, default=20)
+    ap.add_argument("--hours", type=float, default=1.0)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--pad-kb", type=int, default=256, help="filler per page half, to mimic real page sizes")
+    args = ap.parse_args()
+    r = run(args.targets, args.hours, args.seed, args.pad_kb)
+    print(f"replay: {r['targets']} targets, {r['hours']:g} h, {r['ticks']} ticks ({r['busy_ticks']} with requests)")
+    print(f"requests: {r['requests']} total, {r['requests_per_target_hour']:.1f} per target per hour "
+          f"{json.dumps(r['endpoints'], sort_keys=True)}")
+    print(f"downloaded: {r['bytes'] / 1048576:.1f} MB")
+    print(f"loop: p50 {r['loop_p50_ms']:.1f} ms, p95 {r['loop_p95_ms']:.1f} ms, max {r['loop_max_ms']:.1f} ms")
+    print(f"announces: {r['announced']} of {r['lives']} lives, missed={r['missed']}, "
+          f"delay p95 {r['announce_delay_p95_s']:.0f} s, duplicates={r['duplicates']}")
+    if r["external_requests"]:
+        print(f"WARNING: {r['external_requests']} request(s) outside the replay were refused")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+import asyncio, importlib, json, os, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from discord.ext.commands.errors import NoEntryPointError
+
+from nixe import cogs_loader
+
+COGS = {
+    "a10_alpha": "import asyncio\nasync def setup(bot):\n    await asyncio.sleep(0.05)\n    bot.add('Alpha')\n",
+    "b20_loader": "async def setup(bot):\n    if not bot.get_cog('Alpha'):\n        raise RuntimeError('Alpha missing')\n    bot.add('Loader')\n",
+    "c30_beta": "async def setup(bot):\n    bot.add('Beta')\n",
+    "d40_nosetup": "X = 1\n",
+}
+
+
+class FakeBot:
+    def __init__(self):
+        self.cogs = {}
+        self.started = []
+
+    def add(self, name):
+        self.cogs[name] = object()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+    async def load_extension(self, name):
+        self.started.append(name.rsplit(".", 1)[-1])
+        mod = importlib.import_module(name)
+        if not hasattr(mod, "setup"):
+            raise NoEntryPointError(name)
+        await mod.setup(self)
+
+
+def _load(pkg):
+    for m in [m for m in sys.modules if m == pkg or m.startswith(pkg + ".")]:
+        del sys.modules[m]
+    bot = FakeBot()
+    loaded = asyncio.run(cogs_loader.autoload_all(bot, pkg))
+    return bot, loaded, cogs_loader.get_load_report()
+
+
+def test_barrier_cogs_wait_for_earlier_cogs_and_plan_is_cached(tmp_path, monkeypatch):
+    pkg = "fake_cogs_plan"
+    (tmp_path / pkg).mkdir()
+    (tmp_path / pkg / "__init__.py").write_text("")
+    for name, src in COGS.items():
+        (tmp_path / pkg / f"{name}.py").write_text(src)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    plan_path = tmp_path / "plan.json"
+    monkeypatch.setenv("NIXE_COGS_PLAN_PATH", str(plan_path))
+    monkeypatch.setenv("NIXE_REQUIRED_COGS", f"{pkg}.a10_alpha")
+    monkeypatch.setenv("NIXE_COGS_PREWARM", "0")
+
+    bot, loaded, report = _load(pkg)
+    assert loaded == [f"{pkg}.a10_alpha", f"{pkg}.b20_loader", f"{pkg}.c30_beta"]
+    assert set(bot.cogs) == {"Alpha", "Loader", "Beta"}
+    # c30 did not start before the barrier ran
+    assert bot.started.index("c30_beta") > bot.started.index("b20_loader")
+    assert report["barriers"] == [f"{pkg}.b20_loader"] and report["plan_cached"] is False
+    assert {c["name"] for c in report["cogs"]} == {f"{pkg}.{n}" for n in COGS}
+
+    plan = json.loads(plan_path.read_text())
+    assert plan["version"] == cogs_loader.PLAN_VERSION
+    assert plan["deps"][f"{pkg}.b20_loader"][1] == 1 and plan["deps"][f"{pkg}.c30_beta"][1] == 0
+    assert f"{pkg}.d40_nosetup" in plan["disabled"]
+
+    bot, loaded, report = _load(pkg)
+    assert report["plan_cached"] is True and report["barriers"] == [f"{pkg}.b20_loader"]
+    assert "d40_nosetup" not in bot.started and len(loaded) == 3
@@ -0,0 +1,282 @@
+
+import asyncio, gzip, hashlib, json, os, sqlite3, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nixe.storage import gdrive
+from nixe.translate import local_dict_store as ld
+
+ID_PART0 = [
+    {"word": "kucing", "translations": [{"lang_code": "ja", "word": "猫"}]},
+    {"word": "terima kasih", "translations": [{"lang_code": "ja", "word": "ありがとう"}]},
+    {"word": "terima", "senses": [{"glosses": ["receive"]}]},
+]
+ID_PART1 = [
+    {"word": "kucing", "translations": [{"lang_code": "ja", "word": "ネコ"}]},  # duplicate: first wins
+    {"word": "anjing", "translations": [{"code": "ja", "word": "犬"}]},
+]
+EN_MONO = [{"word": "cat", "translations": [{"lang_code": "ja", "word": "猫"}]}]
+
+
+def _jsonl(rows):
+    return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows).encode("utf-8")
+
+
+@pytest.fixture
+def dict_dir(tmp_path, monkeypatch):
+    split = tmp_path / "ID"
+    split.mkdir()
+    (split / "part-000.jsonl").write_bytes(_jsonl(ID_PART0))
+    (split / "part-001.jsonl.gz").write_bytes(gzip.compress(_jsonl(ID_PART1)))
+    (split / "manifest.json").write_text(json.dumps({"output_files": [
+        {"file": "part-000.jsonl"}, {"file": "part-001.jsonl.gz"}]}), encoding="utf-8")
+    (tmp_path / "raw-wiktextract-data.jsonl.gz").write_bytes(gzip.compress(_jsonl(EN_MONO)))
+
+    monkeypatch.setenv("DICT_ENABLE", "1")
+    monkeypatch.setenv("DICT_DIR", str(tmp_path))
+    monkeypatch.delenv("DICT_OFFSET_INDEX_MONO", raising=False)
+    monkeypatch.delenv("DICT_SEEKABLE_DIR", raising=False)
+    # Builds run inline (drained below) instead of on the daemon thread.
+    monkeypatch.setattr(ld, "_start_build_worker", lambda: None)
+    for name in list(ld._BUILD_QUEUED):
+        ld._BUILD_QUEUED.discard(name)
+    ld._BUILD_FAILED.clear()
+    return tmp_path
+
+
+def _drain_builds():
+    while not ld._BUILD_QUEUE.empty():
+        store, name, sources, sig = ld._BUILD_QUEUE.get_nowait()
+        try:
+            store._run_build_job(name, sources, sig)
+        finally:
+            ld._BUILD_QUEUED.discard(name)
+
+
+def _built_store():
+    store = ld.LocalDictStore()
+    store.schedule_index_builds()
+    _drain_builds()
+    return store
+
+
+def test_build_then_lookup(dict_dir):
+    store = _built_store()
+    hits = store.lookup_terms_sync(["kucing", "anjing", "terima", "tidakada"], "ja")
+    assert hits == {"kucing": "猫", "anjing": "犬", "terima": "receive"}
+
+    db_path = store._offset_index_path("split_ID")
+    meta = store._offset_index_meta(db_path)
+    assert meta["words"] == "4"  # 5 rows, "kucing" counted once
+
+    # the monolithic dump is not indexed unless opted in: no uncompressed copy on disk,
+    # lookups scan it and remember the hit
+    assert not any(p.name.startswith("mono_") for p in (dict_dir / ".seek").iterdir())
+    assert store.lookup_terms_sync(["cat"], "ja", source_code="en") == {"cat": "猫"}
+    assert not list(dict_dir.glob(".offidx_mono_*"))
+    con = sqlite3.connect(str(store._cache_db_path("en", "raw-wiktextract-data.jsonl.gz")))
+    assert con.execute("SELECT payload FROM cache WHERE word='cat'").fetchone() == ("猫",)
+    con.close()
+
+
+def test_mono_index_opt_in(dict_dir, monkeypatch):
+    monkeypatch.setenv("DICT_OFFSET_INDEX_MONO", "1")
+    store = _built_store()
+    assert list(dict_dir.glob(".offidx_mono_en_*.sqlite3"))
+    assert store.lookup_terms_sync(["cat", "dog"], "ja", source_code="en") == {"cat": "猫"}
+
+
+def test_bloom_negative_skips_the_index(dict_dir, monkeypatch):
+    _built_store()
+    store = ld.LocalDictStore()  # fresh process: index + filter loaded from disk, nothing rebuilt
+    db_path = store._split_offset_index("id")
+    assert db_path is not None and store._blooms.get(str(db_path)) is not None
+    monkeypatch.setattr(store, "_build_offset_index", lambda *a: pytest.fail("index rebuilt"))
+    _drain_builds()  # only the phrase trie is (re)built for the current index
+    assert store.phrase_trie("id") is not None
+    bloom = store._blooms[str(db_path)]
+    assert bloom.sig == store._file_sig(dict_dir / "ID" / "manifest.json")
+    assert all(w in bloom for w in ("kucing", "anjing", "terima kasih"))
+
+    probes = []
+    real_conn = store._conn
+    monkeypatch.setattr(store, "_conn", lambda p: probes.append(p) or real_conn(p))
+    assert "xyzzy-nope" not in bloom
+    assert store._offset_get_many(db_path, ["xyzzy-nope"]) == {}
+    assert probes == []  # definite miss: no index query
+    assert store._offset_get_many(db_path, ["anjing"])["anjing"]["word"] == "anjing"
+    assert probes == [db_path]
+
+
+def test_batched_lookup_one_query_pooled_connection(dict_dir):
+    store = _built_store()
+    db_path = store._split_offset_index("id")
+    con = store._conn(db_path)
+    stmts = []
+    con.set_trace_callback(stmts.append)
+    words = ["kucing", "anjing", "terima", "terima kasih"]
+    for _ in range(2):
+        hits = store.lookup_terms_sync(words, "ja")
+    assert hits == {"kucing": "猫", "anjing": "犬", "terima": "receive", "terima kasih": "ありがとう"}
+    assert [s for s in stmts if s.startswith("SELECT")] == [stmts[0]] * 2  # one IN query per call
+    assert store._conn(db_path) is con and len(store._conns) == 1
+
+
+def test_interrupted_build_resumes_finished_parts(dict_dir, monkeypatch):
+    store = ld.LocalDictStore()
+    real = store._index_data_file
+    seen = []
+
+    def flaky(con, src, data_path):
+        seen.append(src.name)
+        if src.name.endswith(".gz") and len(seen) == 2:
+            raise OSError("killed mid-build")
+        return real(con, src, data_path)
+
+    monkeypatch.setattr(store, "_index_data_file", flaky)
+    store.schedule_index_builds()
+    _drain_builds()
+    assert ld._BUILD_PROGRESS["split_ID"]["state"] == "failed"
+    db_path = store._offset_index_path("split_ID")
+    assert not db_path.exists() and store._build_manifest_path(db_path).exists()
+
+    # a touched (same content) part still counts as done: the manifest keys on a checksum
+    part0 = dict_dir / "ID" / "part-000.jsonl"
+    os.utime(part0, (1, 1))
+    seen.clear()
+    ld._BUILD_FAILED.clear()
+    store.schedule_index_builds()
+    _drain_builds()
+    assert seen == ["part-001.jsonl.gz"]
+    assert ld._BUILD_PROGRESS["split_ID"]["resumed_parts"] == 1
+    assert store.lookup_terms_sync(["kucing", "anjing"], "ja") == {"kucing": "猫", "anjing": "犬"}
+    assert store._offset_index_meta(db_path)["words"] == "4"
+
+
+def test_phrase_trie_built_in_background(dict_dir, monkeypatch):
+    _built_store()
+    store = ld.LocalDictStore()
+    store._split_offset_index("id")
+    real_conn = store._conn
+    monkeypatch.setattr(store, "_conn", lambda p: pytest.fail("phrase scan on the request path"))
+    assert store.phrase_trie("id") is None  # token-only until the builder has the trie
+    monkeypatch.setattr(store, "_conn", real_conn)
+    _drain_builds()
+    assert store.phrase_trie("id").size == 1
+
+
+def test_phrase_trie_longest_match(dict_dir):
+    store = _built_store()
+    trie = store.phrase_trie("id")
+    assert trie is not None and trie.size == 1
+    assert trie.matches(["terima", "kasih", "kucing"], 0) == [(2, "terima kasih")]
+    assert trie.matches(["terima", "kucing"], 0) == []
+
+    out, pairs = ld._SentenceAssembler(store).translate_id_to_ja("Terima kasih kucing")
+    assert out == "ありがとう猫"
+    assert pairs == [("Terima kasih", "ありがとう"), ("kucing", "猫")]
+
+
+class _Drive:
+    """Drive v3 stand-in: root/ID/{part-000.jsonl, part-001.jsonl, manifest.json}."""
+
+    def __init__(self):
+        self.files = {
+            "p0": ("part-000.jsonl", _jsonl(ID_PART0)),
+            "p1": ("part-001.jsonl", _jsonl(ID_PART1)),
+            "man": ("manifest.json", json.dumps({"output_files": [
+                {"file": "part-000.jsonl"}, {"file": "part-001.jsonl"}]}).encode("utf-8")),
+        }
+        self.modified = "2026-10-01T00:00:00Z"
+        self.drop_p1 = True
+        self.log = []
+
+    def meta(self, fid):
+        name, data = self.files[fid]
+        return {"id": fid, "name": name, "mimeType": "application/octet-stream", "size": str(len(data)),
+                "md5Checksum": hashlib.md5(data).hexdigest(), "modifiedTime": self.modified}
+
+    def app(self):
+        async def list_files(request):
+            q = request.query.get("q", "")
+            if "name='ID'" in q:
+                return web.json_response({"files": [{"id": "idf", "name": "ID"}]})
+            if "name='manifest.json'" in q:
+                return web.json_response({"files": [{"id": "man", "name": "manifest.json"}]})
+            if "'idf' in parents" in q:
+                return web.json_response({"files": [self.meta(f) for f in self.files]})
+            return web.json_response({"files": []})
+
+        async def get_file(request):
+            fid = request.match_info["fid"]
+            if request.query.get("alt") != "media":
+                return web.json_response(self.meta(fid))
+            data = self.files[fid][1]
+            rng = request.headers.get("Range", "")
+            self.log.append((fid, rng))
+            if fid == "p1" and self.drop_p1:
+                self.drop_p1 = False  # the bot is killed mid-download once
+                resp = web.StreamResponse(headers={"Content-Length": str(len(data))})
+                await resp.prepare(request)
+                await resp.write(data[:40])
+                request.transport.close()
+                return resp
+            if rng.startswith("bytes="):
+                return web.Response(status=206, body=data[int(rng[6:].split("-")[0]):])
+            return web.Response(body=data)
+
+        app = web.Application()
+        app.router.add_get("/files", list_files)
+        app.router.add_get("/files/{fid}", get_file)
+        return app
+
+
+def test_bootstrap_resumes_interrupted_split_download_with_refresh(tmp_path, monkeypatch):
+    for k, v in {"DICT_ENABLE": "1", "DICT_DIR": str(tmp_path), "DICT_GDRIVE_ENABLE": "1",
+                 "DICT_GDRIVE_FOLDER_ID": "root", "DICT_GDRIVE_LANGS": "id", "DICT_GDRIVE_SPLIT_ONLY": "1",
+                 "DICT_GDRIVE_REFRESH": "1", "GDRIVE_ACCESS_TOKEN": "test", "GDRIVE_DOWNLOAD_RETRIES": "1"}.items():
+        monkeypatch.setenv(k, v)
+    monkeypatch.setattr(ld, "_start_build_worker", lambda: None)
+    drive = _Drive()
+    split = tmp_path / "ID"
+    split.mkdir()
+    (split / "part-999.jsonl").write_text("stale\n", encoding="utf-8")  # gone from Drive
+
+    async def boot():
+        await ld.LocalDictStore().bootstrap()
+
+    async def run():
+        server = TestServer(drive.app())
+        await server.start_server()
+        monkeypatch.setattr(gdrive, "_API_BASE", str(server.make_url("")).rstrip("/"))
+        try:
+            await boot()  # p1 drops: no manifest, nothing wiped
+            assert (split / "part-000.jsonl").exists() and (split / "part-001.jsonl.part").exists()
+            assert not (split / "manifest.json").exists()
+            drive.log.clear()
+            await boot()  # next boot resumes p1 instead of starting over
+            assert drive.log == [("p1", "bytes=40-"), ("man", "")]
+            assert (split / "manifest.json").exists() and not (split / "part-999.jsonl").exists()
+
+            drive.log.clear()
+            await boot()  # remote unchanged: marker matches, nothing fetched
+            assert drive.log == []
+
+            drive.files["p0"] = ("part-000.jsonl", _jsonl(ID_PART0[:2]))
+            drive.modified = "2026-10-02T00:00:00Z"
+            await boot()  # remote changed: only the changed part (and manifest) is fetched
+            assert drive.log == [("p0", ""), ("man", "")]
+        finally:
+            await server.close()
+
+    asyncio.run(run())
+    assert (split / "part-000.jsonl").read_bytes() == _jsonl(ID_PART0[:2])
+    assert (split / "part-001.jsonl").read_bytes() == _jsonl(ID_PART1)
+    assert sorted(p.name for p in split.iterdir()) == [".remote_manifest_meta.txt", "manifest.json",
+                                                       "part-000.jsonl", "part-001.jsonl"]
@@ -0,0 +1,88 @@
+
+import asyncio, hashlib, os, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nixe.storage import gdrive
+
+FOLDER = "root"
+FILES = {
+    "p0": ("parts/p0.jsonl", os.urandom(300_000)),
+    "p1": ("parts/p1.jsonl", os.urandom(200_000)),
+    "man": ("manifest.json", b'{"output_files": []}'),
+}
+
+
+def _meta(fid):
+    name, data = FILES[fid]
+    return {"id": fid, "name": os.path.basename(name), "mimeType": "application/octet-stream",
+            "size": str(len(data)), "md5Checksum": hashlib.md5(data).hexdigest()}
+
+
+def _app(log):
+    async def list_files(request):
+        q = request.query.get("q", "")
+        if f"'{FOLDER}' in parents" in q:
+            files = [{"id": "parts", "name": "parts", "mimeType": gdrive._FOLDER_MIME}, _meta("man")]
+        else:
+            files = [_meta("p0"), _meta("p1")]
+        return web.json_response({"files": files})
+
+    async def get_file(request):
+        fid = request.match_info["fid"]
+        if request.query.get("alt") != "media":
+            return web.json_response(_meta(fid))
+        data = FILES[fid][1]
+        rng = request.headers.get("Range", "")
+        log.append((fid, rng))
+        if fid == "p1" and sum(1 for f, _ in log if f == "p1") == 1:
+            # first p1 request drops mid-body
+            resp = web.StreamResponse(headers={"Content-Length": str(len(data))})
+            await resp.prepare(request)
+            await resp.write(data[:50_000])
+            request.transport.close()
+            return resp
+        if rng.startswith("bytes="):
+            start = int(rng[6:].split("-")[0])
+            return web.Response(status=206, body=data[start:])
+        return web.Response(body=data)
+
+    app = web.Application()
+    app.router.add_get("/files", list_files)
+    app.router.add_get("/files/{fid}", get_file)
+    return app
+
+
+def test_folder_download_resumes_and_verifies(tmp_path, monkeypatch):
+    monkeypatch.setenv("GDRIVE_ACCESS_TOKEN", "test")
+    log = []
+    out = tmp_path / "ID"
+    # leftover from an interrupted run
+    (out / "parts").mkdir(parents=True)
+    (out / "parts" / "p0.jsonl.part").write_bytes(FILES["p0"][1][:100_000])
+
+    async def run():
+        server = TestServer(_app(log))
+        await server.start_server()
+        monkeypatch.setattr(gdrive, "_API_BASE", str(server.make_url("")).rstrip("/"))
+        try:
+            await gdrive.download_folder_recursive(FOLDER, str(out))
+            first = list(log)
+            await gdrive.download_folder_recursive(FOLDER, str(out))
+            return first
+        finally:
+            await server.close()
+
+    first = asyncio.run(run())
+    for fid, (name, data) in FILES.items():
+        assert (out / name).read_bytes() == data
+        assert not (out / (name + ".part")).exists()
+    assert ("p0", "bytes=100000-") in first
+    assert ("p1", "bytes=50000-") in first
+    # second run: everything verified on disk, nothing fetched
+    assert log == first
@@ -0,0 +1,125 @@
+import asyncio, os, struct, sys
+from types import SimpleNamespace
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+
+from nixe.helpers import guard_snapshot as gs
+from nixe.helpers import lpg_cache_memory as cache
+from nixe.helpers import lpg_denylist
+
+SHA_A, SHA_B, SHA_C = "a" * 40, "b" * 40, "c" * 40
+
+
+@pytest.fixture(autouse=True)
+def _clean(monkeypatch):
+    def reset():
+        cache._CACHE.clear()
+        cache._INDEX_AHASH.clear()
+        cache._MSGID_TO_FP.clear()
+        cache._MSGID_TO_SHA1.clear()
+        lpg_denylist.clear()
+        gs._U64_PROVIDERS.clear()
+        gs._PENDING_U64.clear()
+        gs._META.clear()
+        gs._RESTORED_LPG_SHA1.clear()
+
+    monkeypatch.setenv("NIXE_GUARD_SNAPSHOT_ENABLE", "1")
+    reset()
+    yield
+    reset()
+
+
+def _populate():
+    cache.upsert_entry({"sha1": SHA_A, "ahash": "0123456789abcdef", "ok": True, "score": 0.9, "via": "gemini",
+                        "reason": "lucky", "w": 640, "h": 480, "ts": 1000.5})
+    cache.register_msgid_fp(555, SHA_A, "0123456789abcdef")
+    lpg_denylist.add(SHA_B, "fedcba9876543210")
+    gs.set_meta("lpg", thread_id=42)
+
+
+def test_round_trip_restores_every_section(tmp_path):
+    phash = {1, 2, 2 ** 63 + 5}
+    gs.register_u64_set("PHSH", lambda: phash, lambda vals: None)
+    _populate()
+    path = str(tmp_path / "guard.snap")
+    assert gs.save_now(path) > 0
+
+    gs._U64_PROVIDERS.clear()
+    cache._CACHE.clear(); cache._INDEX_AHASH.clear(); cache._MSGID_TO_FP.clear()
+    lpg_denylist.clear(); gs._META.clear()
+
+    counts = gs.load(path)
+    assert counts["lpg_cache"] == 1 and counts["lpg_msgid"] == 1 and counts["denylist"] == 2
+    ent = next(cache.iter_entries())
+    assert ent["sha1"] == SHA_A and ent["ahash"] == "0123456789abcdef" and ent["ok"] is True
+    assert (ent["via"], ent["reason"], ent["w"], ent["h"], ent["ts"]) == ("gemini", "lucky", 640, 480, 1000.5)
+    assert dict(cache.iter_msgid_fp())[555][0] == SHA_A
+    assert lpg_denylist.is_denied_sha1(SHA_B) and lpg_denylist.is_denied_ahash("fedcba9876543210")
+    assert gs.get_meta("lpg") == {"thread_id": 42}
+    assert gs.restored_lpg_sha1() == {SHA_A}
+
+    # a u64 section loaded before its cog registers is applied on registration
+    got = []
+    gs.register_u64_set("PHSH", lambda: set(), got.append)
+    assert got == [phash]
+
+
+def test_corrupt_section_is_skipped_and_other_version_ignored(tmp_path):
+    _populate()
+    data = bytearray(gs.encode_snapshot())
+    # flip one payload byte of the DNYS section; its crc no longer matches
+    _magic, _ver, n, _ts = gs._HEADER.unpack_from(data, 0)
+    for i in range(n):
+        tag, off, length, _count, _crc = gs._ENTRY.unpack_from(data, gs._HEADER.size + i * gs._ENTRY.size)
+        if tag == b"DNYS":
+            data[off] ^= 0xFF
+    path = tmp_path / "guard.snap"
+    path.write_bytes(bytes(data))
+    lpg_denylist.clear(); cache._CACHE.clear()
+    counts = gs.load(str(path))
+    assert "lpg_cache" in counts and not lpg_denylist.is_denied_sha1(SHA_B)
+
+    struct.pack_into("<I", data, 8, gs.SNAPSHOT_VERSION + 1)
+    path.write_bytes(bytes(data))
+    assert gs.load(str(path)) == {}
+
+
+class _Thread:
+    id = 7
+
+    def __init__(self, contents):
+        self.contents = contents
+
+    async def history(self, limit=100, oldest_first=False):
+        for c in self.contents[:limit]:
+            yield SimpleNamespace(content=c)
+
+
+def test_complete_thread_scan_drops_restored_denylist_entries(tmp_path):
+    from nixe.cogs.a17_1_lpg_denylist_thread_manager_overlay import LPGDenylistThreadManager
+
+    lpg_denylist.add(SHA_A, "1111111111111111")
+    lpg_denylist.add(SHA_B, "2222222222222222")
+    path = str(tmp_path / "guard.snap")
+    gs.save_now(path)
+    lpg_denylist.clear()
+    gs.load(path)
+    lpg_denylist.add(SHA_C, "3333333333333333")  # denied live before the scan finished
+
+    mgr = LPGDenylistThreadManager(SimpleNamespace())
+    # SHA_B was deleted from the thread while the bot was offline
+    mgr._thread = _Thread([f"deny sha1={SHA_A} ahash=1111111111111111 src=unlearn", "chatter"])
+    asyncio.run(mgr._load_from_thread())
+    assert lpg_denylist.is_denied_sha1(SHA_A) and lpg_denylist.is_denied_sha1(SHA_C)
+    assert not lpg_denylist.is_denied_sha1(SHA_B) and not lpg_denylist.is_denied_ahash("2222222222222222")
+
+    # a scan cut off by the limit cannot prove a delete: restored entries stay
+    lpg_denylist.clear()
+    gs.load(path)
+    mgr.scan_limit = 1
+    asyncio.run(mgr._load_from_thread())
+    assert lpg_denylist.is_denied_sha1(SHA_B)
@@ -0,0 +1,30 @@
+
+import os, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from scripts.check_import_budget import check
+
+
+def test_cogs_loader_within_import_budget():
+    budget = float(os.getenv("NIXE_IMPORT_BUDGET_MS", "400") or 400)
+    fails = check(targets=["nixe.cogs_loader"], budget_ms=budget)
+    assert not fails, fails
+
+
+def test_lazy_helpers_do_not_import_heavy_deps():
+    fails = check(
+        targets=["nixe.helpers.hash_utils", "nixe.helpers.gemini_bridge", "nixe.helpers.img_hashing"],
+        budget_ms=float("inf"),
+    )
+    assert not fails, fails
+
+
+def test_lazy_module_resolves_on_first_use():
+    from nixe.helpers.lazy_import import lazy_module, is_loaded
+    mod = lazy_module("colorsys")
+    assert mod is lazy_module("colorsys")
+    assert mod.rgb_to_hsv(1.0, 0.0, 0.0)[0] == 0.0
+    assert is_loaded("colorsys")
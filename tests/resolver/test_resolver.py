@@ -0,0 +1,122 @@
+
+import asyncio, os, sys
+from types import SimpleNamespace
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import discord
+import pytest
+
+from nixe.helpers import resolver
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def monotonic(self):
+        return self.t
+
+
+class _Client:
+    """Empty gateway cache; fetch_channel counts calls and answers from `answers`."""
+
+    def __init__(self, answers, delay=0.0):
+        self.answers, self.delay, self.calls = answers, delay, 0
+
+    def get_channel(self, cid):
+        return None
+
+    async def fetch_channel(self, cid):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        ans = self.answers[cid]
+        if isinstance(ans, BaseException):
+            raise ans
+        return ans
+
+
+@pytest.fixture(autouse=True)
+def _clean(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(resolver, "time", clock)
+    monkeypatch.setenv("NIXE_RESOLVER_TTL_SEC", "300")
+    monkeypatch.setenv("NIXE_RESOLVER_NEG_TTL_SEC", "600")
+    resolver.clear()
+    resolver._INFLIGHT.clear()
+    yield clock
+    resolver.clear()
+
+
+def test_positive_ttl(_clean):
+    ch = SimpleNamespace(id=5)
+    client = _Client({5: ch})
+
+    async def go():
+        assert await resolver.resolve_channel(client, 5) is ch
+        assert await resolver.resolve_channel(client, 5) is ch
+        assert client.calls == 1
+        _clean.t += 301
+        assert await resolver.resolve_channel(client, 5) is ch
+        assert client.calls == 2
+
+    asyncio.run(go())
+
+
+def test_negative_cache_and_transient_errors(_clean):
+    nf = discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Channel")
+    client = _Client({7: nf, 8: RuntimeError("502")})
+
+    async def go():
+        assert await resolver.resolve_channel(client, 7) is None
+        assert await resolver.resolve_channel(client, 7) is None
+        assert client.calls == 1  # NotFound is remembered
+        _clean.t += 601
+        assert await resolver.resolve_channel(client, 7) is None
+        assert client.calls == 2
+
+        assert await resolver.resolve_channel(client, 8) is None
+        assert await resolver.resolve_channel(client, 8) is None
+        assert client.calls == 4  # transient failures are not cached
+
+    asyncio.run(go())
+
+
+def test_single_flight_shares_one_fetch():
+    ch = SimpleNamespace(id=9)
+    client = _Client({9: ch}, delay=0.05)
+
+    async def go():
+        got = await asyncio.gather(*(resolver.resolve_channel(client, 9) for _ in range(10)))
+        assert all(g is ch for g in got) and client.calls == 1
+
+    asyncio.run(go())
+
+
+def test_cancelled_leader_hands_fetch_to_waiter():
+    ch = SimpleNamespace(id=11)
+    client = _Client({11: ch}, delay=0.05)
+
+    async def go():
+        leader = asyncio.ensure_future(resolver.resolve_channel(client, 11))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(resolver.resolve_channel(client, 11))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await waiter is ch  # not None: the waiter fetched again
+        assert client.calls == 2 and not resolver._INFLIGHT
+
+    asyncio.run(go())
+
+
+def test_lru_cap_evicts_least_recently_used():
+    cache = resolver._TTLCache(16)
+    for i in range(16):
+        cache.put(i, i, 60, 0.0)
+    assert cache.get(0, 1.0) == 0  # touched: now the most recent
+    for i in range(16, 20):
+        cache.put(i, i, 60, 0.0)
+    assert len(cache) == 16
+    assert cache.get(0, 1.0) == 0 and cache.get(1, 1.0) is resolver._MISSING and cache.get(19, 1.0) == 19
@@ -0,0 +1,118 @@
+
+import asyncio, os, sys, time
+from types import SimpleNamespace
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nixe.helpers import guard_snapshot as gs
+from nixe.helpers import thread_crawler as tc
+
+
+class _Thread:
+    """history() with discord.py semantics over message ids 1..n; optionally fails after `fail_after` yields."""
+
+    def __init__(self, n, fail_after=None):
+        self.id = 77
+        self.msgs = [SimpleNamespace(id=i, attachments=[], embeds=[]) for i in range(1, n + 1)]
+        self.fail_after = fail_after
+
+    async def history(self, limit=None, after=None, oldest_first=None):
+        floor = int(getattr(after, "id", 0) or 0)
+        msgs = [m for m in self.msgs if m.id > floor]
+        msgs = msgs if oldest_first else msgs[::-1]
+        for i, m in enumerate(msgs[:limit] if limit else msgs):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise RuntimeError("history broke")
+            yield m
+
+
+def _store(tmp_path):
+    return tc.CheckpointStore(str(tmp_path / "ck.json"))
+
+
+def test_incremental_resume_and_deferred_commit(tmp_path):
+    store, th, seen = _store(tmp_path), _Thread(60), []
+
+    async def on_msg(m):
+        seen.append(m.id)
+
+    st = asyncio.run(tc.crawl(th, "k", on_message=on_msg, store=store, batch_size=10, commit=False))
+    assert seen == list(range(1, 61)) and st["last_message_id"] == 60 and st["complete"]
+    assert store.get("k") == {}  # the caller's write has not happened yet
+
+    tc.commit_checkpoint("k", th, st, store=store)
+    assert store.get("k")["last_message_id"] == 60
+
+    th.msgs += [SimpleNamespace(id=i, attachments=[], embeds=[]) for i in (61, 62)]
+    seen.clear()
+    st = asyncio.run(tc.crawl(th, "k", on_message=on_msg, store=store))
+    assert seen == [61, 62] and st["resumed_from"] == 60 and store.get("k")["last_message_id"] == 62
+
+
+def test_failing_handler_runs_each_message_once(tmp_path):
+    store, th, calls = _store(tmp_path), _Thread(30), []
+
+    async def on_msg(m):
+        calls.append(m.id)
+        if m.id == 15:
+            raise RuntimeError("consumer failed")
+
+    st = asyncio.run(tc.crawl(th, "k", on_message=on_msg, store=store, batch_size=10))
+    assert calls == list(range(1, 16))  # no second pass over the failed batch
+    assert st["error"] and st["last_message_id"] == 14 and store.get("k")["last_message_id"] == 14
+
+    calls.clear()
+    asyncio.run(tc.crawl(th, "k", on_message=lambda m: _note(calls, m), store=store, batch_size=10))
+    assert calls == list(range(15, 31))
+
+
+async def _note(calls, m):
+    calls.append(m.id)
+
+
+def test_history_error_keeps_fetched_messages(tmp_path):
+    store, th, calls = _store(tmp_path), _Thread(30, fail_after=13), []
+    st = asyncio.run(tc.crawl(th, "k", on_message=lambda m: _note(calls, m), store=store, batch_size=10))
+    assert calls == list(range(1, 14)) and st["last_message_id"] == 13 and not st["complete"]
+
+
+def test_limited_newest_first_never_skips_a_gap(tmp_path):
+    store, th, calls = _store(tmp_path), _Thread(50), []
+    store.set("k", thread_id=th.id, last_message_id=20)
+
+    st = asyncio.run(tc.crawl(th, "k", on_message=lambda m: _note(calls, m), store=store,
+                              limit=10, newest_first=True, batch_size=4))
+    assert calls == list(range(41, 51))  # newest 10, handled oldest-first
+    assert st["last_message_id"] == 20 and store.get("k")["last_message_id"] == 20  # 21..40 still pending
+
+    calls.clear()
+    st = asyncio.run(tc.crawl(th, "k", on_message=lambda m: _note(calls, m), store=store,
+                              limit=40, newest_first=True))
+    assert calls == list(range(21, 51)) and st["complete"] and store.get("k")["last_message_id"] == 50
+
+
+def test_lpgmem_warm_boot_forces_periodic_full_scan(monkeypatch):
+    from nixe.cogs import a17_lpg_cache_persistence_overlay as a17
+    from nixe.helpers import lpg_cache_memory as cache
+
+    monkeypatch.setattr(cache, "_MAX", cache._MAX)  # the cog configures the cache size
+    monkeypatch.setenv("LPG_CACHE_FULL_SCAN_EVERY_BOOTS", "3")
+    monkeypatch.setenv("LPG_CACHE_FULL_SCAN_EVERY_HOURS", "24")
+    gs._META.clear()
+    gs._RESTORED_LPG_SHA1.clear()
+    gs._RESTORED_LPG_SHA1.add("a" * 40)
+    try:
+        cog = a17.LPGCachePersistence(SimpleNamespace())
+        cog.thread = _Thread(5)
+        gs.set_meta("lpgmem", thread_id=cog.thread.id, last_message_id=5, full_scan_at=time.time(), warm_boots=0)
+
+        results = [asyncio.run(cog._bootstrap_incremental()) for _ in range(4)]
+        assert results == [True, True, True, False]  # 4th warm boot reconciles with a full scan
+
+        gs.set_meta("lpgmem", warm_boots=0, full_scan_at=time.time() - 25 * 3600)
+        assert asyncio.run(cog._bootstrap_incremental()) is False
+    finally:
+        gs._META.clear()
+        gs._RESTORED_LPG_SHA1.clear()
@@ -0,0 +1,55 @@
+
+import os, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nixe.translate import detect_lang, is_target_language
+from scripts.bench_langid import run
+
+
+def test_langid_accuracy_and_speed():
+    res = run(loops=5)
+    assert res["accuracy"] >= 0.95, res["wrong"]
+    budget_us = float(os.getenv("NIXE_LANGID_BUDGET_US", "2000") or 2000)
+    assert res["us_per_call"] < budget_us, res["us_per_call"]
+
+
+def test_already_target_language():
+    assert is_target_language("Jangan lupa ambil hadiah event sebelum berakhir ya", "id")
+    assert is_target_language("Don't forget to claim the event rewards before it ends", "English")
+    assert not is_target_language("Don't forget to claim the event rewards before it ends", "id")
+    assert not is_target_language("ok", "en")  # too short to trust
+
+
+UNMODELED = [
+    ("es", "¿Alguien puede ayudarme con esta misión? Llevo una hora atascado."),
+    ("es", "Hola a todos, ¿cuándo termina el evento de esta semana?"),
+    ("fr", "Honnêtement, l'histoire de ce chapitre était bien meilleure que prévu."),
+    ("fr", "Je ne comprends pas pourquoi le jeu plante après la mise à jour."),
+    ("de", "Kann mir jemand bei dieser Quest helfen? Ich hänge seit einer Stunde fest."),
+    ("de", "Wir brauchen noch einen Spieler für den Bosskampf, wer hat Zeit?"),
+    ("de", "Was ist los mit dem Spiel"),
+    ("de", "Ich bin so müde heute"),
+    ("de", "Das ist nicht was ich meinte"),
+    ("de", "Wann ist das Event zu Ende?"),
+    ("de", "Weiß jemand ob der Server down ist?"),
+    ("nl", "Ik weet niet wat er met dit spel aan de hand is"),
+    ("nl", "Wie kan me helpen met deze missie?"),
+    ("nl", "Het spel is echt leuk"),
+    ("it", "Onestamente la storia di questo capitolo era molto meglio del previsto."),
+    ("it", "Ciao ragazzi, qualcuno sa quando finisce l'evento?"),
+    ("pt", "Alguém pode me ajudar com essa missão? Estou travado há uma hora."),
+    ("pt", "Obrigado pela ajuda, vocês são demais!"),
+]
+
+
+def test_unmodeled_languages_are_unknown_and_never_skipped():
+    from nixe.cogs.c20_translate_commands import _langid
+
+    for lang, text in UNMODELED:
+        assert detect_lang(text) == ("", 0.0), (lang, text)
+        for target in ("en", "id", "su", "jv"):
+            assert not is_target_language(text, target), (lang, target, text)
+            assert _langid(text, target) == ("", False), (lang, target, text)
@@ -0,0 +1,82 @@
+
+import asyncio, os, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+
+from nixe.translate import memory as tm
+
+
+@pytest.fixture(autouse=True)
+def _mem(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRANSLATE_MEMORY_ENABLE", "1")
+    mem = tm.TranslationMemory(str(tmp_path / "tm.sqlite3"), ttl_sec=60, lru_size=2)
+    monkeypatch.setattr(tm, "_MEMORY", mem)
+    tm._INFLIGHT.clear()
+    return mem
+
+
+def test_ttl_and_sqlite_survive_lru(_mem, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(tm.time, "time", lambda: clock[0])
+    _mem.put_sync("k", "halo")
+    _mem._lru.clear()  # as after a restart: only SQLite has it
+    assert _mem.get_sync("k") == "halo" and _mem.stats["db_hit"] == 1
+    assert _mem.lru_get("k") == "halo"
+    clock[0] += 61
+    assert _mem.get_sync("k") is None and _mem.lru_get("k") is None
+
+
+def test_lru_evicts_least_recently_used(_mem):
+    for k in ("a", "b"):
+        _mem.put_sync(k, k.upper())
+    assert _mem.lru_get("a") == "A"
+    _mem.put_sync("c", "C")
+    assert list(_mem._lru) == ["a", "c"]
+
+
+def test_single_flight_and_failures_not_stored(_mem):
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return True, "terjemahan"
+
+    async def bad():
+        calls.append(1)
+        return False, "Gemini HTTP 503"
+
+    async def go():
+        got = await asyncio.gather(*(tm.cached_call("k", call, bool) for _ in range(5)))
+        assert got == [(True, "terjemahan")] * 5 and len(calls) == 1
+        assert _mem.stats["shared"] == 4
+
+        assert await tm.cached_call("x", bad, bool) == (False, "Gemini HTTP 503")
+        assert await tm.cached_call("x", bad, bool) == (False, "Gemini HTTP 503")
+        assert len(calls) == 3  # a failure always goes back to the provider
+
+    asyncio.run(go())
+
+
+def test_cancelled_caller_hands_call_to_waiter(_mem):
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return True, "terjemahan"
+
+    async def go():
+        leader = asyncio.ensure_future(tm.cached_call("k", call, bool))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(tm.cached_call("k", call, bool))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await waiter == (True, "terjemahan")
+        assert len(calls) == 2 and not tm._INFLIGHT
+
+    asyncio.run(go())
@@ -0,0 +1,93 @@
+
+import asyncio, json, os, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+
+from nixe.cogs import c20_translate_commands as tr
+
+SRC = "Don't forget to claim the event rewards before the event ends this week"
+OUT = "Jangan lupa ambil hadiah event sebelum event berakhir minggu ini"
+
+
+class _Resp:
+    def __init__(self, lines):
+        self.status = 200
+        self.content = self._iter(lines)
+
+    @staticmethod
+    async def _iter(lines):
+        for ln in lines:
+            if isinstance(ln, BaseException):
+                raise ln
+            yield ln
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Session:
+    lines: list = []
+
+    def __init__(self, *a, **kw):
+        pass
+
+    def post(self, url, json=None):
+        return _Resp(list(self.lines))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _sse(piece):
+    return ("data: " + json.dumps({"candidates": [{"content": {"parts": [{"text": piece}]}}]}) + "\n").encode()
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    monkeypatch.setenv("TRANSLATE_MEMORY_ENABLE", "0")
+    monkeypatch.setenv("TRANSLATE_PROVIDER_MIN_INTERVAL_SEC", "0")
+    monkeypatch.setattr(tr, "_PROVIDER_SEM", None)
+    monkeypatch.setattr(tr, "_pick_gemini_key", lambda: "k")
+    monkeypatch.setattr(tr.aiohttp, "ClientSession", _Session)
+    plain = []
+
+    async def _plain(text, target_lang, glossary=""):
+        plain.append(text)
+        return True, OUT
+
+    monkeypatch.setattr(tr, "_gemini_translate_text", _plain)
+    return plain
+
+
+def test_stream_reports_chunked_deltas(_env):
+    words = OUT.split(" ")
+    _Session.lines = [b": keep-alive\n"] + [_sse(w + ("" if i == len(words) - 1 else " ")) for i, w in enumerate(words)] + [b"data: [DONE]\n"]
+    deltas = []
+    ok, out = asyncio.run(tr._translate_text_stream(SRC, "Indonesian", on_delta=deltas.append))
+    assert ok and out == OUT
+    assert len(deltas) == len(words) and deltas[0] == words[0] + " " and deltas[-1] == OUT
+    assert all(b.startswith(a) for a, b in zip(deltas, deltas[1:]))
+    assert not _env  # no second call
+
+
+def test_stream_error_falls_back_to_plain_call(_env):
+    _Session.lines = [ConnectionResetError("reset")]
+    deltas = []
+    ok, out = asyncio.run(tr._translate_text_stream(SRC, "Indonesian", on_delta=deltas.append))
+    assert ok and out == OUT and deltas == [OUT] and _env == [SRC]
+
+
+def test_stream_cut_keeps_partial_text(_env):
+    _Session.lines = [_sse("Jangan lupa ambil hadiah event "), _sse("sebelum berakhir"), ConnectionResetError("cut")]
+    ok, out = asyncio.run(tr._translate_text_stream(SRC, "Indonesian"))
+    assert ok and out == "Jangan lupa ambil hadiah event sebelum berakhir" and not _env
@@ -0,0 +1,18 @@
+
+import os, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+
+
+@pytest.fixture(autouse=True)
+def _state_paths(tmp_path, monkeypatch):
+    """Every test gets its own state / watchlist files; the real data/ files are never touched."""
+    monkeypatch.setattr(yt, "STATE_PATH", str(tmp_path / "state.json"))
+    monkeypatch.setattr(yt, "WATCHLIST_PATH", str(tmp_path / "watchlist.json"))
+    return tmp_path / "state.json"
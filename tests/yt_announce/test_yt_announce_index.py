@@ -0,0 +1,90 @@
+
+import asyncio, time
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+from scripts import bench_yt_dedupe as bench
+
+
+def test_index_is_built_once_and_survives_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(yt, "ANNOUNCE_INDEX_MAX_AGE_DAYS", 10)  # fake history spans ~21 days
+
+    async def run():
+        cog = bench._new_cog(str(tmp_path))
+        ch = bench.make_channel(1000)
+        assert await cog._announce_channel_has_video(ch, "v0000000005")
+        assert ch.pages == 10
+        assert not await cog._announce_channel_has_video(ch, "v0000000009")  # chatter, not an announce
+        assert ch.pages == 11  # a miss is only trusted after one top-up request
+        # announces older than the age bound were not kept
+        idx = cog.state["announce_index"]
+        assert "v0000000005" in idx and "v0000000998" not in idx
+        cog._index_announce("vNEWNEWNEW1", ch.id, 1)
+        cog._flush_state()
+
+        cog2 = bench._new_cog(str(tmp_path))
+        ch2 = bench.make_channel(1000)
+        hits = [await cog2._announce_channel_has_video(ch2, v) for v in ("vNEWNEWNEW1", "v0000000005", "missing0001")]
+        assert hits == [True, True, False]
+        assert ch2.pages == 1  # the miss
+        # another announce channel has no index yet: falls back to a history build there
+        ch3 = bench.make_channel(50)
+        ch3.id = 778
+        cog2._announce_vid_cache_ready = False
+        assert not await cog2._announce_channel_has_video(ch3, "vNEWNEWNEW1")
+        assert ch3.pages == 2
+
+    asyncio.run(run())
+
+
+def test_miss_tops_up_announces_from_another_instance(tmp_path):
+    async def run():
+        cog = bench._new_cog(str(tmp_path))
+        ch = bench.make_channel(30)
+        assert await cog._announce_channel_has_video(ch, "v0000000000")
+        # a second instance announces after this one built its index
+        other = bench.make_channel(1).messages[0]
+        other.id, other.content = 10_000_001, "Other is live: <https://www.youtube.com/watch?v=vOTHERINST1>"
+        other.embeds = []
+        ch.messages.insert(0, other)
+        pages = ch.pages
+        assert await cog._announce_channel_has_video(ch, "vOTHERINST1")
+        assert ch.pages == pages + 1
+        assert cog.state["announce_index"]["vOTHERINST1"][:2] == [ch.id, 10_000_001]
+        assert cog.state["announce_index_tail"][str(ch.id)] == 10_000_001
+        # nothing newer: the next miss reads an empty page and is trusted
+        assert not await cog._announce_channel_has_video(ch, "missing0001")
+        assert ch.pages == pages + 2
+
+    asyncio.run(run())
+
+
+def test_prune_runs_on_a_timer(tmp_path, monkeypatch):
+    cog = yt.YouTubeWuWaLiveAnnouncer(None)
+    cog.targets = []
+    old = time.time() - (yt.ANNOUNCE_INDEX_MAX_AGE_DAYS + 1) * 86400
+    cog._index_announce("old", 1, 1, old)
+    monkeypatch.setattr(cog, "_pull_watchlist_from_thread_store", lambda: asyncio.sleep(0))
+    cog._watchlist_pulled_at = time.monotonic()
+    asyncio.run(cog.loop.coro(cog))
+    assert "old" in cog.state["announce_index"]  # pruned at startup; not due again yet
+    cog._index_pruned_at -= yt.ANNOUNCE_INDEX_PRUNE_SECONDS
+    asyncio.run(cog.loop.coro(cog))
+    assert "old" not in cog.state["announce_index"]
+
+
+def test_prune_by_age(tmp_path, monkeypatch):
+    cog = yt.YouTubeWuWaLiveAnnouncer(None)
+    now = time.time()
+    cog._index_announce("old", 1, 1, now - (yt.ANNOUNCE_INDEX_MAX_AGE_DAYS + 1) * 86400)
+    cog._index_announce("new", 1, 2, now)
+    assert cog._prune_announce_index(now) == 1
+    assert list(cog.state["announce_index"]) == ["new"]
+
+
+def test_dedupe_bench_index_requests_only_on_misses(tmp_path, monkeypatch):
+    r = bench.run(messages=1000, checks=100)
+    assert r["build_pages"] == 10
+    assert r["with_pages"] == r["checks"] - r["with_hits"]  # only misses pay a top-up request
+    assert r["without_pages"] == r["checks"]
+    # the index sees the whole channel, the 60-message fallback only the newest few
+    assert r["with_hits"] > r["without_hits"]
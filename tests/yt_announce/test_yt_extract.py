@@ -0,0 +1,19 @@
+
+from nixe.cogs.a21_youtube_wuwa_live_announce import _find_yt_var_json
+from scripts import bench_yt_extract
+
+
+def test_raw_decode_matches_scanner():
+    # Timings / peaks are reported by the bench script, not asserted (noisy on shared CI).
+    res = bench_yt_extract.run(loops=1)
+    for row in res["rows"]:
+        assert row["found"] and row["same"], row
+
+
+def test_skips_non_assignment_occurrences():
+    html = (
+        '<script>if (window.ytInitialPlayerResponse) {}</script>'
+        '<script>window["ytInitialPlayerResponse"] = {"a": "}{\\"", "b": {"c": 1}};</script>'
+    )
+    assert _find_yt_var_json(html, "ytInitialPlayerResponse") == {"a": '}{"', "b": {"c": 1}}
+    assert _find_yt_var_json("var ytInitialData = {broken", "ytInitialData") is None
@@ -0,0 +1,109 @@
+
+import asyncio
+from datetime import datetime, timezone
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+
+CID = "UCabcdefghijklmnopqrstuv"
+
+
+def _feed(ids):
+    entries = "".join(f"<entry><yt:videoId>{v}</yt:videoId><yt:channelId>{CID}</yt:channelId></entry>" for v in ids)
+    return f'<?xml version="1.0"?><feed xmlns:yt="http://www.youtube.com/xml/schemas/2015">{entries}</feed>'
+
+
+def test_feed_tier_escalates_only_on_change_or_schedule(tmp_path, monkeypatch):
+    monkeypatch.setattr(yt, "FEED_TIER", True)
+    monkeypatch.setattr(yt, "FEED_FULL_SCRAPE_SECONDS", 3600)
+    feed = {"ids": ["vidAAAAAAAA", "vidBBBBBBBB"], "version": 1}
+    seen_headers = []
+
+    async def handler(request):
+        seen_headers.append(request.headers.get("If-None-Match"))
+        etag = f'"v{feed["version"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        return web.Response(text=_feed(feed["ids"]), content_type="application/atom+xml", headers={"ETag": etag})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/feeds/videos.xml", handler)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(yt, "FEED_URL", str(server.make_url("/feeds/videos.xml")) + "?channel_id={}")
+        cog = yt.YouTubeWuWaLiveAnnouncer(None)
+        cog.session = aiohttp.ClientSession()
+        t = yt.Target(name="WuWa", query="WuWa", channel_id=CID)
+        now = 1_800_000_000.0
+        results = []
+        try:
+            results.append(await cog._feed_gate(t, now))        # baseline
+            results.append(await cog._feed_gate(t, now + 20))   # 304
+            results.append(await cog._feed_gate(t, now + 40))   # 304
+            feed["ids"].insert(0, "vidCCCCCCCC")
+            feed["version"] = 2
+            results.append(await cog._feed_gate(t, now + 60))   # new id
+            results.append(await cog._feed_gate(t, now + 80))   # 304
+            # the /live scrape saw vidCCCCCCCC as upcoming two minutes out
+            start = datetime.fromtimestamp(now + 200, timezone.utc)
+            player = {"videoDetails": {"channelId": CID}}
+            cog._note_player(t, player, "vidCCCCCCCC", False, start)
+            cog.state["feed"][CID]["upcoming"]["start"] = int(now + 200 + 2 * yt.FEED_PREROLL_SECONDS)
+            results.append(await cog._feed_gate(t, now + 100))  # not near yet
+            cog.state["feed"][CID]["upcoming"]["start"] = int(now + 200)
+            results.append(await cog._feed_gate(t, now + 120))  # near scheduled start
+            cog._note_player(t, player, "vidCCCCCCCC", True, start)
+            results.append(await cog._feed_gate(t, now + 140))  # went live: back to 304
+        finally:
+            cog._flush_state()
+            await cog.session.close()
+            await server.close()
+        return results, cog
+
+    results, cog = asyncio.run(run())
+    assert results == [True, False, False, True, False, False, True, False]
+    assert cog._feed_stats["escalations"] == 3
+    assert cog._feed_stats["not_modified"] == 6
+    assert seen_headers[0] is None and seen_headers[1] == '"v1"'
+    saved = yt._read_json_any(yt.STATE_PATH)
+    assert saved["feed"][CID]["etag"] == '"v2"'
+    assert "upcoming" not in saved["feed"][CID]
+
+
+def test_unannounced_live_is_scraped_within_three_polls(monkeypatch):
+    # A live started without a schedule does not reach the feed for minutes: only the safety
+    # scrape finds it, so its default must stay a few polls, not tens of minutes.
+    monkeypatch.setattr(yt, "FEED_TIER", True)
+    assert yt.FEED_FULL_SCRAPE_SECONDS <= 3 * yt.POLL_SECONDS
+
+    async def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=_feed(["vidAAAAAAAA"]), content_type="application/atom+xml", headers={"ETag": '"v1"'})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/feeds/videos.xml", handler)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(yt, "FEED_URL", str(server.make_url("/feeds/videos.xml")) + "?channel_id={}")
+        cog = yt.YouTubeWuWaLiveAnnouncer(None)
+        cog.session = aiohttp.ClientSession()
+        t = yt.Target(name="WuWa", query="WuWa", channel_id=CID)
+        now = 1_800_000_000.0
+        try:
+            # baseline at 0; the channel goes live (feed unchanged, nothing scheduled) right after
+            return [await cog._feed_gate(t, now + i * yt.POLL_SECONDS) for i in range(7)]
+        finally:
+            await cog.session.close()
+            await server.close()
+
+    gates = asyncio.run(run())
+    assert gates[0] is True
+    first = gates.index(True, 1)
+    assert first * yt.POLL_SECONDS <= yt.FEED_FULL_SCRAPE_SECONDS + yt.POLL_SECONDS
+    assert gates.count(True) >= 3  # the scrape keeps recurring while the feed stays silent
@@ -0,0 +1,110 @@
+
+import asyncio
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+from nixe.helpers.host_governor import HostGovernor, is_block_page, parse_retry_after
+
+BLOCK_PAGE = "<!DOCTYPE html><title>Access denied | Error 1015</title>You are being rate limited. Cloudflare"
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.t
+
+    async def sleep(self, s):
+        self.sleeps.append(round(s, 3))
+        self.t += s
+
+
+def test_scripted_429s_open_and_close_the_host_circuit(tmp_path, monkeypatch):
+    clock = FakeClock()
+    gov = HostGovernor(rate=1.0, burst=2, backoff_seconds=10, circuit_seconds=600, clock=clock, sleep=clock.sleep)
+    monkeypatch.setattr(yt, "_HTTP_GOVERNOR", gov)
+    script = [
+        (200, {}, "ok"),
+        (200, {}, "ok"),
+        (429, {"Retry-After": "30"}, "slow down"),
+        (200, {}, "ok"),
+        (429, {}, "slow down"),
+        (200, {}, "ok"),
+        (429, {}, BLOCK_PAGE),
+    ]
+    hits = []
+
+    async def handler(request):
+        status, headers, body = script[len(hits)]
+        hits.append(status)
+        return web.Response(status=status, headers=headers, text=body)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/page", handler)
+        server = TestServer(app)
+        await server.start_server()
+        url = str(server.make_url("/page"))
+        host = yt._url_host(url)
+        cog = yt.YouTubeWuWaLiveAnnouncer(None)
+        cog.session = aiohttp.ClientSession()
+        got = []
+        try:
+            got.append(await cog._http_get_text(url))
+            got.append(await cog._http_get_text(url))
+            got.append(await cog._http_get_text(url))   # bucket empty: waits 1 s, then 429 Retry-After: 30
+            got.append(await cog._http_get_text(url))   # circuit open: refused locally
+            assert gov.state()[host]["reason"] == "retry-after"
+            clock.t += 30
+            got.append(await cog._http_get_text(url))   # circuit closed again
+            got.append(await cog._http_get_text(url))   # plain 429: 10 s backoff
+            clock.t += 10
+            got.append(await cog._http_get_text(url))
+            got.append(await cog._http_get_text(url))   # 1015 block page: long circuit
+            clock.t += 300
+            got.append(await cog._http_get_text(url))   # still open
+            return got, gov.state()[host]
+        finally:
+            await cog.session.close()
+            await server.close()
+
+    got, st = asyncio.run(run())
+    assert got == ["ok", "ok", None, None, "ok", None, "ok", None, None]
+    assert hits == [200, 200, 429, 200, 429, 200, 429]
+    assert clock.sleeps == [1.0]
+    assert st["circuit"] == "open" and st["reason"] == "block-page"
+    assert 299 < st["open_for"] <= 300
+    assert st["refused"] == 2 and st["throttled"] == 3 and st["requests"] == 7
+
+
+def test_retry_after_http_date():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2026 07:28:00 GMT", now_wall=1792567620.0) == 60.0
+    assert parse_retry_after("soon") is None
+
+
+def test_plain_errors_behind_cloudflare_do_not_open_the_circuit():
+    clock = FakeClock()
+    gov = HostGovernor(rate=1.0, burst=2, backoff_seconds=10, circuit_seconds=600, clock=clock, sleep=clock.sleep)
+    pages = [
+        (404, "<html><title>404 Not Found</title><center>cloudflare</center></html>"),
+        (503, "<title>Service Unavailable</title>Performance &amp; security by Cloudflare. Ray ID: 8a1b"),
+        (503, "<title>www.youtube.com | 522: Connection timed out</title>Cloudflare"),
+    ]
+    for status, body in pages:
+        assert not is_block_page(body)
+        gov.record("www.youtube.com", status, {}, body)
+    assert not gov.is_open("www.youtube.com")
+    assert gov.state()["www.youtube.com"]["throttled"] == 0
+
+    assert is_block_page(BLOCK_PAGE)
+    assert is_block_page("<title>Error 1015</title>")
+    assert is_block_page("Our systems have detected unusual traffic from your computer network.")
+    assert is_block_page('<a href="https://www.google.com/sorry/index?continue=...">')
+    gov.record("www.youtube.com", 503, {}, "error code: 1015")
+    assert gov.is_open("www.youtube.com")
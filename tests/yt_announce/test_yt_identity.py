@@ -0,0 +1,103 @@
+
+import json
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+from scripts import bench_yt_identity
+
+CID = "UC" + "a" * 22
+
+
+def test_legacy_state_migrates_to_one_record_per_channel(tmp_path, monkeypatch):
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({
+        "resolved": {
+            "@Rover": {"channel_id": CID, "title": "Rover Ch", "url": ""},
+            "Rover Ch": "Rover Ch",
+            "https://www.youtube.com/@rover": "Rover Ch",
+            "@other": {"channel_id": "", "title": "@other", "url": "https://www.youtube.com/@other"},
+            "url_to_name": {"https://www.youtube.com/@rover/": "Rover Ch"},
+        },
+        "yt_channel_name_cache": {CID: "Rover Ch"},
+        "channel_ids": {"@other": "UC" + "b" * 22},
+    }), encoding="utf-8")
+
+    cog = yt.YouTubeWuWaLiveAnnouncer(None)
+    assert cog._state_dirty  # the constructor never writes; the first flush does
+    cog._flush_state()
+    saved = json.loads(state_path.read_text(encoding="utf-8"))
+    for old in ("resolved", "yt_channel_name_cache", "channel_ids"):
+        assert old not in cog.state and old not in saved
+    assert sorted(saved["identities"]["channels"]) == [CID, "UC" + "b" * 22]
+    assert saved["identities"]["channels"][CID]["title"] == "Rover Ch"
+
+    ids = cog.identities
+    assert ids.title_for("＠rover") == ids.title_for("https://www.youtube.com/@Rover/") == "Rover Ch"
+    assert ids.title_for("@other") is None  # a handle is never a display name
+    assert cog._feed_channel_id(yt.Target(name="@other", query="@other", handle="@other")) == "UC" + "b" * 22
+
+    # a pseudo record is re-keyed once its channel id is learned
+    t = yt.Target(name="@new", query="@new", handle="@new")
+    cog._remember_identity(t, "New Ch")
+    t.channel_id = "UC" + "c" * 22
+    cog._remember_identity(t)
+    rec = ids.lookup("@new")
+    assert rec.channel_id == t.channel_id and rec.title == "New Ch" and len(ids) == 3
+
+    # loaded once from disk, no re-migration
+    cog._flush_state()
+    again = yt.YouTubeWuWaLiveAnnouncer(None)
+    assert again.identities.title_for(t.channel_id) == "New Ch" and len(again.identities) == 3
+
+
+def test_shared_display_name_is_a_hint_not_a_merge():
+    ids = yt._ChannelIdentityStore({})
+    ids.remember(["@alpha", "Kuro Ch."], title="Kuro Ch.", url="https://www.youtube.com/@alpha", handle="@alpha")
+    ids.remember(["@beta", "Kuro Ch."], title="Kuro Ch.", url="https://www.youtube.com/@beta", handle="@beta")
+    assert len(ids) == 2
+    assert ids.lookup("@alpha").url == "https://www.youtube.com/@alpha"
+    assert ids.lookup("@beta").url == "https://www.youtube.com/@beta"
+    assert ids.lookup("Kuro Ch.") is None  # claimed by two channels: resolves to neither
+    ids.remember(["@alpha", "Kuro Ch."], title="Kuro Ch.")
+    assert ids.lookup("Kuro Ch.") is None and ids.lookup("@alpha").handle == "@alpha"
+
+    # a unique name still finds its channel; learning the id re-keys only that record
+    cog = yt.YouTubeWuWaLiveAnnouncer(None)
+    gamma = yt.Target(name="Gamma Live", query="Gamma Live", handle="@gamma")
+    delta = yt.Target(name="Gamma Live", query="@delta", handle="@delta")
+    cog._remember_identity(gamma, "Gamma Live")
+    assert cog.identities.lookup("gamma live").handle == "@gamma"
+    cog._remember_identity(delta, "Gamma Live")
+    delta.channel_id = "UC" + "d" * 22
+    cog._remember_identity(delta)
+    assert cog.identities.lookup("@gamma").channel_id == ""
+    assert cog.identities.lookup("@delta").channel_id == delta.channel_id and len(cog.identities) == 2
+
+    # a query-only target's record still folds into its channel once the id is known
+    q = yt.Target(name="Rover", query="Rover")
+    cog._remember_identity(q)
+    cog._note_player(q, {"videoDetails": {"channelId": CID}}, None, False, None)
+    assert cog.identities.lookup("rover").channel_id == CID and len(cog.identities) == 3
+
+
+def test_legacy_shared_display_name_keeps_channels_apart():
+    alpha, beta = "UC" + "e" * 22, "UC" + "f" * 22
+    state = {"resolved": {
+        "@alpha": "Wuwa Clips", "https://www.youtube.com/@alpha": "Wuwa Clips",
+        "@beta": "Wuwa Clips", "https://www.youtube.com/@beta": "Wuwa Clips",
+        "Wuwa Clips": "Wuwa Clips",
+    }}
+    ids = yt._ChannelIdentityStore(state)
+    ids.migrate_legacy(state)
+    assert len(ids) == 2
+    ids.remember(["@alpha"], channel_id=alpha)
+    ids.remember(["@beta"], channel_id=beta)
+    assert ids.channel_id_for("https://www.youtube.com/@alpha") == alpha
+    assert ids.channel_id_for("https://www.youtube.com/@beta") == beta
+    assert ids.lookup("Wuwa Clips") is None  # the shared name resolves to neither
+
+
+def test_identity_bench_500_targets():
+    r = bench_yt_identity.run(500, rounds=2)
+    assert r["records"] == 500 and r["store_hits"] == 500
+    assert r["legacy_hits"] < r["store_hits"]
+    assert r["store_bytes"] < r["legacy_bytes"]
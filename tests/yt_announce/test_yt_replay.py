@@ -0,0 +1,21 @@
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+from scripts import replay_yt_announce as replay
+
+
+def test_replay_half_hour_offline():
+    governor, state_path = yt._HTTP_GOVERNOR, yt.STATE_PATH
+    r = replay.run(targets=8, hours=0.5, pad_kb=8)
+
+    assert r["external_requests"] == 0
+    assert yt._HTTP_GOVERNOR is governor and yt.STATE_PATH == state_path  # patches undone
+    assert r["lives"] == 5 and r["announced"] == 5 and r["missed"] == 0  # 2 of them unscheduled
+    assert r["duplicates"] == 0
+    # an unscheduled live is found by the next safety scrape, well before it reaches the feed
+    worst = yt.FEED_FULL_SCRAPE_SECONDS + yt.SCHED_MAX_SECONDS * (1 + yt.SCHED_JITTER) + yt.SCHED_TICK_SECONDS
+    assert r["announce_delay_p95_s"] <= min(worst, replay.UNSCHEDULED_FEED_LAG)
+    # every endpoint the loop depends on was exercised
+    assert {"live", "watch", "feed", "search"} <= set(r["endpoints"])
+    assert r["endpoints"]["feed"] > r["endpoints"]["live"]  # the feed tier absorbs most polls
+    assert 0 < r["requests_per_target_hour"] < 200
+    assert r["bytes"] > 0 and r["busy_ticks"] > 0 and r["loop_p95_ms"] > 0
@@ -0,0 +1,100 @@
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+from nixe.cogs.a21_youtube_wuwa_live_announce import _PollScheduler
+
+
+class FakeClock:
+    def __init__(self, t=1_000_000.0):
+        self.t = t
+
+    def __call__(self):
+        return self.t
+
+
+def _sched(clock, rng=lambda: 0.5, jitter=0.0):
+    return _PollScheduler(base=20, dense=10, max_interval=300, preroll=300, late=1800,
+                          jitter=jitter, clock=clock, rng=rng)
+
+
+def _run_until(s, clock, key, until, **kw):
+    """Advance the fake clock poll by poll; returns the times `key` was checked."""
+    hits = []
+    while clock.t < until:
+        nxt = min(e["due"] for e in s._entries.values() if e.get("seq") != -1)
+        clock.t = max(clock.t, nxt)
+        for k in s.pop_due():
+            if k == key:
+                hits.append(clock.t)
+            s.reschedule(k, **kw)
+    return hits
+
+
+def test_idle_backoff_is_exponential_and_capped():
+    clock = FakeClock()
+    s = _sched(clock)
+    s.sync(["a"])
+    assert s.pop_due() == []
+    clock.t += 10
+    assert s.pop_due() == ["a"]
+    gaps = []
+    for _ in range(7):
+        due = s.reschedule("a")
+        gaps.append(due - clock.t)
+        clock.t = due
+        assert s.pop_due() == ["a"]
+    assert gaps == [20, 40, 80, 160, 300, 300, 300]
+    # a live result resets the backoff
+    assert s.reschedule("a", live=True) - clock.t == 20
+
+
+def test_dense_polling_around_scheduled_start():
+    clock = FakeClock()
+    s = _sched(clock)
+    start = clock.t + 3600
+    s.sync(["up"])
+    hits = _run_until(s, clock, "up", start + 1800 + 600, start_ts=start)
+    before = [h for h in hits if h < start - 300]
+    window = [h for h in hits if start - 300 <= h <= start + 1800]
+    after = [h for h in hits if h > start + 1800]
+    # idle back-off while far away, woken exactly at the pre-roll
+    assert len(before) < 20
+    assert start - 300 in hits
+    # every 10 s through the window, idle again afterwards
+    assert all(b - a == 10 for a, b in zip(window, window[1:]))
+    assert len(window) == 2100 // 10 + 1
+    assert [b - a for a, b in zip(after, after[1:])] == [40, 80, 160, 300]
+
+
+def test_jitter_bounds_sync_and_snapshot():
+    clock = FakeClock()
+    lo = _sched(clock, rng=lambda: 0.0, jitter=0.1)
+    hi = _sched(clock, rng=lambda: 1.0, jitter=0.1)
+    for s in (lo, hi):
+        s.sync(["a", "b"])
+        clock.t += 10
+        assert sorted(s.pop_due()) == ["a", "b"]
+    assert lo.reschedule("a") - clock.t == 18
+    assert hi.reschedule("a") - clock.t == 22
+
+    lo.reschedule("b", start_ts=clock.t + 310)
+    snap = lo.snapshot()
+    assert [r["key"] for r in snap] == ["b", "a"] and snap[0]["reason"] == "waiting-start"
+    lo.sync(["b", "c"])
+    assert {r["key"] for r in lo.snapshot()} == {"b", "c"}
+    clock.t += 1000
+    assert sorted(lo.pop_due()) == ["b", "c"]
+    assert lo.requeue_in_flight() == 2
+
+
+def test_default_idle_cap_bounds_surprise_live_delay():
+    # A live without a schedule is only seen by the next idle poll: with the default cap a
+    # target idle for hours is still checked every few polls, not every five minutes.
+    assert yt.SCHED_MAX_SECONDS <= 3 * yt.POLL_SECONDS
+    clock = FakeClock()
+    s = _PollScheduler(base=yt.POLL_SECONDS, dense=yt.SCHED_DENSE_SECONDS, max_interval=yt.SCHED_MAX_SECONDS,
+                       preroll=yt.FEED_PREROLL_SECONDS, late=yt.FEED_LATE_SECONDS,
+                       jitter=yt.SCHED_JITTER, clock=clock, rng=lambda: 1.0)
+    s.sync(["a"])
+    hits = _run_until(s, clock, "a", clock.t + 4 * 3600)
+    worst = max(b - a for a, b in zip(hits, hits[1:]))
+    assert worst <= yt.SCHED_MAX_SECONDS * (1 + yt.SCHED_JITTER)
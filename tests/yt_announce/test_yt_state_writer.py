@@ -0,0 +1,78 @@
+
+import asyncio, json
+from types import SimpleNamespace
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+
+
+def test_burst_of_resolutions_is_one_atomic_write(tmp_path, monkeypatch):
+    state_path = tmp_path / "state.json"
+    monkeypatch.setattr(yt, "STATE_FLUSH_SECONDS", 0.05)
+    writes = []
+    real_write = yt._write_json_best_effort
+
+    def counting_write(p, data):
+        writes.append(p)
+        real_write(p, data)
+
+    monkeypatch.setattr(yt, "_write_json_best_effort", counting_write)
+
+    async def run():
+        cog = yt.YouTubeWuWaLiveAnnouncer(None)
+        for i in range(100):
+            t = yt.Target(name=f"@ch{i}", query=f"@ch{i}", handle=f"@ch{i}")
+            cog._note_player(t, {"videoDetails": {"channelId": f"UC{i:022d}"}}, None, False, None)
+            t.channel_id = f"UC{i:022d}"
+            cog._remember_identity(t, f"Channel {i}")
+        assert writes == []
+        await asyncio.sleep(0.2)
+        return cog
+
+    cog = asyncio.run(run())
+    assert writes == [str(state_path)]
+    saved = json.loads(state_path.read_text(encoding="utf-8"))
+    assert len(saved["identities"]["channels"]) == 100
+    assert saved["identities"]["channels"]["UC" + "0" * 22]["title"] == "Channel 0"
+    assert not (tmp_path / "state.json.tmp").exists()
+
+    # nothing dirty: unload does not rewrite; a late change is flushed on unload
+    cog.cog_unload()
+    assert len(writes) == 1
+    cog.state["announced_vids"]["vidAAAAAAAA"] = 1
+    cog._mark_state_dirty()
+    cog.cog_unload()
+    assert len(writes) == 2
+    assert json.loads(state_path.read_text(encoding="utf-8"))["announced_vids"] == {"vidAAAAAAAA": 1}
+
+
+def test_sent_announce_is_written_at_once(tmp_path, monkeypatch):
+    state_path = tmp_path / "state.json"
+    monkeypatch.setattr(yt, "STATE_FLUSH_SECONDS", 60.0)
+    writes = []
+    real_write = yt._write_json_best_effort
+    monkeypatch.setattr(yt, "_write_json_best_effort", lambda p, data: writes.append(p) or real_write(p, data))
+
+    async def sent(channel, **kw):
+        return SimpleNamespace(id=4321)
+
+    async def nothing(*a, **kw):
+        return False
+
+    async def run():
+        cog = yt.YouTubeWuWaLiveAnnouncer(None)
+        monkeypatch.setattr(cog, "_send_queued", sent)
+        monkeypatch.setattr(cog, "_announce_channel_has_video", nothing)
+        monkeypatch.setattr(cog, "_cleanup_duplicate_announcements", nothing)
+        t = yt.Target(name="@ch", query="@ch", handle="@ch", channel_id="UC" + "0" * 22)
+        cog._remember_identity(t, "Channel")  # name resolutions stay debounced
+        assert writes == []
+        await cog._post(SimpleNamespace(id=777), "Channel", "Live!", "vidAAAAAAAA")
+        assert writes == [str(state_path)]  # no crash window before the 60 s debounce
+        cog._flush_state()
+        return cog
+
+    asyncio.run(run())
+    saved = json.loads(state_path.read_text(encoding="utf-8"))
+    assert saved["announce_index"]["vidAAAAAAAA"][:2] == [777, 4321]
+    assert "UC" + "0" * 22 in saved["identities"]["channels"]
+    assert len(writes) == 1
@@ -0,0 +1,75 @@
+
+import asyncio
+import threading
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+from scripts.bench_yt_extract import synth_page
+
+PAGE = synth_page().encode("utf-8") + b"<!--" + b"x" * 2_000_000 + b"-->"
+NO_PLAYER = b"<html>" + b'"videoId":"abcdefghijk"' + b"y" * 3_000_000 + b"</html>"
+
+
+def _app(sent):
+    async def page(request):
+        body = PAGE if request.path == "/live" else NO_PLAYER
+        resp = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8", "Content-Length": str(len(body))})
+        await resp.prepare(request)
+        try:
+            for i in range(0, len(body), 16384):
+                await resp.write(body[i:i + 16384])
+                sent[request.path] = i + 16384
+                await asyncio.sleep(0.001)  # paced like a network, not a 2 MB burst
+        except (ConnectionResetError, ConnectionError):
+            pass
+        return resp
+
+    app = web.Application()
+    app.router.add_get("/live", page)
+    app.router.add_get("/watch", page)
+    return app
+
+
+def _fetch(path):
+    sent = {}
+
+    async def run():
+        server = TestServer(_app(sent))
+        await server.start_server()
+        try:
+            async with aiohttp.ClientSession() as s:
+                return await yt._stream_yt_var_json(
+                    s, str(server.make_url(path)), "ytInitialPlayerResponse", max_bytes=256 * 1024, chunk_bytes=8192
+                )
+        finally:
+            await server.close()
+
+    return asyncio.run(run()), sent
+
+
+def test_stream_stops_after_player_response():
+    (html, player, st), sent = _fetch("/live")
+    assert player == yt._find_yt_var_json(PAGE.decode("utf-8"), "ytInitialPlayerResponse")
+    assert st["early"] and st["total"] == len(PAGE)
+    assert st["read"] < len(PAGE) // 4
+    assert sent["/live"] < len(PAGE) // 2
+    assert "ytInitialPlayerResponse" in html
+
+
+def test_stream_byte_cap_keeps_partial_html_for_fallback():
+    (html, player, st), _sent = _fetch("/watch")
+    assert player is None
+    assert st["early"] and 256 * 1024 <= st["read"] < 256 * 1024 + 8192
+    assert '"videoId":"abcdefghijk"' in html
+
+
+def test_stream_decodes_off_the_event_loop(monkeypatch):
+    threads = []
+    real = yt._find_yt_var_json
+    monkeypatch.setattr(yt, "_find_yt_var_json", lambda *a: threads.append(threading.current_thread()) or real(*a))
+    (_html, player, _st), _sent = _fetch("/live")
+    assert player is not None
+    assert threads and threading.main_thread() not in threads
@@ -0,0 +1,137 @@
+
+import asyncio, json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from nixe.cogs import a21_youtube_wuwa_live_announce as yt
+
+BOT_ID = 99
+
+
+class FakeAttachment:
+    def __init__(self, aid, cfg, reads):
+        self.id = aid
+        self.filename = yt.WATCHLIST_STORE_ATTACHMENT_NAME
+        self.payload = json.dumps(cfg).encode("utf-8")
+        self.size = len(self.payload)
+        self.reads = reads
+
+    async def read(self):
+        self.reads.append(self.id)
+        return self.payload
+
+
+class FakeThread:
+    def __init__(self, msg):
+        self.msg = msg
+        self.fetches = 0
+
+    async def fetch_message(self, mid):
+        self.fetches += 1
+        return self.msg
+
+
+def test_store_attachment_downloaded_only_when_changed(tmp_path, monkeypatch):
+    reads = []
+    cfg1 = {"targets": [{"name": "WuWa", "query": "WuWa", "handle": "@WutheringWaves"}]}
+    msg = SimpleNamespace(id=555, author=SimpleNamespace(id=BOT_ID), content=yt.WATCHLIST_STORE_MARKER,
+                          edited_at=None, attachments=[FakeAttachment(1, cfg1, reads)], embeds=[])
+    th = FakeThread(msg)
+
+    async def run():
+        cog = yt.YouTubeWuWaLiveAnnouncer(SimpleNamespace(user=SimpleNamespace(id=BOT_ID)))
+        cog.state["watchlist_store_mid"] = 555
+        got = [await cog._load_watchlist_from_store_attachment(th) for _ in range(5)]
+        assert all(g == cfg1 for g in got)
+        assert reads == [1] and th.fetches == 1
+
+        # periodic re-check: message unchanged -> fetched, but the attachment is not downloaded
+        cog._store_checked_at -= yt.WATCHLIST_STORE_REFRESH_SECONDS
+        assert await cog._load_watchlist_from_store_attachment(th) == cfg1
+        assert reads == [1] and th.fetches == 2
+
+        # edit event for the store message -> new attachment is downloaded once
+        cfg2 = {"targets": cfg1["targets"] + [{"name": "Other", "query": "Other"}]}
+        msg.edited_at = datetime(2026, 10, 18, tzinfo=timezone.utc)
+        msg.attachments = [FakeAttachment(2, cfg2, reads)]
+        await cog.on_raw_message_edit(SimpleNamespace(message_id=555))
+        assert await cog._load_watchlist_from_store_attachment(th) == cfg2
+        assert await cog._load_watchlist_from_store_attachment(th) == cfg2
+        assert reads == [1, 2] and th.fetches == 3
+        return cog.watchlist_store_metrics()
+
+    m = asyncio.run(run())
+    assert m["downloads_per_hour"] == 2
+    assert m["downloads_avoided_per_hour"] == 6 and m["downloads_avoided_total"] == 6
+
+
+def test_store_counters_stay_bounded_without_metrics_reads(monkeypatch):
+    cog = yt.YouTubeWuWaLiveAnnouncer(SimpleNamespace(user=SimpleNamespace(id=BOT_ID)))
+    clock = [0.0]
+    monkeypatch.setattr(yt.time, "monotonic", lambda: clock[0])
+    for _ in range(3 * 3600 // 20):  # three hours of 20 s polls, nobody scraping /metrics
+        cog._note_store_avoided()
+        clock[0] += 20
+    assert len(cog._store_avoided) <= 3600 // 20 + 1
+    assert cog._store_avoided_total == 3 * 3600 // 20
+
+
+class FakeStoreMessage:
+    """Store message whose `edit(attachments=...)` works (or raises, forcing `th.send`)."""
+
+    def __init__(self, mid, att, reads, edit_fails=False):
+        self.id = mid
+        self.author = SimpleNamespace(id=BOT_ID)
+        self.content = yt.WATCHLIST_STORE_MARKER
+        self.edited_at = None
+        self.attachments = [att]
+        self.embeds = []
+        self.reads = reads
+        self.edit_fails = edit_fails
+
+    async def edit(self, **kw):
+        if "attachments" not in kw:
+            self.content = kw.get("content", self.content)
+            return self
+        if self.edit_fails:
+            raise TypeError("attachments not supported")
+        f = kw["attachments"][0]
+        self.attachments = [FakeAttachment(self.attachments[0].id + 1, json.loads(f.fp.read()), self.reads)]
+        self.edited_at = datetime(2026, 10, 18, tzinfo=timezone.utc)
+        return self
+
+
+class FakeStoreThread(FakeThread):
+    async def send(self, content, *, file, **kw):
+        self.msg = FakeStoreMessage(self.msg.id + 1, FakeAttachment(100, json.loads(file.fp.read()), self.msg.reads), self.msg.reads)
+        self.msg.pin = lambda **kw: asyncio.sleep(0)
+        return self.msg
+
+
+def test_own_store_write_updates_the_cache_without_an_edit_event(monkeypatch):
+    for edit_fails in (False, True):
+        reads = []
+        cfg1 = {"targets": [{"name": "WuWa", "query": "WuWa", "handle": "@WutheringWaves"}]}
+        th = FakeStoreThread(FakeStoreMessage(555, FakeAttachment(1, cfg1, reads), reads, edit_fails))
+
+        async def run():
+            cog = yt.YouTubeWuWaLiveAnnouncer(SimpleNamespace(user=SimpleNamespace(id=BOT_ID)))
+            cog.state["watchlist_store_mid"] = 555
+            assert await cog._load_watchlist_from_store_attachment(th) == cfg1
+
+            async def find_store(_th):
+                return th.msg
+
+            monkeypatch.setattr(cog, "_find_or_create_watchlist_store_message", find_store)
+            monkeypatch.setattr(cog, "_build_watchlist_embed", lambda *a, **kw: None)
+            monkeypatch.setattr(cog, "_build_watchlist_view_for_targets", lambda *a, **kw: None)
+            added = cfg1["targets"] + [{"name": "Other", "query": "Other", "handle": "@other"}]
+            yt._write_json_best_effort(yt.WATCHLIST_PATH, {"enabled": True, "targets": added})
+            await cog._sync_watchlist_store_message(th)
+
+            # no on_raw_message_edit delivered: the cache must already hold what was written
+            got = await cog._load_watchlist_from_store_attachment(th)
+            assert [t["handle"] for t in got["targets"]] == ["@other", "@WutheringWaves"]
+            assert reads == [1]
+
+        asyncio.run(run())